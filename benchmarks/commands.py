@@ -0,0 +1,302 @@
+"""Command benchmark suite on synthetic workshops.
+
+For each workshop size, builds a workshop with workshop_gen.py and runs
+every command in a fresh interpreter, as a user would, in two states:
+
+- cold: the caches in _workshop/.steward/ (item, slug, search and
+  content hash indexes) are removed first and, when run as root, the page cache is
+  dropped
+- warm: the caches left by the previous run are used
+
+Each run records wall time (spawn to exit), peak RSS (from wait4) and
+syscalls (from the command's STEWARD_METRICS record). Absolute times
+depend on the machine and its load, so every size first times a
+startup probe (``steward --version``), and commands are compared by
+their wall time as a multiple of it and their peak RSS above it;
+syscall counts are compared as they are.
+
+The medians over --repeat runs are compared against a baseline, and any
+metric more than --threshold above it fails the suite. Baselines are
+local: record one with --write-baseline (commands_baseline.json, not
+committed) on the box you compare on, before the change under test.
+Without one, the suite only reports. Only the standard library and
+steward itself are needed.
+
+Usage:
+    python benchmarks/commands.py                              # 1k and 10k items
+    python benchmarks/commands.py --sizes 1000,10000,100000
+    python benchmarks/commands.py --threshold 0.1 --repeat 5
+    python benchmarks/commands.py --write-baseline             # then compare later runs to it
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from workshop_gen import GeneratedWorkshop, build_workshop
+
+from steward.domain.item_ids import slug_from_id
+from steward.domain.stages import Stage
+from steward.infrastructure.hash_index import HASH_INDEX_FILENAME
+from steward.infrastructure.item_index import INDEX_FILENAME
+from steward.infrastructure.search_index import SEARCH_INDEX_FILENAME
+from steward.infrastructure.slug_resolver import RESOLVER_FILENAME
+from steward.infrastructure.state import STATE_DIR
+
+BASELINE_FILE = Path(__file__).with_name("commands_baseline.json")
+
+DEFAULT_SIZES = (1_000, 10_000)
+STATES = ("cold", "warm")
+
+# Cached state removed before a cold run (SQLite sidecars included)
+CACHE_FILES = (
+    *(
+        f"{db}{suffix}"
+        for db in (INDEX_FILENAME, SEARCH_INDEX_FILENAME, HASH_INDEX_FILENAME)
+        for suffix in ("", "-wal", "-shm")
+    ),
+    RESOLVER_FILENAME,
+)
+
+# Wall-time changes smaller than this are noise, whatever the ratio
+MIN_WALL_DELTA_MS = 5.0
+
+# Arguments of the startup probe commands are measured against
+PROBE_ARGV = ["--version"]
+
+# Content of each file dropped into the inbox for the intake benchmark
+_INBOX_NOTE = "# Bench idea\n\n" + "Some words about an idea worth keeping. " * 50 + "\n"
+
+
+class Workload:
+    """Hands out fresh arguments for commands that change the workshop."""
+
+    def __init__(self, generated: GeneratedWorkshop) -> None:
+        self.generated = generated
+        self._intake_ids = list(reversed(generated.items[Stage.INTAKE]))
+        self._drops = 0
+
+    def next_intake_slug(self) -> str:
+        """Slug of an item still in intake, so each stage run moves a new one."""
+        slug = slug_from_id(self._intake_ids.pop())
+        assert slug is not None
+        return slug
+
+    def next_drop(self) -> str:
+        """Drop a new file into the inbox and return its name."""
+        self._drops += 1
+        name = f"bench-drop-{self._drops:05d}.md"
+        (self.generated.path / "1-inbox" / name).write_text(_INBOX_NOTE)
+        return name
+
+
+# Benchmark name -> steward arguments for the next run
+BENCHMARKS: dict[str, Callable[[Workload], list[str]]] = {
+    "list": lambda workload: ["list"],
+    "list-stage": lambda workload: ["list", "--stage", "backlog"],
+    "sync": lambda workload: ["sync"],
+    "sync-check": lambda workload: ["sync", "--check"],
+    "stage": lambda workload: ["stage", workload.next_intake_slug(), "backlog"],
+    "intake": lambda workload: ["intake", workload.next_drop()],
+    "search": lambda workload: ["search", "retry", "token"],
+}
+
+
+def clear_caches(workshop: Path) -> bool:
+    """Remove steward's caches and try to drop the page cache.
+
+    Returns:
+        True if the page cache was dropped (needs root and a writable
+        /proc/sys/vm/drop_caches).
+    """
+    for name in CACHE_FILES:
+        (workshop / STATE_DIR / name).unlink(missing_ok=True)
+    if os.geteuid() != 0:
+        return False
+    os.sync()
+    try:
+        with open("/proc/sys/vm/drop_caches", "w") as f:
+            f.write("3\n")
+    except OSError:
+        return False
+    return True
+
+
+def _spawn(praxis_home: Path, argv: list[str], env_extra: dict[str, str]) -> tuple[float, float]:
+    """Run one steward command; return its wall time (ms) and peak RSS (KiB)."""
+    env = dict(os.environ, PRAXIS_HOME=str(praxis_home), **env_extra)
+    env.pop("STEWARD_TRACE", None)
+    with tempfile.TemporaryFile() as stderr:
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "steward", *argv], stdout=subprocess.DEVNULL, stderr=stderr, env=env
+        )
+        _, status, rusage = os.wait4(proc.pid, 0)
+        wall_ms = (time.perf_counter() - start) * 1000
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        if proc.returncode != 0:
+            stderr.seek(0)
+            message = stderr.read().decode(errors="replace")
+            raise SystemExit(f"steward {' '.join(argv)} exited {proc.returncode}\n{message}")
+    return wall_ms, float(rusage.ru_maxrss)
+
+
+def run_once(praxis_home: Path, argv: list[str], metrics_file: Path) -> dict[str, float]:
+    """Run one steward command and measure it.
+
+    Returns:
+        wall_ms, rss_kib and syscalls of the run.
+    """
+    wall_ms, rss_kib = _spawn(praxis_home, argv, {"STEWARD_METRICS": str(metrics_file)})
+    with open(metrics_file, "rb") as f:
+        record = json.loads(f.read().splitlines()[-1])
+    return {"wall_ms": wall_ms, "rss_kib": rss_kib, "syscalls": float(sum(record.get("syscalls", {}).values()))}
+
+
+def probe(praxis_home: Path, repeat: int) -> dict[str, float]:
+    """Median wall time and peak RSS of the startup probe."""
+    runs = [_spawn(praxis_home, PROBE_ARGV, {}) for _ in range(max(repeat, 3))]
+    return {
+        "wall_ms": statistics.median(wall for wall, _ in runs),
+        "rss_kib": statistics.median(rss for _, rss in runs),
+    }
+
+
+def relative(measured: dict[str, float], startup: dict[str, float]) -> dict[str, float]:
+    """Express a command's metrics relative to the startup probe of the same run.
+
+    Returns:
+        wall_x (wall time as a multiple of startup), rss_extra_kib (peak
+        RSS above startup) and syscalls.
+    """
+    return {
+        "wall_x": measured["wall_ms"] / startup["wall_ms"],
+        "rss_extra_kib": max(0.0, measured["rss_kib"] - startup["rss_kib"]),
+        "syscalls": measured["syscalls"],
+    }
+
+
+def measure(
+    praxis_home: Path, workload: Workload, name: str, repeat: int, metrics_file: Path
+) -> tuple[dict[str, dict[str, float]], bool]:
+    """Run a benchmark cold then warm, repeat times each.
+
+    Returns:
+        Median metrics per state, and whether the page cache was dropped
+        for the cold runs.
+    """
+    samples: dict[str, list[dict[str, float]]] = {state: [] for state in STATES}
+    dropped = True
+    for _ in range(repeat):
+        dropped = clear_caches(workload.generated.path) and dropped
+        samples["cold"].append(run_once(praxis_home, BENCHMARKS[name](workload), metrics_file))
+    for _ in range(repeat):
+        samples["warm"].append(run_once(praxis_home, BENCHMARKS[name](workload), metrics_file))
+    medians = {
+        state: {metric: statistics.median(run[metric] for run in runs) for metric in runs[0]}
+        for state, runs in samples.items()
+    }
+    return medians, dropped
+
+
+def regressions(
+    measured: dict[str, float], baseline: dict[str, float], threshold: float, startup_ms: float
+) -> list[str]:
+    """Describe the relative metrics that exceed their baseline by more than threshold."""
+    found = []
+    for metric, value in measured.items():
+        base = baseline.get(metric)
+        if base is None or value <= base * (1 + threshold):
+            continue
+        if metric == "wall_x" and (value - base) * startup_ms < MIN_WALL_DELTA_MS:
+            continue
+        found.append(f"{metric} {value:.2f} vs {base:.2f} (+{(value / base - 1) * 100 if base else 100:.0f}%)")
+    return found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated workshop sizes in items.",
+    )
+    parser.add_argument("--benchmarks", help=f"Comma-separated subset of: {', '.join(BENCHMARKS)}.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark and state (median is kept).")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown over baseline (0.25 = 25%%).")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Local baseline JSON file.")
+    parser.add_argument("--write-baseline", action="store_true", help="Write measured medians as the new baseline.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the generated workshops.")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    names = args.benchmarks.split(",") if args.benchmarks else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    results: dict[str, dict[str, dict[str, dict[str, float]]]] = {}
+    failures: list[str] = []
+    page_cache_dropped = True
+
+    print(
+        f"{'size':>7} {'benchmark':<11} {'state':<5} {'wall ms':>9} {'x start':>8} {'base x':>7} "
+        f"{'rss MiB':>8} {'syscalls':>9}"
+    )
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            praxis_home = Path(tmpdir)
+            generated = build_workshop(praxis_home, size, args.seed)
+            workload = Workload(generated)
+            metrics_file = praxis_home / "metrics.jsonl"
+            startup = probe(praxis_home, args.repeat)
+            print(
+                f"{size:>7} {'startup':<11} {'-':<5} {startup['wall_ms']:>9.1f} {1:>8.2f} {'-':>7} "
+                f"{startup['rss_kib'] / 1024:>8.1f} {'-':>9}"
+            )
+            for name in names:
+                medians, dropped = measure(praxis_home, workload, name, args.repeat, metrics_file)
+                page_cache_dropped = page_cache_dropped and dropped
+                for state, measured in medians.items():
+                    normalized = relative(measured, startup)
+                    results.setdefault(str(size), {}).setdefault(name, {})[state] = {
+                        metric: round(value, 3) for metric, value in normalized.items()
+                    }
+                    base = baseline.get(str(size), {}).get(name, {}).get(state, {})
+                    base_x = f"{base['wall_x']:.2f}" if "wall_x" in base else "-"
+                    print(
+                        f"{size:>7} {name:<11} {state:<5} {measured['wall_ms']:>9.1f} {normalized['wall_x']:>8.2f} "
+                        f"{base_x:>7} {measured['rss_kib'] / 1024:>8.1f} {measured['syscalls']:>9.0f}"
+                    )
+                    failures += [
+                        f"{size} {name} {state}: {found}"
+                        for found in regressions(normalized, base, args.threshold, startup["wall_ms"])
+                    ]
+
+    if not page_cache_dropped:
+        print("Note: page cache not dropped for cold runs (needs root); only steward's caches were cleared")
+
+    if args.write_baseline:
+        merged = {size: {**baseline.get(size, {}), **benchmarks} for size, benchmarks in results.items()}
+        merged = {**baseline, **merged}
+        args.baseline.write_text(json.dumps(merged, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"No baseline at {args.baseline}; record one with --write-baseline to compare runs")
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""Memory benchmark: peak RSS of listing with pydantic Items vs records.
+
+Builds a synthetic workshop, then lists it in fresh interpreters, once
+through list_items (a pydantic Item per entry) and once through
+list_records (slotted ItemRecords). Each run is measured twice: cold,
+with no item index, and warm, answering from the index.
+
+Usage:
+    python benchmarks/list_memory.py              # 100k items
+    python benchmarks/list_memory.py --count 10000
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from steward.domain.models import Status
+from steward.domain.stages import Stage
+from steward.infrastructure.status_yaml import write_status
+
+# Runs in the child: prints "<baseline KiB> <peak KiB> <count> <seconds>"
+_CHILD = """
+import resource, sys, time
+from steward.application import list_service
+from steward.domain.models import Item, Status
+
+baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+result = getattr(list_service, sys.argv[1])()
+elapsed = time.perf_counter() - start
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(baseline, peak, len(result), elapsed)
+"""
+
+MODES = {"items": "list_items", "records": "list_records"}
+
+
+def build_workshop(praxis_home: Path, count: int) -> None:
+    """Create a workshop with count items spread over the board stages."""
+    workshop = praxis_home / "_workshop"
+    items_path = workshop / "9-items"
+    items_path.mkdir(parents=True)
+    stages = [Stage.BACKLOG, Stage.FORGE, Stage.REVIEW, Stage.SHELF, Stage.ARCHIVE]
+    base = datetime(2024, 1, 1)
+    for i in range(count):
+        created = base + timedelta(minutes=i)
+        item_path = items_path / f"{created:%Y-%m-%d-%H%M}__item-{i:06d}"
+        item_path.mkdir()
+        write_status(item_path, Status(stage=stages[i % len(stages)], created=created, updated=created))
+
+
+def measure(praxis_home: Path, function: str) -> tuple[int, int, int, float]:
+    """List the workshop in a fresh interpreter and return its measurements."""
+    env = dict(os.environ, PRAXIS_HOME=str(praxis_home))
+    proc = subprocess.run(
+        [sys.executable, "-c", _CHILD, function],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    baseline, peak, listed, elapsed = proc.stdout.split()
+    return int(baseline), int(peak), int(listed), float(elapsed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000, help="Number of items.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        praxis_home = Path(tmpdir)
+        start = time.perf_counter()
+        build_workshop(praxis_home, args.count)
+        print(f"Built {args.count:,} items in {time.perf_counter() - start:.1f} s")
+        index_path = praxis_home / "_workshop" / ".steward" / "index.db"
+
+        print(f"{'mode':<8} {'index':<5} {'peak MiB':>9} {'listing MiB':>12} {'seconds':>8}")
+        deltas: dict[tuple[str, str], int] = {}
+        for mode, function in MODES.items():
+            index_path.unlink(missing_ok=True)
+            for state in ("cold", "warm"):
+                baseline, peak, listed, elapsed = measure(praxis_home, function)
+                if listed != args.count:
+                    print(f"{mode}: listed {listed} items, expected {args.count}", file=sys.stderr)
+                    return 1
+                deltas[mode, state] = peak - baseline
+                print(f"{mode:<8} {state:<5} {peak / 1024:>9.1f} {(peak - baseline) / 1024:>12.1f} {elapsed:>8.3f}")
+
+        for state in ("cold", "warm"):
+            ratio = deltas["items", state] / max(deltas["records", state], 1)
+            print(f"{state}: records use {ratio:.1f}x less memory for the listing than pydantic Items")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
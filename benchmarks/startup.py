@@ -0,0 +1,142 @@
+"""Startup-time benchmark for the steward CLI.
+
+Runs each command under ``python -X importtime`` in a throwaway
+PRAXIS_HOME, sums the self time of every imported module, and compares
+the result against the committed budget in startup_budget.json. Exits
+non-zero if any command exceeds its budget or imports a forbidden
+module.
+
+Usage:
+    python benchmarks/startup.py                 # check against budget
+    python benchmarks/startup.py --repeat 10     # more samples (min is used)
+    python benchmarks/startup.py --write-budget  # record a new budget
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+BUDGET_FILE = Path(__file__).with_name("startup_budget.json")
+
+# Headroom applied to measured times when writing a new budget
+BUDGET_HEADROOM = 1.5
+
+
+def _run(args: list[str], home: Path, importtime: bool = False) -> subprocess.CompletedProcess[str]:
+    env = os.environ.copy()
+    env["PRAXIS_HOME"] = str(home)
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-m", "steward", *args]
+    return subprocess.run(cmd, capture_output=True, text=True, env=env, check=False)
+
+
+def _setup_empty(home: Path) -> None:
+    pass
+
+
+def _setup_workshop(home: Path) -> None:
+    _run(["init"], home)
+    (home / "_workshop" / "1-inbox" / "bench-idea.md").write_text("# Bench idea\n")
+    _run(["intake", "bench-idea.md"], home)
+
+
+def _setup_inbox(home: Path) -> None:
+    _run(["init"], home)
+    (home / "_workshop" / "1-inbox" / "fresh-idea.md").write_text("# Fresh idea\n")
+
+
+# Command name -> (argv, setup). The setup runs without -X importtime.
+COMMANDS: dict[str, tuple[list[str], Callable[[Path], None]]] = {
+    "version": (["--version"], _setup_empty),
+    "init": (["init"], _setup_empty),
+    "intake": (["intake", "fresh-idea.md"], _setup_inbox),
+    "stage": (["stage", "bench-idea", "backlog"], _setup_workshop),
+    "sync": (["sync"], _setup_workshop),
+    "list": (["list"], _setup_workshop),
+}
+
+
+def parse_importtime(stderr: str) -> tuple[int, set[str]]:
+    """Parse ``-X importtime`` output.
+
+    Returns:
+        Tuple of (total self time in microseconds, imported module names).
+    """
+    total_us = 0
+    modules: set[str] = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        total_us += int(parts[0])
+        modules.add(parts[2].strip())
+    return total_us, modules
+
+
+def measure(name: str, repeat: int) -> tuple[int, set[str]]:
+    """Measure the fastest import time of a command over several runs."""
+    argv, setup = COMMANDS[name]
+    best_us: int | None = None
+    modules: set[str] = set()
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            home = Path(tmpdir)
+            setup(home)
+            proc = _run(argv, home, importtime=True)
+            if proc.returncode != 0:
+                raise SystemExit(f"{name}: steward {' '.join(argv)} exited {proc.returncode}\n{proc.stderr}")
+            total_us, modules = parse_importtime(proc.stderr)
+            best_us = total_us if best_us is None else min(best_us, total_us)
+    assert best_us is not None
+    return best_us, modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per command (fastest is kept).")
+    parser.add_argument("--write-budget", action="store_true", help="Write measured times as the new budget.")
+    args = parser.parse_args()
+
+    budget = json.loads(BUDGET_FILE.read_text()) if BUDGET_FILE.exists() else {}
+    failures: list[str] = []
+    new_budget: dict[str, dict[str, object]] = {}
+
+    print(f"{'command':<10} {'import ms':>10} {'budget ms':>10}  modules")
+    for name in COMMANDS:
+        total_us, modules = measure(name, args.repeat)
+        entry = budget.get(name, {})
+        max_ms = entry.get("max_import_ms")
+        forbidden = sorted(mod for mod in modules if mod.split(".")[0] in set(entry.get("forbidden_modules", [])))
+        print(f"{name:<10} {total_us / 1000:>10.1f} {max_ms if max_ms is not None else '-':>10}  {len(modules)}")
+
+        if max_ms is not None and total_us / 1000 > max_ms:
+            failures.append(f"{name}: import time {total_us / 1000:.1f} ms exceeds budget {max_ms} ms")
+        if forbidden:
+            failures.append(f"{name}: imports forbidden modules: {', '.join(forbidden)}")
+
+        new_budget[name] = {
+            "max_import_ms": round(total_us / 1000 * BUDGET_HEADROOM),
+            "forbidden_modules": entry.get("forbidden_modules", []),
+        }
+
+    if args.write_budget:
+        BUDGET_FILE.write_text(json.dumps(new_budget, indent=2) + "\n")
+        print(f"Budget written to {BUDGET_FILE}")
+        return 0
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
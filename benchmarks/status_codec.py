@@ -0,0 +1,107 @@
+"""Micro-benchmark: status codec fast path vs PyYAML.
+
+Writes N status.yaml files with both encoders, checks that the outputs
+are byte-identical, then times reading them back with
+yaml.safe_load and with decode_status.
+
+Usage:
+    python benchmarks/status_codec.py            # 100k files
+    python benchmarks/status_codec.py --count 10000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import yaml
+
+from steward.domain.stages import Stage
+from steward.infrastructure.status_codec import decode_status, encode_status
+
+
+def _yaml_encode(stage: str, created: datetime, updated: datetime) -> str:
+    data = {"stage": stage, "created": created.isoformat(), "updated": updated.isoformat()}
+    return yaml.dump(data, default_flow_style=False, sort_keys=False)
+
+
+def _samples(count: int) -> list[tuple[str, datetime, datetime]]:
+    rng = random.Random(42)
+    stages = [stage.value for stage in Stage]
+    base = datetime(2024, 1, 1)
+    samples = []
+    for _ in range(count):
+        microseconds = rng.choice([0, rng.randrange(1, 10**6)])
+        created = base + timedelta(seconds=rng.randrange(60 * 60 * 24 * 365), microseconds=microseconds)
+        updated = created + timedelta(seconds=rng.randrange(60 * 60 * 24 * 30))
+        samples.append((rng.choice(stages), created, updated))
+    return samples
+
+
+def _time(label: str, func: Callable[[], None], count: int) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.3f} s  ({count / elapsed:>10,.0f} files/s)")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000, help="Number of status files.")
+    args = parser.parse_args()
+
+    samples = _samples(args.count)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        paths = [root / f"{i:06d}.yaml" for i in range(args.count)]
+
+        print(f"Encoding {args.count:,} status files")
+
+        def write_yaml() -> None:
+            for path, sample in zip(paths, samples, strict=True):
+                path.write_text(_yaml_encode(*sample))
+
+        def write_fast() -> None:
+            for path, sample in zip(paths, samples, strict=True):
+                path.write_text(encode_status(*sample))
+
+        yaml_write = _time("yaml.dump", write_yaml, args.count)
+        expected = [path.read_bytes() for path in paths]
+        fast_write = _time("encode_status", write_fast, args.count)
+        mismatches = sum(path.read_bytes() != want for path, want in zip(paths, expected, strict=True))
+        if mismatches:
+            print(f"FAIL {mismatches} files differ from yaml.dump output", file=sys.stderr)
+            return 1
+
+        print(f"Decoding {args.count:,} status files")
+
+        def read_yaml() -> None:
+            for path in paths:
+                yaml.safe_load(path.read_text())
+
+        def read_fast() -> None:
+            for path in paths:
+                decode_status(path.read_text())
+
+        yaml_read = _time("yaml.safe_load", read_yaml, args.count)
+        if hasattr(yaml, "CSafeLoader"):
+
+            def read_libyaml() -> None:
+                for path in paths:
+                    yaml.load(path.read_text(), Loader=yaml.CSafeLoader)
+
+            _time("yaml.load (CSafeLoader)", read_libyaml, args.count)
+        fast_read = _time("decode_status", read_fast, args.count)
+
+        speedup = f"write {yaml_write / fast_write:.1f}x, read {yaml_read / fast_read:.1f}x"
+        print(f"Speedup: {speedup} (byte-identical output)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""Synthetic workshop generator for benchmarks.
+
+Builds a workshop that looks like a long-lived real one: most items are
+archived or waiting in the backlog, a few are in flight, and each item
+holds a nucleus plus, for some, drafts and research handoffs of
+realistic (log-normal) sizes. Status files are written in the canonical
+format and every item is linked into its stage folder, so the result is
+in sync and needs no repair. Output is reproducible for a given seed.
+
+Usage:
+    python benchmarks/workshop_gen.py /tmp/bench-home --count 10000
+    python benchmarks/workshop_gen.py /tmp/bench-home --count 100000 --seed 7
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from steward.application.init_service import WORKSHOP_DIRS
+from steward.domain.stages import Stage, get_stage_path
+from steward.infrastructure.status_codec import STATUS_FILENAME, encode_status
+
+# Share of items per stage
+STAGE_MIX = {
+    Stage.INTAKE: 0.08,
+    Stage.BACKLOG: 0.22,
+    Stage.FORGE: 0.06,
+    Stage.REVIEW: 0.04,
+    Stage.SHELF: 0.08,
+    Stage.HANDOFF: 0.05,
+    Stage.ARCHIVE: 0.42,
+    Stage.TRASH: 0.05,
+}
+
+# File name -> (chance an item has it, median bytes); sizes are log-normal
+ITEM_FILES = {
+    "nucleus.md": (1.0, 1200),
+    "draft.md": (0.35, 3500),
+    "research-handoff.md": (0.12, 9000),
+}
+SIZE_SIGMA = 0.9
+MAX_FILE_BYTES = 512 * 1024
+
+# Vocabulary for slugs and note text
+_VOCABULARY = """
+api auth backlog cache client config deploy design docs error event flow gap handler index
+intake latency limit link migration model network parser pipeline queue rate refactor
+release retry review schema search service session shard spec stage storage symlink sync
+task timeout token trace upgrade user validation watcher workflow workshop yaml
+"""
+_WORDS = _VOCABULARY.split()
+
+
+@dataclass
+class GeneratedWorkshop:
+    """What was generated: the workshop path and item IDs per stage."""
+
+    path: Path
+    items: dict[Stage, list[str]] = field(default_factory=dict)
+    bytes_written: int = 0
+
+    @property
+    def count(self) -> int:
+        return sum(len(ids) for ids in self.items.values())
+
+
+def _corpus(rng: random.Random, size: int) -> str:
+    words: list[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(_WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+
+def build_workshop(praxis_home: Path, count: int, seed: int = 0) -> GeneratedWorkshop:
+    """Create a workshop with count items under praxis_home/_workshop."""
+    rng = random.Random(seed)
+    workshop = praxis_home / "_workshop"
+    for directory in WORKSHOP_DIRS:
+        (workshop / directory).mkdir(parents=True, exist_ok=True)
+    items_path = workshop / "9-items"
+    folders = {stage: workshop / get_stage_path(stage) for stage in Stage if stage is not Stage.INBOX}
+    prefixes = {stage: os.path.relpath(items_path, folder) for stage, folder in folders.items()}
+
+    # File contents are slices of one shared corpus, so generation is I/O bound
+    corpus = _corpus(rng, 2 * MAX_FILE_BYTES)
+    stages = list(STAGE_MIX)
+    weights = list(STAGE_MIX.values())
+    generated = GeneratedWorkshop(workshop, {stage: [] for stage in stages})
+    start = datetime(2024, 1, 1)
+    span_minutes = 2 * 365 * 24 * 60
+
+    for i in range(count):
+        stage = rng.choices(stages, weights)[0]
+        created = start + timedelta(minutes=span_minutes * i // max(count, 1))
+        updated = created + timedelta(hours=rng.randint(0, 24 * 90))
+        slug = f"{rng.choice(_WORDS)}-{rng.choice(_WORDS)}-{i:06d}"
+        item_id = f"{created:%Y-%m-%d-%H%M}__{slug}"
+        item_path = items_path / item_id
+        item_path.mkdir()
+
+        (item_path / STATUS_FILENAME).write_text(encode_status(stage.value, created, updated))
+        for name, (chance, median) in ITEM_FILES.items():
+            if rng.random() >= chance:
+                continue
+            size = min(MAX_FILE_BYTES, int(rng.lognormvariate(math.log(median), SIZE_SIGMA)))
+            offset = rng.randrange(len(corpus) - size)
+            (item_path / name).write_text(corpus[offset : offset + size])
+            generated.bytes_written += size
+
+        os.symlink(f"{prefixes[stage]}/{item_id}", folders[stage] / slug)
+        generated.items[stage].append(item_id)
+
+    return generated
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("praxis_home", type=Path, help="Directory to create _workshop/ in (must not have one).")
+    parser.add_argument("--count", type=int, default=10_000, help="Number of items.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    args = parser.parse_args()
+
+    if (args.praxis_home / "_workshop").exists():
+        print(f"{args.praxis_home / '_workshop'} already exists", file=sys.stderr)
+        return 1
+    args.praxis_home.mkdir(parents=True, exist_ok=True)
+    began = time.perf_counter()
+    generated = build_workshop(args.praxis_home, args.count, args.seed)
+    elapsed = time.perf_counter() - began
+    print(f"Built {generated.count:,} items ({generated.bytes_written / 1e6:.1f} MB of notes) in {elapsed:.1f} s")
+    for stage, ids in generated.items.items():
+        print(f"  {stage.value:<8} {len(ids):>8,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""Lazy re-exports for package ``__init__`` modules.
+
+Packages list their public names and the module each one lives in; the
+module is only imported when the name is first accessed. This keeps
+``import steward.<layer>`` cheap for commands that never touch pydantic,
+PyYAML or Rich.
+"""
+
+import sys
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+
+def lazy_getattr(package: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """Build a module-level ``__getattr__`` (PEP 562) for a package.
+
+    Args:
+        package: The package's ``__name__``.
+        exports: Mapping of public name to the module defining it.
+
+    Returns:
+        A ``__getattr__`` function that imports on first access and
+        caches the result in the package namespace.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module_name), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -1,15 +1,37 @@
-"""Application layer - use cases and orchestration."""
+"""Application layer - use cases and orchestration.
 
-from steward.application.init_service import init_workshop
-from steward.application.intake_service import intake_item
-from steward.application.list_service import list_items
-from steward.application.stage_service import stage_item
-from steward.application.sync_service import sync_workshop
+Services are imported lazily on first access; see steward._lazy.
+"""
+
+from typing import TYPE_CHECKING
+
+from steward._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from steward.application.init_service import init_workshop
+    from steward.application.intake_service import intake_item
+    from steward.application.list_service import iter_records, list_items, list_records
+    from steward.application.stage_service import stage_item
+    from steward.application.sync_service import sync_workshop
+
+_EXPORTS = {
+    "init_workshop": "steward.application.init_service",
+    "intake_item": "steward.application.intake_service",
+    "iter_records": "steward.application.list_service",
+    "list_items": "steward.application.list_service",
+    "list_records": "steward.application.list_service",
+    "stage_item": "steward.application.stage_service",
+    "sync_workshop": "steward.application.sync_service",
+}
+
+__getattr__ = lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "init_workshop",
     "intake_item",
+    "iter_records",
     "list_items",
+    "list_records",
     "stage_item",
     "sync_workshop",
 ]
@@ -0,0 +1,190 @@
+"""Flow service - lead time, time in stage, throughput and WIP aging.
+
+Status files only record when an item was created and when it last
+changed stage, so every figure here is derived from (stage, created,
+updated) per item:
+
+- lead time: updated - created of finished items (handoff, archive)
+- time in stage: now - updated of items still in progress
+- throughput: finished items per period, by the time they finished
+- cumulative flow: per stage, how many of the items now in it had
+  entered it by the end of each period (earlier stages an item passed
+  through are not recorded, so they are not counted)
+- WIP aging: items in progress bucketed by age (now - created)
+
+Timestamps are loaded into columnar arrays (one array per stage) in a
+single parallel, index-backed scan. Counting is done on sorted columns
+with binary search, so each series costs O(periods log n) after one
+sort per column rather than a pass over every item per period.
+"""
+
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+
+from steward.application.list_service import iter_records
+from steward.application.metrics_service import percentile
+from steward.domain.stages import Stage
+
+DAY = 86_400.0
+
+# Stages whose items are finished; trashed items are dropped, not finished
+DONE_STAGES = (Stage.HANDOFF, Stage.ARCHIVE)
+
+# Stages whose items are still in progress
+WIP_STAGES = (Stage.INTAKE, Stage.BACKLOG, Stage.FORGE, Stage.REVIEW, Stage.SHELF)
+
+# Upper bounds (days) of the WIP aging buckets; a last, open bucket holds older items
+AGING_BUCKETS_DAYS = (1, 7, 30, 90, 365)
+
+# Percentiles reported for every distribution
+PERCENTILES = (50, 85, 95)
+
+
+@dataclass
+class FlowColumns:
+    """Item timestamps (epoch seconds) as one created and one updated column per stage."""
+
+    created: dict[Stage, array[float]]
+    updated: dict[Stage, array[float]]
+
+    @property
+    def count(self) -> int:
+        return sum(len(column) for column in self.created.values())
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """Percentiles of a duration, in days."""
+
+    count: int
+    p50: float
+    p85: float
+    p95: float
+    max: float
+
+
+@dataclass(frozen=True)
+class FlowReport:
+    """Flow metrics of a workshop at one moment.
+
+    ``period_ends`` are the epoch times closing each period, oldest
+    first; ``throughput`` and the ``cumulative_flow`` series have one
+    value per period. ``aging`` has one count per AGING_BUCKETS_DAYS
+    bound plus one for older items.
+    """
+
+    now: float
+    items: int
+    stage_counts: dict[str, int]
+    lead_time: Distribution
+    time_in_stage: dict[str, Distribution]
+    period_days: int
+    period_ends: list[float]
+    throughput: list[int]
+    arrivals: list[int]
+    cumulative_flow: dict[str, list[int]]
+    aging: dict[str, tuple[int, ...]]
+
+
+def load_flow_columns(jobs: int | None = None) -> FlowColumns:
+    """Read every item's stage and timestamps into columnar arrays.
+
+    Uses the item index (refreshed in parallel, see iter_records), so
+    only status files that changed since the last scan are parsed.
+
+    Args:
+        jobs: Worker count for reading status files (default: $STEWARD_JOBS).
+    """
+    created: dict[Stage, array[float]] = {stage: array("d") for stage in Stage}
+    updated: dict[Stage, array[float]] = {stage: array("d") for stage in Stage}
+    by_value = {stage.value: stage for stage in Stage}
+    parse = datetime.fromisoformat
+    for record in iter_records(jobs=jobs):
+        stage = by_value[record.stage]
+        created[stage].append(parse(record.created).timestamp())
+        updated[stage].append(parse(record.updated).timestamp())
+    return FlowColumns(created, updated)
+
+
+def distribution(days: list[float]) -> Distribution:
+    """Summarise durations in days (sorted in place)."""
+    days.sort()
+    p50, p85, p95 = (percentile(days, q) for q in PERCENTILES)
+    return Distribution(len(days), p50, p85, p95, days[-1] if days else 0.0)
+
+
+def count_until(sorted_times: list[float], ends: list[float]) -> list[int]:
+    """Count the times at or before each end (ends ascending)."""
+    return [bisect_right(sorted_times, end) for end in ends]
+
+
+def count_between(sorted_times: list[float], bounds: list[float]) -> list[int]:
+    """Count the times in each [bounds[i], bounds[i + 1]) interval."""
+    positions = [bisect_left(sorted_times, bound) for bound in bounds]
+    return [high - low for low, high in zip(positions, positions[1:], strict=False)]
+
+
+def compute_flow(columns: FlowColumns, now: float, periods: int = 12, period_days: int = 7) -> FlowReport:
+    """Compute flow metrics from loaded columns.
+
+    Args:
+        columns: Item timestamps, see load_flow_columns.
+        now: Epoch time the report is made at.
+        periods: Number of periods in the throughput and cumulative flow series.
+        period_days: Length of a period in days.
+    """
+    period = period_days * DAY
+    period_ends = [now - (periods - 1 - i) * period for i in range(periods)]
+    bounds = [period_ends[0] - period, *period_ends]
+
+    lead_days: list[float] = []
+    done_times: list[float] = []
+    for stage in DONE_STAGES:
+        finished = columns.updated[stage]
+        lead_days += [max(0.0, (u - c) / DAY) for c, u in zip(columns.created[stage], finished, strict=True)]
+        done_times += finished
+    done_times.sort()
+
+    time_in_stage = {}
+    aging = {}
+    age_bounds = [now - bound * DAY for bound in reversed(AGING_BUCKETS_DAYS)]
+    for stage in WIP_STAGES:
+        time_in_stage[stage.value] = distribution([max(0.0, (now - u) / DAY) for u in columns.updated[stage]])
+        # Bucket by creation time: newest bucket (< 1 day old) is the last interval
+        oldest_first = count_between(sorted(columns.created[stage]), [float("-inf"), *age_bounds, float("inf")])
+        aging[stage.value] = tuple(reversed(oldest_first))
+
+    all_created = sorted(t for column in columns.created.values() for t in column)
+    cumulative_flow = {
+        stage.value: count_until(sorted(columns.updated[stage]), period_ends)
+        for stage in Stage
+        if stage is not Stage.INBOX
+    }
+
+    return FlowReport(
+        now=now,
+        items=columns.count,
+        stage_counts={stage.value: len(columns.created[stage]) for stage in Stage if stage is not Stage.INBOX},
+        lead_time=distribution(lead_days),
+        time_in_stage=time_in_stage,
+        period_days=period_days,
+        period_ends=period_ends,
+        throughput=count_between(done_times, bounds),
+        arrivals=count_between(all_created, bounds),
+        cumulative_flow=cumulative_flow,
+        aging=aging,
+    )
+
+
+def flow_report(periods: int = 12, period_days: int = 7, jobs: int | None = None) -> FlowReport:
+    """Compute flow metrics for the workshop as of now.
+
+    Args:
+        periods: Number of periods in the throughput and cumulative flow series.
+        period_days: Length of a period in days.
+        jobs: Worker count for reading status files (default: $STEWARD_JOBS).
+    """
+    return compute_flow(load_flow_columns(jobs), time.time(), periods, period_days)
@@ -5,6 +5,7 @@ from pathlib import Path
 from steward.domain.errors import WorkshopAlreadyExistsError
 from steward.infrastructure.env import get_praxis_home, get_workshop_path
 from steward.infrastructure.filesystem import ensure_directory
+from steward.infrastructure.tracing import Phase, phase
 
 # Directories to create
 WORKSHOP_DIRS = [
@@ -51,8 +52,9 @@ def init_workshop() -> Path:
         )
 
     # Create all directories
-    for dir_path in WORKSHOP_DIRS:
-        ensure_directory(workshop_path / dir_path)
+    with phase(Phase.WRITE):
+        for dir_path in WORKSHOP_DIRS:
+            ensure_directory(workshop_path / dir_path)
 
     # Update .gitignore at PRAXIS_HOME level
     praxis_home = get_praxis_home()
@@ -1,48 +1,461 @@
 """Intake service - move or copy items from inbox to workshop."""
 
+import contextlib
+import glob
+import os
 import shutil
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from pathlib import Path
+from typing import Any
 
-from steward.domain.errors import ItemNotFoundError
+from steward.application.recovery_service import recover_workshop
+from steward.domain.errors import ItemNotFoundError, WorkshopError
 from steward.domain.models import Item, Status
 from steward.domain.stages import Stage, get_stage_path
+from steward.infrastructure.content_hash import ContentDigest, DuplicatePolicy, list_content
+from steward.infrastructure.copy_engine import CopyEngine, CopyStats, LinkMode
 from steward.infrastructure.env import get_workshop_path
-from steward.infrastructure.filesystem import create_symlink, ensure_directory
+from steward.infrastructure.filesystem import create_symlink, ensure_directory, replace_with_symlink
+from steward.infrastructure.hash_index import ITEM_METADATA, open_hash_index
+from steward.infrastructure.id_reservation import IdReserver
+from steward.infrastructure.item_index import open_index
+from steward.infrastructure.journal import Journal
+from steward.infrastructure.locking import exclusive_lock, hold_operation
+from steward.infrastructure.move_engine import ProgressCallback, find_interrupted_move, move_into
+from steward.infrastructure.scanner import resolve_jobs
+from steward.infrastructure.slug_resolver import load_slug_resolver, save_slug_resolver
 from steward.infrastructure.slugify import slugify
-from steward.infrastructure.status_yaml import write_status
+from steward.infrastructure.status_codec import STATUS_FILENAME
+from steward.infrastructure.status_yaml import read_status, write_statuses
+from steward.infrastructure.tracing import BYTES_COPIED, Phase, count, phase
 
 
-def generate_item_id(slug: str, timestamp: datetime | None = None) -> str:
-    """Generate an item ID in format YYYY-MM-DD-HHMM__slug."""
-    if timestamp is None:
-        timestamp = datetime.now()
-    date_part = timestamp.strftime("%Y-%m-%d-%H%M")
-    return f"{date_part}__{slug}"
+@dataclass
+class IntakeResult:
+    """Outcome of intaking one source.
+
+    ``error`` is set when the source could not be intaken. ``duplicate_of``
+    names the item that already held the source's content; depending on
+    the DuplicatePolicy, ``item`` is then a new item anyway (warn), None
+    (skip) or that existing item (link). Otherwise ``item`` is the new
+    item. ``source_linked`` is True when a linked inbox source was
+    replaced with a symlink to the existing item.
+    """
+
+    source: str
+    item: Item | None = None
+    stats: CopyStats = field(default_factory=CopyStats)
+    error: WorkshopError | None = None
+    # True when this run finished an earlier, interrupted move
+    resumed: bool = False
+    duplicate_of: str | None = None
+    source_linked: bool = False
+
+    @property
+    def bytes_copied(self) -> int:
+        """Bytes copied (or moved) into the item."""
+        return self.stats.bytes
+
+    @property
+    def intaken(self) -> bool:
+        """True if a new item was created for the source."""
+        return self.item is not None and self.item.id != self.duplicate_of
+
+
+@dataclass
+class _Intake:
+    """A source with its reserved item ID."""
+
+    result: IntakeResult
+    source_path: Path
+    item_id: str
+    # Content digest of the source, recorded for the new item
+    content: ContentDigest | None = None
+
+
+# (source, bytes done, bytes total) while a move falls back to copying
+IntakeProgress = Callable[[str, int, int], None]
 
 
 def find_unique_id(items_path: Path, base_slug: str, timestamp: datetime) -> str:
-    """Find a unique item ID, handling collisions."""
-    base_id = generate_item_id(base_slug, timestamp)
+    """Reserve a unique item ID, creating its (empty) directory.
+
+    Collisions are resolved by numbering the slug (slug-2, slug-3, ...);
+    see IdReserver. Reserve many IDs with one IdReserver instead.
+    """
+    return IdReserver(items_path).reserve(base_slug, timestamp)
+
+
+def resolve_source(source: str, inbox_path: Path) -> Path:
+    """Resolve a source path.
+
+    Checks, in order: the path as given (absolute or relative to cwd),
+    then a name in the inbox.
+
+    Raises:
+        ItemNotFoundError: If source doesn't exist.
+    """
+    source_path = Path(source)
+    if not source_path.exists():
+        source_path = inbox_path / source
+        if not source_path.exists():
+            raise ItemNotFoundError(f"not found: {source}")
+    return source_path
+
+
+def expand_sources(sources: Iterable[str], inbox_path: Path) -> list[str]:
+    """Expand glob patterns among sources.
+
+    A pattern is matched against the working directory first, then the
+    inbox; inbox matches are returned as absolute paths, so they cannot
+    be mistaken for files of the same name in the working directory.
+    Patterns that match nothing, and plain names, are kept as given so
+    they are reported as not found.
+    """
+    expanded: list[str] = []
+    for source in sources:
+        if not glob.has_magic(source):
+            expanded.append(source)
+            continue
+        matches = sorted(glob.glob(source)) or sorted(glob.glob(str(inbox_path / source)))
+        expanded.extend(matches or [source])
+    return expanded
+
+
+def inbox_sources(inbox_path: Path) -> list[str]:
+    """Absolute paths of every entry in the inbox, skipping hidden files."""
+    try:
+        return sorted(str(inbox_path / name) for name in os.listdir(inbox_path) if not name.startswith("."))
+    except FileNotFoundError:
+        return []
+
+
+def _transfer(
+    workshop_path: Path,
+    source_path: Path,
+    item_path: Path,
+    move: bool,
+    link_mode: LinkMode,
+    progress: ProgressCallback | None = None,
+    size: int | None = None,
+) -> CopyStats:
+    """Copy or move a source into its item directory.
+
+    Directories have their contents placed in item_path (not the folder
+    itself); files are placed inside item_path.
+
+    Args:
+        size: Total size of the source, if already known (see move_into).
+
+    Returns:
+        What was transferred, and how.
+    """
+    if not move:
+        return CopyEngine(link_mode).copy(source_path, item_path)
+    return move_into(workshop_path, source_path, item_path, progress, size)
+
+
+def intake_items(
+    sources: Iterable[str],
+    move: bool = False,
+    jobs: int | None = None,
+    custom_slug: str | None = None,
+    link_mode: LinkMode = LinkMode.AUTO,
+    progress: IntakeProgress | None = None,
+    on_duplicate: DuplicatePolicy = DuplicatePolicy.WARN,
+) -> list[IntakeResult]:
+    """Intake many sources in one run.
+
+    Sources are resolved up front and each gets its item directory
+    reserved atomically (see IdReserver), so sources with the same name
+    get distinct IDs, even when other intakes run at the same time,
+    without probing 9-items/ once per candidate. Copies of separate
+    sources run in a worker pool without holding the workshop lock; status
+    files, the index, the slug resolver and the intake symlinks are then
+    updated once for the batch, under the exclusive lock. The reserved
+    directories are journaled before the copies start, so that recovery
+    removes them if the run dies first (see release_reservations).
+
+    A move that was interrupted (see move_engine) is resumed into the
+    item it had already started, rather than into a new one.
+
+    Sources are hashed first (see HashIndex.digest_many), and a source
+    whose content is already an item, or matches an earlier source of
+    the batch, is handled according to on_duplicate.
+
+    Args:
+        sources: Paths to files/folders (absolute, relative, or names in inbox).
+        move: If True, move the sources. If False (default), copy them.
+        jobs: Worker count for hashing and copies (default: $STEWARD_JOBS).
+        custom_slug: Slug to use instead of deriving one from the source
+            name (for a single source).
+        link_mode: How copies place file data (see CopyEngine); ignored
+            when moving.
+        progress: Called with (source, bytes done, bytes total) while a
+            move across filesystems copies data.
+        on_duplicate: What to do with sources whose content is already
+            in the workshop (see DuplicatePolicy).
+
+    Returns:
+        One IntakeResult per source, in input order.
+    """
+    workshop_path = get_workshop_path()
+    inbox_path = workshop_path / "1-inbox"
+    items_path = workshop_path / "9-items"
+
+    results: list[IntakeResult] = []
+    fresh: list[tuple[IntakeResult, Path]] = []
+    pending: list[_Intake] = []
+    now = datetime.now()
+    ensure_directory(items_path)
+    reserver = IdReserver(items_path)
+    claimed: set[Path] = set()
+    for source in sources:
+        result = IntakeResult(source=source)
+        results.append(result)
+        try:
+            source_path = resolve_source(source, inbox_path)
+        except ItemNotFoundError as e:
+            result.error = e
+            continue
+        if source_path.resolve() in claimed:
+            result.error = WorkshopError(f"listed more than once: {source}")
+            continue
+        claimed.add(source_path.resolve())
+        interrupted = find_interrupted_move(workshop_path, source_path) if move else None
+        if interrupted is not None and (items_path / interrupted.item_id).is_dir():
+            result.resumed = True
+            pending.append(_Intake(result, source_path, interrupted.item_id))
+            continue
+        fresh.append((result, source_path))
+
+    # Content already in the workshop: an item from an earlier run, or an
+    # earlier source of this batch (by the ID reserved for it)
+    contents = _source_contents(workshop_path, [source_path for _, source_path in fresh], jobs)
+    reserved: dict[bytes, str] = {}
+    reused: list[tuple[IntakeResult, Path]] = []
+    for (result, source_path), (content, existing) in zip(fresh, contents, strict=True):
+        if content is not None and content.size:
+            result.duplicate_of = existing or reserved.get(content.digest)
+        if result.duplicate_of is not None and on_duplicate is not DuplicatePolicy.WARN:
+            reused.append((result, source_path))
+            continue
+        slug = custom_slug if custom_slug else slugify(source_path.name)
+        intake = _Intake(result, source_path, reserver.reserve(slug, now), content)
+        pending.append(intake)
+        if content is not None and content.size:
+            reserved.setdefault(content.digest, intake.item_id)
 
-    # Check if ID already exists
-    if not (items_path / base_id).exists():
-        return base_id
+    if not pending:
+        if on_duplicate is DuplicatePolicy.LINK:
+            _link_duplicates(workshop_path, reused, move)
+        return results
 
-    # Handle collision by appending suffix
-    suffix = 2
-    while True:
-        suffixed_slug = f"{base_slug}-{suffix}"
-        item_id = generate_item_id(suffixed_slug, timestamp)
-        if not (items_path / item_id).exists():
-            return item_id
-        suffix += 1
+    with hold_operation(workshop_path) as op_id:
+        journal = Journal(workshop_path)
+        # Recorded before anything is copied, so that recovery removes the
+        # directories if this run dies before registering them
+        reservation = journal.begin(
+            "reserve",
+            [{"item_id": intake.item_id, "move": move} for intake in pending if not intake.result.resumed],
+            op_id=op_id,
+        )
+        done = _transfer_all(workshop_path, pending, move, jobs, link_mode, progress)
+
+        with phase(Phase.VALIDATE):
+            status = Status(stage=Stage.INTAKE, created=now, updated=now)
+        with exclusive_lock(workshop_path):
+            recover_workshop(workshop_path)
+            if done:
+                entry = journal.begin(
+                    "intake", [{"item_id": intake.item_id, "created": now.isoformat()} for intake in done]
+                )
+                _register_intakes(workshop_path, [intake.item_id for intake in done], status)
+                journal.end(entry)
+            journal.end(reservation)
+
+    with phase(Phase.VALIDATE):
+        for intake in done:
+            item_path = items_path / intake.item_id
+            final_slug = intake.item_id.split("__", 1)[1]
+            intake.result.item = Item(id=intake.item_id, slug=final_slug, status=status, path=str(item_path))
+
+    with open_hash_index(workshop_path) as hashes:
+        # A resumed item holds what earlier runs moved too; let the next refresh re-read it
+        hashes.forget_items(intake.item_id for intake in done if intake.result.resumed)
+        hashes.record_items((intake.item_id, intake.content) for intake in done if intake.content is not None)
+    if on_duplicate is DuplicatePolicy.LINK:
+        _link_duplicates(workshop_path, reused, move)
+    return results
+
+
+def _transfer_all(
+    workshop_path: Path,
+    pending: list[_Intake],
+    move: bool,
+    jobs: int | None,
+    link_mode: LinkMode,
+    progress: IntakeProgress | None,
+) -> list[_Intake]:
+    """Copy or move every pending source into its item, in a worker pool.
+
+    Returns:
+        The intakes whose transfer finished; the others have an error set.
+    """
+    items_path = workshop_path / "9-items"
+    workers = min(resolve_jobs(jobs), len(pending))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _transfer,
+                workshop_path,
+                intake.source_path,
+                items_path / intake.item_id,
+                move,
+                link_mode,
+                partial(progress, intake.result.source) if progress is not None else None,
+                intake.content.size if intake.content is not None else None,
+            )
+            for intake in pending
+        ]
+        done: list[_Intake] = []
+        for intake, future in zip(pending, futures, strict=True):
+            try:
+                intake.result.stats = future.result()
+                count(BYTES_COPIED, intake.result.stats.bytes)
+            except OSError as e:
+                if move:
+                    # Part of the source may already live in the item, so
+                    # keep it for the next run to resume into
+                    intake.result.error = WorkshopError(
+                        f"could not move {intake.result.source}: {e} (run the intake again to resume)"
+                    )
+                    continue
+                intake.result.error = WorkshopError(f"could not intake {intake.result.source}: {e}")
+                shutil.rmtree(items_path / intake.item_id, ignore_errors=True)
+                continue
+            done.append(intake)
+    return done
+
+
+def _source_contents(
+    workshop_path: Path, source_paths: list[Path], jobs: int | None
+) -> list[tuple[ContentDigest | None, str | None]]:
+    """Digest sources and find the items already holding their content.
+
+    Returns:
+        Per source, its digest (None if it could not be read) and the
+        first item with the same content, if any. Empty sources are
+        never duplicates.
+    """
+    if not source_paths:
+        return []
+    with open_hash_index(workshop_path) as hashes:
+        contents = hashes.digest_many(source_paths, jobs=jobs)
+        if any(content is not None and content.size for content in contents):
+            hashes.refresh_items(jobs)
+        return [
+            (content, hashes.find_item(content, jobs) if content is not None and content.size else None)
+            for content in contents
+        ]
+
+
+def _link_duplicates(workshop_path: Path, duplicates: list[tuple[IntakeResult, Path]], move: bool) -> None:
+    """Point duplicate sources at the items holding their content.
+
+    A moved source is removed, since the workshop already has its content.
+    A copied source in the inbox is replaced with a symlink to the item's
+    copy of it (the item's file, for a file, otherwise the item directory).
+    A copied source anywhere else belongs to the caller and is left alone.
+    """
+    items_path = workshop_path / "9-items"
+    inbox_path = (workshop_path / "1-inbox").resolve()
+    for result, source_path in duplicates:
+        assert result.duplicate_of is not None
+        item_path = items_path / result.duplicate_of
+        try:
+            status = read_status(item_path)
+            if move:
+                if source_path.is_dir() and not source_path.is_symlink():
+                    shutil.rmtree(source_path)
+                else:
+                    source_path.unlink()
+            elif source_path.absolute().parent.resolve().is_relative_to(inbox_path):
+                replace_with_symlink(_linked_copy(item_path, source_path), source_path)
+                result.source_linked = True
+        except (OSError, ValueError) as e:
+            result.error = WorkshopError(f"could not link {result.source} to {result.duplicate_of}: {e}")
+            continue
+        slug = result.duplicate_of.split("__", 1)[1]
+        result.item = Item(id=result.duplicate_of, slug=slug, status=status, path=str(item_path))
+
+
+def _linked_copy(item_path: Path, source_path: Path) -> Path:
+    """Return the item's copy of a duplicate source, for linking to it."""
+    if not source_path.is_dir():
+        files = list_content(item_path, ITEM_METADATA)
+        if len(files) == 1:
+            return Path(files[0].path)
+    return item_path
+
+
+def _register_intakes(workshop_path: Path, item_ids: list[str], status: Status) -> None:
+    """Create status.yaml files, then index, resolve and link the items as one batch."""
+    items_path = workshop_path / "9-items"
+    intake_stage_path = workshop_path / get_stage_path(Stage.INTAKE)
+    resolver = load_slug_resolver(workshop_path)
+    for item_id in item_ids:
+        resolver.add(item_id)
+    save_slug_resolver(workshop_path, resolver)
+    write_statuses((items_path / item_id, status) for item_id in item_ids)
+    with open_index(workshop_path) as index:
+        index.upsert_many((item_id, status) for item_id in item_ids)
+    for item_id in item_ids:
+        create_symlink(items_path / item_id, intake_stage_path / item_id.split("__", 1)[1])
+
+
+def release_reservations(changes: list[dict[str, Any]]) -> None:
+    """Remove item directories reserved by an intake that died.
+
+    Directories that got a status.yaml are kept; so are the contents of
+    a move's directory, which the next intake of the same source resumes
+    into. Everything else was a copy in progress.
+    """
+    items_path = get_workshop_path() / "9-items"
+    for change in changes:
+        item_path = items_path / change["item_id"]
+        if (item_path / STATUS_FILENAME).exists():
+            continue
+        if change.get("move"):
+            with contextlib.suppress(OSError):
+                item_path.rmdir()
+        else:
+            shutil.rmtree(item_path, ignore_errors=True)
+
+
+def replay_intakes(changes: list[dict[str, Any]]) -> None:
+    """Re-register a journaled batch of intakes whose data is in place.
+
+    Items whose directory no longer exists are skipped; registering an
+    item twice rewrites the same status and link.
+    """
+    workshop_path = get_workshop_path()
+    item_ids = [change["item_id"] for change in changes if (workshop_path / "9-items" / change["item_id"]).is_dir()]
+    if not item_ids:
+        return
+    created = datetime.fromisoformat(changes[0]["created"])
+    _register_intakes(workshop_path, item_ids, Status(stage=Stage.INTAKE, created=created, updated=created))
 
 
 def intake_item(
     source: str,
     custom_slug: str | None = None,
     move: bool = False,
+    link_mode: LinkMode = LinkMode.AUTO,
 ) -> Item:
     """Intake an item from any path to workshop.
 
@@ -50,6 +463,7 @@ def intake_item(
         source: Path to file/folder (absolute, relative, or name in inbox).
         custom_slug: Optional custom slug (otherwise derived from source name).
         move: If True, move the source. If False (default), copy it.
+        link_mode: How copies place file data (see CopyEngine).
 
     Returns:
         The created Item.
@@ -57,66 +471,35 @@ def intake_item(
     Raises:
         ItemNotFoundError: If source doesn't exist.
     """
-    workshop_path = get_workshop_path()
-    inbox_path = workshop_path / "1-inbox"
-    items_path = workshop_path / "9-items"
-    intake_stage_path = workshop_path / get_stage_path(Stage.INTAKE)
+    item = intake_source(source, custom_slug, move, link_mode).item
+    assert item is not None
+    return item
 
-    # Resolve source path - check in order:
-    # 1. As given (absolute or relative to cwd)
-    # 2. In inbox
-    source_path = Path(source)
-    if not source_path.exists():
-        # Try inbox
-        source_path = inbox_path / source
-        if not source_path.exists():
-            raise ItemNotFoundError(f"not found: {source}")
-
-    # Generate slug from the source filename/foldername
-    slug = custom_slug if custom_slug else slugify(source_path.name)
-
-    # Generate unique item ID
-    now = datetime.now()
-    item_id = find_unique_id(items_path, slug, now)
-
-    # Determine final slug from ID (in case of collision)
-    final_slug = item_id.split("__", 1)[1]
-
-    # Create item directory
-    item_path = items_path / item_id
-    ensure_directory(item_path)
-
-    # Copy or move source into item directory
-    # For directories: copy CONTENTS into item_path (not the folder itself)
-    # For files: copy the file into item_path
-    if source_path.is_dir():
-        if move:
-            # Move directory contents
-            for child in source_path.iterdir():
-                child.rename(item_path / child.name)
-            # Remove empty source directory
-            source_path.rmdir()
-        else:
-            # Copy directory contents (not the directory itself)
-            shutil.copytree(source_path, item_path, dirs_exist_ok=True)
-    else:
-        dest_path = item_path / source_path.name
-        if move:
-            source_path.rename(dest_path)
-        else:
-            shutil.copy2(source_path, dest_path)
 
-    # Create status.yaml
-    status = Status(stage=Stage.INTAKE, created=now, updated=now)
-    write_status(item_path, status)
+def intake_source(
+    source: str,
+    custom_slug: str | None = None,
+    move: bool = False,
+    link_mode: LinkMode = LinkMode.AUTO,
+    progress: IntakeProgress | None = None,
+    on_duplicate: DuplicatePolicy = DuplicatePolicy.WARN,
+) -> IntakeResult:
+    """Intake a single source, like intake_item, returning transfer stats too.
 
-    # Create symlink in intake stage
-    symlink_path = intake_stage_path / final_slug
-    create_symlink(item_path, symlink_path)
+    With DuplicatePolicy.SKIP, the result has no item when the source's
+    content is already in the workshop.
 
-    return Item(
-        id=item_id,
-        slug=final_slug,
-        status=status,
-        path=str(item_path),
+    Raises:
+        ItemNotFoundError: If source doesn't exist.
+    """
+    (result,) = intake_items(
+        [source],
+        move=move,
+        custom_slug=custom_slug,
+        link_mode=link_mode,
+        progress=progress,
+        on_duplicate=on_duplicate,
     )
+    if result.error is not None:
+        raise result.error
+    return result
@@ -1,59 +1,97 @@
 """List service - enumerate items in workshop."""
 
-from steward.domain.models import Item
+from collections.abc import Generator
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from steward.domain.records import ItemRecord
 from steward.domain.stages import Stage
 from steward.infrastructure.env import get_workshop_path
-from steward.infrastructure.status_yaml import read_status
+from steward.infrastructure.item_index import open_index
+from steward.infrastructure.locking import shared_lock
 
+if TYPE_CHECKING:
+    from steward.domain.models import Item
 
-def list_items(stage_filter: str | None = None) -> list[Item]:
-    """List all items in the workshop.
+# Records read per hold of the shared workshop lock
+LOCK_BATCH = 256
+
+
+def iter_records(stage_filter: str | None = None, jobs: int | None = None) -> Generator[ItemRecord, None, None]:
+    """Stream the items in the workshop as lightweight records.
+
+    Records come out in item-ID order as the scan progresses, so the
+    first ones are available long before a large workshop has been read.
+    The item index is refreshed along the way. The scan runs in batches,
+    each under a shared workshop lock that is released before its
+    records are yielded, so a slow consumer (e.g. a pager) never holds up
+    writers. Close the iterator (or use contextlib.closing) when stopping
+    early; the rest of the workshop is then not read.
 
     Args:
         stage_filter: Optional stage name to filter by.
+        jobs: Worker count for reading status files (default: $STEWARD_JOBS).
 
     Returns:
-        List of Item objects.
-    """
-    workshop_path = get_workshop_path()
-    items_path = workshop_path / "9-items"
+        Generator of ItemRecord objects ordered by item ID.
 
-    if not items_path.exists():
-        return []
-
-    # Validate stage filter if provided
+    Raises:
+        ValueError: If stage_filter is not a valid stage.
+    """
+    # Validate stage filter up front rather than on first iteration
     filter_stage: Stage | None = None
     if stage_filter:
         filter_stage = Stage(stage_filter)
 
-    items: list[Item] = []
-    for item_dir in sorted(items_path.iterdir()):
-        if not item_dir.is_dir():
-            continue
+    return _iter_records(filter_stage.value if filter_stage else None, jobs)
+
+
+def _iter_records(stage: str | None, jobs: int | None) -> Generator[ItemRecord, None, None]:
+    workshop_path = get_workshop_path()
+    if not (workshop_path / "9-items").exists():
+        return
 
-        # Read status
+    with open_index(workshop_path) as index:
+        records = index.scan(stage, jobs)
         try:
-            status = read_status(item_dir)
-        except FileNotFoundError:
-            continue
-
-        # Extract slug from item ID
-        item_id = item_dir.name
-        if "__" not in item_id:
-            continue
-        slug = item_id.split("__", 1)[1]
-
-        # Apply filter
-        if filter_stage and status.stage != filter_stage.value:
-            continue
-
-        items.append(
-            Item(
-                id=item_id,
-                slug=slug,
-                status=status,
-                path=str(item_dir),
-            )
-        )
-
-    return items
+            while True:
+                with shared_lock(workshop_path):
+                    batch = list(islice(records, LOCK_BATCH))
+                if not batch:
+                    return
+                yield from batch
+        finally:
+            # Closing writes the rows refreshed so far
+            with shared_lock(workshop_path):
+                records.close()
+
+
+def list_records(stage_filter: str | None = None, jobs: int | None = None) -> list[ItemRecord]:
+    """List all items in the workshop as lightweight records.
+
+    Answers from the persistent item index, re-parsing only items whose
+    status.yaml changed since the index was last refreshed. Prefer this
+    over list_items when iterating many items.
+
+    Args:
+        stage_filter: Optional stage name to filter by.
+        jobs: Worker count for reading status files (default: $STEWARD_JOBS).
+
+    Returns:
+        List of ItemRecord objects ordered by item ID.
+    """
+    return list(iter_records(stage_filter, jobs))
+
+
+def list_items(stage_filter: str | None = None, jobs: int | None = None) -> list["Item"]:
+    """List all items in the workshop.
+
+    Args:
+        stage_filter: Optional stage name to filter by.
+        jobs: Worker count for reading status files (default: $STEWARD_JOBS).
+
+    Returns:
+        List of Item objects.
+    """
+    items_path = get_workshop_path() / "9-items"
+    return [record.to_item(items_path) for record in list_records(stage_filter, jobs)]
@@ -0,0 +1,119 @@
+"""Metrics service - aggregate STEWARD_METRICS files into latency reports."""
+
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from steward.infrastructure.metrics import MetricsRecord, read_records
+
+# Upper bounds (ms) of the latency histogram buckets; a last, open bucket
+# holds everything slower
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# Workshop size classes: (label, exclusive upper bound in items)
+SIZE_CLASSES = (("<1k", 1_000), ("1k-10k", 10_000), ("10k-100k", 100_000), (">=100k", None))
+
+ALL_SIZES = "all"
+UNKNOWN_SIZE = "unknown"
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """Latency of one command, over all runs or one workshop size class.
+
+    ``histogram`` has one count per LATENCY_BUCKETS_MS bound plus one for
+    slower runs; ``phases_ms`` holds the mean time per phase.
+    """
+
+    command: str
+    size_class: str
+    count: int
+    errors: int
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+    histogram: tuple[int, ...]
+    phases_ms: dict[str, float]
+
+
+def size_class(size: int | None) -> str:
+    """Label the size class of a workshop with this many items."""
+    if size is None:
+        return UNKNOWN_SIZE
+    for label, bound in SIZE_CLASSES:
+        if bound is None or size < bound:
+            return label
+    raise AssertionError("unreachable")
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0-100) of an ascending sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def histogram(values: Iterable[float]) -> tuple[int, ...]:
+    """Count values into LATENCY_BUCKETS_MS buckets."""
+    counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    for value in values:
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if value < bound:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+    return tuple(counts)
+
+
+def _summarize(command: str, label: str, records: list[MetricsRecord]) -> LatencySummary:
+    walls = sorted(record.wall_ms for record in records)
+    phase_totals: dict[str, float] = defaultdict(float)
+    for record in records:
+        for name, ms in record.phases.items():
+            phase_totals[name] += ms
+    return LatencySummary(
+        command=command,
+        size_class=label,
+        count=len(records),
+        errors=sum(1 for record in records if record.exit_code != 0),
+        p50_ms=percentile(walls, 50),
+        p90_ms=percentile(walls, 90),
+        p99_ms=percentile(walls, 99),
+        max_ms=walls[-1],
+        histogram=histogram(walls),
+        phases_ms={name: total / len(records) for name, total in phase_totals.items()},
+    )
+
+
+def summarize_metrics(paths: Iterable[Path]) -> list[LatencySummary]:
+    """Aggregate metrics files into per-command latency summaries.
+
+    For each command there is one summary over all runs (size class
+    "all"), followed by one per workshop size class seen, smallest first.
+
+    Args:
+        paths: Metrics files written via $STEWARD_METRICS.
+
+    Raises:
+        FileNotFoundError: If a file does not exist.
+    """
+    by_command: dict[str, list[MetricsRecord]] = defaultdict(list)
+    for record in read_records(paths):
+        by_command[record.command].append(record)
+
+    order = [label for label, _ in SIZE_CLASSES] + [UNKNOWN_SIZE]
+    summaries: list[LatencySummary] = []
+    for command in sorted(by_command):
+        records = by_command[command]
+        summaries.append(_summarize(command, ALL_SIZES, records))
+        by_size: dict[str, list[MetricsRecord]] = defaultdict(list)
+        for record in records:
+            by_size[size_class(record.size)].append(record)
+        for label in order:
+            if label in by_size:
+                summaries.append(_summarize(command, label, by_size[label]))
+    return summaries
@@ -0,0 +1,103 @@
+"""Search service - ranked full-text search over item notes."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from steward.domain.item_ids import slug_from_id
+from steward.domain.stages import Stage
+from steward.infrastructure.env import get_workshop_path
+from steward.infrastructure.item_index import status_fields
+from steward.infrastructure.locking import shared_lock
+from steward.infrastructure.search_index import open_search_index, tokenize
+from steward.infrastructure.slug_resolver import load_slug_resolver
+from steward.infrastructure.status_codec import STATUS_FILENAME, decode_status
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """An item matching every term of a query.
+
+    ``score`` is the sum of the BM25 scores of the item's matching
+    files; ``files`` lists those files, best match first. ``stage`` is
+    None if the item's status.yaml could not be read.
+    """
+
+    item_id: str
+    slug: str
+    stage: str | None
+    score: float
+    files: tuple[str, ...]
+
+
+def query_terms(query: str) -> list[str]:
+    """Split a query into distinct index terms, in order."""
+    return list(dict.fromkeys(tokenize(query.encode())))
+
+
+def _read_stage(items_path: Path, item_id: str) -> str | None:
+    try:
+        with open(items_path / item_id / STATUS_FILENAME) as f:
+            return status_fields(decode_status(f.read()))[0]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def search_items(
+    query: str,
+    stage_filter: str | None = None,
+    item: str | None = None,
+    limit: int | None = 20,
+    refresh: bool = True,
+    jobs: int | None = None,
+) -> list[SearchHit]:
+    """Find the items whose notes contain every term of a query.
+
+    The search index is refreshed first (only files changed since the
+    last search are re-read), then items are ranked with BM25 over the
+    postings of the query's terms alone (see SearchIndex.rank).
+
+    Args:
+        query: Words to look for; case and punctuation are ignored.
+        stage_filter: Only return items in this stage.
+        item: Only search this item (slug or slug prefix).
+        limit: Return at most this many hits (None for all).
+        refresh: Set False to query the index as it is, skipping the scan.
+        jobs: Worker count for scanning item directories (default: $STEWARD_JOBS).
+
+    Returns:
+        Hits ordered by descending score, then item ID.
+
+    Raises:
+        ValueError: If stage_filter is not a valid stage.
+        ItemNotFoundError: If item matches no item.
+        AmbiguousItemError: If item matches several items.
+    """
+    stage = Stage(stage_filter).value if stage_filter else None
+    terms = query_terms(query)
+    workshop_path = get_workshop_path()
+    items_path = workshop_path / "9-items"
+    if not terms or not items_path.exists():
+        return []
+
+    only = load_slug_resolver(workshop_path).resolve(item) if item else None
+
+    hits: list[SearchHit] = []
+    with shared_lock(workshop_path), open_search_index(workshop_path) as index:
+        if refresh:
+            index.refresh(jobs)
+        for item_id, score in index.rank(terms, only):
+            if limit is not None and len(hits) >= limit:
+                break
+            item_stage = _read_stage(items_path, item_id)
+            if stage is not None and item_stage != stage:
+                continue
+            hits.append(
+                SearchHit(
+                    item_id=item_id,
+                    slug=slug_from_id(item_id) or item_id,
+                    stage=item_stage,
+                    score=score,
+                    files=tuple(index.matching_files(terms, item_id)),
+                )
+            )
+    return hits
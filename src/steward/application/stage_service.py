@@ -1,23 +1,65 @@
 """Stage service - transition items between stages."""
 
+import contextlib
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
-from steward.domain.errors import (
-    AmbiguousItemError,
-    InvalidStageTransitionError,
-    ItemNotFoundError,
-)
+from steward.application.recovery_service import recover_workshop
+from steward.domain.errors import InvalidStageTransitionError, WorkshopError
+from steward.domain.item_ids import slug_from_id
 from steward.domain.models import Item, Status
 from steward.domain.stages import Stage, get_stage_path, is_valid_transition
 from steward.infrastructure.env import get_workshop_path
 from steward.infrastructure.filesystem import create_symlink, remove_symlink
-from steward.infrastructure.status_yaml import read_status, write_status
+from steward.infrastructure.item_index import open_index
+from steward.infrastructure.journal import Journal
+from steward.infrastructure.locking import exclusive_lock
+from steward.infrastructure.slug_resolver import SlugResolver, load_slug_resolver
+from steward.infrastructure.status_yaml import read_status, write_statuses
+from steward.infrastructure.tracing import Phase, phase
+
+
+@dataclass
+class StageResult:
+    """Outcome of one transition in a batch.
+
+    ``error`` is set when the transition was rejected. ``applied`` is
+    False for rejected transitions and, in all-or-nothing mode, for valid
+    ones that were held back because another transition was rejected.
+    """
+
+    slug: str
+    to_stage: str
+    item_id: str | None = None
+    from_stage: str | None = None
+    error: WorkshopError | None = None
+    applied: bool = False
+
+
+@dataclass
+class _Transition:
+    """A validated transition, ready to apply."""
+
+    item_id: str
+    item_slug: str
+    item_path: Path
+    status: Status
+    target_stage: Stage
+
+    @property
+    def current_stage(self) -> Stage:
+        return Stage(self.status.stage)
 
 
 def find_item_by_slug(slug: str) -> tuple[Path, str]:
     """Find an item by its slug.
 
+    Uses the persisted slug resolver, so only a stat of 9-items/ is
+    needed when no items were added or removed since the last lookup.
+
     Args:
         slug: The slug to search for (partial match allowed).
 
@@ -29,34 +71,8 @@ def find_item_by_slug(slug: str) -> tuple[Path, str]:
         AmbiguousItemError: If multiple items match.
     """
     workshop_path = get_workshop_path()
-    items_path = workshop_path / "9-items"
-
-    if not items_path.exists():
-        raise ItemNotFoundError(f"No item found matching: {slug}")
-
-    # Find all matching items
-    matches: list[tuple[Path, str]] = []
-    for item_dir in items_path.iterdir():
-        if not item_dir.is_dir():
-            continue
-        # Check if slug is in the item ID (after the __ separator)
-        item_id = item_dir.name
-        if "__" in item_id:
-            item_slug = item_id.split("__", 1)[1]
-            if slug == item_slug or item_slug.startswith(slug):
-                matches.append((item_dir, item_id))
-
-    if not matches:
-        raise ItemNotFoundError(f"No item found matching: {slug}")
-
-    if len(matches) > 1:
-        match_ids = [m[1] for m in matches]
-        raise AmbiguousItemError(
-            f"Multiple items match '{slug}'. Please be more specific.",
-            matches=match_ids,
-        )
-
-    return matches[0]
+    item_id = load_slug_resolver(workshop_path).resolve(slug)
+    return (workshop_path / "9-items" / item_id, item_id)
 
 
 def get_symlink_path_for_stage(stage: Stage, slug: str) -> Path:
@@ -66,24 +82,9 @@ def get_symlink_path_for_stage(stage: Stage, slug: str) -> Path:
     return stage_path / slug
 
 
-def stage_item(slug: str, to_stage: str) -> Item:
-    """Transition an item to a new stage.
-
-    Args:
-        slug: Item slug (or partial match).
-        to_stage: Target stage name.
-
-    Returns:
-        Updated Item.
-
-    Raises:
-        ItemNotFoundError: If item not found.
-        AmbiguousItemError: If multiple items match slug.
-        InvalidStageTransitionError: If transition is not allowed.
-    """
-    # Validate target stage
+def _parse_stage(to_stage: str) -> Stage:
     try:
-        target_stage = Stage(to_stage)
+        return Stage(to_stage)
     except ValueError as e:
         valid_stages = ", ".join(s.value for s in Stage)
         raise InvalidStageTransitionError(
@@ -92,15 +93,19 @@ def stage_item(slug: str, to_stage: str) -> Item:
             to_stage=to_stage,
         ) from e
 
-    # Find the item
-    item_path, item_id = find_item_by_slug(slug)
-    item_slug = item_id.split("__", 1)[1]
 
-    # Read current status
-    status = read_status(item_path)
-    current_stage = Stage(status.stage)
+def _plan_transition(items_path: Path, resolver: SlugResolver, slug: str, to_stage: str) -> _Transition:
+    target_stage = _parse_stage(to_stage)
 
-    # Validate transition
+    item_id = resolver.resolve(slug)
+    item_slug = slug_from_id(item_id) or item_id
+    item_path = items_path / item_id
+
+    try:
+        status = read_status(item_path)
+    except (OSError, ValueError) as e:
+        raise WorkshopError(f"Cannot read the status of {item_id}: {e}") from e
+    current_stage = Stage(status.stage)
     if not is_valid_transition(current_stage, target_stage):
         raise InvalidStageTransitionError(
             f"Cannot transition from {current_stage.value} to {target_stage.value}",
@@ -108,26 +113,187 @@ def stage_item(slug: str, to_stage: str) -> Item:
             to_stage=target_stage.value,
         )
 
-    # Remove old symlink
-    old_symlink = get_symlink_path_for_stage(current_stage, item_slug)
-    remove_symlink(old_symlink)
+    return _Transition(item_id, item_slug, item_path, status, target_stage)
 
-    # Update status
-    now = datetime.now()
-    new_status = Status(
-        stage=target_stage,
-        created=status.created,
-        updated=now,
+
+def _apply_transitions(transitions: list[_Transition], now: datetime | None = None) -> list[Status]:
+    """Apply validated transitions together.
+
+    The batch is recorded in the journal first. All status files are
+    then written as one batch; if that fails part-way, the old statuses
+    are written back before the error propagates. The index is then
+    updated in a single transaction, and finally every item is linked
+    into its new stage folder before its old link is removed. Only then
+    is the batch marked done in the journal, so a run interrupted after
+    the status writes is finished by the next one (see recovery_service).
+
+    Args:
+        transitions: Validated transitions.
+        now: The items' new updated time (default: now).
+
+    Returns:
+        The new status of each transition, in order.
+    """
+    now = now or datetime.now()
+    with phase(Phase.VALIDATE):
+        new_statuses = [
+            Status(stage=transition.target_stage, created=transition.status.created, updated=now)
+            for transition in transitions
+        ]
+
+    workshop_path = get_workshop_path()
+    journal = Journal(workshop_path)
+    entry = journal.begin(
+        "stage",
+        [
+            {
+                "item_id": transition.item_id,
+                "from": transition.current_stage.value,
+                "to": transition.target_stage.value,
+                "created": transition.status.created.isoformat(),
+                "updated": now.isoformat(),
+            }
+            for transition in transitions
+        ],
     )
-    write_status(item_path, new_status)
 
-    # Create new symlink
-    new_symlink = get_symlink_path_for_stage(target_stage, item_slug)
-    create_symlink(item_path, new_symlink)
+    try:
+        write_statuses(
+            (transition.item_path, new_status) for transition, new_status in zip(transitions, new_statuses, strict=True)
+        )
+    except BaseException:
+        with contextlib.suppress(OSError):
+            write_statuses((transition.item_path, transition.status) for transition in transitions)
+        journal.end(entry)
+        raise
+
+    with open_index(workshop_path) as index:
+        index.upsert_many(
+            (transition.item_id, status) for transition, status in zip(transitions, new_statuses, strict=True)
+        )
+
+    for transition in transitions:
+        new_symlink = get_symlink_path_for_stage(transition.target_stage, transition.item_slug)
+        create_symlink(transition.item_path, new_symlink)
+    for transition in transitions:
+        if transition.current_stage != transition.target_stage:
+            old_symlink = get_symlink_path_for_stage(transition.current_stage, transition.item_slug)
+            remove_symlink(old_symlink)
+
+    journal.end(entry)
+    return new_statuses
+
+
+def replay_transitions(changes: list[dict[str, Any]]) -> None:
+    """Re-apply a journaled batch of transitions.
+
+    Items that no longer exist are skipped. Applying a transition that
+    already completed rewrites the same status and links, so it is safe
+    to replay a batch that was only partly applied.
+    """
+    items_path = get_workshop_path() / "9-items"
+    transitions = []
+    for change in changes:
+        item_path = items_path / change["item_id"]
+        if not item_path.is_dir():
+            continue
+        created = datetime.fromisoformat(change["created"])
+        transitions.append(
+            _Transition(
+                item_id=change["item_id"],
+                item_slug=slug_from_id(change["item_id"]) or change["item_id"],
+                item_path=item_path,
+                status=Status(stage=Stage(change["from"]), created=created, updated=created),
+                target_stage=Stage(change["to"]),
+            )
+        )
+    if transitions:
+        _apply_transitions(transitions, now=datetime.fromisoformat(changes[0]["updated"]))
+
+
+def stage_item(slug: str, to_stage: str) -> Item:
+    """Transition an item to a new stage.
+
+    Args:
+        slug: Item slug (or partial match).
+        to_stage: Target stage name.
+
+    Returns:
+        Updated Item.
+
+    Raises:
+        ItemNotFoundError: If item not found.
+        AmbiguousItemError: If multiple items match slug.
+        InvalidStageTransitionError: If transition is not allowed.
+        WorkshopError: If the item's status.yaml cannot be read.
+    """
+    workshop_path = get_workshop_path()
+    with exclusive_lock(workshop_path):
+        recover_workshop(workshop_path)
+        transition = _plan_transition(workshop_path / "9-items", load_slug_resolver(workshop_path), slug, to_stage)
+        (new_status,) = _apply_transitions([transition])
 
     return Item(
-        id=item_id,
-        slug=item_slug,
+        id=transition.item_id,
+        slug=transition.item_slug,
         status=new_status,
-        path=str(item_path),
+        path=str(transition.item_path),
     )
+
+
+def stage_items(pairs: Iterable[tuple[str, str]], all_or_nothing: bool = False) -> list[StageResult]:
+    """Transition many items in one pass.
+
+    Every slug is resolved against a single load of the slug resolver and
+    every transition is validated before anything is written. Valid
+    transitions are then applied together: status files first, then one
+    index update, then the symlinks. The whole batch runs under the
+    exclusive workshop lock.
+
+    Args:
+        pairs: (slug, target stage) pairs; slugs may be partial matches.
+        all_or_nothing: Apply nothing if any transition is rejected.
+
+    Returns:
+        One StageResult per pair, in input order.
+    """
+    workshop_path = get_workshop_path()
+    with exclusive_lock(workshop_path):
+        recover_workshop(workshop_path)
+        return _stage_items(workshop_path, pairs, all_or_nothing)
+
+
+def _stage_items(workshop_path: Path, pairs: Iterable[tuple[str, str]], all_or_nothing: bool) -> list[StageResult]:
+    items_path = workshop_path / "9-items"
+    resolver = load_slug_resolver(workshop_path)
+
+    results: list[StageResult] = []
+    planned: list[tuple[StageResult, _Transition]] = []
+    seen: set[str] = set()
+    for slug, to_stage in pairs:
+        result = StageResult(slug=slug, to_stage=to_stage)
+        results.append(result)
+        try:
+            transition = _plan_transition(items_path, resolver, slug, to_stage)
+        except WorkshopError as e:
+            result.error = e
+            continue
+        result.item_id = transition.item_id
+        result.from_stage = transition.current_stage.value
+        if transition.item_id in seen:
+            result.error = InvalidStageTransitionError(
+                f"{transition.item_id} appears more than once in the batch",
+                from_stage=result.from_stage,
+                to_stage=to_stage,
+            )
+            continue
+        seen.add(transition.item_id)
+        planned.append((result, transition))
+
+    if not planned or (all_or_nothing and len(planned) < len(results)):
+        return results
+
+    _apply_transitions([transition for _, transition in planned])
+    for result, _ in planned:
+        result.applied = True
+    return results
@@ -1,11 +1,69 @@
-"""Sync service - regenerate symlinks from status.yaml files."""
+"""Sync service - reconcile symlinks with status.yaml files."""
 
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import StrEnum
 from pathlib import Path
+from typing import NamedTuple
 
+from steward.application.recovery_service import recover_workshop
+from steward.domain.item_ids import slug_from_id
 from steward.domain.stages import Stage, get_stage_path
 from steward.infrastructure.env import get_workshop_path
-from steward.infrastructure.filesystem import create_symlink, remove_symlink
-from steward.infrastructure.status_yaml import read_status
+from steward.infrastructure.filesystem import read_symlinks, remove_symlink, replace_symlink
+from steward.infrastructure.item_index import open_index, read_indexed_stages, status_fields
+from steward.infrastructure.locking import exclusive_lock, shared_lock
+from steward.infrastructure.scanner import scan_items
+from steward.infrastructure.tracing import Phase, phase
+
+
+class DriftKind(StrEnum):
+    """Ways a stage symlink can disagree with status.yaml."""
+
+    MISSING = "missing"  # No link to the item anywhere
+    WRONG_STAGE = "wrong-stage"  # Linked only from another stage's folder
+    MISTARGETED = "mis-targeted"  # The slug's link points at something else
+    ORPHANED = "orphaned"  # A link no item asks for
+
+
+@dataclass(frozen=True)
+class Drift:
+    """One stage symlink that sync would change.
+
+    ``link`` is the link as it should be (missing, mis-targeted) or as it
+    is (wrong-stage, orphaned). ``current`` is what a link on disk points
+    at, and ``expected`` what it should point at.
+    """
+
+    kind: DriftKind
+    link: Path
+    current: str | None = None
+    expected: str | None = None
+
+
+class SyncResult(NamedTuple):
+    """Counts of the symlink changes applied by a sync."""
+
+    created: int
+    retargeted: int
+    removed: int
+    unchanged: int
+
+
+@dataclass
+class SyncPlan:
+    """The minimal set of link changes that brings stage folders in sync.
+
+    Each entry is a (link_path, relative_target) pair; removals carry the
+    target the link currently points at.
+    """
+
+    create: list[tuple[Path, str]] = field(default_factory=list)
+    retarget: list[tuple[Path, str]] = field(default_factory=list)
+    remove: list[tuple[Path, str]] = field(default_factory=list)
+    unchanged: int = 0
 
 
 def get_all_stage_folders(workshop_path: Path) -> list[Path]:
@@ -18,59 +76,238 @@ def get_all_stage_folders(workshop_path: Path) -> list[Path]:
     return folders
 
 
-def clear_all_symlinks(workshop_path: Path) -> int:
-    """Remove all symlinks from stage folders.
+def _desired_links(workshop_path: Path, items: Iterable[tuple[str, str, str]]) -> dict[Path, dict[str, str]]:
+    """Map each stage folder to the links it should hold: slug -> relative target.
 
-    Returns:
-        Number of symlinks removed.
+    Args:
+        workshop_path: Workshop the items belong to.
+        items: (item ID, slug, stage value) per item.
+    """
+    items_path = workshop_path / "9-items"
+    # The relative prefix is computed once per folder, not once per item
+    stage_folders = {stage.value: workshop_path / get_stage_path(stage) for stage in Stage}
+    prefixes = {folder: os.path.relpath(items_path, folder) for folder in stage_folders.values()}
+    desired: dict[Path, dict[str, str]] = {folder: {} for folder in stage_folders.values()}
+    for item_id, slug, stage in items:
+        folder = stage_folders[stage]
+        desired[folder][slug] = f"{prefixes[folder]}/{item_id}"
+    return desired
+
+
+def compute_sync_plan(workshop_path: Path, jobs: int | None = None) -> SyncPlan:
+    """Diff the desired stage symlinks against the ones on disk.
+
+    Desired links come from the item index (refreshed from status.yaml);
+    actual links are read with scandir and readlink. Stage folders are
+    not modified.
+
+    Args:
+        workshop_path: Workshop to inspect.
+        jobs: Worker count for reading status files (default: $STEWARD_JOBS).
     """
-    removed = 0
-    for folder in get_all_stage_folders(workshop_path):
-        for item in folder.iterdir():
-            if item.is_symlink():
-                remove_symlink(item)
-                removed += 1
-    return removed
+    with open_index(workshop_path) as index:
+        index.refresh(jobs)
+        entries = index.entries()
+
+    desired = _desired_links(workshop_path, ((entry.id, entry.slug, entry.stage) for entry in entries))
+
+    plan = SyncPlan()
+    for folder, wanted in desired.items():
+        actual = read_symlinks(folder)
+        for slug, target in wanted.items():
+            current = actual.get(slug)
+            if current is None:
+                plan.create.append((folder / slug, target))
+            elif current != target:
+                plan.retarget.append((folder / slug, target))
+            else:
+                plan.unchanged += 1
+        for slug, current in actual.items():
+            if slug not in wanted:
+                plan.remove.append((folder / slug, current))
+
+    return plan
+
+
+def apply_sync_plan(plan: SyncPlan) -> None:
+    """Apply a sync plan.
+
+    Creates and retargets run before removals, so an item moving between
+    stages is linked in its new folder before leaving the old one.
+    """
+    with phase(Phase.LINK):
+        for link, target in plan.create:
+            link.parent.mkdir(parents=True, exist_ok=True)
+            os.symlink(target, link)
+        for link, target in plan.retarget:
+            replace_symlink(target, link)
+        for link, _ in plan.remove:
+            remove_symlink(link)
+
 
+def sync_workshop(jobs: int | None = None) -> SyncResult:
+    """Reconcile stage symlinks with status.yaml files.
 
-def sync_workshop() -> tuple[int, int]:
-    """Regenerate all symlinks from status.yaml files.
+    Only missing links are created, wrong links retargeted and orphans
+    removed; links that are already correct are left untouched.
+
+    Args:
+        jobs: Worker count for reading status files (default: $STEWARD_JOBS).
 
     Returns:
-        Tuple of (symlinks_created, orphans_removed).
+        SyncResult with counts per kind of change.
     """
     workshop_path = get_workshop_path()
     items_path = workshop_path / "9-items"
 
     if not items_path.exists():
-        return (0, 0)
-
-    # First, clear all existing symlinks
-    orphans_removed = clear_all_symlinks(workshop_path)
-
-    # Then, create symlinks based on status.yaml
-    symlinks_created = 0
-    for item_dir in items_path.iterdir():
-        if not item_dir.is_dir():
-            continue
-
-        # Read status
-        try:
-            status = read_status(item_dir)
-        except FileNotFoundError:
-            continue
-
-        # Extract slug from item ID
-        item_id = item_dir.name
-        if "__" not in item_id:
-            continue
-        slug = item_id.split("__", 1)[1]
-
-        # Create symlink in appropriate stage folder
-        stage = Stage(status.stage)
-        stage_path = workshop_path / get_stage_path(stage)
-        symlink_path = stage_path / slug
-        create_symlink(item_dir, symlink_path)
-        symlinks_created += 1
+        return SyncResult(0, 0, 0, 0)
+
+    with exclusive_lock(workshop_path):
+        recover_workshop(workshop_path)
+        plan = compute_sync_plan(workshop_path, jobs)
+        apply_sync_plan(plan)
+
+    return SyncResult(
+        created=len(plan.create),
+        retargeted=len(plan.retarget),
+        removed=len(plan.remove),
+        unchanged=plan.unchanged,
+    )
+
+
+def check_workshop(jobs: int | None = None) -> list[Drift]:
+    """Compare stage symlinks with status.yaml files without changing anything.
+
+    Status files are scanned in parallel (see scan_items); those whose
+    signature matches the item index are only stat'ed, and the index is
+    opened read-only, so nothing is written, not even the index. Stage
+    folders are read with scandir and readlink while the status files
+    are being scanned.
+
+    Args:
+        jobs: Worker count for reading status files (default: $STEWARD_JOBS).
+
+    Returns:
+        Every drift found, ordered by kind then link path; empty when the
+        workshop is consistent.
+    """
+    workshop_path = get_workshop_path()
+    items_path = workshop_path / "9-items"
+    if not items_path.exists():
+        return []
+
+    with shared_lock(workshop_path):
+        folders = get_all_stage_folders(workshop_path)
+        with ThreadPoolExecutor(max_workers=len(folders) or 1) as pool:
+            reads = [pool.submit(read_symlinks, folder) for folder in folders]
+            indexed = read_indexed_stages(workshop_path)
+            known = {item_id: (mtime_ns, size) for item_id, (_, mtime_ns, size) in indexed.items()}
+            items = [
+                (
+                    scanned.item_id,
+                    scanned.slug,
+                    indexed[scanned.item_id][0] if scanned.data is None else status_fields(scanned.data)[0],
+                )
+                for scanned in scan_items(items_path, known, jobs)
+            ]
+            actual = {folder: read.result() for folder, read in zip(folders, reads, strict=True)}
+
+    desired = _desired_links(workshop_path, items)
+    drifts: list[Drift] = []
+    # Item ID -> where its link should be, for items with no link there
+    unlinked: dict[str, tuple[Path, str]] = {}
+    for folder, wanted in desired.items():
+        links = actual.get(folder, {})
+        for slug, target in wanted.items():
+            current = links.get(slug)
+            if current is None:
+                unlinked[os.path.basename(target)] = (folder / slug, target)
+            elif current != target:
+                drifts.append(Drift(DriftKind.MISTARGETED, folder / slug, current, target))
+
+    for folder, links in actual.items():
+        wanted = desired.get(folder, {})
+        for slug, current in links.items():
+            if slug in wanted:
+                continue
+            expected = unlinked.pop(os.path.basename(current.rstrip("/")), None)
+            if expected is not None:
+                drifts.append(Drift(DriftKind.WRONG_STAGE, folder / slug, current, expected[1]))
+            else:
+                drifts.append(Drift(DriftKind.ORPHANED, folder / slug, current))
+
+    drifts += [Drift(DriftKind.MISSING, link, expected=target) for link, target in unlinked.values()]
+    order = list(DriftKind)
+    return sorted(drifts, key=lambda drift: (order.index(drift.kind), drift.link))
+
+
+def relink_items(item_ids: Iterable[str]) -> SyncResult:
+    """Bring the links and index rows of some items in line with status.yaml.
+
+    Unlike sync_workshop, this only looks at the given items: one status
+    read and one readlink per stage folder each, however large the
+    workshop is. Items whose status.yaml is gone lose their links and
+    index rows; items with an unreadable status.yaml are left alone.
+
+    Args:
+        item_ids: IDs of the items to check.
+
+    Returns:
+        SyncResult with counts per kind of change.
+    """
+    from steward.infrastructure.status_yaml import read_status
+
+    workshop_path = get_workshop_path()
+    items_path = workshop_path / "9-items"
+    stage_folders = {stage: workshop_path / get_stage_path(stage) for stage in Stage}
+    prefixes = {folder: os.path.relpath(items_path, folder) for folder in stage_folders.values()}
+
+    plan = SyncPlan()
+    with exclusive_lock(workshop_path):
+        updates = []
+        gone = []
+        for item_id in item_ids:
+            slug = slug_from_id(item_id)
+            if slug is None:
+                continue
+            try:
+                status = read_status(items_path / item_id)
+            except FileNotFoundError:
+                wanted: Stage | None = None
+                gone.append(item_id)
+            except (OSError, ValueError):
+                continue
+            else:
+                wanted = Stage(status.stage)
+                updates.append((item_id, status))
+
+            for stage, folder in stage_folders.items():
+                link = folder / slug
+                try:
+                    current: str | None = os.readlink(link)
+                except OSError:
+                    current = None
+                if stage is wanted:
+                    target = f"{prefixes[folder]}/{item_id}"
+                    if current is None:
+                        plan.create.append((link, target))
+                    elif current != target:
+                        plan.retarget.append((link, target))
+                    else:
+                        plan.unchanged += 1
+                elif current is not None and os.path.basename(current) == item_id:
+                    plan.remove.append((link, current))
+
+        apply_sync_plan(plan)
+        with open_index(workshop_path) as index:
+            index.upsert_many(updates)
+            for item_id in gone:
+                index.remove(item_id)
 
-    return (symlinks_created, orphans_removed)
+    return SyncResult(
+        created=len(plan.create),
+        retargeted=len(plan.retarget),
+        removed=len(plan.remove),
+        unchanged=plan.unchanged,
+    )
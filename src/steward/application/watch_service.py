@@ -0,0 +1,237 @@
+"""Watch service - intake inbox drops and re-link items as they change.
+
+Events come from steward.infrastructure.watcher (inotify, or polling
+where inotify is unavailable). Work per event is bounded by what
+changed: an inbox drop is intaken on its own, and a status.yaml edit
+re-links just that item (see relink_items) instead of syncing the
+whole workshop.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import partial
+from pathlib import Path
+
+from steward.application.intake_service import IntakeResult, intake_items
+from steward.application.sync_service import SyncResult, relink_items, sync_workshop
+from steward.domain.errors import WorkshopError
+from steward.infrastructure.env import get_workshop_path
+from steward.infrastructure.watcher import WatchKind, open_watcher
+
+# How long status.yaml events are collected before re-linking, so that
+# an editor's write-rename-chmod burst becomes one re-link
+STATUS_DEBOUNCE = 0.05
+
+# Longest single wait, so a stop request is noticed promptly
+MAX_WAIT = 0.5
+
+# Names used by downloaders and editors for files still being written
+PARTIAL_SUFFIXES = (".part", ".partial", ".crdownload", ".download", ".tmp", "~")
+
+
+class WatchAction(StrEnum):
+    """What the watcher did."""
+
+    INTAKE = "intake"
+    RELINK = "relink"
+    SYNC = "sync"
+
+
+@dataclass(frozen=True)
+class WatchReport:
+    """One action taken by the watcher.
+
+    ``intake`` is set for intakes, ``sync`` for re-links and full syncs.
+    ``error`` is set when the action failed outright; the watcher keeps
+    running either way.
+    """
+
+    action: WatchAction
+    intake: IntakeResult | None = None
+    sync: SyncResult | None = None
+    error: str | None = None
+
+
+def is_drop_candidate(name: str) -> bool:
+    """Check whether an inbox entry may be intaken (not hidden or partial)."""
+    return not name.startswith(".") and not name.endswith(PARTIAL_SUFFIXES)
+
+
+def drop_signature(path: Path) -> tuple[int, int, int] | None:
+    """Summarise an inbox entry as (size, file count, newest mtime).
+
+    Folders are walked, since writes inside them raise no event on the
+    inbox itself. Returns None if the entry has gone.
+    """
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return None
+    if not os.path.isdir(path) or os.path.islink(path):
+        return (st.st_size, 1, st.st_mtime_ns)
+
+    size, count, newest = 0, 0, st.st_mtime_ns
+    for root, dirs, files in os.walk(path):
+        for name in dirs + files:
+            try:
+                entry = os.lstat(os.path.join(root, name))
+            except FileNotFoundError:
+                continue
+            size += entry.st_size
+            count += 1
+            newest = max(newest, entry.st_mtime_ns)
+    return (size, count, newest)
+
+
+class _Drops:
+    """Inbox entries waiting to settle.
+
+    An entry is ready once it has raised no event for ``debounce``
+    seconds and its signature did not change over that time.
+    """
+
+    def __init__(self, inbox_path: Path, debounce: float) -> None:
+        self.inbox_path = inbox_path
+        self.debounce = debounce
+        # name -> (signature at the last check, time of the last change)
+        self._pending: dict[str, tuple[tuple[int, int, int] | None, float]] = {}
+
+    def touch(self, name: str, now: float) -> None:
+        if is_drop_candidate(name):
+            signature = self._pending.get(name, (None, now))[0]
+            self._pending[name] = (signature, now)
+
+    def next_deadline(self) -> float | None:
+        return min((changed + self.debounce for _, changed in self._pending.values()), default=None)
+
+    def take_ready(self, now: float) -> list[str]:
+        ready = []
+        for name, (previous, changed) in list(self._pending.items()):
+            if now - changed < self.debounce:
+                continue
+            signature = drop_signature(self.inbox_path / name)
+            if signature is None:
+                del self._pending[name]
+            elif signature == previous:
+                del self._pending[name]
+                ready.append(name)
+            else:
+                self._pending[name] = (signature, now)
+        return sorted(ready)
+
+
+def watch_workshop(
+    intake: bool = True,
+    debounce: float = 1.0,
+    poll: bool = False,
+    interval: float = 1.0,
+    stop: threading.Event | None = None,
+    on_report: Callable[[WatchReport], None] | None = None,
+) -> None:
+    """Watch the workshop until stopped.
+
+    Entries dropped into 1-inbox/ are moved in with intake_items once
+    they have settled (see _Drops); entries already there when watching
+    starts are treated as fresh drops. Changed status.yaml files are
+    re-linked item by item. If events were lost (inotify queue overflow)
+    the whole workshop is synced once.
+
+    Args:
+        intake: If False, leave the inbox alone and only re-link items.
+        debounce: Seconds an inbox entry must stay unchanged before intake.
+        poll: Poll every interval seconds instead of using inotify.
+        interval: Polling interval in seconds.
+        stop: Event that ends the watch; without one, runs until interrupted.
+        on_report: Called with a WatchReport after every action.
+    """
+    workshop_path = get_workshop_path()
+    inbox_path = workshop_path / "1-inbox"
+    stop = stop or threading.Event()
+
+    def report(watch_report: WatchReport) -> None:
+        if on_report is not None:
+            on_report(watch_report)
+
+    watcher = open_watcher(workshop_path, poll=poll, interval=interval)
+    drops = _Drops(inbox_path, debounce)
+    changed_items: set[str] = set()
+    status_changed_at = 0.0
+
+    if intake:
+        now = time.monotonic()
+        for name in os.listdir(inbox_path):
+            drops.touch(name, now)
+
+    try:
+        while not stop.is_set():
+            now = time.monotonic()
+            timeout = MAX_WAIT
+            drop_deadline = drops.next_deadline()
+            if drop_deadline is not None:
+                timeout = min(timeout, drop_deadline - now)
+            if changed_items:
+                timeout = min(timeout, status_changed_at + STATUS_DEBOUNCE - now)
+
+            rescan = False
+            for event in watcher.read(timeout):
+                now = time.monotonic()
+                if event.kind is WatchKind.INBOX:
+                    if intake:
+                        drops.touch(event.name, now)
+                elif event.kind is WatchKind.STATUS:
+                    changed_items.add(event.name)
+                    status_changed_at = now
+                else:
+                    rescan = True
+
+            now = time.monotonic()
+            if rescan:
+                changed_items.clear()
+                _run(report, WatchAction.SYNC, sync_workshop)
+                if intake:
+                    for name in os.listdir(inbox_path):
+                        drops.touch(name, now)
+
+            if changed_items and now - status_changed_at >= STATUS_DEBOUNCE:
+                relink = partial(relink_items, sorted(changed_items))
+                changed_items.clear()
+                _run(report, WatchAction.RELINK, relink, quiet_if_unchanged=True)
+
+            if intake:
+                ready = drops.take_ready(now)
+                if ready:
+                    _intake(report, [str(inbox_path / name) for name in ready])
+    finally:
+        watcher.close()
+
+
+def _run(
+    report: Callable[[WatchReport], None],
+    action: WatchAction,
+    sync: Callable[[], SyncResult],
+    quiet_if_unchanged: bool = False,
+) -> None:
+    """Run a sync or re-link and report it (or its error)."""
+    try:
+        result = sync()
+    except (WorkshopError, OSError) as e:
+        report(WatchReport(action, error=e.message if isinstance(e, WorkshopError) else str(e)))
+        return
+    if quiet_if_unchanged and not (result.created or result.retargeted or result.removed):
+        return
+    report(WatchReport(action, sync=result))
+
+
+def _intake(report: Callable[[WatchReport], None], sources: list[str]) -> None:
+    """Move settled drops into the workshop and report each one."""
+    try:
+        results = intake_items(sources, move=True)
+    except (WorkshopError, OSError) as e:
+        report(WatchReport(WatchAction.INTAKE, error=e.message if isinstance(e, WorkshopError) else str(e)))
+        return
+    for result in results:
+        report(WatchReport(WatchAction.INTAKE, intake=result))
@@ -4,32 +4,51 @@ This module provides the steward CLI for workshop management:
 - steward init: Initialize workshop directory structure
 - steward intake: Move items from inbox to workshop
 - steward stage: Transition items between stages
-- steward sync: Regenerate symlinks from status.yaml
+- steward sync: Reconcile symlinks with status.yaml
+- steward watch: Intake inbox drops and repair symlinks as files change
 - steward list: List items in workshop
+- steward search: Ranked full-text search over item notes
+- steward serve: Keep services warm behind a Unix socket
+- steward metrics report: Latency percentiles from STEWARD_METRICS files
+- steward metrics flow: Lead time, time in stage, throughput and WIP aging
+
+Application services (and with them pydantic, PyYAML and SQLite) are
+imported inside the commands that use them, so that cheap invocations
+such as ``steward --version`` do not pay for them.
 """
 
-from typing import Annotated
+import contextlib
+import os
+import sys
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
 
+import click
 import typer
 
 from steward import __version__
-from steward.application import (
-    init_workshop,
-    intake_item,
-    list_items,
-    stage_item,
-    sync_workshop,
-)
-from steward.domain import (
+from steward.domain.errors import (
     AmbiguousItemError,
-    ExitCode,
     InvalidStageTransitionError,
     ItemNotFoundError,
-    Stage,
+    LockTimeoutError,
     WorkshopAlreadyExistsError,
     WorkshopError,
 )
-from steward.infrastructure import get_console, get_error_console
+from steward.domain.exit_codes import ExitCode
+from steward.domain.stages import Stage
+from steward.infrastructure.console import OutputConsole, PlainConsole, get_console, get_error_console
+from steward.infrastructure.content_hash import DuplicatePolicy
+from steward.infrastructure.copy_engine import CopyStats, LinkMode
+from steward.infrastructure.metrics import metrics_path
+from steward.infrastructure.record_format import OutputFormat, write_records
+from steward.infrastructure.tracing import format_trace, start_profile, start_trace, stop_trace, tracing_requested
+
+if TYPE_CHECKING:
+    from steward.application.flow_service import Distribution
+    from steward.application.intake_service import IntakeProgress, IntakeResult
 
 app = typer.Typer(
     name="steward",
@@ -48,6 +67,7 @@ def version_callback(value: bool) -> None:
 
 @app.callback()
 def main(
+    ctx: typer.Context,
     version: Annotated[
         bool | None,
         typer.Option(
@@ -58,9 +78,79 @@ def main(
             help="Show version and exit.",
         ),
     ] = None,
+    profile: Annotated[
+        Path | None,
+        typer.Option(
+            "--profile",
+            dir_okay=False,
+            help="Write a cProfile dump of the command to this file (read it with pstats).",
+        ),
+    ] = None,
+    profile_memory: Annotated[
+        bool,
+        typer.Option(
+            "--profile-memory",
+            help="With --profile, also write a tracemalloc snapshot to <file>.tracemalloc.",
+        ),
+    ] = False,
 ) -> None:
-    """Steward - Workshop management for Praxis."""
-    pass
+    """Steward - Workshop management for Praxis.
+
+    Set STEWARD_TRACE=1 to print a per-phase timing breakdown and
+    syscall counts on stderr after any command.
+    """
+    if profile is not None:
+        ctx.call_on_close(start_profile(profile, memory=profile_memory))
+    command = ctx.invoked_subcommand or "steward"
+    metrics_file = metrics_path() if command not in _UNMETERED_COMMANDS else None
+    if tracing_requested() or metrics_file is not None:
+        start_trace()
+        ctx.call_on_close(lambda: _finish_trace(command, metrics_file))
+
+
+# Long-running or reporting commands, whose timings would skew latency metrics
+_UNMETERED_COMMANDS = {"metrics", "serve", "watch"}
+
+
+def _finish_trace(command: str, metrics_file: Path | None) -> None:
+    """Print the finished trace on stderr and/or append it to the metrics file.
+
+    Runs while the command's exit is still propagating, so the exit code
+    is read from the exception in flight.
+    """
+    trace = stop_trace()
+    if trace is None:
+        return
+    if tracing_requested():
+        err_console = get_error_console()
+        for line in format_trace(trace, command):
+            err_console.print(line)
+    if metrics_file is not None:
+        from steward.infrastructure.env import get_workshop_path
+        from steward.infrastructure.metrics import append_record, build_record, workshop_size
+
+        try:
+            size = workshop_size(get_workshop_path())
+        except WorkshopError:
+            size = None
+        with contextlib.suppress(OSError):
+            append_record(metrics_file, build_record(command, _exit_code_in_flight(), trace, size))
+
+
+def _exit_code_in_flight() -> int:
+    """Exit code of the exception being raised (0 if none)."""
+    exc = sys.exception()
+    if exc is None:
+        return ExitCode.SUCCESS
+    if isinstance(exc, click.exceptions.Exit):
+        return exc.exit_code
+    if isinstance(exc, click.ClickException):
+        return exc.exit_code
+    if isinstance(exc, SystemExit):
+        return exc.code if isinstance(exc.code, int) else ExitCode.GENERAL_ERROR
+    if isinstance(exc, KeyboardInterrupt | click.exceptions.Abort):
+        return 130
+    return ExitCode.GENERAL_ERROR
 
 
 @app.command()
@@ -73,6 +163,8 @@ def init() -> None:
     - Canonical storage (9-items/)
     - .gitignore patterns
     """
+    from steward.application.init_service import init_workshop
+
     console = get_console()
     err_console = get_error_console()
 
@@ -92,10 +184,10 @@ def init() -> None:
 
 @app.command()
 def intake(
-    source: Annotated[
-        str,
-        typer.Argument(help="Path to file or folder."),
-    ],
+    sources: Annotated[
+        list[str] | None,
+        typer.Argument(help="Paths to files or folders, or glob patterns.", show_default=False),
+    ] = None,
     slug: Annotated[
         str | None,
         typer.Option(
@@ -112,6 +204,38 @@ def intake(
             help="Move instead of copy (removes source after intake).",
         ),
     ] = False,
+    all_inbox: Annotated[
+        bool,
+        typer.Option(
+            "--all",
+            "-a",
+            help="Intake everything in _workshop/1-inbox/.",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Parallel workers for copies (default: $STEWARD_JOBS or CPU-based).",
+        ),
+    ] = None,
+    link_mode: Annotated[
+        LinkMode,
+        typer.Option(
+            "--link-mode",
+            "-l",
+            help="How copies place data: auto/reflink (clone if supported), hardlink (share inodes), copy.",
+        ),
+    ] = LinkMode.AUTO,
+    on_duplicate: Annotated[
+        DuplicatePolicy,
+        typer.Option(
+            "--on-duplicate",
+            help="When a source's content is already an item: warn (intake anyway), skip, or link to that item.",
+        ),
+    ] = DuplicatePolicy.WARN,
 ) -> None:
     """Intake an item from any path to workshop.
 
@@ -122,9 +246,23 @@ def intake(
     - An absolute path: /path/to/my-idea.md
     - A relative path: ./ideas/my-idea.md
     - A name in inbox: my-idea.md (looks in _workshop/1-inbox/)
+    - A glob pattern: '*.md' (matched in the current directory, then the inbox)
 
     By default, the source is copied (preserved). Use --move to remove
-    the source after intake.
+    the source after intake. Several sources, or --all, intake them in
+    one run and print a summary.
+
+    Copies use reflinks where the filesystem supports them, and kernel-side
+    copies (copy_file_range, sendfile) otherwise. --link-mode hardlink
+    shares inodes with the source instead: edits to either show in both.
+
+    Sources are hashed before they are copied. A source whose content is
+    already an item (or matches another source of the run) is intaken
+    with a warning by default; --on-duplicate skip leaves it alone, and
+    --on-duplicate link points it at the existing item: an inbox source is
+    replaced with a symlink to it, and --move removes the source. Copied
+    sources outside the inbox are never touched. Hashing reads each source once before it
+    is copied; file digests are cached in _workshop/.steward/.
 
     Examples:
         steward intake my-idea.md                    # from inbox
@@ -132,37 +270,186 @@ def intake(
         steward intake /tmp/project-folder/          # from absolute path
         steward intake my-idea.md --move             # move instead of copy
         steward intake ./idea.md --slug my-feature   # custom slug
+        steward intake --all --move                  # sweep the inbox
+        steward intake 'notes-*.md' other.md         # several sources
+        steward intake big-dataset/ --link-mode hardlink
+        steward intake --all --move --on-duplicate link
     """
+    from steward.application.intake_service import expand_sources, inbox_sources, intake_items, intake_source
+    from steward.infrastructure.env import get_workshop_path
+
     console = get_console()
     err_console = get_error_console()
+    sources = sources or []
 
     try:
-        item = intake_item(source, custom_slug=slug, move=move)
-        action = "moved" if move else "copied"
-        console.print(f"[green]Intake complete ({action}):[/green] {item.id}")
-        console.print(f"  Stage: {item.stage.value}")
-        console.print(f"  Path: {item.path}")
-        raise typer.Exit(ExitCode.SUCCESS)
+        inbox_path = get_workshop_path() / "1-inbox"
+        sources = expand_sources(sources, inbox_path)
+        if all_inbox:
+            sources = [*inbox_sources(inbox_path), *sources]
+
+        if not all_inbox and len(sources) == 1:
+            with _move_progress(err_console) as progress:
+                result = intake_source(
+                    sources[0],
+                    custom_slug=slug,
+                    move=move,
+                    link_mode=link_mode,
+                    progress=progress,
+                    on_duplicate=on_duplicate,
+                )
+            if result.duplicate_of is not None and not result.intaken:
+                _print_duplicate(console, result, on_duplicate, move)
+                raise typer.Exit(ExitCode.SUCCESS)
+            assert result.item is not None
+            if result.duplicate_of is not None:
+                err_console.print(f"[yellow]Warning:[/yellow] same content as existing item {result.duplicate_of}")
+            action = "moved" if move else "copied"
+            if result.resumed:
+                console.print("[dim]Resumed an interrupted move[/dim]")
+            console.print(f"[green]Intake complete ({action}):[/green] {result.item.id}")
+            console.print(f"  Stage: {result.item.stage.value}")
+            console.print(f"  Path: {result.item.path}")
+            console.print(f"  Transfer: {_describe_transfer(result.stats)}")
+            raise typer.Exit(ExitCode.SUCCESS)
+
+        if not sources:
+            if not all_inbox:
+                err_console.print("[red]Error:[/red] Nothing to intake: give a source or use --all")
+                raise typer.Exit(ExitCode.INVALID_ARGUMENT)
+            console.print("[dim]Inbox is empty[/dim]")
+            raise typer.Exit(ExitCode.SUCCESS)
+        if slug is not None:
+            err_console.print("[red]Error:[/red] --slug can only be used with a single source")
+            raise typer.Exit(ExitCode.INVALID_ARGUMENT)
+
+        with _move_progress(err_console) as progress:
+            results = intake_items(
+                sources, move=move, jobs=jobs, link_mode=link_mode, progress=progress, on_duplicate=on_duplicate
+            )
 
     except ItemNotFoundError as e:
         err_console.print(f"[red]Error:[/red] {e.message}")
         raise typer.Exit(ExitCode.ITEM_NOT_FOUND) from None
 
+    except LockTimeoutError as e:
+        err_console.print(f"[red]Error:[/red] {e.message}")
+        raise typer.Exit(ExitCode.LOCK_TIMEOUT) from None
+
     except WorkshopError as e:
         err_console.print(f"[red]Error:[/red] {e.message}")
         raise typer.Exit(ExitCode.ENV_ERROR) from None
 
+    intaken = [(result, result.item) for result in results if result.item is not None and result.intaken]
+    failures = [(result, result.error) for result in results if result.error is not None]
+    duplicates = [result for result in results if result.duplicate_of is not None and result.error is None]
+
+    width = max((len(item.id) for _, item in intaken), default=2)
+    console.print(f"[bold]{'ID':<{width}}  {'BYTES':>12}  {'STRATEGY':<16}  {'MB/S':>8}  SOURCE[/bold]")
+    for result, item in intaken:
+        stats = result.stats
+        if result.resumed:
+            err_console.print(f"[dim]resumed an interrupted move of {result.source}[/dim]")
+        console.print(
+            f"{item.id:<{width}}  {stats.bytes:>12,}  {stats.strategy:<16}  "
+            f"{stats.throughput / 1e6:>8.1f}  {result.source}"
+        )
+    for result in duplicates:
+        assert result.duplicate_of is not None
+        if result.intaken:
+            err_console.print(f"[yellow]duplicate[/yellow] {result.source}: same content as {result.duplicate_of}")
+        else:
+            _print_duplicate(console, result, on_duplicate, move)
+    for result, error in failures:
+        err_console.print(f"[red]failed[/red] {result.source}: {error.message}")
+
+    action = "moved" if move else "copied"
+    total = sum(result.bytes_copied for result, _ in intaken)
+    summary = f"[green]Intake complete ({action}):[/green] {len(intaken)} items, {total:,} bytes"
+    reused = sum(1 for result in duplicates if not result.intaken)
+    if reused:
+        summary += f", {reused} duplicates {'skipped' if on_duplicate is DuplicatePolicy.SKIP else 'linked'}"
+    console.print(summary)
+    if not failures:
+        raise typer.Exit(ExitCode.SUCCESS)
+    if all(isinstance(error, ItemNotFoundError) for _, error in failures):
+        raise typer.Exit(ExitCode.ITEM_NOT_FOUND)
+    raise typer.Exit(ExitCode.ENV_ERROR)
+
+
+def _print_duplicate(console: OutputConsole, result: "IntakeResult", on_duplicate: DuplicatePolicy, move: bool) -> None:
+    """Report a source that was skipped or linked instead of intaken."""
+    source, item_id = result.source, result.duplicate_of
+    if on_duplicate is DuplicatePolicy.SKIP:
+        console.print(f"[yellow]Skipped[/yellow] {source}: same content as {item_id}")
+        return
+    if move:
+        replaced = "source removed"
+    elif result.source_linked:
+        replaced = "source replaced by a symlink"
+    else:
+        replaced = "source left in place"
+    console.print(f"[cyan]Linked[/cyan] {source} to existing item {item_id} ({replaced})")
+
+
+@contextlib.contextmanager
+def _move_progress(err_console: OutputConsole) -> Iterator["IntakeProgress | None"]:
+    """Show a progress bar per source while moves copy across filesystems.
+
+    Yields None (no progress reporting) when stderr is not a terminal.
+    """
+    if isinstance(err_console, PlainConsole):
+        yield None
+        return
+
+    from rich.console import Console
+    from rich.progress import DownloadColumn, Progress, TaskID, TransferSpeedColumn
+
+    assert isinstance(err_console, Console)
+
+    with Progress(
+        *Progress.get_default_columns(), DownloadColumn(), TransferSpeedColumn(), console=err_console, transient=True
+    ) as bar:
+        tasks: dict[str, TaskID] = {}
+
+        def update(source: str, done: int, total: int) -> None:
+            if source not in tasks:
+                tasks[source] = bar.add_task(source, total=total)
+            bar.update(tasks[source], completed=done)
+
+        yield update
+
+
+def _describe_transfer(stats: CopyStats) -> str:
+    """Summarise a transfer, e.g. '1,024 bytes in 1 file via reflink (512.0 MB/s)'."""
+    files = "file" if stats.files == 1 else "files"
+    return f"{stats.bytes:,} bytes in {stats.files} {files} via {stats.strategy} ({stats.throughput / 1e6:.1f} MB/s)"
+
 
 @app.command()
 def stage(
-    item_slug: Annotated[
-        str,
-        typer.Argument(help="Item slug or partial match."),
-    ],
-    to_stage: Annotated[
-        str,
-        typer.Argument(help="Target stage name."),
-    ],
+    args: Annotated[
+        list[str] | None,
+        typer.Argument(
+            metavar="SLUG STAGE",
+            help="Item slug (or partial match) and target stage name. With --batch, any number of pairs.",
+            show_default=False,
+        ),
+    ] = None,
+    batch: Annotated[
+        bool,
+        typer.Option(
+            "--batch",
+            help="Apply many transitions; pairs come from the arguments or, if none, from stdin.",
+        ),
+    ] = False,
+    all_or_nothing: Annotated[
+        bool,
+        typer.Option(
+            "--all-or-nothing",
+            help="With --batch, apply no transition unless all of them are valid.",
+        ),
+    ] = False,
 ) -> None:
     """Transition an item to a new stage.
 
@@ -175,13 +462,29 @@ def stage(
     - Shelving: forge <-> shelf (bidirectional)
     - Exits: ANY stage -> handoff | archive | trash
 
+    With --batch, stdin takes one "slug stage" pair per line; blank
+    lines and lines starting with # are ignored.
+
     Examples:
         steward stage my-feature backlog
         steward stage my-feature forge
         steward stage my-feature archive
+        steward stage --batch feature-a archive feature-b archive
+        steward list --stage review --format tsv | cut -f2 | sed 's/$/ archive/' | steward stage --batch
     """
     console = get_console()
     err_console = get_error_console()
+    args = args or []
+
+    if batch:
+        _stage_batch(args, all_or_nothing)
+
+    if len(args) != 2:
+        err_console.print("[red]Error:[/red] Expected an item slug and a target stage (or use --batch)")
+        raise typer.Exit(ExitCode.INVALID_ARGUMENT)
+    item_slug, to_stage = args
+
+    from steward.application.stage_service import stage_item
 
     try:
         item = stage_item(item_slug, to_stage)
@@ -206,34 +509,236 @@ def stage(
         err_console.print(f"[dim]Valid stages: {valid_stages}[/dim]")
         raise typer.Exit(ExitCode.INVALID_TRANSITION) from None
 
+    except LockTimeoutError as e:
+        err_console.print(f"[red]Error:[/red] {e.message}")
+        raise typer.Exit(ExitCode.LOCK_TIMEOUT) from None
+
     except WorkshopError as e:
         err_console.print(f"[red]Error:[/red] {e.message}")
         raise typer.Exit(ExitCode.ENV_ERROR) from None
 
 
+def _read_stage_pairs(args: list[str]) -> list[tuple[str, str]]:
+    """Collect (slug, stage) pairs from arguments, or from stdin if none."""
+    if args:
+        if len(args) % 2:
+            raise typer.BadParameter("expected slug and stage pairs", param_hint="SLUG STAGE")
+        return list(zip(args[::2], args[1::2], strict=True))
+
+    pairs: list[tuple[str, str]] = []
+    for number, line in enumerate(sys.stdin, start=1):
+        fields = line.split()
+        if not fields or fields[0].startswith("#"):
+            continue
+        if len(fields) != 2:
+            raise typer.BadParameter(f"line {number}: expected 'slug stage', got: {line.strip()}", param_hint="stdin")
+        pairs.append((fields[0], fields[1]))
+    return pairs
+
+
+def _batch_exit_code(error: WorkshopError) -> ExitCode:
+    if isinstance(error, ItemNotFoundError | AmbiguousItemError):
+        return ExitCode.ITEM_NOT_FOUND
+    if isinstance(error, InvalidStageTransitionError):
+        return ExitCode.INVALID_TRANSITION
+    if isinstance(error, LockTimeoutError):
+        return ExitCode.LOCK_TIMEOUT
+    return ExitCode.ENV_ERROR
+
+
+def _stage_batch(args: list[str], all_or_nothing: bool) -> None:
+    """Run steward stage --batch and exit."""
+    from steward.application.stage_service import stage_items
+
+    console = get_console()
+    err_console = get_error_console()
+
+    pairs = _read_stage_pairs(args)
+    if not pairs:
+        console.print("[dim]No transitions given[/dim]")
+        raise typer.Exit(ExitCode.SUCCESS)
+
+    try:
+        results = stage_items(pairs, all_or_nothing=all_or_nothing)
+    except LockTimeoutError as e:
+        err_console.print(f"[red]Error:[/red] {e.message}")
+        raise typer.Exit(ExitCode.LOCK_TIMEOUT) from None
+
+    except WorkshopError as e:
+        err_console.print(f"[red]Error:[/red] {e.message}")
+        raise typer.Exit(ExitCode.ENV_ERROR) from None
+
+    for result in results:
+        if result.error is not None:
+            err_console.print(f"[red]failed[/red]  {result.slug} -> {result.to_stage}: {result.error.message}")
+        elif result.applied:
+            console.print(f"[green]ok[/green]      {result.item_id}: {result.from_stage} -> {result.to_stage}")
+        else:
+            console.print(f"[yellow]skipped[/yellow] {result.item_id}: {result.from_stage} -> {result.to_stage}")
+
+    applied = sum(result.applied for result in results)
+    errors = [result.error for result in results if result.error is not None]
+    skipped = len(results) - applied - len(errors)
+    console.print(f"[bold]Transitioned:[/bold] {applied}, failed: {len(errors)}, skipped: {skipped}")
+    raise typer.Exit(_batch_exit_code(errors[0]) if errors else ExitCode.SUCCESS)
+
+
+JobsOption = Annotated[
+    int | None,
+    typer.Option(
+        "--jobs",
+        "-j",
+        min=1,
+        help="Parallel workers for reading status files (default: $STEWARD_JOBS or CPU-based).",
+    ),
+]
+
+
 @app.command()
-def sync() -> None:
+def sync(
+    jobs: JobsOption = None,
+    check: Annotated[
+        bool,
+        typer.Option(
+            "--check",
+            help="Only report links that disagree with status.yaml; exit 1 if any do.",
+        ),
+    ] = False,
+) -> None:
     """Regenerate all symlinks from status.yaml files.
 
-    Clears all existing symlinks in stage folders and recreates them
-    based on the stage field in each item's status.yaml.
+    Compares the symlinks in stage folders with the stage field in each
+    item's status.yaml and applies only the changes needed: missing
+    links are created, wrong links retargeted and orphans removed.
 
     Use this command to fix broken symlinks or after manual edits
     to status.yaml files.
 
+    With --check nothing is written: each missing, wrong-stage,
+    mis-targeted or orphaned link is listed, and the exit code is 1 if
+    there are any, which suits pre-commit hooks and CI.
+
     Examples:
         steward sync
+        steward sync --jobs 16
+        steward sync --check
     """
+    from steward.application.sync_service import check_workshop, sync_workshop
+    from steward.infrastructure.env import get_workshop_path
+
     console = get_console()
     err_console = get_error_console()
 
     try:
-        created, removed = sync_workshop()
+        if check:
+            workshop_path = get_workshop_path()
+            drifts = check_workshop(jobs)
+            for drift in drifts:
+                link = drift.link.relative_to(workshop_path)
+                current = f" -> {drift.current}" if drift.current is not None else ""
+                expected = f" (should be -> {drift.expected})" if drift.expected is not None else ""
+                console.print(f"{drift.kind:<12}  {link}{current}{expected}")
+            if drifts:
+                err_console.print(f"[red]Out of sync:[/red] {len(drifts)} links differ; run 'steward sync' to fix")
+                raise typer.Exit(ExitCode.GENERAL_ERROR)
+            console.print("[green]In sync[/green]")
+            raise typer.Exit(ExitCode.SUCCESS)
+
+        result = sync_workshop(jobs)
         console.print("[green]Sync complete[/green]")
-        console.print(f"  Symlinks created: {created}")
-        console.print(f"  Orphans removed: {removed}")
+        console.print(f"  Symlinks created: {result.created}")
+        console.print(f"  Symlinks retargeted: {result.retargeted}")
+        console.print(f"  Orphans removed: {result.removed}")
+        console.print(f"  Unchanged: {result.unchanged}")
         raise typer.Exit(ExitCode.SUCCESS)
 
+    except LockTimeoutError as e:
+        err_console.print(f"[red]Error:[/red] {e.message}")
+        raise typer.Exit(ExitCode.LOCK_TIMEOUT) from None
+
+    except WorkshopError as e:
+        err_console.print(f"[red]Error:[/red] {e.message}")
+        raise typer.Exit(ExitCode.ENV_ERROR) from None
+
+
+@app.command()
+def watch(
+    debounce: Annotated[
+        float,
+        typer.Option(
+            "--debounce",
+            "-d",
+            min=0,
+            help="Seconds an inbox drop must stay unchanged before it is intaken.",
+        ),
+    ] = 1.0,
+    poll: Annotated[
+        bool,
+        typer.Option(
+            "--poll",
+            help="Poll for changes instead of using inotify.",
+        ),
+    ] = False,
+    interval: Annotated[
+        float,
+        typer.Option(
+            "--interval",
+            min=0.05,
+            help="Polling interval in seconds (with --poll, or where inotify is unavailable).",
+        ),
+    ] = 1.0,
+    no_intake: Annotated[
+        bool,
+        typer.Option(
+            "--no-intake",
+            help="Leave the inbox alone; only repair symlinks.",
+        ),
+    ] = False,
+) -> None:
+    """Watch the workshop and keep it up to date.
+
+    Entries dropped into _workshop/1-inbox/ are moved into the workshop
+    once they stop changing, as with 'steward intake --move'. When an
+    item's status.yaml is edited, only that item's symlinks are fixed,
+    so each change is handled in milliseconds however large the
+    workshop is. Stop with Ctrl-C.
+
+    Uses inotify on Linux; elsewhere, or when the inotify watch limit is
+    too low, the workshop is polled every --interval seconds.
+
+    Examples:
+        steward watch
+        steward watch --no-intake
+        steward watch --poll --interval 5
+    """
+    from steward.application.watch_service import WatchReport, watch_workshop
+
+    console = get_console()
+    err_console = get_error_console()
+
+    def report(watch_report: WatchReport) -> None:
+        if watch_report.error is not None:
+            err_console.print(f"[red]{watch_report.action} failed:[/red] {watch_report.error}")
+        elif watch_report.intake is not None:
+            intaken = watch_report.intake
+            if intaken.item is not None:
+                console.print(f"[green]intake[/green] {intaken.item.id}  {os.path.basename(intaken.source)}")
+                if intaken.duplicate_of is not None:
+                    err_console.print(f"[yellow]duplicate[/yellow] same content as {intaken.duplicate_of}")
+            elif intaken.error is not None:
+                err_console.print(f"[red]intake failed[/red] {intaken.source}: {intaken.error.message}")
+        elif watch_report.sync is not None:
+            synced = watch_report.sync
+            console.print(
+                f"[cyan]{watch_report.action}[/cyan] created {synced.created}, "
+                f"retargeted {synced.retargeted}, removed {synced.removed}"
+            )
+
+    try:
+        console.print("[dim]Watching the workshop (Ctrl-C to stop)[/dim]")
+        watch_workshop(intake=not no_intake, debounce=debounce, poll=poll, interval=interval, on_report=report)
+    except KeyboardInterrupt:
+        raise typer.Exit(ExitCode.SUCCESS) from None
     except WorkshopError as e:
         err_console.print(f"[red]Error:[/red] {e.message}")
         raise typer.Exit(ExitCode.ENV_ERROR) from None
@@ -249,6 +754,24 @@ def list_cmd(
             help="Filter by stage name.",
         ),
     ] = None,
+    output_format: Annotated[
+        OutputFormat,
+        typer.Option(
+            "--format",
+            "-f",
+            help="Output format. plain, tsv and jsonl stream one line per item.",
+        ),
+    ] = OutputFormat.TEXT,
+    limit: Annotated[
+        int | None,
+        typer.Option(
+            "--limit",
+            "-n",
+            min=0,
+            help="Stop after this many items.",
+        ),
+    ] = None,
+    jobs: JobsOption = None,
 ) -> None:
     """List items in the workshop.
 
@@ -258,12 +781,26 @@ def list_cmd(
         steward list
         steward list --stage forge
         steward list -s backlog
+        steward list --format tsv | cut -f2
+        steward list --format jsonl --limit 10
+        STEWARD_JOBS=8 steward list
     """
+    from steward.application.list_service import iter_records
+
     console = get_console()
     err_console = get_error_console()
 
     try:
-        items = list_items(stage_filter)
+        records = iter_records(stage_filter, jobs)
+
+        if output_format is not OutputFormat.TEXT:
+            # Stream without Rich; stops scanning as soon as the limit is hit
+            with contextlib.closing(records):
+                write_records(islice(records, limit), output_format, sys.stdout)
+            raise typer.Exit(ExitCode.SUCCESS)
+
+        with contextlib.closing(records):
+            items = list(islice(records, limit))
 
         if not items:
             console.print("[dim]No items found[/dim]")
@@ -271,20 +808,431 @@ def list_cmd(
 
         console.print(f"[bold]Items ({len(items)}):[/bold]")
         for item in items:
-            console.print(f"  {item.slug} [{item.stage.value}]")
+            console.print(f"  {item.slug} \\[{item.stage}]")
 
         raise typer.Exit(ExitCode.SUCCESS)
 
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into head); exit quietly
+        with contextlib.suppress(OSError, ValueError):
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        raise typer.Exit(ExitCode.SUCCESS) from None
+
     except ValueError:
         err_console.print(f"[red]Error:[/red] Invalid stage: {stage_filter}")
         valid_stages = ", ".join(s.value for s in Stage)
         err_console.print(f"[dim]Valid stages: {valid_stages}[/dim]")
         raise typer.Exit(ExitCode.INVALID_ARGUMENT) from None
 
+    except LockTimeoutError as e:
+        err_console.print(f"[red]Error:[/red] {e.message}")
+        raise typer.Exit(ExitCode.LOCK_TIMEOUT) from None
+
+    except WorkshopError as e:
+        err_console.print(f"[red]Error:[/red] {e.message}")
+        raise typer.Exit(ExitCode.ENV_ERROR) from None
+
+
+@app.command()
+def search(
+    query: Annotated[
+        list[str],
+        typer.Argument(help="Words to look for (all must appear in an item).", show_default=False),
+    ],
+    stage_filter: Annotated[
+        str | None,
+        typer.Option(
+            "--stage",
+            "-s",
+            help="Only show items in this stage.",
+        ),
+    ] = None,
+    item: Annotated[
+        str | None,
+        typer.Option(
+            "--item",
+            "-i",
+            help="Only search this item (slug or slug prefix).",
+        ),
+    ] = None,
+    limit: Annotated[
+        int,
+        typer.Option(
+            "--limit",
+            "-n",
+            min=1,
+            help="Show at most this many items.",
+        ),
+    ] = 20,
+    no_refresh: Annotated[
+        bool,
+        typer.Option(
+            "--no-refresh",
+            help="Query the index as it is, without checking for changed files.",
+        ),
+    ] = False,
+    json_output: Annotated[
+        bool,
+        typer.Option(
+            "--json",
+            help="Print the hits as JSON.",
+        ),
+    ] = False,
+    jobs: JobsOption = None,
+) -> None:
+    """Search the notes of every item, best matches first.
+
+    Matches whole words in the items' markdown and text files, ignoring
+    case. Results are ranked by relevance (BM25). The search index under
+    _workshop/.steward/ is updated first, re-reading only files whose
+    size or modification time changed.
+
+    Examples:
+        steward search rate limit
+        steward search oauth --stage forge
+        steward search timeout --item api-gateway --json
+    """
+    import json
+
+    from steward.application.search_service import search_items
+
+    console = get_console()
+    err_console = get_error_console()
+
+    try:
+        hits = search_items(" ".join(query), stage_filter, item, limit, refresh=not no_refresh, jobs=jobs)
+
+    except ValueError:
+        err_console.print(f"[red]Error:[/red] Invalid stage: {stage_filter}")
+        valid_stages = ", ".join(s.value for s in Stage)
+        err_console.print(f"[dim]Valid stages: {valid_stages}[/dim]")
+        raise typer.Exit(ExitCode.INVALID_ARGUMENT) from None
+
+    except ItemNotFoundError as e:
+        err_console.print(f"[red]Error:[/red] {e.message}")
+        raise typer.Exit(ExitCode.ITEM_NOT_FOUND) from None
+
+    except AmbiguousItemError as e:
+        err_console.print(f"[red]Error:[/red] {e.message}")
+        err_console.print("[dim]Matching items:[/dim]")
+        for match in e.matches:
+            err_console.print(f"  - {match}")
+        raise typer.Exit(ExitCode.ITEM_NOT_FOUND) from None
+
+    except LockTimeoutError as e:
+        err_console.print(f"[red]Error:[/red] {e.message}")
+        raise typer.Exit(ExitCode.LOCK_TIMEOUT) from None
+
+    except WorkshopError as e:
+        err_console.print(f"[red]Error:[/red] {e.message}")
+        raise typer.Exit(ExitCode.ENV_ERROR) from None
+
+    if json_output:
+        data = [
+            {"id": hit.item_id, "slug": hit.slug, "stage": hit.stage, "score": round(hit.score, 4), "files": hit.files}
+            for hit in hits
+        ]
+        sys.stdout.write(json.dumps(data, indent=2) + "\n")
+        raise typer.Exit(ExitCode.SUCCESS)
+
+    if not hits:
+        console.print("[dim]No matches[/dim]")
+        raise typer.Exit(ExitCode.SUCCESS)
+
+    for hit in hits:
+        console.print(f"  {hit.slug} \\[{hit.stage or '?'}]  {hit.score:.2f}  [dim]{', '.join(hit.files)}[/dim]")
+    raise typer.Exit(ExitCode.SUCCESS)
+
+
+metrics_app = typer.Typer(
+    name="metrics",
+    help="Reports on steward's own behaviour and on the workshop's flow.",
+    no_args_is_help=True,
+)
+app.add_typer(metrics_app)
+
+
+@metrics_app.command("report")
+def metrics_report(
+    files: Annotated[
+        list[Path] | None,
+        typer.Argument(help="Metrics files (default: $STEWARD_METRICS).", show_default=False),
+    ] = None,
+    json_output: Annotated[
+        bool,
+        typer.Option(
+            "--json",
+            help="Print the summaries as JSON.",
+        ),
+    ] = False,
+) -> None:
+    """Aggregate command metrics into latency percentiles and histograms.
+
+    Reads the files written by commands run with STEWARD_METRICS set
+    (one JSON line per command) and summarises wall time per command,
+    overall and per workshop size (<1k, 1k-10k, 10k-100k, >=100k items).
+    Files from several hosts can be given together.
+
+    Examples:
+        STEWARD_METRICS=~/steward-metrics.jsonl steward list
+        steward metrics report ~/steward-metrics.jsonl
+        steward metrics report hosts/*.jsonl --json
+    """
+    import json
+
+    from steward.application.metrics_service import ALL_SIZES, LATENCY_BUCKETS_MS, summarize_metrics
+
+    console = get_console()
+    err_console = get_error_console()
+
+    if not files:
+        default = metrics_path()
+        if default is None:
+            err_console.print("[red]Error:[/red] Give metrics files or set STEWARD_METRICS")
+            raise typer.Exit(ExitCode.INVALID_ARGUMENT)
+        files = [default]
+
+    try:
+        summaries = summarize_metrics(files)
+    except FileNotFoundError as e:
+        err_console.print(f"[red]Error:[/red] No such metrics file: {e.filename}")
+        raise typer.Exit(ExitCode.ITEM_NOT_FOUND) from None
+
+    if json_output:
+        data = {
+            "buckets_ms": list(LATENCY_BUCKETS_MS),
+            "commands": [
+                {
+                    "command": summary.command,
+                    "size": summary.size_class,
+                    "count": summary.count,
+                    "errors": summary.errors,
+                    "p50_ms": summary.p50_ms,
+                    "p90_ms": summary.p90_ms,
+                    "p99_ms": summary.p99_ms,
+                    "max_ms": summary.max_ms,
+                    "histogram": list(summary.histogram),
+                    "phases_ms": {name: round(ms, 3) for name, ms in summary.phases_ms.items()},
+                }
+                for summary in summaries
+            ],
+        }
+        sys.stdout.write(json.dumps(data, indent=2) + "\n")
+        raise typer.Exit(ExitCode.SUCCESS)
+
+    if not summaries:
+        console.print("[dim]No metrics recorded[/dim]")
+        raise typer.Exit(ExitCode.SUCCESS)
+
+    console.print(
+        f"[bold]{'COMMAND':<10} {'SIZE':<9} {'RUNS':>7} {'ERRORS':>6} "
+        f"{'P50 MS':>9} {'P90 MS':>9} {'P99 MS':>9} {'MAX MS':>9}[/bold]"
+    )
+    for summary in summaries:
+        console.print(
+            f"{summary.command:<10} {summary.size_class:<9} {summary.count:>7} {summary.errors:>6} "
+            f"{summary.p50_ms:>9.1f} {summary.p90_ms:>9.1f} {summary.p99_ms:>9.1f} {summary.max_ms:>9.1f}"
+        )
+
+    labels = [f"<{bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">={LATENCY_BUCKETS_MS[-1]}ms"]
+    for summary in summaries:
+        if summary.size_class != ALL_SIZES:
+            continue
+        console.print(f"\n[bold]{summary.command}[/bold] wall time")
+        peak = max(summary.histogram)
+        first = next(i for i, n in enumerate(summary.histogram) if n)
+        last = max(i for i, n in enumerate(summary.histogram) if n)
+        for label, runs in list(zip(labels, summary.histogram, strict=True))[first : last + 1]:
+            console.print(f"  {label:>9} {runs:>7}  {'#' * round(40 * runs / peak)}")
+    raise typer.Exit(ExitCode.SUCCESS)
+
+
+@metrics_app.command("flow")
+def metrics_flow(
+    periods: Annotated[
+        int,
+        typer.Option(
+            "--periods",
+            "-p",
+            min=1,
+            help="Number of periods in the throughput and cumulative flow series.",
+        ),
+    ] = 12,
+    period_days: Annotated[
+        int,
+        typer.Option(
+            "--period-days",
+            min=1,
+            help="Length of a period in days.",
+        ),
+    ] = 7,
+    json_output: Annotated[
+        bool,
+        typer.Option(
+            "--json",
+            help="Print the report as JSON.",
+        ),
+    ] = False,
+    jobs: JobsOption = None,
+) -> None:
+    """Report lead time, time in stage, throughput and WIP aging.
+
+    Derived from each item's stage and its created and updated times:
+    lead time of finished (handoff, archive) items, time in the current
+    stage and age of items in progress, items finished and created per
+    period, and a cumulative flow series per stage. Times are in days.
+
+    Examples:
+        steward metrics flow
+        steward metrics flow --periods 26 --period-days 14
+        steward metrics flow --json | jq .lead_time_days
+    """
+    import json
+    from datetime import datetime
+
+    from steward.application.flow_service import AGING_BUCKETS_DAYS, flow_report
+
+    console = get_console()
+    err_console = get_error_console()
+
+    try:
+        report = flow_report(periods, period_days, jobs)
+    except LockTimeoutError as e:
+        err_console.print(f"[red]Error:[/red] {e.message}")
+        raise typer.Exit(ExitCode.LOCK_TIMEOUT) from None
     except WorkshopError as e:
         err_console.print(f"[red]Error:[/red] {e.message}")
         raise typer.Exit(ExitCode.ENV_ERROR) from None
 
+    def day(epoch: float) -> str:
+        return datetime.fromtimestamp(epoch).strftime("%Y-%m-%d")
+
+    aging_labels = [f"<{AGING_BUCKETS_DAYS[0]}d"]
+    aging_labels += [f"{low}-{high}d" for low, high in zip(AGING_BUCKETS_DAYS, AGING_BUCKETS_DAYS[1:], strict=False)]
+    aging_labels.append(f">={AGING_BUCKETS_DAYS[-1]}d")
+
+    def rounded(dist: "Distribution") -> dict[str, float]:
+        return {name: round(value, 3) for name, value in vars(dist).items()}
+
+    if json_output:
+        data = {
+            "items": report.items,
+            "stages": report.stage_counts,
+            "lead_time_days": rounded(report.lead_time),
+            "time_in_stage_days": {stage: rounded(dist) for stage, dist in report.time_in_stage.items()},
+            "aging_buckets": aging_labels,
+            "aging": {stage: list(counts) for stage, counts in report.aging.items()},
+            "period_days": report.period_days,
+            "periods": [
+                {
+                    "end": day(end),
+                    "finished": report.throughput[i],
+                    "created": report.arrivals[i],
+                    "cumulative": {stage: series[i] for stage, series in report.cumulative_flow.items()},
+                }
+                for i, end in enumerate(report.period_ends)
+            ],
+        }
+        sys.stdout.write(json.dumps(data, indent=2) + "\n")
+        raise typer.Exit(ExitCode.SUCCESS)
+
+    if not report.items:
+        console.print("[dim]No items found[/dim]")
+        raise typer.Exit(ExitCode.SUCCESS)
+
+    header = f"{'COUNT':>7} {'P50':>7} {'P85':>7} {'P95':>7} {'MAX':>7}"
+
+    def row(label: str, dist: "Distribution") -> str:
+        return f"{label:<9} {dist.count:>7} {dist.p50:>7.1f} {dist.p85:>7.1f} {dist.p95:>7.1f} {dist.max:>7.1f}"
+
+    console.print(
+        f"[bold]Items ({report.items}):[/bold] "
+        + ", ".join(f"{count} {stage}" for stage, count in report.stage_counts.items() if count)
+    )
+    console.print(f"\n[bold]Lead time, days[/bold]\n[bold]{'':<9} {header}[/bold]")
+    console.print(row("finished", report.lead_time))
+    console.print(f"\n[bold]Time in stage, days[/bold]\n[bold]{'STAGE':<9} {header}[/bold]")
+    for stage, dist in report.time_in_stage.items():
+        console.print(row(stage, dist))
+
+    console.print("\n[bold]WIP age[/bold]")
+    console.print("[bold]" + f"{'STAGE':<9}" + "".join(f" {label:>8}" for label in aging_labels) + "[/bold]")
+    for stage, counts in report.aging.items():
+        console.print(f"{stage:<9}" + "".join(f" {count:>8}" for count in counts))
+
+    stages = list(report.cumulative_flow)
+    console.print(f"\n[bold]Flow per {report.period_days} days[/bold]")
+    console.print(
+        "[bold]" + f"{'ENDING':<10} {'CREATED':>8} {'FINISHED':>8}" + "".join(f" {s:>8}" for s in stages) + "[/bold]"
+    )
+    peak = max(report.throughput) or 1
+    for i, end in enumerate(report.period_ends):
+        cumulative = "".join(f" {report.cumulative_flow[stage][i]:>8}" for stage in stages)
+        bar = "#" * round(20 * report.throughput[i] / peak)
+        console.print(f"{day(end):<10} {report.arrivals[i]:>8} {report.throughput[i]:>8}{cumulative}  {bar}".rstrip())
+    raise typer.Exit(ExitCode.SUCCESS)
+
+
+@app.command()
+def serve() -> None:
+    """Serve steward commands from a long-running process.
+
+    Listens on a Unix socket at _workshop/.steward/steward.sock and runs
+    commands forwarded by steward-client, keeping the application
+    services and item index warm between calls. Commands are handled
+    one at a time. Stop with Ctrl-C or SIGTERM.
+
+    steward-client falls back to running commands itself when no server
+    is listening, so the server is purely an optimisation.
+
+    Examples:
+        steward serve &
+        steward-client list --stage forge
+    """
+    import signal
+
+    from steward.infrastructure.console import use_plain_consoles
+    from steward.infrastructure.daemon import bind_socket, close_socket, get_socket_path, serve_forever
+    from steward.infrastructure.env import get_workshop_path
+    from steward.server import run_forwarded, warm_up
+
+    console = get_console()
+    err_console = get_error_console()
+
+    # Shut down cleanly (removing the socket) on SIGTERM as on Ctrl-C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        workshop_path = get_workshop_path()
+        if not workshop_path.exists():
+            err_console.print(f"[red]Error:[/red] Workshop not found at {workshop_path}")
+            raise typer.Exit(ExitCode.ENV_ERROR)
+
+        warm_up()
+        socket_path = get_socket_path(workshop_path)
+        server = bind_socket(socket_path)
+
+    except FileExistsError as e:
+        err_console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(ExitCode.GENERAL_ERROR) from None
+
+    except OSError as e:
+        err_console.print(f"[red]Error:[/red] Cannot listen on socket: {e}")
+        raise typer.Exit(ExitCode.ENV_ERROR) from None
+
+    except WorkshopError as e:
+        err_console.print(f"[red]Error:[/red] {e.message}")
+        raise typer.Exit(ExitCode.ENV_ERROR) from None
+
+    with contextlib.suppress(KeyboardInterrupt):
+        try:
+            console.print(f"[green]Serving on:[/green] {socket_path}")
+            use_plain_consoles()
+            serve_forever(server, run_forwarded)
+        finally:
+            close_socket(server, socket_path)
+    raise typer.Exit(ExitCode.SUCCESS)
+
 
 if __name__ == "__main__":
     app()
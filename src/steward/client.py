@@ -0,0 +1,68 @@
+"""Thin client entry point (steward-client).
+
+Forwards argv to a running ``steward serve`` over its Unix socket and
+streams back output and the exit code. When no server is reachable the
+command runs in-process, exactly as ``steward`` would; so do ``serve``
+and ``watch``, which run until stopped.
+
+Only the standard library and steward's lightweight modules are
+imported on the forwarding path.
+"""
+
+import io
+import os
+import sys
+
+from steward.domain.errors import WorkshopError
+from steward.infrastructure.daemon import LOCAL_COMMANDS, forward, forwarded_env, get_socket_path
+from steward.infrastructure.env import get_workshop_path
+
+
+def _write(stream: str, data: str) -> None:
+    out = sys.stderr if stream == "stderr" else sys.stdout
+    out.write(data)
+    out.flush()
+
+
+def _read_stdin(argv: list[str]) -> str:
+    """Read stdin for commands that consume it (steward stage --batch)."""
+    if argv[0] == "stage" and "--batch" in argv and not sys.stdin.isatty():
+        return sys.stdin.read()
+    return ""
+
+
+def main() -> None:
+    """Run a steward command, via the server when one is running."""
+    argv = sys.argv[1:]
+    code: int | None = None
+    stdin = ""
+
+    if argv and argv[0] not in LOCAL_COMMANDS:
+        try:
+            socket_path = get_socket_path(get_workshop_path())
+        except WorkshopError:
+            socket_path = None
+        if socket_path is not None:
+            stdin = _read_stdin(argv)
+            try:
+                code = forward(socket_path, argv, os.getcwd(), _write, stdin, forwarded_env())
+            except BrokenPipeError:
+                # Reader went away (e.g. piped into head); exit quietly
+                os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+                code = 0
+
+    if code is None:
+        from steward.cli import app
+
+        if stdin:
+            # Already consumed for the server; hand it to the local run
+            sys.stdin = io.StringIO(stdin)
+
+        app(prog_name="steward")
+        return
+
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
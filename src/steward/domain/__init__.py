@@ -1,16 +1,43 @@
-"""Domain layer - pure business logic."""
+"""Domain layer - pure business logic.
 
-from steward.domain.errors import (
-    AmbiguousItemError,
-    InvalidStageTransitionError,
-    ItemNotFoundError,
-    WorkshopAlreadyExistsError,
-    WorkshopError,
-    WorkshopNotFoundError,
-)
-from steward.domain.exit_codes import ExitCode
-from steward.domain.models import Item, Status
-from steward.domain.stages import Stage, get_stage_path, is_valid_transition
+Names are imported lazily on first access; see steward._lazy.
+"""
+
+from typing import TYPE_CHECKING
+
+from steward._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from steward.domain.errors import (
+        AmbiguousItemError,
+        InvalidStageTransitionError,
+        ItemNotFoundError,
+        WorkshopAlreadyExistsError,
+        WorkshopError,
+        WorkshopNotFoundError,
+    )
+    from steward.domain.exit_codes import ExitCode
+    from steward.domain.models import Item, Status
+    from steward.domain.records import ItemRecord
+    from steward.domain.stages import Stage, get_stage_path, is_valid_transition
+
+_EXPORTS = {
+    "AmbiguousItemError": "steward.domain.errors",
+    "ExitCode": "steward.domain.exit_codes",
+    "InvalidStageTransitionError": "steward.domain.errors",
+    "Item": "steward.domain.models",
+    "ItemNotFoundError": "steward.domain.errors",
+    "ItemRecord": "steward.domain.records",
+    "Stage": "steward.domain.stages",
+    "Status": "steward.domain.models",
+    "WorkshopAlreadyExistsError": "steward.domain.errors",
+    "WorkshopError": "steward.domain.errors",
+    "WorkshopNotFoundError": "steward.domain.errors",
+    "get_stage_path": "steward.domain.stages",
+    "is_valid_transition": "steward.domain.stages",
+}
+
+__getattr__ = lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "AmbiguousItemError",
@@ -18,6 +45,7 @@ __all__ = [
     "InvalidStageTransitionError",
     "Item",
     "ItemNotFoundError",
+    "ItemRecord",
     "Stage",
     "Status",
     "WorkshopAlreadyExistsError",
@@ -46,3 +46,9 @@ class InvalidStageTransitionError(WorkshopError):
         super().__init__(message)
         self.from_stage = from_stage
         self.to_stage = to_stage
+
+
+class LockTimeoutError(WorkshopError):
+    """Another steward process held the workshop lock for too long."""
+
+    pass
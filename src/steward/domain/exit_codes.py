@@ -19,4 +19,5 @@ class ExitCode(IntEnum):
     ITEM_NOT_FOUND = 66  # EX_NOINPUT - cannot open input
     WORKSHOP_EXISTS = 73  # EX_CANTCREAT - can't create output
     INVALID_TRANSITION = 65  # EX_DATAERR - input data incorrect
+    LOCK_TIMEOUT = 75  # EX_TEMPFAIL - temporary failure, retry later
     ENV_ERROR = 78  # EX_CONFIG - configuration error
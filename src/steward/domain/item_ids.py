@@ -0,0 +1,24 @@
+"""Item ID conventions.
+
+Item IDs have the form YYYY-MM-DD-HHMM__slug; the double underscore
+separates the timestamp from the slug.
+"""
+
+from datetime import datetime
+
+ID_SEPARATOR = "__"
+ID_TIME_FORMAT = "%Y-%m-%d-%H%M"
+
+
+def slug_from_id(item_id: str) -> str | None:
+    """Extract the slug from an item ID, or None if it has no separator."""
+    if ID_SEPARATOR not in item_id:
+        return None
+    return item_id.split(ID_SEPARATOR, 1)[1]
+
+
+def generate_item_id(slug: str, timestamp: datetime | None = None) -> str:
+    """Generate an item ID in format YYYY-MM-DD-HHMM__slug."""
+    if timestamp is None:
+        timestamp = datetime.now()
+    return f"{timestamp.strftime(ID_TIME_FORMAT)}{ID_SEPARATOR}{slug}"
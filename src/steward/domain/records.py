@@ -0,0 +1,55 @@
+"""Lightweight item records for bulk operations.
+
+Listing and syncing touch every item in the workshop but only need its
+id, slug, stage and timestamps. ItemRecord holds those as plain strings
+in a slotted, immutable object, which is several times smaller and
+cheaper to build than a pydantic Item. Convert to Item with to_item()
+only where a caller needs the full domain model.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from steward.domain.stages import Stage
+
+if TYPE_CHECKING:
+    from steward.domain.models import Item
+
+# Canonical stage strings, so every record shares one object per stage
+STAGE_VALUES: dict[str, str] = {stage.value: stage.value for stage in Stage}
+
+
+@dataclass(frozen=True, slots=True)
+class ItemRecord:
+    """Compact view of one item's status.
+
+    Timestamps are kept as their ISO 8601 strings and parsed on demand.
+    """
+
+    id: str
+    slug: str
+    stage: str
+    created: str
+    updated: str
+
+    def to_item(self, items_path: Path) -> "Item":
+        """Build the domain Item for this record.
+
+        Records are validated when they are created, so the models are
+        constructed without re-running pydantic validation.
+        """
+        from steward.domain.models import Item, Status
+
+        status = Status.model_construct(
+            stage=self.stage,
+            created=datetime.fromisoformat(self.created),
+            updated=datetime.fromisoformat(self.updated),
+        )
+        return Item.model_construct(
+            id=self.id,
+            slug=self.slug,
+            status=status,
+            path=f"{items_path}/{self.id}",
+        )
@@ -1,24 +1,57 @@
-"""Infrastructure layer - external adapters and implementations."""
+"""Infrastructure layer - external adapters and implementations.
 
-from steward.infrastructure.console import get_console, get_error_console
-from steward.infrastructure.env import get_praxis_home, get_workshop_path
-from steward.infrastructure.filesystem import (
-    create_symlink,
-    ensure_directory,
-    remove_symlink,
-)
-from steward.infrastructure.slugify import slugify
-from steward.infrastructure.status_yaml import read_status, write_status
+Adapters are imported lazily on first access; see steward._lazy.
+"""
+
+from typing import TYPE_CHECKING
+
+from steward._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from steward.infrastructure.console import get_console, get_error_console
+    from steward.infrastructure.durability import Durability
+    from steward.infrastructure.env import get_praxis_home, get_workshop_path
+    from steward.infrastructure.filesystem import (
+        create_symlink,
+        ensure_directory,
+        remove_symlink,
+    )
+    from steward.infrastructure.item_index import ItemIndex, open_index
+    from steward.infrastructure.slugify import slugify
+    from steward.infrastructure.status_yaml import read_status, write_status, write_statuses
+
+_EXPORTS = {
+    "Durability": "steward.infrastructure.durability",
+    "ItemIndex": "steward.infrastructure.item_index",
+    "create_symlink": "steward.infrastructure.filesystem",
+    "ensure_directory": "steward.infrastructure.filesystem",
+    "get_console": "steward.infrastructure.console",
+    "get_error_console": "steward.infrastructure.console",
+    "get_praxis_home": "steward.infrastructure.env",
+    "get_workshop_path": "steward.infrastructure.env",
+    "open_index": "steward.infrastructure.item_index",
+    "read_status": "steward.infrastructure.status_yaml",
+    "remove_symlink": "steward.infrastructure.filesystem",
+    "slugify": "steward.infrastructure.slugify",
+    "write_status": "steward.infrastructure.status_yaml",
+    "write_statuses": "steward.infrastructure.status_yaml",
+}
+
+__getattr__ = lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
+    "Durability",
+    "ItemIndex",
     "create_symlink",
     "ensure_directory",
     "get_console",
     "get_error_console",
     "get_praxis_home",
     "get_workshop_path",
+    "open_index",
     "read_status",
     "remove_symlink",
     "slugify",
     "write_status",
+    "write_statuses",
 ]
@@ -1,29 +1,96 @@
-"""Console output utilities using Rich."""
+"""Console output utilities.
 
+Rich is only imported when the stream is a terminal. Pipes, files and
+test runners get a PlainConsole that strips Rich markup and writes text
+directly, which keeps non-interactive invocations fast to start.
+"""
+
+import re
 import sys
+from typing import Any, Protocol, TextIO
+
+# Rich markup tags: [bold], [/green], [/], etc. A preceding backslash
+# escapes the tag (rendered literally), matching rich.markup semantics.
+_MARKUP_TAG = re.compile(r"(\\*)\[([a-z#/@][^\[]*?)\]")
+
+
+class OutputConsole(Protocol):
+    """The subset of rich.console.Console used by the CLI."""
+
+    def print(self, *objects: Any) -> None: ...
+
+
+class PlainConsole:
+    """Markup-stripping console for non-TTY output."""
+
+    def __init__(self, stderr: bool = False) -> None:
+        self.stderr = stderr
+
+    @property
+    def file(self) -> TextIO:
+        """The stream to write to, resolved at print time."""
+        return sys.stderr if self.stderr else sys.stdout
+
+    def print(self, *objects: Any) -> None:
+        """Print objects separated by spaces, with markup removed."""
+        text = " ".join(strip_markup(str(obj)) for obj in objects)
+        stream = self.file
+        stream.write(text + "\n")
+        stream.flush()
+
 
-from rich.console import Console
+def strip_markup(text: str) -> str:
+    """Remove Rich markup tags from text, honouring backslash escapes."""
 
-_console: Console | None = None
-_error_console: Console | None = None
+    def replace(match: re.Match[str]) -> str:
+        backslashes, escaped = divmod(len(match.group(1)), 2)
+        if escaped:
+            return "\\" * backslashes + f"[{match.group(2)}]"
+        return "\\" * backslashes
 
+    return _MARKUP_TAG.sub(replace, text)
 
-def get_console() -> Console:
+
+def _make_console(stderr: bool) -> OutputConsole:
+    stream = sys.stderr if stderr else sys.stdout
+    if not stream.isatty():
+        return PlainConsole(stderr=stderr)
+
+    from rich.console import Console
+
+    return Console(stderr=stderr)
+
+
+_console: OutputConsole | None = None
+_error_console: OutputConsole | None = None
+
+
+def get_console() -> OutputConsole:
     """Get the stdout console (for data output)."""
     global _console
     if _console is None:
-        _console = Console()
+        _console = _make_console(stderr=False)
     return _console
 
 
-def get_error_console() -> Console:
+def get_error_console() -> OutputConsole:
     """Get the stderr console (for diagnostics)."""
     global _error_console
     if _error_console is None:
-        _error_console = Console(stderr=True)
+        _error_console = _make_console(stderr=True)
     return _error_console
 
 
+def use_plain_consoles() -> None:
+    """Force markup-free output on both consoles.
+
+    Used when output is captured and forwarded, as in steward serve.
+    """
+    global _console, _error_console
+    _console = PlainConsole()
+    _error_console = PlainConsole(stderr=True)
+
+
 def is_tty() -> bool:
     """Check if stdout is a TTY."""
     return sys.stdout.isatty()
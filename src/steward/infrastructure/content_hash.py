@@ -0,0 +1,161 @@
+"""Streaming content digests of intake sources and item directories.
+
+The content digest of a tree is the SHA-256 of its files' relative
+paths and digests, in path order, so it does not depend on timestamps,
+listing order or how the files were copied. A tree holding a single
+file is identified by that file's digest alone, so a renamed copy of a
+dropped file still matches the item it was intaken into.
+
+Files are read in fixed-size chunks (never whole) by a thread pool;
+hashlib releases the GIL while hashing, so large trees hash on several
+cores. Callers pass in the digests they already know, keyed by (device,
+inode) and checked against mtime and size, so unchanged files are not
+read again.
+"""
+
+import hashlib
+import os
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+
+from steward.infrastructure.tracing import Phase, phase
+
+HASH_ALGORITHM = "sha256"
+
+# (device, inode)
+FileKey = tuple[int, int]
+
+# (device, inode) -> (mtime_ns, size, digest) of digests computed earlier
+DigestCache = Mapping[FileKey, tuple[int, int, bytes]]
+
+
+class DuplicatePolicy(StrEnum):
+    """What intake does with a source whose content is already an item."""
+
+    WARN = "warn"  # intake it anyway, naming the existing item
+    SKIP = "skip"  # leave the source where it is
+    LINK = "link"  # point an inbox source at the existing item with a symlink; --move removes it
+
+
+@dataclass(frozen=True)
+class FileState:
+    """A regular file of a tree, as stat'ed when the tree was listed."""
+
+    relative: str
+    path: str
+    dev: int
+    ino: int
+    mtime_ns: int
+    size: int
+
+    @property
+    def key(self) -> FileKey:
+        return (self.dev, self.ino)
+
+
+@dataclass(frozen=True)
+class ContentDigest:
+    """Digest of a file or tree, with its total size and file count."""
+
+    digest: bytes
+    size: int
+    files: int
+
+    @property
+    def hex(self) -> str:
+        return self.digest.hex()
+
+
+def _state(relative: str, path: str, st: os.stat_result) -> FileState:
+    return FileState(relative, path, st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def list_content(path: Path, exclude: tuple[str, ...] = ()) -> list[FileState]:
+    """List the regular files of a file or directory tree, sorted by relative path.
+
+    Symlinks to files count as the file they point to; symlinked
+    directories are not followed.
+
+    Args:
+        path: A file (listed with an empty relative path) or directory.
+        exclude: Names to leave out at the top of the tree (e.g. status.yaml).
+
+    Raises:
+        OSError: If path cannot be stat'ed or listed.
+    """
+    with phase(Phase.SCAN):
+        if not path.is_dir():
+            return [_state("", str(path), os.stat(path))]
+        found: list[FileState] = []
+        stack = [""]
+        while stack:
+            relative = stack.pop()
+            with os.scandir(f"{path}/{relative}") as entries:
+                for entry in entries:
+                    name = f"{relative}{entry.name}"
+                    if not relative and entry.name in exclude:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(f"{name}/")
+                    elif entry.is_file():
+                        found.append(_state(name, entry.path, entry.stat()))
+        found.sort(key=lambda state: state.relative)
+        return found
+
+
+def hash_file(path: str) -> bytes:
+    """Digest a file, reading it in chunks."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, HASH_ALGORITHM).digest()
+
+
+def combine(files: list[FileState], digests: Mapping[FileKey, bytes]) -> ContentDigest:
+    """Combine per-file digests into the digest of their tree."""
+    if len(files) == 1:
+        digest = digests[files[0].key]
+    else:
+        h = hashlib.new(HASH_ALGORITHM)
+        for state in files:
+            h.update(state.relative.encode("utf-8", "surrogateescape"))
+            h.update(b"\0")
+            h.update(digests[state.key])
+        digest = h.digest()
+    return ContentDigest(digest, sum(state.size for state in files), len(files))
+
+
+def hash_files(files: list[FileState], cache: DigestCache, workers: int) -> dict[FileKey, bytes]:
+    """Digest files, reusing cached digests of files that did not change.
+
+    Args:
+        files: Files to digest; hard links to the same inode are read once.
+        cache: Earlier digests; used when mtime and size still match.
+        workers: Threads reading the files that are not cached.
+
+    Returns:
+        A digest per (device, inode) of files.
+
+    Raises:
+        OSError: If a file could not be read.
+    """
+    digests: dict[FileKey, bytes] = {}
+    todo: dict[FileKey, FileState] = {}
+    for state in files:
+        cached = cache.get(state.key)
+        if cached is not None and cached[:2] == (state.mtime_ns, state.size):
+            digests[state.key] = cached[2]
+        else:
+            todo.setdefault(state.key, state)
+    if not todo:
+        return digests
+    paths = [state.path for state in todo.values()]
+    with phase(Phase.PARSE):
+        if workers <= 1 or len(paths) == 1:
+            computed = [hash_file(path) for path in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+                computed = list(pool.map(hash_file, paths))
+    digests.update(zip(todo, computed, strict=True))
+    return digests
@@ -0,0 +1,226 @@
+"""File copy engine for intake.
+
+Copies files with the cheapest strategy the filesystem supports:
+
+- reflink: FICLONE ioctl; the copy shares data blocks with the source
+  until either is modified (btrfs, XFS, bcachefs, ...).
+- hardlink: os.link; no data is copied, and source and item share the
+  same inode, so edits to one show up in the other.
+- copy_file_range / sendfile: the kernel copies the data without it
+  passing through user space.
+- userspace: a plain read/write loop, the last resort.
+
+Unsupported strategies fall back to the next one automatically. Copies
+keep file metadata, like shutil.copy2.
+"""
+
+import errno
+import fcntl
+import os
+import shutil
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+
+# From <linux/fs.h>: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# Errors meaning "this strategy is not available here", not a real failure.
+# EPERM (seccomp filters) and EBADF (some FUSE filesystems) are included
+# for the kernel-side copies, like coreutils does: the copy is retried
+# with the next strategy, down to a plain read/write loop, which reports
+# any genuine permission or I/O error with its real errno.
+_UNSUPPORTED = frozenset(
+    {
+        errno.EOPNOTSUPP,
+        errno.ENOTSUP,
+        errno.ENOTTY,
+        errno.EXDEV,
+        errno.EINVAL,
+        errno.ENOSYS,
+        errno.EBADF,
+        errno.EPERM,
+    }
+)
+
+# os.link: EPERM where the filesystem has no hard links, EMLINK when the
+# source has too many; the file is then copied instead
+_LINK_UNSUPPORTED = frozenset({errno.EOPNOTSUPP, errno.ENOTSUP, errno.EXDEV, errno.ENOSYS, errno.EPERM, errno.EMLINK})
+
+_CHUNK_SIZE = 8 * 1024 * 1024
+
+# (src_fd, dst_fd, size) -> None; raises OSError when unsupported
+_Strategy = Callable[[int, int, int], None]
+
+
+class LinkMode(StrEnum):
+    """How intake places file data in 9-items/."""
+
+    AUTO = "auto"  # reflink if possible, else kernel copy
+    REFLINK = "reflink"  # same as auto, but named for intent
+    HARDLINK = "hardlink"  # share the inode; falls back to auto
+    COPY = "copy"  # always a real copy (kernel-side when possible)
+
+
+@dataclass
+class CopyStats:
+    """What a copy did and how fast."""
+
+    bytes: int = 0
+    files: int = 0
+    seconds: float = 0.0
+    # Files copied per strategy
+    strategies: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def strategy(self) -> str:
+        """The strategy used, or several joined with '+'."""
+        return "+".join(sorted(self.strategies)) or "none"
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second (0 when nothing was timed)."""
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+class CopyEngine:
+    """Copies files and trees, recording what it did in ``stats``.
+
+    One engine should be used per source; it remembers strategies that
+    failed as unsupported so they are not retried for every file.
+    """
+
+    def __init__(self, mode: LinkMode = LinkMode.AUTO) -> None:
+        self.mode = mode
+        self.stats = CopyStats()
+        self._unsupported: set[str] = set()
+
+    def copy_file(self, src: str, dst: str) -> str:
+        """Copy one file (usable as a shutil.copytree copy_function).
+
+        Returns:
+            dst.
+        """
+        size = os.stat(src).st_size
+        strategy = None
+        if self.mode is LinkMode.HARDLINK:
+            strategy = self._try_hardlink(src, dst)
+        if strategy is None:
+            strategy, size = self._copy_data(src, dst, size)
+            shutil.copystat(src, dst)
+        self.stats.bytes += size
+        self.stats.files += 1
+        self.stats.strategies[strategy] = self.stats.strategies.get(strategy, 0) + 1
+        return dst
+
+    def copy_tree(self, src: Path, dst: Path) -> None:
+        """Copy the contents of a directory into dst."""
+        shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=self.copy_file)
+
+    def copy(self, src: Path, dst_dir: Path) -> CopyStats:
+        """Copy a file into dst_dir, or a directory's contents into it.
+
+        Returns:
+            The engine's stats, including the time taken.
+        """
+        start = time.perf_counter()
+        if src.is_dir():
+            self.copy_tree(src, dst_dir)
+        else:
+            self.copy_file(str(src), str(dst_dir / src.name))
+        self.stats.seconds += time.perf_counter() - start
+        return self.stats
+
+    def _try_hardlink(self, src: str, dst: str) -> str | None:
+        if "hardlink" in self._unsupported:
+            return None
+        try:
+            os.link(src, dst)
+        except OSError as e:
+            if e.errno not in _LINK_UNSUPPORTED:
+                raise
+            self._unsupported.add("hardlink")
+            return None
+        return "hardlink"
+
+    def _copy_data(self, src: str, dst: str, size: int) -> tuple[str, int]:
+        """Copy a file's data, returning the strategy used and the bytes copied."""
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                return self._copy_fds(src_fd, dst_fd, size), os.fstat(dst_fd).st_size
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+    def _copy_fds(self, src_fd: int, dst_fd: int, size: int) -> str:
+        # An empty size may just be unknown (procfs): only reading to EOF tells
+        if size:
+            strategies = _KERNEL_COPIES if self.mode is LinkMode.COPY else _CLONE_OR_COPY
+            for name, func in strategies:
+                if self._attempt(name, func, src_fd, dst_fd, size):
+                    return name
+        _userspace_copy(src_fd, dst_fd)
+        return "userspace"
+
+    def _attempt(self, name: str, func: _Strategy, src_fd: int, dst_fd: int, size: int) -> bool:
+        if name in self._unsupported:
+            return False
+        try:
+            func(src_fd, dst_fd, size)
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED:
+                raise
+            self._unsupported.add(name)
+            # Start the next strategy from a clean destination
+            os.ftruncate(dst_fd, 0)
+            os.lseek(src_fd, 0, os.SEEK_SET)
+            os.lseek(dst_fd, 0, os.SEEK_SET)
+            return False
+        return True
+
+
+def _reflink(src_fd: int, dst_fd: int, size: int) -> None:
+    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+
+
+def _short_copy(name: str, copied: int, size: int) -> OSError:
+    # procfs, sysfs and some FUSE/overlay setups report 0 bytes copied
+    # where a read would return data; let the next strategy copy it
+    return OSError(errno.ENOTSUP, f"{name} stopped after {copied} of {size} bytes")
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, size: int) -> None:
+    remaining = size
+    while remaining > 0:
+        copied = os.copy_file_range(src_fd, dst_fd, min(remaining, _CHUNK_SIZE))
+        if copied == 0:
+            raise _short_copy("copy_file_range", size - remaining, size)
+        remaining -= copied
+
+
+def _sendfile(src_fd: int, dst_fd: int, size: int) -> None:
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(dst_fd, src_fd, offset, min(size - offset, _CHUNK_SIZE))
+        if sent == 0:
+            raise _short_copy("sendfile", offset, size)
+        offset += sent
+
+
+def _userspace_copy(src_fd: int, dst_fd: int) -> None:
+    while chunk := os.read(src_fd, _CHUNK_SIZE):
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(dst_fd, view) :]
+
+
+# Kernel-side strategies available on this platform, in order of preference
+_KERNEL_COPIES: list[tuple[str, _Strategy]] = [
+    (name, func) for name, func in (("copy_file_range", _copy_file_range), ("sendfile", _sendfile)) if hasattr(os, name)
+]
+_CLONE_OR_COPY: list[tuple[str, _Strategy]] = [("reflink", _reflink), *_KERNEL_COPIES]
@@ -0,0 +1,166 @@
+"""Unix socket transport for steward serve.
+
+The wire protocol is newline-delimited JSON. A client sends one request
+frame and then reads output frames until it receives the exit frame:
+
+    -> {"argv": ["list", "--stage", "forge"], "cwd": "/some/dir", "stdin": "", "env": {"STEWARD_JOBS": "4"}}
+    <- {"stream": "stdout", "data": "Items (2):\\n"}
+    <- {"stream": "stderr", "data": "..."}
+    <- {"exit": 0}
+
+"stdin" is optional and carries the client's standard input for commands
+that read it (steward stage --batch). "env" is optional and carries the
+client's STEWARD_* variables (jobs, durability, lock timeout, tracing,
+...), which the server applies for that command only.
+
+This module only depends on the standard library so that the thin
+client stays fast to start.
+"""
+
+import contextlib
+import json
+import os
+import socket
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from steward.domain.exit_codes import ExitCode
+from steward.infrastructure.state import get_state_path
+
+SOCKET_FILENAME = "steward.sock"
+
+# Client environment variables forwarded with each request
+FORWARDED_ENV_PREFIX = "STEWARD_"
+
+# Commands that run until stopped; forwarded, they would keep the
+# single-threaded server from answering anyone else
+LOCAL_COMMANDS = frozenset({"serve", "watch"})
+
+# Handler invoked per request: (argv, cwd, write, stdin, env) -> exit
+# code, where write(stream, data) forwards output to the client.
+RequestHandler = Callable[[list[str], str, Callable[[str, str], None], str, dict[str, str]], int]
+
+
+def get_socket_path(workshop_path: Path) -> Path:
+    """Get the path of the serve socket for a workshop."""
+    return get_state_path(workshop_path) / SOCKET_FILENAME
+
+
+def _send(sock: socket.socket, frame: dict[str, Any]) -> None:
+    sock.sendall(json.dumps(frame).encode("utf-8") + b"\n")
+
+
+def _frames(sock: socket.socket) -> Iterator[dict[str, Any]]:
+    with sock.makefile("rb") as reader:
+        for line in reader:
+            yield json.loads(line)
+
+
+def _is_listening(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def bind_socket(socket_path: Path) -> socket.socket:
+    """Bind and listen on the serve socket, replacing a stale one.
+
+    Raises:
+        FileExistsError: If another server is already listening.
+    """
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        if _is_listening(socket_path):
+            raise FileExistsError(f"steward serve is already running on {socket_path}")
+        socket_path.unlink()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    os.chmod(socket_path, 0o600)
+    server.listen()
+    return server
+
+
+def serve_forever(server: socket.socket, handler: RequestHandler) -> None:
+    """Answer requests one at a time until interrupted.
+
+    Requests are handled sequentially, which serialises commands issued
+    through the daemon.
+    """
+    while True:
+        conn, _ = server.accept()
+        with conn:
+            _handle(conn, handler)
+
+
+def close_socket(server: socket.socket, socket_path: Path) -> None:
+    """Stop listening and remove the socket file."""
+    server.close()
+    with contextlib.suppress(FileNotFoundError):
+        socket_path.unlink()
+
+
+def _handle(conn: socket.socket, handler: RequestHandler) -> None:
+    try:
+        request = next(_frames(conn))
+    except (StopIteration, ValueError):
+        return
+
+    def write(stream: str, data: str) -> None:
+        with contextlib.suppress(OSError):
+            _send(conn, {"stream": stream, "data": data})
+
+    env = {str(name): str(value) for name, value in dict(request.get("env", {})).items()}
+    code = handler(
+        list(request.get("argv", [])), str(request.get("cwd", "/")), write, str(request.get("stdin", "")), env
+    )
+    with contextlib.suppress(OSError):
+        _send(conn, {"exit": code})
+
+
+def forwarded_env() -> dict[str, str]:
+    """The STEWARD_* variables of this process, to send with a request."""
+    return {name: value for name, value in os.environ.items() if name.startswith(FORWARDED_ENV_PREFIX)}
+
+
+def forward(
+    socket_path: Path,
+    argv: list[str],
+    cwd: str,
+    write: Callable[[str, str], None],
+    stdin: str = "",
+    env: dict[str, str] | None = None,
+) -> int | None:
+    """Run a command through a running server.
+
+    Args:
+        env: Variables the command should see (see forwarded_env).
+
+    Returns:
+        The command's exit code, or None if no server is reachable (the
+        caller should then run the command locally).
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+
+    with sock:
+        request: dict[str, Any] = {"argv": argv, "cwd": cwd}
+        if stdin:
+            request["stdin"] = stdin
+        if env:
+            request["env"] = env
+        _send(sock, request)
+        for frame in _frames(sock):
+            if "exit" in frame:
+                return int(frame["exit"])
+            write(frame["stream"], frame["data"])
+    # Server went away mid-command
+    return ExitCode.GENERAL_ERROR
@@ -0,0 +1,86 @@
+"""How hard steward works to make writes survive a crash.
+
+Set STEWARD_DURABILITY to one of:
+
+- none: files are replaced atomically (never seen half-written by
+  another process), but nothing is flushed to disk.
+- file: every file and its directory are fsynced before the write
+  returns. Safe, but each write waits for the disk.
+- group (default): a batch of writes shares its flushes. All new files
+  are written, then fsynced together, then renamed into place, and each
+  directory holding a renamed file is fsynced once at the end. The
+  fsyncs of a batch are issued concurrently, so the disk can merge them.
+"""
+
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+from pathlib import Path
+
+from steward.domain.errors import WorkshopError
+
+DURABILITY_ENV_VAR = "STEWARD_DURABILITY"
+
+
+class Durability(StrEnum):
+    """Durability modes for steward's writes."""
+
+    NONE = "none"
+    FILE = "file"
+    GROUP = "group"
+
+
+def resolve_durability(durability: Durability | None = None) -> Durability:
+    """Resolve the durability mode.
+
+    Uses, in order: the explicit value, $STEWARD_DURABILITY, or group.
+
+    Raises:
+        WorkshopError: If $STEWARD_DURABILITY is not a known mode.
+    """
+    if durability is not None:
+        return durability
+    value = os.environ.get(DURABILITY_ENV_VAR)
+    if not value:
+        return Durability.GROUP
+    try:
+        return Durability(value)
+    except ValueError:
+        valid = ", ".join(mode.value for mode in Durability)
+        raise WorkshopError(f"{DURABILITY_ENV_VAR} must be one of {valid}, got: {value}") from None
+
+
+def fsync_directory(path: Path) -> None:
+    """Flush a directory's entries (e.g. a rename into it) to disk."""
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_file(path: Path) -> None:
+    """Flush a file's data and metadata to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_all(fsync: Callable[[Path], None], paths: Sequence[Path], max_workers: int = 16) -> None:
+    """Flush many files or directories, with the fsyncs in flight together.
+
+    Args:
+        fsync: fsync_file or fsync_directory.
+        paths: What to flush.
+        max_workers: Most fsyncs waiting on the disk at once.
+    """
+    if len(paths) <= 1:
+        for path in paths:
+            fsync(path)
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        # list() re-raises the first error
+        list(pool.map(fsync, paths))
@@ -4,6 +4,7 @@ import os
 from pathlib import Path
 
 from steward.domain.errors import WorkshopError
+from steward.infrastructure.tracing import Phase, phase
 
 PRAXIS_HOME_VAR = "PRAXIS_HOME"
 WORKSHOP_DIR = "_workshop"
@@ -32,4 +33,5 @@ def get_workshop_path() -> Path:
     Returns:
         Path to $PRAXIS_HOME/_workshop/
     """
-    return get_praxis_home() / WORKSHOP_DIR
+    with phase(Phase.ENV):
+        return get_praxis_home() / WORKSHOP_DIR
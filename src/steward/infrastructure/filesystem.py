@@ -1,8 +1,11 @@
 """Filesystem operations for workshop management."""
 
 import os
+import shutil
 from pathlib import Path
 
+from steward.infrastructure.tracing import Phase, phase
+
 
 def ensure_directory(path: Path) -> None:
     """Create directory and parents if they don't exist."""
@@ -16,23 +19,87 @@ def create_symlink(target: Path, link: Path) -> None:
         target: The path the symlink points to (canonical item).
         link: The symlink path to create (in stage folder).
     """
-    # Ensure parent directory exists
-    link.parent.mkdir(parents=True, exist_ok=True)
+    with phase(Phase.LINK):
+        # Ensure parent directory exists
+        link.parent.mkdir(parents=True, exist_ok=True)
 
-    # Calculate relative path from link location to target
-    relative_target = Path(os.path.relpath(target, link.parent))
+        # Calculate relative path from link location to target
+        relative_target = Path(os.path.relpath(target, link.parent))
 
-    # Remove existing symlink if present
-    if link.is_symlink():
-        link.unlink()
+        # Remove existing symlink if present
+        if link.is_symlink():
+            link.unlink()
 
-    link.symlink_to(relative_target)
+        link.symlink_to(relative_target)
 
 
 def remove_symlink(link: Path) -> None:
     """Remove a symbolic link if it exists."""
-    if link.is_symlink():
-        link.unlink()
+    with phase(Phase.LINK):
+        if link.is_symlink():
+            link.unlink()
+
+
+def read_symlinks(folder: Path) -> dict[str, str]:
+    """Read every symlink in a folder without following it.
+
+    Args:
+        folder: Stage folder to scan.
+
+    Returns:
+        Mapping of link name to its raw (usually relative) target.
+    """
+    links: dict[str, str] = {}
+    try:
+        with phase(Phase.SCAN), os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    links[entry.name] = os.readlink(entry.path)
+    except FileNotFoundError:
+        pass
+    return links
+
+
+def replace_symlink(relative_target: str, link: Path) -> None:
+    """Atomically point an existing symlink at a new target.
+
+    The new link is created beside the old one and renamed over it, so
+    the link never disappears, even briefly.
+
+    Args:
+        relative_target: Target path, relative to the link's folder.
+        link: The symlink path to replace.
+    """
+    with phase(Phase.LINK):
+        tmp_link = link.with_name(f".{link.name}.steward-tmp-{os.getpid()}")
+        if tmp_link.is_symlink():
+            tmp_link.unlink()
+        os.symlink(relative_target, tmp_link)
+        os.replace(tmp_link, link)
+
+
+def replace_with_symlink(target: Path, path: Path) -> None:
+    """Replace a file or directory with a symlink to target.
+
+    A file is replaced atomically. A directory is renamed aside first
+    and deleted once the link is in place.
+
+    Args:
+        target: What the link points to (stored as an absolute path).
+        path: The file, directory or symlink to replace.
+    """
+    with phase(Phase.LINK):
+        tmp_link = path.with_name(f".{path.name}.steward-tmp-{os.getpid()}")
+        if tmp_link.is_symlink():
+            tmp_link.unlink()
+        os.symlink(target.absolute(), tmp_link)
+        if not path.is_dir() or path.is_symlink():
+            os.replace(tmp_link, path)
+            return
+        aside = path.with_name(f".{path.name}.steward-old-{os.getpid()}")
+        os.rename(path, aside)
+        os.replace(tmp_link, path)
+        shutil.rmtree(aside)
 
 
 def move_to_items(source: Path, dest: Path) -> None:
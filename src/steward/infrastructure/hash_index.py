@@ -0,0 +1,369 @@
+"""Persistent index of content digests, stored under _workshop/.steward/.
+
+Two tables back duplicate detection on intake:
+
+- files: the digest of each file hashed so far, keyed by (device,
+  inode) with the mtime and size it was computed at, so a file is only
+  read again once it changes. Moves and hardlinked intakes keep the
+  inode, so the files of such items are never read twice.
+- items: per item in 9-items/, its content size and digest (status.yaml
+  excluded), with a stamp of the item's files (inode, mtime and size of
+  each) taken when they were recorded. Items intaken by steward are
+  recorded with the digest of their source; other items are only
+  stat'ed when first seen.
+
+A lookup compares a source with the items of its size only. Those
+candidates are re-stat'ed (not read) first, and one whose stamp changed
+since it was recorded, because it was edited or created outside
+steward, is hashed again, so a lookup reads at most the items that
+could match. An item edited to a new size is re-stamped the next time
+it is a candidate at its recorded size.
+
+New and removed items are found by listing 9-items/, which is skipped
+while the directory's stamp (mtime, size and link count) is the one the
+items table was last brought up to date with. Directory mtimes only
+advance once per clock tick, so size and link count, which change with
+every entry added, catch another process creating an item in the same
+tick.
+
+The index is a cache: deleting it only costs the next intake a rehash.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+from steward.infrastructure.content_hash import (
+    ContentDigest,
+    FileKey,
+    FileState,
+    combine,
+    hash_files,
+    list_content,
+)
+from steward.infrastructure.scanner import list_item_dirs, resolve_jobs
+from steward.infrastructure.state import ensure_state_path
+from steward.infrastructure.status_codec import STATUS_FILENAME
+from steward.infrastructure.tracing import Phase, phase
+
+HASH_INDEX_FILENAME = "hashes.db"
+SCHEMA_VERSION = 3
+
+# A 9-items/ stamp with a whole-second mtime younger than this is not
+# recorded: filesystems with such coarse timestamps (FAT, HFS+, some NFS
+# servers) may not track directory size or link count either
+MTIME_SETTLE_NS = 2_000_000_000
+
+# Files of an item directory that are steward's, not content
+ITEM_METADATA = (STATUS_FILENAME,)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    PRIMARY KEY (dev, ino)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS items (
+    item_id TEXT PRIMARY KEY,
+    stamp BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    digest BLOB
+);
+CREATE INDEX IF NOT EXISTS items_size ON items (size);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# meta key: stamp of 9-items/ that the items table reflects
+_ITEMS_STAMP = "items_stamp"
+
+# Re-stamping an item drops its digest, unless it is the stamp already recorded
+_RESTAMP = """
+INSERT INTO items (item_id, stamp, size) VALUES (?, ?, ?)
+ON CONFLICT (item_id) DO UPDATE SET stamp = excluded.stamp, size = excluded.size, digest = NULL
+WHERE items.stamp != excluded.stamp
+"""
+
+
+def _stamp(files: list[FileState]) -> bytes:
+    """Fingerprint a tree by the inode, mtime and size of its files."""
+    h = hashlib.blake2b(digest_size=16)
+    for state in files:
+        h.update(
+            f"{state.relative}\0{state.dev}:{state.ino}:{state.mtime_ns}:{state.size}\0".encode(
+                "utf-8", "surrogateescape"
+            )
+        )
+    return h.digest()
+
+
+def _list_sources(paths: list[Path], exclude: tuple[str, ...]) -> list[list[FileState] | None]:
+    results: list[list[FileState] | None] = []
+    for path in paths:
+        try:
+            results.append(list_content(path, exclude))
+        except OSError:
+            # Vanished or unreadable; whatever uses it next reports why
+            results.append(None)
+    return results
+
+
+def _list_many(paths: list[Path], exclude: tuple[str, ...], workers: int) -> list[list[FileState] | None]:
+    """List trees in parallel, one chunk of paths per worker."""
+    step = max(1, -(-len(paths) // workers))
+    chunks = [paths[i : i + step] for i in range(0, len(paths), step)]
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(chunks)))) as pool:
+        return [files for found in pool.map(_list_sources, chunks, repeat(exclude)) for files in found]
+
+
+class HashIndex:
+    """SQLite-backed index of file and item content digests."""
+
+    def __init__(self, workshop_path: Path) -> None:
+        self.workshop_path = workshop_path
+        self.items_path = workshop_path / "9-items"
+        self.db_path = ensure_state_path(workshop_path) / HASH_INDEX_FILENAME
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS items; DROP TABLE IF EXISTS meta;")
+            self._init_schema(conn)
+        except sqlite3.DatabaseError:
+            # Corrupt index - it is only a cache, so start over
+            conn.close()
+            self.db_path.unlink(missing_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            self._init_schema(conn)
+        return conn
+
+    @staticmethod
+    def _init_schema(conn: sqlite3.Connection) -> None:
+        conn.execute("PRAGMA journal_mode = WAL")
+        # A cache: losing the last transaction on power loss only means re-hashing
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "HashIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def digest_many(
+        self, paths: list[Path], exclude: tuple[str, ...] = (), jobs: int | None = None
+    ) -> list[ContentDigest | None]:
+        """Digest several files or trees at once.
+
+        The trees are listed in parallel, then every file not already in
+        the index (by inode, mtime and size) is hashed in one worker pool,
+        so many small sources hash as fast as one large one.
+
+        Args:
+            paths: Files or directories.
+            exclude: Names to leave out at the top of each tree.
+            jobs: Worker count (see resolve_jobs).
+
+        Returns:
+            One digest per path, or None where a path could not be read.
+        """
+        workers = resolve_jobs(jobs)
+        return self._digest_listed(_list_many(paths, exclude, workers), workers)
+
+    def _digest_listed(self, listed: list[list[FileState] | None], workers: int) -> list[ContentDigest | None]:
+        all_files = [state for files in listed if files for state in files]
+        cache = self._cached(state.key for state in all_files)
+        try:
+            digests = hash_files(all_files, cache, workers)
+        except OSError:
+            # Some file is unreadable: digest the sources one by one to find it
+            return [self._digest_one(files, cache) for files in listed]
+        self._store(all_files, digests, cache)
+        return [combine(files, digests) if files is not None else None for files in listed]
+
+    def _digest_one(
+        self, files: list[FileState] | None, cache: dict[FileKey, tuple[int, int, bytes]]
+    ) -> ContentDigest | None:
+        if files is None:
+            return None
+        try:
+            digests = hash_files(files, cache, 1)
+        except OSError:
+            return None
+        self._store(files, digests, cache)
+        return combine(files, digests)
+
+    def _cached(self, keys: Iterable[FileKey]) -> dict[FileKey, tuple[int, int, bytes]]:
+        cached: dict[FileKey, tuple[int, int, bytes]] = {}
+        query = "SELECT mtime_ns, size, digest FROM files WHERE dev = ? AND ino = ?"
+        for key in set(keys):
+            row = self._conn.execute(query, key).fetchone()
+            if row is not None:
+                cached[key] = row
+        return cached
+
+    def _store(
+        self,
+        files: list[FileState],
+        digests: dict[FileKey, bytes],
+        cache: dict[FileKey, tuple[int, int, bytes]],
+    ) -> None:
+        fresh = {
+            state.key: (state.mtime_ns, state.size, digests[state.key])
+            for state in files
+            if cache.get(state.key) != (state.mtime_ns, state.size, digests[state.key])
+        }
+        if not fresh:
+            return
+        with phase(Phase.WRITE), self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                [(dev, ino, *entry) for (dev, ino), entry in fresh.items()],
+            )
+        cache.update(fresh)
+
+    def _items_stamp(self) -> str | None:
+        try:
+            st = os.stat(self.items_path)
+        except FileNotFoundError:
+            return None
+        if st.st_mtime_ns % 1_000_000_000 == 0 and time.time_ns() - st.st_mtime_ns < MTIME_SETTLE_NS:
+            return None
+        return f"{st.st_mtime_ns}:{st.st_size}:{st.st_nlink}"
+
+    def _recorded_items_stamp(self) -> str | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (_ITEMS_STAMP,)).fetchone()
+        return row[0] if row is not None else None
+
+    def refresh_items(self, jobs: int | None = None) -> None:
+        """Bring the items table up to date with the directories in 9-items/.
+
+        New items are stat'ed (not read) in parallel to record their
+        size; items whose directory is gone are dropped. Nothing is
+        listed when 9-items/ has not changed since the last refresh.
+        Edits to known items are picked up by find_item.
+        """
+        # Stamp first: a directory created after the listing changes it
+        stamp = self._items_stamp()
+        if stamp is not None and stamp == self._recorded_items_stamp():
+            return
+
+        known = {item_id for (item_id,) in self._conn.execute("SELECT item_id FROM items")}
+        names = list_item_dirs(self.items_path) if self.items_path.exists() else []
+        new = [name for name in names if name not in known]
+        listed = _list_many([self.items_path / name for name in new], ITEM_METADATA, resolve_jobs(jobs))
+        stamps = [
+            (name, _stamp(files), sum(state.size for state in files))
+            for name, files in zip(new, listed, strict=True)
+            if files is not None
+        ]
+        # Only items listed before this refresh started can be gone; an
+        # intake running alongside may have recorded new ones since
+        gone = known - set(names)
+        with phase(Phase.WRITE), self._conn:
+            self._conn.executemany(_RESTAMP, stamps)
+            self._conn.executemany("DELETE FROM items WHERE item_id = ?", [(item_id,) for item_id in gone])
+            if stamp is None:
+                self._conn.execute("DELETE FROM meta WHERE key = ?", (_ITEMS_STAMP,))
+            else:
+                self._conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (_ITEMS_STAMP, stamp))
+
+    def find_item(self, content: ContentDigest, jobs: int | None = None) -> str | None:
+        """Return the first item (by ID) holding exactly this content, if any.
+
+        Only items recorded with the same size are compared. Each is
+        re-stat'ed, and hashed again if its files changed since it was
+        recorded (or it was never hashed). Call refresh_items first so
+        new items are known.
+        """
+        digests = self._candidates(content, jobs)
+        for item_id, digest in digests.items():
+            if digest == content.digest and (self.items_path / item_id).is_dir():
+                return item_id
+        return None
+
+    def _candidates(self, content: ContentDigest, jobs: int | None) -> dict[str, bytes]:
+        """Current digests of the items of the same size as content."""
+        rows = self._conn.execute(
+            "SELECT item_id, stamp, digest FROM items WHERE size = ? ORDER BY item_id", (content.size,)
+        ).fetchall()
+        if not rows:
+            return {}
+        workers = resolve_jobs(jobs)
+        listed = _list_many([self.items_path / item_id for item_id, _, _ in rows], ITEM_METADATA, workers)
+        digests: dict[str, bytes] = {}
+        stale: list[tuple[str, list[FileState]]] = []
+        for (item_id, stamp, digest), files in zip(rows, listed, strict=True):
+            if files is None:
+                continue
+            if digest is not None and _stamp(files) == stamp:
+                digests[item_id] = digest
+            else:
+                stale.append((item_id, files))
+        if not stale:
+            return digests
+        computed = self._digest_listed([files for _, files in stale], workers)
+        fresh = [
+            (item_id, _stamp(files), found.size, found.digest)
+            for (item_id, files), found in zip(stale, computed, strict=True)
+            if found is not None
+        ]
+        with phase(Phase.WRITE), self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?)", fresh)
+        digests.update((item_id, digest) for item_id, _, size, digest in fresh if size == content.size)
+        return dict(sorted(digests.items()))
+
+    def record_items(self, items: Iterable[tuple[str, ContentDigest]]) -> None:
+        """Record the content of new items, e.g. the digests of their intake sources.
+
+        Each item's files are stat'ed for its stamp. An item whose files
+        no longer add up to the recorded size (the source changed while
+        it was copied) is recorded without a digest, to be hashed later.
+
+        Args:
+            items: (item ID, content) pairs.
+        """
+        items = list(items)
+        listed = _list_sources([self.items_path / item_id for item_id, _ in items], ITEM_METADATA)
+        rows = []
+        for (item_id, content), files in zip(items, listed, strict=True):
+            if files is None:
+                continue
+            size = sum(state.size for state in files)
+            digest = content.digest if (size, len(files)) == (content.size, content.files) else None
+            rows.append((item_id, _stamp(files), size, digest))
+        with phase(Phase.WRITE), self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?)", rows)
+
+    def forget_items(self, item_ids: Iterable[str]) -> None:
+        """Drop items from the index, so the next refresh re-reads them."""
+        item_ids = list(item_ids)
+        if not item_ids:
+            return
+        with phase(Phase.WRITE), self._conn:
+            self._conn.executemany("DELETE FROM items WHERE item_id = ?", [(item_id,) for item_id in item_ids])
+            self._conn.execute("DELETE FROM meta WHERE key = ?", (_ITEMS_STAMP,))
+
+
+def open_hash_index(workshop_path: Path) -> HashIndex:
+    """Open (creating if needed) the content hash index for a workshop."""
+    return HashIndex(workshop_path)
@@ -0,0 +1,76 @@
+"""Atomic item ID reservation.
+
+An item ID is reserved by creating its directory in 9-items/ with
+os.mkdir, which fails if the directory already exists, so two intakes
+can never be given the same ID, even from separate processes.
+
+IDs only have minute resolution, so items with the same slug intaken in
+the same minute get numbered slugs (slug-2, slug-3, ...). The first
+candidate is simply created, so a reservation without a collision is a
+single mkdir. Rather than probing each numbered candidate in turn after
+a collision, the reserver lists 9-items/ once and counts up through the
+taken numbers in memory. Only that unbroken run
+of numbers is skipped: an unrelated slug that merely ends in a number
+(report-2024) does not push report's next number to 2025. A mkdir that
+loses a race with another process just moves on to the next number.
+"""
+
+import os
+from datetime import datetime
+from pathlib import Path
+
+from steward.domain.item_ids import generate_item_id
+
+
+class IdReserver:
+    """Reserves item IDs in one items directory.
+
+    Use one reserver per batch; what it knows of taken IDs only reflects
+    this process's reservations and the directory listing taken on the
+    first collision.
+    """
+
+    def __init__(self, items_path: Path) -> None:
+        self.items_path = items_path
+        self._taken: set[str] | None = None
+        # Base ID -> next number to try (1 means the unnumbered ID)
+        self._next: dict[str, int] = {}
+
+    def _taken_ids(self) -> set[str]:
+        if self._taken is None:
+            self._taken = set(os.listdir(self.items_path))
+        return self._taken
+
+    def reserve(self, slug: str, timestamp: datetime | None = None) -> str:
+        """Create a new, empty item directory and return its ID.
+
+        Args:
+            slug: The item's slug; numbered if the ID is already taken.
+            timestamp: Creation time (default: now).
+
+        Returns:
+            The reserved item ID.
+
+        Raises:
+            OSError: If the directory cannot be created for any reason
+                other than the ID being taken.
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
+        base_id = generate_item_id(slug, timestamp)
+        number = self._next.get(base_id, 1)
+        while True:
+            item_id = base_id if number == 1 else generate_item_id(f"{slug}-{number}", timestamp)
+            if self._taken is not None and item_id in self._taken:
+                number += 1
+                continue
+            try:
+                os.mkdir(self.items_path / item_id)
+            except FileExistsError:
+                self._taken_ids().add(item_id)
+                number += 1
+                continue
+            if self._taken is not None:
+                self._taken.add(item_id)
+            self._next[base_id] = number + 1
+            return item_id
@@ -0,0 +1,285 @@
+"""Persistent item index stored under _workshop/.steward/.
+
+The index caches each item's id, slug, stage and timestamps so bulk
+commands do not have to parse every status.yaml on every run. Rows are
+validated against the mtime and size of the item's status.yaml; only
+items whose status file changed are re-parsed.
+
+Each ItemIndex keeps an in-memory mirror of the table once it has been
+read. Long-running processes (steward serve) can enable shared mode so
+that every open_index() call reuses one warm instance per workshop.
+"""
+
+import os
+import sqlite3
+from collections.abc import Generator, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from steward.domain.item_ids import slug_from_id
+from steward.domain.records import STAGE_VALUES, ItemRecord
+from steward.domain.stages import Stage
+from steward.infrastructure.scanner import scan_items
+from steward.infrastructure.state import ensure_state_path, get_state_path
+from steward.infrastructure.status_codec import STATUS_FILENAME, canonical_fields
+from steward.infrastructure.tracing import Phase, phase
+
+if TYPE_CHECKING:
+    from steward.domain.models import Status
+
+INDEX_FILENAME = "index.db"
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    slug TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    created TEXT NOT NULL,
+    updated TEXT NOT NULL,
+    status_mtime_ns INTEGER NOT NULL,
+    status_size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_stage ON items (stage);
+"""
+
+_UPSERT = "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+_Row = tuple[str, str, str, str, str, int, int]
+
+
+class ItemIndex:
+    """SQLite-backed index of the items in 9-items/."""
+
+    def __init__(self, workshop_path: Path, shared: bool = False) -> None:
+        self.workshop_path = workshop_path
+        self.items_path = workshop_path / "9-items"
+        self.db_path = ensure_state_path(workshop_path) / INDEX_FILENAME
+        self.shared = shared
+        self._conn = self._connect()
+        # In-memory mirror of the table, loaded on first bulk access
+        self._entries: dict[str, ItemRecord] | None = None
+        self._signatures: dict[str, tuple[int, int]] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                conn.executescript("DROP TABLE IF EXISTS items;")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+        except sqlite3.DatabaseError:
+            # Corrupt index - it is only a cache, so start over
+            conn.close()
+            self.db_path.unlink(missing_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+        return conn
+
+    def close(self) -> None:
+        """Close the underlying database connection (no-op when shared)."""
+        if not self.shared:
+            self._conn.close()
+
+    def __enter__(self) -> "ItemIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _load(self) -> dict[str, ItemRecord]:
+        if self._entries is None:
+            self._entries = {}
+            self._signatures = {}
+            for row in self._conn.execute("SELECT * FROM items"):
+                self._remember(row)
+        return self._entries
+
+    def _remember(self, row: _Row) -> None:
+        assert self._entries is not None
+        item_id, slug, stage, created, updated = row[:5]
+        self._entries[item_id] = ItemRecord(item_id, slug, STAGE_VALUES.get(stage, stage), created, updated)
+        self._signatures[row[0]] = (row[5], row[6])
+
+    def _forget(self, item_id: str) -> None:
+        if self._entries is not None:
+            self._entries.pop(item_id, None)
+            self._signatures.pop(item_id, None)
+
+    def upsert(self, item_id: str, status: "Status") -> None:
+        """Record the current status of an item.
+
+        Must be called after status.yaml has been written so the stored
+        mtime matches the file on disk.
+        """
+        self.upsert_many([(item_id, status)])
+
+    def upsert_many(self, updates: Iterable[tuple[str, "Status"]]) -> None:
+        """Record the current status of several items in one transaction.
+
+        Must be called after the status.yaml files have been written.
+        """
+        rows: list[_Row] = []
+        for item_id, status in updates:
+            slug = slug_from_id(item_id)
+            if slug is None:
+                continue
+            st = os.stat(f"{self.items_path}/{item_id}/{STATUS_FILENAME}")
+            rows.append(_row(item_id, slug, status, st.st_mtime_ns, st.st_size))
+        self._apply(rows, [])
+
+    def remove(self, item_id: str) -> None:
+        """Drop an item from the index."""
+        with phase(Phase.WRITE), self._conn:
+            self._conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
+        self._forget(item_id)
+
+    def refresh(self, jobs: int | None = None) -> None:
+        """Bring the index up to date with 9-items/.
+
+        Stats every status.yaml (in parallel, see scan_items), re-parses
+        only those whose mtime or size differ from the stored row, and
+        drops rows for removed items. Canonical status files are stored
+        as-is; only unusual ones go through pydantic validation.
+
+        Args:
+            jobs: Worker count for the scan (see resolve_jobs).
+        """
+        for _ in self.scan(jobs=jobs):
+            pass
+
+    def scan(self, stage: str | None = None, jobs: int | None = None) -> Generator[ItemRecord, None, None]:
+        """Refresh the index while yielding records in item-ID order.
+
+        Records are yielded as soon as their status file has been checked,
+        so callers can stream output before the whole workshop is scanned.
+        Changed rows are written when the generator finishes or is closed;
+        rows for removed items are only dropped after a complete scan.
+
+        Args:
+            stage: Only yield records in this stage.
+            jobs: Worker count for the scan (see resolve_jobs).
+
+        Yields:
+            An up-to-date ItemRecord per item.
+        """
+        entries = self._load()
+        changed: list[_Row] = []
+        seen: set[str] = set()
+        complete = False
+        try:
+            for scanned in scan_items(self.items_path, self._signatures, jobs):
+                seen.add(scanned.item_id)
+                if scanned.data is None:
+                    record = entries[scanned.item_id]
+                else:
+                    fields = status_fields(scanned.data)
+                    changed.append((scanned.item_id, scanned.slug, *fields, scanned.mtime_ns, scanned.size))
+                    record = ItemRecord(scanned.item_id, scanned.slug, *fields)
+                if stage is None or record.stage == stage:
+                    yield record
+            complete = True
+        finally:
+            stale = list(self._signatures.keys() - seen) if complete else []
+            self._apply(changed, stale)
+
+    def _apply(self, changed: list[_Row], stale: list[str]) -> None:
+        if not changed and not stale:
+            return
+        with phase(Phase.WRITE), self._conn:
+            self._conn.executemany(_UPSERT, changed)
+            self._conn.executemany("DELETE FROM items WHERE id = ?", [(item_id,) for item_id in stale])
+        if self._entries is not None:
+            for row in changed:
+                self._remember(row)
+        for item_id in stale:
+            self._forget(item_id)
+
+    def entries(self, stage: str | None = None) -> list[ItemRecord]:
+        """Return indexed records ordered by item ID."""
+        entries = self._load()
+        return [entries[item_id] for item_id in sorted(entries) if stage is None or entries[item_id].stage == stage]
+
+
+def status_fields(data: dict[str, Any]) -> tuple[str, str, str]:
+    """Return (stage, created, updated) from a decoded status.yaml.
+
+    Canonical data is taken as is; anything else is validated through
+    the Status model.
+    """
+    fields = canonical_fields(data)
+    if fields is not None:
+        stage, created, updated = fields
+        return STAGE_VALUES[stage], created, updated
+    from steward.domain.models import Status
+
+    with phase(Phase.VALIDATE):
+        status = Status(**data)
+    return Stage(status.stage).value, status.created.isoformat(), status.updated.isoformat()
+
+
+def _row(item_id: str, slug: str, status: "Status", mtime_ns: int, size: int) -> _Row:
+    return (
+        item_id,
+        slug,
+        Stage(status.stage).value,
+        status.created.isoformat(),
+        status.updated.isoformat(),
+        mtime_ns,
+        size,
+    )
+
+
+def read_indexed_stages(workshop_path: Path) -> dict[str, tuple[str, int, int]]:
+    """Read the indexed stages without creating or updating the index.
+
+    The database is opened read-only. A missing, outdated or unreadable
+    index gives an empty mapping.
+
+    Returns:
+        Item ID -> (stage, status mtime_ns, status size) as last indexed.
+    """
+    db_path = get_state_path(workshop_path) / INDEX_FILENAME
+    if not db_path.exists():
+        return {}
+    try:
+        conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return {}
+    try:
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            return {}
+        rows = conn.execute("SELECT id, stage, status_mtime_ns, status_size FROM items")
+        return {item_id: (stage, mtime_ns, size) for item_id, stage, mtime_ns, size in rows}
+    except sqlite3.Error:
+        return {}
+    finally:
+        conn.close()
+
+
+_shared_indexes: dict[Path, ItemIndex] | None = None
+
+
+def enable_shared_indexes() -> None:
+    """Reuse one open, warm index per workshop for the rest of the process.
+
+    Intended for long-running processes such as steward serve.
+    """
+    global _shared_indexes
+    if _shared_indexes is None:
+        _shared_indexes = {}
+
+
+def open_index(workshop_path: Path) -> ItemIndex:
+    """Open (creating if needed) the item index for a workshop."""
+    if _shared_indexes is None:
+        return ItemIndex(workshop_path)
+    index = _shared_indexes.get(workshop_path)
+    if index is None:
+        index = ItemIndex(workshop_path, shared=True)
+        _shared_indexes[workshop_path] = index
+    return index
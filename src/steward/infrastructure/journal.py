@@ -0,0 +1,133 @@
+"""Append-only journal of workshop mutations.
+
+Intakes and stage transitions touch several files (status.yaml, the
+index, stage symlinks) that cannot be updated atomically together. Each
+one is therefore described in _workshop/.steward/journal.log before it
+is applied and marked finished afterwards. An operation that has a
+"begin" record but no "end" record was interrupted, and can be replayed:
+every operation is written so that applying it twice is harmless.
+
+Intakes also journal the item directories they reserve, before copying
+into them, so that recovery can remove the reservations of an intake
+that died before registering its items.
+
+The journal only holds operations in flight. Whoever finishes the last
+open operation truncates the file, so checking for interrupted work is a
+single stat in the common case, and replay cost depends on how many
+operations were cut short, not on the size of the workshop.
+"""
+
+import contextlib
+import json
+import os
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from steward.infrastructure.durability import Durability, resolve_durability
+from steward.infrastructure.state import ensure_state_path, get_state_path
+from steward.infrastructure.tracing import Phase, phase
+
+JOURNAL_FILENAME = "journal.log"
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """One journaled operation.
+
+    ``kind`` names the operation ("intake", "reserve" or "stage");
+    ``changes`` holds one JSON object per item, in the operation's own
+    format.
+    """
+
+    op_id: str
+    kind: str
+    changes: list[dict[str, Any]]
+
+
+def get_journal_path(workshop_path: Path) -> Path:
+    """Get the path of the workshop's journal."""
+    return get_state_path(workshop_path) / JOURNAL_FILENAME
+
+
+def _append(path: Path, record: dict[str, Any], sync: bool) -> tuple[int, int]:
+    """Append one record; return (its end offset, file size after the append)."""
+    line = (json.dumps(record, separators=(",", ":")) + "\n").encode()
+    with phase(Phase.WRITE):
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+            if sync:
+                os.fsync(fd)
+            end = os.lseek(fd, 0, os.SEEK_CUR)
+            return end, os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+
+
+class Journal:
+    """The journal of one workshop."""
+
+    def __init__(self, workshop_path: Path) -> None:
+        self.workshop_path = workshop_path
+        self.path = get_journal_path(workshop_path)
+
+    def begin(
+        self,
+        kind: str,
+        changes: list[dict[str, Any]],
+        durability: Durability | None = None,
+        op_id: str | None = None,
+    ) -> JournalEntry:
+        """Record an operation before applying it.
+
+        Unless durability is none, the record is flushed to disk before
+        this returns, so the operation can be replayed after a crash.
+        op_id defaults to a new ID.
+        """
+        ensure_state_path(self.workshop_path)
+        entry = JournalEntry(op_id or uuid.uuid4().hex, kind, changes)
+        record = {"op": "begin", "id": entry.op_id, "kind": kind, "changes": changes}
+        _append(self.path, record, sync=resolve_durability(durability) is not Durability.NONE)
+        return entry
+
+    def end(self, entry: JournalEntry) -> None:
+        """Mark an operation as finished (applied, or cleanly given up)."""
+        end, size = _append(self.path, {"op": "end", "id": entry.op_id}, sync=False)
+        # Records after ours belong to operations still running
+        if end == size and not self.pending():
+            self.clear()
+
+    def pending(self) -> list[JournalEntry]:
+        """Return operations that were begun but never ended, oldest first."""
+        try:
+            with open(self.path, "rb") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+
+        open_ops: dict[str, JournalEntry] = {}
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A record cut short by a crash: its operation never started
+                continue
+            if record.get("op") == "begin":
+                open_ops[record["id"]] = JournalEntry(record["id"], record["kind"], record["changes"])
+            elif record.get("op") == "end":
+                open_ops.pop(record["id"], None)
+        return list(open_ops.values())
+
+    def is_empty(self) -> bool:
+        """Check, with a single stat, that there is nothing to recover."""
+        try:
+            return self.path.stat().st_size == 0
+        except FileNotFoundError:
+            return True
+
+    def clear(self) -> None:
+        """Drop every record (only once nothing is in flight)."""
+        with contextlib.suppress(FileNotFoundError):
+            os.truncate(self.path, 0)
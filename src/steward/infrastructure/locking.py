@@ -0,0 +1,155 @@
+"""Workshop-wide locking between steward processes.
+
+Commands that read the workshop hold a shared lock, so any number of
+them run side by side; commands that change it hold an exclusive lock,
+so they never interleave with each other or with readers. The lock is
+an fcntl.flock on _workshop/.steward/workshop.lock and is released by
+the kernel if its holder dies.
+
+Locks are held only around the short steps that read or update shared
+state (status files, the index, the slug resolver, symlinks). Long
+copies during intake run without the lock: the item directory they fill
+was reserved atomically and belongs to that intake alone. While it runs,
+the intake holds an operation lock of its own (see hold_operation), so
+recovery can tell its reservations from those of an intake that died.
+
+flock has no timeout, so acquisition polls with a growing back-off and
+gives up after $STEWARD_LOCK_TIMEOUT seconds (default 30).
+"""
+
+import contextlib
+import fcntl
+import os
+import time
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+
+from steward.domain.errors import LockTimeoutError, WorkshopError
+from steward.infrastructure.state import ensure_state_path, get_state_path
+
+LOCK_FILENAME = "workshop.lock"
+LOCK_TIMEOUT_ENV_VAR = "STEWARD_LOCK_TIMEOUT"
+DEFAULT_LOCK_TIMEOUT = 30.0
+
+_MIN_BACKOFF = 0.001
+_MAX_BACKOFF = 0.05
+
+
+def resolve_lock_timeout(timeout: float | None = None) -> float:
+    """Resolve the lock timeout in seconds.
+
+    Uses, in order: the explicit value, $STEWARD_LOCK_TIMEOUT, or 30.
+
+    Raises:
+        WorkshopError: If $STEWARD_LOCK_TIMEOUT is not a non-negative number.
+    """
+    if timeout is not None:
+        return timeout
+    value = os.environ.get(LOCK_TIMEOUT_ENV_VAR)
+    if not value:
+        return DEFAULT_LOCK_TIMEOUT
+    try:
+        timeout = float(value)
+    except ValueError:
+        timeout = -1.0
+    if timeout < 0:
+        raise WorkshopError(f"{LOCK_TIMEOUT_ENV_VAR} must be a number of seconds, got: {value}")
+    return timeout
+
+
+def _acquire(fd: int, operation: int, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    backoff = _MIN_BACKOFF
+    while True:
+        try:
+            fcntl.flock(fd, operation | fcntl.LOCK_NB)
+            return
+        except BlockingIOError:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                kind = "exclusive" if operation == fcntl.LOCK_EX else "shared"
+                raise LockTimeoutError(
+                    f"Timed out after {timeout:g}s waiting for a {kind} workshop lock; "
+                    "another steward command is still running"
+                ) from None
+            time.sleep(min(backoff, remaining))
+            backoff = min(backoff * 2, _MAX_BACKOFF)
+
+
+@contextlib.contextmanager
+def _workshop_lock(workshop_path: Path, operation: int, timeout: float | None) -> Iterator[None]:
+    seconds = resolve_lock_timeout(timeout)
+    fd = os.open(ensure_state_path(workshop_path) / LOCK_FILENAME, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        _acquire(fd, operation, seconds)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+def shared_lock(workshop_path: Path, timeout: float | None = None) -> contextlib.AbstractContextManager[None]:
+    """Hold the workshop lock for reading.
+
+    Raises:
+        LockTimeoutError: If a writer kept the lock past the timeout.
+    """
+    return _workshop_lock(workshop_path, fcntl.LOCK_SH, timeout)
+
+
+def exclusive_lock(workshop_path: Path, timeout: float | None = None) -> contextlib.AbstractContextManager[None]:
+    """Hold the workshop lock for changing the workshop.
+
+    Not reentrant: do not take it again while already holding it.
+
+    Raises:
+        LockTimeoutError: If other commands kept the lock past the timeout.
+    """
+    return _workshop_lock(workshop_path, fcntl.LOCK_EX, timeout)
+
+
+def _operation_lock_path(workshop_path: Path, op_id: str) -> Path:
+    return get_state_path(workshop_path) / f"op-{op_id}.lock"
+
+
+@contextlib.contextmanager
+def hold_operation(workshop_path: Path) -> Iterator[str]:
+    """Mark an operation as running for as long as the block runs.
+
+    Yields:
+        A new operation ID, for the operation's journal entry.
+    """
+    op_id = uuid.uuid4().hex
+    ensure_state_path(workshop_path)
+    path = _operation_lock_path(workshop_path, op_id)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield op_id
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+        os.close(fd)
+
+
+def operation_running(workshop_path: Path, op_id: str) -> bool:
+    """Check whether the holder of an operation lock is still running.
+
+    The lock file left behind by a holder that died is removed.
+    """
+    path = _operation_lock_path(workshop_path, op_id)
+    try:
+        fd = os.open(path, os.O_RDWR)
+    except FileNotFoundError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    else:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+        return False
+    finally:
+        os.close(fd)
@@ -0,0 +1,258 @@
+"""Move engine for intake --move.
+
+A move is first attempted as a rename, which is atomic and instant. When
+the source is on another filesystem (EXDEV), each file is instead copied
+in chunks while being hashed, flushed to disk, read back and compared
+against the source digest, and only then unlinked from the source.
+
+Every move keeps a small state file in _workshop/.steward/moves/ until
+it completes. If a move is interrupted, running the same intake again
+finds the state, reuses the item directory and carries on with whatever
+is still left in the source: finished files are already gone from it,
+and a large file that was part-way through resumes from its last
+checkpoint once its copied prefix has been verified.
+"""
+
+import contextlib
+import errno
+import hashlib
+import json
+import os
+import shutil
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from steward.infrastructure.copy_engine import CopyStats
+from steward.infrastructure.state import ensure_state_path, get_state_path
+
+MOVES_DIR = "moves"
+
+CHUNK_SIZE = 4 * 1024 * 1024
+# Flush and record progress this often while copying a large file
+CHECKPOINT_BYTES = 64 * 1024 * 1024
+
+# (bytes done, bytes total) for one source
+ProgressCallback = Callable[[int, int], None]
+
+
+class MoveVerificationError(OSError):
+    """A copied file did not match its source."""
+
+
+@dataclass
+class MoveState:
+    """Persisted progress of one move.
+
+    ``partial`` is the source-relative path of the file being copied and
+    ``offset`` how many of its bytes are known to be on disk.
+    """
+
+    source: str
+    item_id: str
+    partial: str | None = None
+    offset: int = 0
+
+
+def _state_file(workshop_path: Path, source_path: Path) -> Path:
+    key = hashlib.sha256(str(source_path.resolve()).encode()).hexdigest()[:32]
+    return get_state_path(workshop_path) / MOVES_DIR / f"{key}.json"
+
+
+def find_interrupted_move(workshop_path: Path, source_path: Path) -> MoveState | None:
+    """Return the state of an unfinished move of source_path, if any."""
+    try:
+        data = json.loads(_state_file(workshop_path, source_path).read_text())
+        return MoveState(**data)
+    except (FileNotFoundError, ValueError, TypeError):
+        return None
+
+
+def _save_state(path: Path, state: MoveState) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    tmp_path.write_text(json.dumps(asdict(state)))
+    os.replace(tmp_path, path)
+
+
+def _sha256_prefix(path: str, length: int) -> "hashlib._Hash":
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        remaining = length
+        while remaining > 0 and (chunk := f.read(min(CHUNK_SIZE, remaining))):
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest
+
+
+def _drop_cache(fd: int) -> None:
+    # Make the read-back hit the disk rather than the page cache
+    if hasattr(os, "posix_fadvise"):
+        with contextlib.suppress(OSError):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+class _Mover:
+    def __init__(self, state: MoveState, state_path: Path, progress: ProgressCallback | None) -> None:
+        self.state = state
+        self.state_path = state_path
+        self.stats = CopyStats()
+        # Bytes to copy, for progress; set when falling back to copying
+        self.total = 0
+        self.progress = progress
+
+    def _advance(self, count: int) -> None:
+        self.stats.bytes += count
+        if self.progress is not None:
+            self.progress(self.stats.bytes, self.total)
+
+    def copy_file(self, src: str, dst: str, rel: str) -> None:
+        """Copy, verify and unlink one file."""
+        offset = 0
+        digest = hashlib.sha256()
+        if self.state.partial == rel and self.state.offset and os.path.exists(dst):
+            # Resume only if what is already on disk matches the source
+            src_prefix = _sha256_prefix(src, self.state.offset)
+            if os.path.getsize(dst) >= self.state.offset and (
+                _sha256_prefix(dst, self.state.offset).digest() == src_prefix.digest()
+            ):
+                offset, digest = self.state.offset, src_prefix
+                self._advance(offset)
+
+        self.state.partial, self.state.offset = rel, offset
+        _save_state(self.state_path, self.state)
+        with open(src, "rb") as fin, open(dst, "r+b" if offset else "wb") as fout:
+            fin.seek(offset)
+            fout.seek(offset)
+            fout.truncate()
+            since_checkpoint = 0
+            while chunk := fin.read(CHUNK_SIZE):
+                digest.update(chunk)
+                fout.write(chunk)
+                offset += len(chunk)
+                since_checkpoint += len(chunk)
+                self._advance(len(chunk))
+                if since_checkpoint >= CHECKPOINT_BYTES:
+                    fout.flush()
+                    os.fsync(fout.fileno())
+                    self.state.offset = offset
+                    _save_state(self.state_path, self.state)
+                    since_checkpoint = 0
+            fout.flush()
+            os.fsync(fout.fileno())
+            _drop_cache(fout.fileno())
+
+        if _sha256_prefix(dst, offset).digest() != digest.digest() or os.path.getsize(dst) != offset:
+            raise MoveVerificationError(errno.EIO, f"copy of {src} does not match the source")
+        shutil.copystat(src, dst)
+        os.unlink(src)
+        self.stats.files += 1
+        self.state.partial, self.state.offset = None, 0
+
+    def copy_tree(self, source: Path, dest: Path) -> None:
+        """Move the contents of a directory by copying, then remove it."""
+        for root, dirs, files in os.walk(source):
+            rel_root = os.path.relpath(root, source)
+            dest_root = dest / rel_root if rel_root != "." else dest
+            dest_root.mkdir(exist_ok=True)
+            for name in dirs:
+                src = os.path.join(root, name)
+                if os.path.islink(src):
+                    _move_symlink(src, str(dest_root / name))
+            for name in files:
+                src = os.path.join(root, name)
+                rel = os.path.normpath(os.path.join(rel_root, name))
+                if os.path.islink(src):
+                    _move_symlink(src, str(dest_root / name))
+                else:
+                    self.copy_file(src, str(dest_root / name), rel)
+            # Keep walking into real directories only
+            dirs[:] = [name for name in dirs if not os.path.islink(os.path.join(root, name))]
+        for root, _, _ in os.walk(source, topdown=False):
+            os.rmdir(root)
+
+
+def _move_symlink(src: str, dst: str) -> None:
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    os.symlink(os.readlink(src), dst)
+    os.unlink(src)
+
+
+def _tree_size(path: Path) -> int:
+    if not path.is_dir():
+        return path.stat().st_size
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            with contextlib.suppress(OSError):
+                total += os.lstat(os.path.join(root, name)).st_size
+    return total
+
+
+def move_into(
+    workshop_path: Path,
+    source_path: Path,
+    item_path: Path,
+    progress: ProgressCallback | None = None,
+    size: int | None = None,
+) -> CopyStats:
+    """Move a source into its item directory.
+
+    Directories have their contents placed in item_path and are then
+    removed; files are placed inside item_path.
+
+    Args:
+        workshop_path: Workshop the item belongs to (for the state file).
+        source_path: File or directory to move.
+        item_path: The item directory (already created).
+        progress: Called with (bytes done, bytes total) during copies.
+        size: Total size of the source, if the caller already knows it
+            (e.g. from hashing it). Otherwise a renamed directory reports
+            no bytes, and the source tree is only walked to size it when
+            it has to be copied across filesystems.
+
+    Returns:
+        Transfer stats; the strategy is "rename" or "verified-copy".
+
+    Raises:
+        OSError: If the move fails. The state file is kept, so running
+            the same intake again resumes the move.
+    """
+    ensure_state_path(workshop_path)
+    state_path = _state_file(workshop_path, source_path)
+    state_path.parent.mkdir(exist_ok=True)
+    state = find_interrupted_move(workshop_path, source_path) or MoveState(
+        source=str(source_path.resolve()), item_id=item_path.name
+    )
+    _save_state(state_path, state)
+
+    start = time.perf_counter()
+    strategy = "rename"
+    mover = _Mover(state, state_path, progress)
+    try:
+        if source_path.is_dir():
+            for child in sorted(os.listdir(source_path)):
+                os.rename(source_path / child, item_path / child)
+                mover.stats.files += 1
+            source_path.rmdir()
+        else:
+            if size is None:
+                size = source_path.stat().st_size
+            os.rename(source_path, item_path / source_path.name)
+            mover.stats.files += 1
+        mover.stats.bytes = size or 0
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        strategy = "verified-copy"
+        mover.total = size if size is not None else _tree_size(source_path)
+        if source_path.is_dir():
+            mover.copy_tree(source_path, item_path)
+        else:
+            mover.copy_file(str(source_path), str(item_path / source_path.name), source_path.name)
+
+    state_path.unlink(missing_ok=True)
+    mover.stats.seconds = time.perf_counter() - start
+    mover.stats.strategies[strategy] = mover.stats.files
+    return mover.stats
@@ -0,0 +1,58 @@
+"""Machine-readable output formats for item records.
+
+Each record is rendered as one self-contained line with no Rich markup,
+so output can be written while the workshop is still being scanned and
+piped straight into tools like head, cut or jq.
+"""
+
+import json
+from collections.abc import Iterable
+from enum import StrEnum
+from typing import TextIO
+
+from steward.domain.records import ItemRecord
+
+
+class OutputFormat(StrEnum):
+    """Output formats for steward list."""
+
+    TEXT = "text"  # Human-readable summary (default)
+    PLAIN = "plain"  # "<slug> [<stage>]"
+    TSV = "tsv"  # id, slug, stage, created, updated
+    JSONL = "jsonl"  # One JSON object per line
+
+
+def format_record(record: ItemRecord, output_format: OutputFormat) -> str:
+    """Render one record as a newline-terminated line.
+
+    Raises:
+        ValueError: If output_format is TEXT, which is not line-oriented.
+    """
+    if output_format is OutputFormat.PLAIN:
+        return f"{record.slug} [{record.stage}]\n"
+    if output_format is OutputFormat.TSV:
+        return f"{record.id}\t{record.slug}\t{record.stage}\t{record.created}\t{record.updated}\n"
+    if output_format is OutputFormat.JSONL:
+        data = {
+            "id": record.id,
+            "slug": record.slug,
+            "stage": record.stage,
+            "created": record.created,
+            "updated": record.updated,
+        }
+        return json.dumps(data) + "\n"
+    raise ValueError(f"Not a line format: {output_format.value}")
+
+
+def write_records(records: Iterable[ItemRecord], output_format: OutputFormat, stream: TextIO) -> int:
+    """Write records to a stream one line at a time.
+
+    Returns:
+        Number of records written.
+    """
+    count = 0
+    for record in records:
+        stream.write(format_record(record, output_format))
+        count += 1
+    stream.flush()
+    return count
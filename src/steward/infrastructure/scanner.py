@@ -0,0 +1,150 @@
+"""Parallel scanner for the items in 9-items/.
+
+Walks 9-items/ with os.scandir, then stats, reads and decodes each
+item's status.yaml across a bounded worker pool. Work is split into
+chunks of item directories, and results come back in sorted item-ID
+order whatever the worker count.
+
+Threads are used by default because the work is dominated by
+filesystem latency. Set STEWARD_SCAN_EXECUTOR=process to use processes
+when decoding is the bottleneck (e.g. many non-canonical files).
+"""
+
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import Any
+
+from steward.domain.errors import WorkshopError
+from steward.domain.item_ids import ID_SEPARATOR, slug_from_id
+from steward.infrastructure.status_codec import STATUS_FILENAME, decode_status
+from steward.infrastructure.tracing import ITEMS_SCANNED, Phase, count, phase
+
+JOBS_ENV_VAR = "STEWARD_JOBS"
+EXECUTOR_ENV_VAR = "STEWARD_SCAN_EXECUTOR"
+
+# Item directories handed to a worker at a time
+CHUNK_SIZE = 512
+
+
+@dataclass(frozen=True)
+class ScannedItem:
+    """One item directory with its status.yaml signature.
+
+    ``data`` holds the decoded status.yaml, or None when the signature
+    matched the caller's known signature and the file was not read.
+    """
+
+    item_id: str
+    slug: str
+    mtime_ns: int
+    size: int
+    data: dict[str, Any] | None
+
+
+def resolve_jobs(jobs: int | None = None) -> int:
+    """Resolve the worker count.
+
+    Uses, in order: the explicit value (--jobs), $STEWARD_JOBS, or the
+    ThreadPoolExecutor default of min(32, cpu_count + 4).
+
+    Raises:
+        WorkshopError: If the value is not a positive integer.
+    """
+    if jobs is None:
+        value = os.environ.get(JOBS_ENV_VAR)
+        if not value:
+            return min(32, (os.cpu_count() or 1) + 4)
+        try:
+            jobs = int(value)
+        except ValueError:
+            raise WorkshopError(f"{JOBS_ENV_VAR} must be a positive integer, got: {value}") from None
+    if jobs < 1:
+        raise WorkshopError(f"Number of jobs must be at least 1, got: {jobs}")
+    return jobs
+
+
+def list_item_dirs(items_path: Path) -> list[str]:
+    """Return the sorted names of item directories in 9-items/."""
+    with phase(Phase.SCAN), os.scandir(items_path) as entries:
+        return sorted(entry.name for entry in entries if ID_SEPARATOR in entry.name and entry.is_dir())
+
+
+def _scan_chunk(items_dir: str, names: list[str], known: dict[str, tuple[int, int]]) -> list[ScannedItem]:
+    results: list[ScannedItem] = []
+    with phase(Phase.SCAN):
+        for name in names:
+            status_file = f"{items_dir}/{name}/{STATUS_FILENAME}"
+            try:
+                st = os.stat(status_file)
+                if known.get(name) == (st.st_mtime_ns, st.st_size):
+                    data = None
+                else:
+                    with open(status_file) as f:
+                        text = f.read()
+                    with phase(Phase.PARSE):
+                        data = decode_status(text)
+            except FileNotFoundError:
+                continue
+            slug = slug_from_id(name)
+            assert slug is not None
+            results.append(ScannedItem(name, slug, st.st_mtime_ns, st.st_size, data))
+    return results
+
+
+def _executor_kind() -> str:
+    kind = os.environ.get(EXECUTOR_ENV_VAR) or "thread"
+    if kind not in ("thread", "process"):
+        raise WorkshopError(f"{EXECUTOR_ENV_VAR} must be 'thread' or 'process', got: {kind}")
+    return kind
+
+
+def scan_items(
+    items_path: Path,
+    known: dict[str, tuple[int, int]] | None = None,
+    jobs: int | None = None,
+) -> Iterator[ScannedItem]:
+    """Scan every item in 9-items/, in sorted item-ID order.
+
+    Args:
+        items_path: Path to 9-items/.
+        known: Item ID -> (mtime_ns, size) of status.yaml already known
+            to the caller; matching items are yielded with data=None.
+        jobs: Worker count (see resolve_jobs).
+
+    Yields:
+        A ScannedItem for every item directory that has a status.yaml.
+        Closing the generator early cancels chunks not yet started.
+    """
+    known = known or {}
+    names = list_item_dirs(items_path)
+    count(ITEMS_SCANNED, len(names))
+    chunks = [names[i : i + CHUNK_SIZE] for i in range(0, len(names), CHUNK_SIZE)]
+    workers = min(resolve_jobs(jobs), len(chunks))
+    items_dir = str(items_path)
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _scan_chunk(items_dir, chunk, known)
+        return
+
+    pool: Executor
+    if _executor_kind() == "process":
+        # Only ship each chunk's own signatures to worker processes
+        pool = ProcessPoolExecutor(max_workers=workers)
+        chunk_known: Iterable[dict[str, tuple[int, int]]] = (
+            {name: known[name] for name in chunk if name in known} for chunk in chunks
+        )
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+        chunk_known = repeat(known)
+
+    try:
+        for results in pool.map(_scan_chunk, repeat(items_dir), chunks, chunk_known):
+            yield from results
+    finally:
+        # Don't read the rest of the workshop if the caller stopped early
+        pool.shutdown(cancel_futures=True)
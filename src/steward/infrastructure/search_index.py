@@ -0,0 +1,339 @@
+"""Persistent full-text index of item notes, stored under _workshop/.steward/.
+
+Every text file in an item directory (nucleus, drafts, research
+handoffs; status.yaml excluded) is a document. The index keeps, per
+document, its mtime and size, so a refresh only re-tokenises files that
+changed, and an inverted table of (term, document, term frequency)
+postings, so a query reads just the postings of its own terms. Results
+are ranked with BM25, computed inside SQLite.
+
+Files are tokenised through mmap without decoding: a term is a run of
+ASCII letters, digits and underscores (UTF-8 multi-byte characters
+count as letters), lowercased, at most MAX_TERM_BYTES long. Large
+refreshes are tokenised in worker processes, since tokenising is
+CPU-bound.
+"""
+
+import math
+import mmap
+import os
+import re
+import sqlite3
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+
+from steward.infrastructure.scanner import CHUNK_SIZE, list_item_dirs, resolve_jobs
+from steward.infrastructure.state import ensure_state_path
+from steward.infrastructure.tracing import Phase, phase
+
+SEARCH_INDEX_FILENAME = "search.db"
+SCHEMA_VERSION = 1
+
+# Files indexed inside item directories
+INDEXED_SUFFIXES = (".md", ".markdown", ".txt", ".rst")
+
+# Longer runs of word characters (hashes, base64) are not useful terms
+MAX_TERM_BYTES = 64
+
+# BM25 parameters: term frequency saturation and document length normalisation
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# One posting's BM25 score, given q.idf and the :k1, :b and :avgdl parameters
+_BM25 = "q.idf * p.tf * (:k1 + 1) / (p.tf + :k1 * (1 - :b + :b * d.length / :avgdl))"
+
+# Refreshes that re-tokenise more than this many bytes use worker processes
+PARALLEL_TOKENIZE_BYTES = 8 * 1024 * 1024
+
+_TOKEN = re.compile(rb"[0-9A-Za-z_\x80-\xff]+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    item_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    UNIQUE (item_id, name)
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc);
+"""
+
+# (item ID, path relative to the item directory)
+DocKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class RefreshStats:
+    """What a refresh changed."""
+
+    indexed: int
+    removed: int
+    unchanged: int
+    bytes: int
+
+
+def tokenize(data: bytes | mmap.mmap) -> Counter[str]:
+    """Count the terms in a buffer."""
+    # findall and Counter run in C; only distinct tokens are decoded
+    raw = Counter(map(bytes.lower, _TOKEN.findall(data)))
+    terms: Counter[str] = Counter()
+    for token, tf in raw.items():
+        if len(token) <= MAX_TERM_BYTES:
+            term = token.decode("utf-8", "ignore")
+            if term:
+                terms[term] += tf
+    return terms
+
+
+def tokenize_file(path: str) -> Counter[str]:
+    """Count the terms in a file, mapping it rather than reading it."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return Counter()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return tokenize(mapped)
+
+
+def _tokenize_files(paths: list[str]) -> list[Counter[str] | None]:
+    results: list[Counter[str] | None] = []
+    with phase(Phase.PARSE):
+        for path in paths:
+            try:
+                results.append(tokenize_file(path))
+            except OSError:
+                # Vanished or unreadable since it was listed
+                results.append(None)
+    return results
+
+
+def _list_docs(items_dir: str, names: list[str]) -> list[tuple[str, str, int, int]]:
+    """Find the indexable files of some items, as (item ID, name, mtime_ns, size)."""
+    found: list[tuple[str, str, int, int]] = []
+    with phase(Phase.SCAN):
+        for item_id in names:
+            stack = [""]
+            while stack:
+                relative = stack.pop()
+                try:
+                    with os.scandir(f"{items_dir}/{item_id}/{relative}") as entries:
+                        for entry in entries:
+                            name = f"{relative}{entry.name}"
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(f"{name}/")
+                            elif entry.name.endswith(INDEXED_SUFFIXES) and entry.is_file(follow_symlinks=False):
+                                st = entry.stat(follow_symlinks=False)
+                                found.append((item_id, name, st.st_mtime_ns, st.st_size))
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
+    return found
+
+
+class SearchIndex:
+    """SQLite-backed inverted index of the notes in 9-items/."""
+
+    def __init__(self, workshop_path: Path) -> None:
+        self.workshop_path = workshop_path
+        self.items_path = workshop_path / "9-items"
+        self.db_path = ensure_state_path(workshop_path) / SEARCH_INDEX_FILENAME
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                conn.executescript("DROP TABLE IF EXISTS postings; DROP TABLE IF EXISTS docs;")
+            self._init_schema(conn)
+        except sqlite3.DatabaseError:
+            # Corrupt index - it is only a cache, so start over
+            conn.close()
+            self.db_path.unlink(missing_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            self._init_schema(conn)
+        return conn
+
+    @staticmethod
+    def _init_schema(conn: sqlite3.Connection) -> None:
+        conn.execute("PRAGMA journal_mode = WAL")
+        # A cache: losing the last transaction on power loss only means re-indexing
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def refresh(self, jobs: int | None = None) -> RefreshStats:
+        """Bring the index up to date with the files in 9-items/.
+
+        Item directories are listed and their files stat'ed in parallel;
+        only files whose mtime or size differ from the stored document
+        are tokenised, and documents for removed files are dropped.
+
+        Args:
+            jobs: Worker count (see resolve_jobs).
+        """
+        known: dict[DocKey, tuple[int, int]] = {
+            (item_id, name): (mtime_ns, size)
+            for item_id, name, mtime_ns, size in self._conn.execute("SELECT item_id, name, mtime_ns, size FROM docs")
+        }
+
+        names = list_item_dirs(self.items_path) if self.items_path.exists() else []
+        chunks = [names[i : i + CHUNK_SIZE] for i in range(0, len(names), CHUNK_SIZE)]
+        workers = max(1, min(resolve_jobs(jobs), len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            listed = [doc for found in pool.map(_list_docs, repeat(str(self.items_path)), chunks) for doc in found]
+
+        changed: list[tuple[str, str, int, int]] = []
+        seen: set[DocKey] = set()
+        for item_id, name, mtime_ns, size in listed:
+            key = (item_id, name)
+            seen.add(key)
+            stored = known.get(key)
+            if stored is None or stored != (mtime_ns, size):
+                changed.append((item_id, name, mtime_ns, size))
+        removed = sorted(known.keys() - seen)
+
+        changed_bytes = sum(size for *_, size in changed)
+        terms = self._tokenize([f"{self.items_path}/{item_id}/{name}" for item_id, name, *_ in changed], changed_bytes)
+        self._apply(changed, terms, removed)
+        return RefreshStats(len(changed), len(removed), len(listed) - len(changed), changed_bytes)
+
+    def _tokenize(self, paths: list[str], total_bytes: int) -> list[Counter[str] | None]:
+        if total_bytes < PARALLEL_TOKENIZE_BYTES or len(paths) < 2:
+            return _tokenize_files(paths)
+        workers = min(os.cpu_count() or 1, len(paths))
+        step = max(1, min(CHUNK_SIZE, -(-len(paths) // (workers * 4))))
+        chunks = [paths[i : i + step] for i in range(0, len(paths), step)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return [counts for result in pool.map(_tokenize_files, chunks) for counts in result]
+
+    def _apply(
+        self,
+        changed: list[tuple[str, str, int, int]],
+        terms: list[Counter[str] | None],
+        removed: list[DocKey],
+    ) -> None:
+        """Replace the documents of changed files and drop removed ones.
+
+        The changes were worked out from a snapshot read without a write
+        lock, and another search may have applied the same changes since,
+        so documents are replaced by (item ID, name) inside an immediate
+        transaction rather than by the IDs in the snapshot.
+        """
+        if not changed and not removed:
+            return
+        with phase(Phase.WRITE):
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._replace_docs(changed, terms, removed)
+            except BaseException:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
+
+    def _replace_docs(
+        self,
+        changed: list[tuple[str, str, int, int]],
+        terms: list[Counter[str] | None],
+        removed: list[DocKey],
+    ) -> None:
+        stale = removed + [(item_id, name) for item_id, name, *_ in changed]
+        self._conn.executemany(
+            "DELETE FROM postings WHERE doc IN (SELECT id FROM docs WHERE item_id = ? AND name = ?)", stale
+        )
+        self._conn.executemany("DELETE FROM docs WHERE item_id = ? AND name = ?", stale)
+        for (item_id, name, mtime_ns, size), counts in zip(changed, terms, strict=True):
+            if counts is None:
+                continue
+            cursor = self._conn.execute(
+                "INSERT INTO docs (item_id, name, mtime_ns, size, length) VALUES (?, ?, ?, ?, ?)",
+                (item_id, name, mtime_ns, size, sum(counts.values())),
+            )
+            doc = cursor.lastrowid
+            self._conn.executemany(
+                "INSERT INTO postings VALUES (?, ?, ?)", [(term, doc, tf) for term, tf in counts.items()]
+            )
+
+    def corpus_stats(self) -> tuple[int, float]:
+        """Return (document count, mean document length in terms)."""
+        count, mean = self._conn.execute("SELECT count(*), avg(length) FROM docs").fetchone()
+        return count, mean or 0.0
+
+    def _weighted_terms(self, terms: list[str]) -> tuple[str, dict[str, float | str]]:
+        """Build a CTE of the terms with their BM25 idf, plus its parameters."""
+        docs, mean_length = self.corpus_stats()
+        params: dict[str, float | str] = {"k1": BM25_K1, "b": BM25_B, "avgdl": mean_length or 1.0}
+        rows = []
+        for i, term in enumerate(terms):
+            df = self._conn.execute("SELECT count(*) FROM postings WHERE term = ?", (term,)).fetchone()[0]
+            params[f"t{i}"] = term
+            params[f"w{i}"] = math.log(1 + (docs - df + 0.5) / (df + 0.5))
+            rows.append(f"(:t{i}, :w{i})")
+        return f"WITH q(term, idf) AS (VALUES {', '.join(rows)})", params
+
+    def rank(self, terms: list[str], item_id: str | None = None) -> Iterator[tuple[str, float]]:
+        """Yield the items whose documents contain every term, best first.
+
+        An item's score is the sum of the BM25 scores of its documents.
+        Scoring runs inside SQLite over the postings of the given terms
+        only, and results stream from the cursor, so callers that stop
+        early do not pay for the rest.
+
+        Args:
+            terms: Distinct terms as produced by tokenize.
+            item_id: Only rank this item.
+
+        Yields:
+            (item ID, score), by descending score then item ID.
+        """
+        cte, params = self._weighted_terms(terms)
+        params["n"] = len(terms)
+        where = ""
+        if item_id is not None:
+            where = "WHERE d.item_id = :item"
+            params["item"] = item_id
+        yield from self._conn.execute(
+            f"{cte} SELECT d.item_id, SUM({_BM25}) AS score "
+            "FROM q JOIN postings p ON p.term = q.term JOIN docs d ON d.id = p.doc "
+            f"{where} GROUP BY d.item_id HAVING COUNT(DISTINCT p.term) = :n "
+            "ORDER BY score DESC, d.item_id",
+            params,
+        )
+
+    def matching_files(self, terms: list[str], item_id: str) -> list[str]:
+        """Return the item's documents containing any of the terms, best first."""
+        cte, params = self._weighted_terms(terms)
+        params["item"] = item_id
+        rows = self._conn.execute(
+            f"{cte} SELECT d.name, SUM({_BM25}) AS score "
+            "FROM q JOIN postings p ON p.term = q.term JOIN docs d ON d.id = p.doc "
+            "WHERE d.item_id = :item GROUP BY d.id ORDER BY score DESC, d.name",
+            params,
+        )
+        return [name for name, _ in rows]
+
+
+def open_search_index(workshop_path: Path) -> SearchIndex:
+    """Open (creating if needed) the search index for a workshop."""
+    return SearchIndex(workshop_path)
@@ -0,0 +1,170 @@
+"""Slug resolution over a sorted array of item IDs.
+
+Items are kept sorted by (slug, item_id), so every item whose slug
+starts with a given prefix sits in one contiguous run that bisect finds
+in O(log n). The array is persisted to _workshop/.steward/slugs.idx and
+trusted as long as the mtime of 9-items/ is unchanged. That mtime only
+moves when items are added, removed or renamed.
+
+The array lists every directory in 9-items/, including ones an intake
+has reserved but not registered yet; resolving skips those, since they
+have no status.yaml.
+"""
+
+import bisect
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from steward.domain.errors import AmbiguousItemError, ItemNotFoundError
+from steward.domain.item_ids import slug_from_id
+from steward.infrastructure.state import ensure_state_path, get_state_path
+from steward.infrastructure.status_codec import STATUS_FILENAME
+from steward.infrastructure.tracing import Phase, phase
+
+RESOLVER_FILENAME = "slugs.idx"
+_HEADER = "steward-slugs 1"
+
+# A directory changed this close to when it was last verified may have
+# changed again within the same timestamp tick, so it is rescanned.
+RACY_WINDOW_NS = 1_000_000_000
+
+
+class SlugResolver:
+    """Prefix lookup from slug to item ID."""
+
+    def __init__(self, item_ids: Iterable[str], items_mtime_ns: int = -1, verified_at_ns: int = 0) -> None:
+        self._keys: list[tuple[str, str]] = sorted(
+            (slug, item_id) for item_id in item_ids if (slug := slug_from_id(item_id)) is not None
+        )
+        self.items_mtime_ns = items_mtime_ns
+        self.verified_at_ns = verified_at_ns
+        # Set by load_slug_resolver: resolve() then skips unregistered items
+        self.items_path: Path | None = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def item_ids(self) -> list[str]:
+        """All known item IDs, ordered by slug."""
+        return [item_id for _, item_id in self._keys]
+
+    def add(self, item_id: str) -> None:
+        """Insert an item ID, keeping the array sorted."""
+        slug = slug_from_id(item_id)
+        if slug is None:
+            return
+        key = (slug, item_id)
+        i = bisect.bisect_left(self._keys, key)
+        if i == len(self._keys) or self._keys[i] != key:
+            self._keys.insert(i, key)
+
+    def remove(self, item_id: str) -> None:
+        """Remove an item ID if present."""
+        slug = slug_from_id(item_id)
+        if slug is None:
+            return
+        key = (slug, item_id)
+        i = bisect.bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+
+    def candidates(self, prefix: str) -> list[str]:
+        """Return the IDs of all items whose slug starts with prefix."""
+        i = bisect.bisect_left(self._keys, (prefix,))
+        matches: list[str] = []
+        while i < len(self._keys) and self._keys[i][0].startswith(prefix):
+            matches.append(self._keys[i][1])
+            i += 1
+        return matches
+
+    def resolve(self, prefix: str) -> str:
+        """Resolve a slug or slug prefix to exactly one item ID.
+
+        Raises:
+            ItemNotFoundError: If no item matches.
+            AmbiguousItemError: If multiple items match.
+        """
+        matches = self.candidates(prefix)
+        if self.items_path is not None:
+            items_dir = self.items_path
+            matches = [item_id for item_id in matches if os.path.exists(items_dir / item_id / STATUS_FILENAME)]
+        if not matches:
+            raise ItemNotFoundError(f"No item found matching: {prefix}")
+        if len(matches) > 1:
+            raise AmbiguousItemError(
+                f"Multiple items match '{prefix}'. Please be more specific.",
+                matches=matches,
+            )
+        return matches[0]
+
+    def is_fresh(self, items_mtime_ns: int) -> bool:
+        """Check whether the array still reflects a 9-items/ mtime."""
+        return items_mtime_ns == self.items_mtime_ns and items_mtime_ns < self.verified_at_ns - RACY_WINDOW_NS
+
+
+def _scan(items_path: Path) -> SlugResolver:
+    # Read the mtime before scanning so a concurrent change is seen as stale
+    items_mtime_ns = os.stat(items_path).st_mtime_ns
+    with os.scandir(items_path) as entries:
+        item_ids = [entry.name for entry in entries if entry.is_dir()]
+    return SlugResolver(item_ids, items_mtime_ns, time.time_ns())
+
+
+def _load_persisted(path: Path) -> SlugResolver | None:
+    try:
+        verified_at_ns = os.stat(path).st_mtime_ns
+        lines = path.read_text().splitlines()
+    except FileNotFoundError:
+        return None
+    if len(lines) < 2 or lines[0] != _HEADER or not lines[1].lstrip("-").isdigit():
+        return None
+    return SlugResolver(lines[2:], int(lines[1]), verified_at_ns)
+
+
+def save_slug_resolver(workshop_path: Path, resolver: SlugResolver, items_mtime_ns: int | None = None) -> None:
+    """Persist the resolver.
+
+    Args:
+        workshop_path: Workshop the resolver belongs to.
+        resolver: Resolver to save.
+        items_mtime_ns: 9-items/ mtime the resolver reflects; defaults to
+            the current mtime (use right after adding an item).
+    """
+    if items_mtime_ns is None:
+        items_mtime_ns = os.stat(workshop_path / "9-items").st_mtime_ns
+    resolver.items_mtime_ns = items_mtime_ns
+    path = ensure_state_path(workshop_path) / RESOLVER_FILENAME
+    tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    body = "\n".join([_HEADER, str(resolver.items_mtime_ns), *resolver.item_ids()])
+    with phase(Phase.WRITE):
+        tmp_path.write_text(body + "\n")
+        os.replace(tmp_path, path)
+    resolver.verified_at_ns = os.stat(path).st_mtime_ns
+
+
+_cache: dict[Path, SlugResolver] = {}
+
+
+def load_slug_resolver(workshop_path: Path) -> SlugResolver:
+    """Get an up-to-date resolver for a workshop.
+
+    Uses, in order: the in-process copy, the persisted array, or a fresh
+    scandir of 9-items/ (which is then persisted).
+    """
+    items_path = workshop_path / "9-items"
+    try:
+        items_mtime_ns = os.stat(items_path).st_mtime_ns
+    except FileNotFoundError:
+        return SlugResolver([])
+
+    resolver = _cache.get(workshop_path)
+    if resolver is None or not resolver.is_fresh(items_mtime_ns):
+        resolver = _load_persisted(get_state_path(workshop_path) / RESOLVER_FILENAME)
+        if resolver is None or not resolver.is_fresh(items_mtime_ns):
+            resolver = _scan(items_path)
+            save_slug_resolver(workshop_path, resolver, resolver.items_mtime_ns)
+        resolver.items_path = items_path
+        _cache[workshop_path] = resolver
+    return resolver
@@ -0,0 +1,21 @@
+"""Location of steward's private state.
+
+Caches, sockets and other bookkeeping live in _workshop/.steward/, which
+is covered by the workshop .gitignore pattern.
+"""
+
+from pathlib import Path
+
+STATE_DIR = ".steward"
+
+
+def get_state_path(workshop_path: Path) -> Path:
+    """Get the directory holding steward's private state."""
+    return workshop_path / STATE_DIR
+
+
+def ensure_state_path(workshop_path: Path) -> Path:
+    """Get the state directory, creating it if needed."""
+    path = get_state_path(workshop_path)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
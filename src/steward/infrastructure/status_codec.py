@@ -0,0 +1,103 @@
+"""Fast encoding and decoding of status.yaml documents.
+
+steward writes status.yaml in one canonical shape:
+
+    stage: forge
+    created: '2025-01-01T12:00:00.123456'
+    updated: '2025-01-02T09:30:00'
+
+Documents in that shape are parsed and emitted directly with a regular
+expression and string formatting, byte-for-byte identical to what
+yaml.dump produces. Anything else, such as hand-edited files, comments,
+extra keys or unquoted timestamps, falls back to PyYAML, which is only
+imported when needed.
+"""
+
+import re
+from datetime import datetime
+from typing import Any
+
+from steward.domain.stages import Stage
+
+STATUS_FILENAME = "status.yaml"
+
+_STAGE_VALUES = frozenset(stage.value for stage in Stage)
+
+# isoformat() output that yaml.dump emits single-quoted (it resolves as a
+# YAML timestamp). Offsets with seconds are not quoted by yaml.dump, so
+# they are left to the fallback.
+_ISO_TIMESTAMP = r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(?:\.\d{6})?(?:[+-]\d\d:\d\d)?"
+
+_CANONICAL = re.compile(
+    rf"stage: ([a-z]+)\ncreated: '({_ISO_TIMESTAMP})'\nupdated: '({_ISO_TIMESTAMP})'\n\Z",
+)
+_TIMESTAMP = re.compile(rf"{_ISO_TIMESTAMP}\Z")
+
+
+def decode_status(text: str) -> dict[str, Any]:
+    """Parse a status.yaml document into a dict.
+
+    Canonical documents take the fast path; others are parsed with
+    yaml.CSafeLoader when libyaml is available, else yaml.SafeLoader.
+
+    Raises:
+        ValueError: If the document is not valid YAML or not a mapping.
+    """
+    match = _CANONICAL.match(text)
+    if match is not None and match.group(1) in _STAGE_VALUES:
+        return {"stage": match.group(1), "created": match.group(2), "updated": match.group(3)}
+    return _yaml_load(text)
+
+
+def canonical_fields(data: dict[str, Any]) -> tuple[str, str, str] | None:
+    """Return (stage, created, updated) if decoded data is already canonical.
+
+    Canonical data has a known stage and ISO 8601 timestamp strings exactly
+    as isoformat() emits them, so it needs no further validation. Returns
+    None for anything else.
+    """
+    stage = data.get("stage")
+    created = data.get("created")
+    updated = data.get("updated")
+    if len(data) != 3 or stage not in _STAGE_VALUES or not isinstance(created, str) or not isinstance(updated, str):
+        return None
+    if not (_TIMESTAMP.match(created) and _TIMESTAMP.match(updated)):
+        return None
+    try:
+        datetime.fromisoformat(created)
+        datetime.fromisoformat(updated)
+    except ValueError:
+        return None
+    return stage, created, updated
+
+
+def encode_status(stage: str, created: datetime, updated: datetime) -> str:
+    """Emit a status.yaml document.
+
+    The output is identical to ``yaml.dump(data, default_flow_style=False,
+    sort_keys=False)`` for the same data.
+    """
+    created_iso = created.isoformat()
+    updated_iso = updated.isoformat()
+    if stage in _STAGE_VALUES and _TIMESTAMP.match(created_iso) and _TIMESTAMP.match(updated_iso):
+        return f"stage: {stage}\ncreated: '{created_iso}'\nupdated: '{updated_iso}'\n"
+    return _yaml_dump({"stage": stage, "created": created_iso, "updated": updated_iso})
+
+
+def _yaml_load(text: str) -> dict[str, Any]:
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        data = yaml.load(text, Loader=loader)
+    except yaml.YAMLError as e:
+        raise ValueError(f"status.yaml is not valid YAML: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError("status.yaml must contain a mapping")
+    return data
+
+
+def _yaml_dump(data: dict[str, str]) -> str:
+    import yaml
+
+    return yaml.dump(data, default_flow_style=False, sort_keys=False)
@@ -1,12 +1,24 @@
-"""Status YAML file operations."""
+"""Status YAML file operations.
 
-from pathlib import Path
+Encoding and decoding go through steward.infrastructure.status_codec,
+which handles the canonical format without PyYAML.
 
-import yaml
+Writes go to a temporary file that then replaces status.yaml, so a crash
+leaves either the old or the new status, never a truncated one. How the
+writes are flushed to disk is set by the durability mode (see
+steward.infrastructure.durability).
+"""
 
-from steward.domain.models import Status
+import contextlib
+import os
+from collections.abc import Iterable
+from pathlib import Path
 
-STATUS_FILENAME = "status.yaml"
+from steward.domain.models import Status
+from steward.domain.stages import Stage
+from steward.infrastructure.durability import Durability, fsync_all, fsync_directory, fsync_file, resolve_durability
+from steward.infrastructure.status_codec import STATUS_FILENAME, decode_status, encode_status
+from steward.infrastructure.tracing import Phase, phase
 
 
 def read_status(item_path: Path) -> Status:
@@ -23,28 +35,64 @@ def read_status(item_path: Path) -> Status:
     """
     status_file = item_path / STATUS_FILENAME
     with open(status_file) as f:
-        data = yaml.safe_load(f)
-    return Status(**data)
+        text = f.read()
+    with phase(Phase.PARSE):
+        data = decode_status(text)
+    with phase(Phase.VALIDATE):
+        return Status(**data)
 
 
-def write_status(item_path: Path, status: Status) -> None:
+def write_status(item_path: Path, status: Status, durability: Durability | None = None) -> None:
     """Write status.yaml to an item directory.
 
     Args:
         item_path: Path to the item directory in 9-items/.
         status: Status object to write.
+        durability: How to flush the write (default: $STEWARD_DURABILITY).
     """
-    status_file = item_path / STATUS_FILENAME
+    write_statuses([(item_path, status)], durability)
 
-    # Ensure directory exists
-    item_path.mkdir(parents=True, exist_ok=True)
 
-    # Convert to dict with ISO format timestamps
-    data = {
-        "stage": status.stage if isinstance(status.stage, str) else status.stage.value,
-        "created": status.created.isoformat(),
-        "updated": status.updated.isoformat(),
-    }
+def write_statuses(updates: Iterable[tuple[Path, Status]], durability: Durability | None = None) -> None:
+    """Write status.yaml to many item directories as one batch.
+
+    Every new file is written before any status.yaml is replaced, so if
+    writing one fails, all items keep their old status. In group mode the
+    new files are fsynced together before the renames, and each item
+    directory once after them, rather than one after the other per item.
+
+    Args:
+        updates: (item directory, status) pairs.
+        durability: How to flush the writes (default: $STEWARD_DURABILITY).
+    """
+    with phase(Phase.WRITE):
+        mode = resolve_durability(durability)
+        updates = list(updates)
+
+        temp_files: list[tuple[Path, Path]] = []
+        try:
+            for item_path, status in updates:
+                item_path.mkdir(parents=True, exist_ok=True)
+                temp_file = item_path / f".{STATUS_FILENAME}.{os.getpid()}.tmp"
+                temp_files.append((temp_file, item_path / STATUS_FILENAME))
+                with open(temp_file, "w") as f:
+                    f.write(encode_status(Stage(status.stage).value, status.created, status.updated))
+                    if mode is Durability.FILE:
+                        f.flush()
+                        os.fsync(f.fileno())
+        except BaseException:
+            for temp_file, _ in temp_files:
+                with contextlib.suppress(OSError):
+                    temp_file.unlink()
+            raise
 
-    with open(status_file, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        if not temp_files:
+            return
+        if mode is Durability.GROUP:
+            fsync_all(fsync_file, [temp_file for temp_file, _ in temp_files])
+        for temp_file, status_file in temp_files:
+            os.replace(temp_file, status_file)
+            if mode is Durability.FILE:
+                fsync_directory(status_file.parent)
+        if mode is Durability.GROUP:
+            fsync_all(fsync_directory, list(dict.fromkeys(status_file.parent for _, status_file in temp_files)))
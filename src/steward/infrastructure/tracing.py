@@ -0,0 +1,284 @@
+"""Hot-path instrumentation: per-phase timings and syscall counts.
+
+Set STEWARD_TRACE=1 and a command prints, on stderr, where its time
+went: imports, environment resolution, directory scans, status.yaml parsing,
+model validation, writes (status files, index, journal) and symlink
+changes, plus counts of the filesystem syscalls it made.
+
+Phase times are exclusive: time spent in a nested phase (e.g. parsing
+inside a scan) is only counted once, in the inner phase. Phases run by
+scan workers are added up across threads, so on a parallel scan they
+can exceed the wall time. Workers in other processes
+(STEWARD_SCAN_EXECUTOR=process) are not traced.
+
+Syscalls are counted from Python audit events (see sys.addaudithook),
+which cover opens, directory listings, renames, unlinks, symlinks and
+the like but not stat or readlink; total read and write syscalls come
+from /proc/self/io where it exists.
+
+Imports are timed by wrapping builtins.__import__ while a trace is
+active. When no trace is active, phase() returns a shared no-op context
+manager, so instrumented code pays one global lookup per call.
+"""
+
+import builtins
+import contextlib
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+TRACE_ENV_VAR = "STEWARD_TRACE"
+
+
+class Phase(StrEnum):
+    """Parts of a command that are timed separately."""
+
+    IMPORT = "import"  # Modules imported by the command (e.g. pydantic)
+    ENV = "env"  # Resolving PRAXIS_HOME and the workshop path
+    SCAN = "scan"  # Listing directories and stat'ing status files
+    PARSE = "parse"  # Decoding status.yaml text
+    VALIDATE = "validate"  # Building and checking Status models
+    WRITE = "write"  # Status files, the index and the journal
+    LINK = "link"  # Creating, retargeting and removing stage symlinks
+
+
+# Counters (see count())
+ITEMS_SCANNED = "items_scanned"
+BYTES_COPIED = "bytes_copied"
+
+# Audit event -> syscall name reported in the trace
+_SYSCALL_EVENTS = {
+    "open": "open",
+    "os.scandir": "scandir",
+    "os.listdir": "listdir",
+    "os.mkdir": "mkdir",
+    "os.rmdir": "rmdir",
+    "os.rename": "rename",
+    "os.remove": "unlink",
+    "os.symlink": "symlink",
+    "os.link": "link",
+    "os.truncate": "truncate",
+    "os.chmod": "chmod",
+    "os.utime": "utime",
+    "shutil.copyfile": "copyfile",
+}
+
+
+@dataclass
+class PhaseStats:
+    """Time spent in one phase."""
+
+    calls: int = 0
+    seconds: float = 0.0
+
+
+class Trace:
+    """Timings and counts collected while a command runs."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.finished: float | None = None
+        self.phases: dict[Phase, PhaseStats] = {phase: PhaseStats() for phase in Phase}
+        self.syscalls: Counter[str] = Counter()
+        self.counters: Counter[str] = Counter()
+        self._io_start = _read_proc_io()
+        self._io_end: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def wall_seconds(self) -> float:
+        """Seconds from start to finish (or to now, while running)."""
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    @property
+    def io_syscalls(self) -> dict[str, int]:
+        """Read and write syscalls made while tracing (empty without /proc)."""
+        end = self._io_end or _read_proc_io()
+        return {key: end[key] - self._io_start[key] for key in self._io_start if key in end}
+
+    def add(self, phase: Phase, seconds: float) -> None:
+        """Count one call of a phase."""
+        with self._lock:
+            stats = self.phases[phase]
+            stats.calls += 1
+            stats.seconds += seconds
+
+    def stop(self) -> None:
+        """Freeze the wall time and syscall counts."""
+        self.finished = time.perf_counter()
+        self._io_end = _read_proc_io()
+
+    def _stack(self) -> list["_PhaseTimer"]:
+        stack: list[_PhaseTimer] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+class _PhaseTimer:
+    """Times one phase, excluding time spent in phases nested inside it."""
+
+    __slots__ = ("trace", "phase", "start", "nested")
+
+    def __init__(self, trace: Trace, phase: Phase) -> None:
+        self.trace = trace
+        self.phase = phase
+        self.start = 0.0
+        self.nested = 0.0
+
+    def __enter__(self) -> None:
+        self.trace._stack().append(self)
+        self.start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        elapsed = time.perf_counter() - self.start
+        stack = self.trace._stack()
+        stack.pop()
+        if stack:
+            stack[-1].nested += elapsed
+        self.trace.add(self.phase, elapsed - self.nested)
+
+
+_active: Trace | None = None
+_hook_installed = False
+_NULL = contextlib.nullcontext()
+_original_import = builtins.__import__
+
+
+def phase(name: Phase) -> AbstractContextManager[None]:
+    """Time the enclosed block as part of a phase, if a trace is active."""
+    trace = _active
+    if trace is None:
+        return _NULL
+    return _PhaseTimer(trace, name)
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Add to a counter (e.g. ITEMS_SCANNED), if a trace is active."""
+    trace = _active
+    if trace is not None:
+        with trace._lock:
+            trace.counters[name] += amount
+
+
+def active_trace() -> Trace | None:
+    """Return the trace being collected, if any."""
+    return _active
+
+
+def tracing_requested() -> bool:
+    """Check whether $STEWARD_TRACE asks for a trace."""
+    return os.environ.get(TRACE_ENV_VAR, "") not in ("", "0")
+
+
+def start_trace() -> Trace:
+    """Start collecting a trace for the rest of the command."""
+    global _active, _hook_installed
+    if not _hook_installed:
+        # Audit hooks cannot be removed, so one hook serves every trace
+        sys.addaudithook(_count_syscall)
+        _hook_installed = True
+    _active = Trace()
+    builtins.__import__ = _traced_import
+    return _active
+
+
+def stop_trace() -> Trace | None:
+    """Stop collecting and return the finished trace."""
+    global _active
+    trace, _active = _active, None
+    builtins.__import__ = _original_import
+    if trace is not None:
+        trace.stop()
+    return trace
+
+
+def _traced_import(*args: Any, **kwargs: Any) -> Any:
+    with phase(Phase.IMPORT):
+        return _original_import(*args, **kwargs)
+
+
+def _count_syscall(event: str, args: tuple[Any, ...]) -> None:
+    trace = _active
+    if trace is not None:
+        name = _SYSCALL_EVENTS.get(event)
+        if name is not None:
+            with trace._lock:
+                trace.syscalls[name] += 1
+
+
+def _read_proc_io() -> dict[str, int]:
+    counts: dict[str, int] = {}
+    try:
+        with open("/proc/self/io", "rb") as f:
+            for line in f:
+                key, _, value = line.decode().partition(":")
+                if key in ("syscr", "syscw"):
+                    counts[key] = int(value)
+    except OSError:
+        pass
+    return counts
+
+
+def format_trace(trace: Trace, command: str) -> list[str]:
+    """Render a trace as lines of a per-phase breakdown."""
+    wall_ms = trace.wall_seconds * 1000
+    lines = [f"steward trace: {command}  wall {wall_ms:.1f} ms", f"  {'PHASE':<10} {'CALLS':>8} {'MS':>10} {'%':>6}"]
+    for name, stats in trace.phases.items():
+        share = 100 * stats.seconds * 1000 / wall_ms if wall_ms else 0.0
+        lines.append(f"  {name:<10} {stats.calls:>8} {stats.seconds * 1000:>10.2f} {share:>5.1f}%")
+    syscalls = ", ".join(f"{name} {count}" for name, count in sorted(trace.syscalls.items())) or "none"
+    other = trace.wall_seconds - sum(stats.seconds for stats in trace.phases.values())
+    if other > 0:
+        lines.append(f"  {'other':<10} {'':>8} {other * 1000:>10.2f} {100 * other * 1000 / wall_ms:>5.1f}%")
+    lines.append(f"  syscalls: {syscalls}")
+    if trace.counters:
+        lines.append("  counts: " + ", ".join(f"{name} {value}" for name, value in sorted(trace.counters.items())))
+    io = trace.io_syscalls
+    if io:
+        lines.append(f"  read/write syscalls: {io.get('syscr', 0)} read, {io.get('syscw', 0)} write")
+    return lines
+
+
+def start_profile(path: Path, memory: bool = False) -> Callable[[], None]:
+    """Start cProfile (and tracemalloc, if memory is set).
+
+    Returns:
+        A function that stops profiling and writes the pstats dump to
+        path and, with memory, a tracemalloc snapshot to
+        ``<path>.tracemalloc``.
+    """
+    import cProfile
+
+    if memory:
+        import tracemalloc
+
+        tracemalloc.start()
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    def finish() -> None:
+        profiler.disable()
+        profiler.dump_stats(path)
+        if memory:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            snapshot.dump(f"{path}.tracemalloc")
+
+    return finish
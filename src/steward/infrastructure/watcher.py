@@ -0,0 +1,253 @@
+"""Change notifications for the inbox and item status files.
+
+Two backends report the same events:
+
+- InotifyWatcher: Linux inotify through libc. The inbox, 9-items/ and
+  every item directory are watched, so an event costs the same however
+  large the workshop is.
+- PollingWatcher: rescans the inbox and stats every status.yaml at a
+  fixed interval. Used where inotify is unavailable or the watch limit
+  (fs.inotify.max_user_watches) is too low for the workshop.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import Protocol
+
+from steward.domain.item_ids import ID_SEPARATOR
+from steward.infrastructure.status_codec import STATUS_FILENAME
+
+# From <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+_INBOX_MASK = IN_CREATE | IN_CLOSE_WRITE | IN_MOVED_TO | IN_MODIFY | IN_ATTRIB
+_ITEMS_MASK = IN_CREATE | IN_MOVED_TO | IN_DELETE | IN_MOVED_FROM | IN_ONLYDIR
+_ITEM_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE | IN_DELETE_SELF | IN_ONLYDIR
+
+
+class WatchKind(StrEnum):
+    """What changed."""
+
+    INBOX = "inbox"  # An entry in 1-inbox/ was created or written to
+    STATUS = "status"  # An item's status.yaml (or the item itself) changed
+    RESCAN = "rescan"  # Events were lost; everything may have changed
+
+
+@dataclass(frozen=True)
+class WatchEvent:
+    """One change. ``name`` is the inbox entry or item ID."""
+
+    kind: WatchKind
+    name: str = ""
+
+
+class Watcher(Protocol):
+    """A source of WatchEvents."""
+
+    def read(self, timeout: float) -> list[WatchEvent]:
+        """Wait up to timeout seconds and return the events seen."""
+        ...
+
+    def close(self) -> None:
+        """Stop watching."""
+        ...
+
+
+class WatchUnavailableError(OSError):
+    """inotify cannot be used here (no support, or watch limit reached)."""
+
+
+class InotifyWatcher:
+    """Watches the workshop with inotify."""
+
+    def __init__(self, workshop_path: Path) -> None:
+        self.inbox_path = workshop_path / "1-inbox"
+        self.items_path = workshop_path / "9-items"
+        libc_name = ctypes.util.find_library("c")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise WatchUnavailableError(errno.ENOSYS, "inotify is not available")
+        self._add_watch_fn = libc.inotify_add_watch
+        self._add_watch_fn.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise WatchUnavailableError(err, f"inotify_init1: {os.strerror(err)}")
+        # Watch descriptor -> item ID ("" for the inbox and 9-items/)
+        self._items: dict[int, str] = {}
+        try:
+            self.inbox_path.mkdir(parents=True, exist_ok=True)
+            self.items_path.mkdir(parents=True, exist_ok=True)
+            self._inbox_wd = self._add_watch(self.inbox_path, _INBOX_MASK)
+            self._items_wd = self._add_watch(self.items_path, _ITEMS_MASK)
+            with os.scandir(self.items_path) as entries:
+                for entry in entries:
+                    if ID_SEPARATOR in entry.name and entry.is_dir():
+                        self._watch_item(entry.name)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def _add_watch(self, path: Path, mask: int) -> int:
+        wd = int(self._add_watch_fn(self._fd, os.fsencode(path), mask))
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                raise WatchUnavailableError(err, "inotify watch limit reached (fs.inotify.max_user_watches)")
+            raise OSError(err, os.strerror(err), str(path))
+        return wd
+
+    def _watch_item(self, item_id: str) -> None:
+        try:
+            self._items[self._add_watch(self.items_path / item_id, _ITEM_MASK)] = item_id
+        except OSError as e:
+            # Gone already, or not a directory: nothing to watch
+            if e.errno not in (errno.ENOENT, errno.ENOTDIR):
+                raise
+
+    def read(self, timeout: float) -> list[WatchEvent]:
+        """Wait up to timeout seconds and return the events seen."""
+        ready, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events: list[WatchEvent] = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0").decode(errors="surrogateescape")
+            offset += length
+            event = self._translate(wd, mask, name)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def _translate(self, wd: int, mask: int, name: str) -> WatchEvent | None:
+        if mask & IN_Q_OVERFLOW:
+            return WatchEvent(WatchKind.RESCAN)
+        if wd == self._inbox_wd:
+            return WatchEvent(WatchKind.INBOX, name) if name else None
+        if wd == self._items_wd:
+            if ID_SEPARATOR not in name:
+                return None
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                # status.yaml may already be in place before the watch is
+                self._watch_item(name)
+            return WatchEvent(WatchKind.STATUS, name)
+        item_id = self._items.get(wd)
+        if item_id is None:
+            return None
+        if mask & IN_IGNORED:
+            del self._items[wd]
+            return None
+        if mask & IN_DELETE_SELF or name == STATUS_FILENAME:
+            return WatchEvent(WatchKind.STATUS, item_id)
+        return None
+
+    def close(self) -> None:
+        """Stop watching."""
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Watches the workshop by rescanning it every interval seconds."""
+
+    def __init__(self, workshop_path: Path, interval: float = 1.0) -> None:
+        self.inbox_path = workshop_path / "1-inbox"
+        self.items_path = workshop_path / "9-items"
+        self.interval = interval
+        self._inbox = self._scan_inbox()
+        self._items = self._scan_items()
+        self._next_poll = time.monotonic() + interval
+
+    def _scan_inbox(self) -> dict[str, tuple[int, int]]:
+        snapshot: dict[str, tuple[int, int]] = {}
+        try:
+            with os.scandir(self.inbox_path) as entries:
+                for entry in entries:
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except FileNotFoundError:
+                        continue
+                    snapshot[entry.name] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            pass
+        return snapshot
+
+    def _scan_items(self) -> dict[str, tuple[int, int] | None]:
+        snapshot: dict[str, tuple[int, int] | None] = {}
+        try:
+            with os.scandir(self.items_path) as entries:
+                names = [entry.name for entry in entries if ID_SEPARATOR in entry.name]
+        except FileNotFoundError:
+            return snapshot
+        for name in names:
+            try:
+                st = os.stat(self.items_path / name / STATUS_FILENAME)
+                snapshot[name] = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                snapshot[name] = None
+        return snapshot
+
+    def read(self, timeout: float) -> list[WatchEvent]:
+        """Wait up to timeout seconds and return the events seen."""
+        wait = self._next_poll - time.monotonic()
+        if wait > timeout:
+            time.sleep(max(timeout, 0))
+            return []
+        if wait > 0:
+            time.sleep(wait)
+        self._next_poll = time.monotonic() + self.interval
+
+        inbox, items = self._scan_inbox(), self._scan_items()
+        events = [
+            WatchEvent(WatchKind.INBOX, name) for name, signature in inbox.items() if self._inbox.get(name) != signature
+        ]
+        events += [
+            WatchEvent(WatchKind.STATUS, item_id)
+            for item_id in items.keys() | self._items.keys()
+            if items.get(item_id, ()) != self._items.get(item_id, ())
+        ]
+        self._inbox, self._items = inbox, items
+        return events
+
+    def close(self) -> None:
+        """Stop watching."""
+
+
+def open_watcher(workshop_path: Path, poll: bool = False, interval: float = 1.0) -> Watcher:
+    """Open an inotify watcher, or a polling one if asked or if inotify is unavailable."""
+    if not poll:
+        try:
+            return InotifyWatcher(workshop_path)
+        except WatchUnavailableError:
+            pass
+    return PollingWatcher(workshop_path, interval)
@@ -0,0 +1,123 @@
+"""Request execution for steward serve.
+
+Each forwarded request runs the regular Typer app in-process, with
+stdout and stderr redirected to the client connection and the client's
+STEWARD_* variables in place of the server's. The application services
+stay imported and the item index stays open between requests.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import traceback
+from collections.abc import Callable, Iterator
+
+from steward.domain.exit_codes import ExitCode
+from steward.infrastructure.daemon import FORWARDED_ENV_PREFIX, LOCAL_COMMANDS
+
+
+class _ForwardingStream(io.TextIOBase):
+    """Text stream that forwards every write to the client."""
+
+    encoding = "utf-8"
+
+    def __init__(self, name: str, write: Callable[[str, str], None]) -> None:
+        self._name = name
+        self._write = write
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: str) -> int:
+        if data:
+            self._write(self._name, data)
+        return len(data)
+
+
+def _exit_code(code: object) -> int:
+    if code is None:
+        return ExitCode.SUCCESS
+    if isinstance(code, int):
+        return code
+    return ExitCode.GENERAL_ERROR
+
+
+@contextlib.contextmanager
+def _client_env(env: dict[str, str]) -> Iterator[None]:
+    """Swap the server's STEWARD_* variables for the client's while a command runs."""
+    saved = {name: value for name, value in os.environ.items() if name.startswith(FORWARDED_ENV_PREFIX)}
+    for name in saved:
+        del os.environ[name]
+    os.environ.update({name: value for name, value in env.items() if name.startswith(FORWARDED_ENV_PREFIX)})
+    try:
+        yield
+    finally:
+        for name in [name for name in os.environ if name.startswith(FORWARDED_ENV_PREFIX)]:
+            del os.environ[name]
+        os.environ.update(saved)
+
+
+def run_forwarded(
+    argv: list[str],
+    cwd: str,
+    write: Callable[[str, str], None],
+    stdin: str = "",
+    env: dict[str, str] | None = None,
+) -> int:
+    """Run one CLI invocation on behalf of a client.
+
+    Args:
+        argv: Command-line arguments, without the program name.
+        cwd: Client working directory (relative paths resolve against it).
+        write: Callback forwarding (stream, data) to the client.
+        stdin: The client's standard input, if it sent any.
+        env: The client's STEWARD_* variables; the command sees these
+            instead of the server's.
+
+    Returns:
+        The command's exit code.
+    """
+    from steward.cli import app
+
+    stderr = _ForwardingStream("stderr", write)
+    if argv and argv[0] in LOCAL_COMMANDS:
+        stderr.write(f"Error: {argv[0]} cannot be forwarded to a running server\n")
+        return ExitCode.INVALID_ARGUMENT
+
+    old_cwd = os.getcwd()
+    old_stdin = sys.stdin
+    try:
+        os.chdir(cwd)
+        sys.stdin = io.StringIO(stdin)
+        with (
+            _client_env(env or {}),
+            contextlib.redirect_stdout(_ForwardingStream("stdout", write)),
+            contextlib.redirect_stderr(stderr),
+        ):
+            try:
+                app(args=argv, prog_name="steward")
+            except SystemExit as e:
+                return _exit_code(e.code)
+            except Exception:
+                stderr.write(traceback.format_exc())
+                return ExitCode.GENERAL_ERROR
+    except OSError as e:
+        stderr.write(f"Error: {e}\n")
+        return ExitCode.ENV_ERROR
+    finally:
+        sys.stdin = old_stdin
+        os.chdir(old_cwd)
+    return ExitCode.SUCCESS
+
+
+def warm_up() -> None:
+    """Import the application services so requests start warm."""
+    import steward.application.init_service  # noqa: F401
+    import steward.application.intake_service  # noqa: F401
+    import steward.application.list_service  # noqa: F401
+    import steward.application.stage_service  # noqa: F401
+    import steward.application.sync_service  # noqa: F401
+    from steward.infrastructure.item_index import enable_shared_indexes
+
+    enable_shared_indexes()
@@ -0,0 +1,21 @@
+Feature: Concurrent Steward Processes
+  Several steward processes can work on one workshop at the same time.
+
+  Scenario: Parallel intakes, transitions and listings keep the workshop consistent
+    Given an initialized workshop
+    And an item "contested" in the intake stage
+    When 6 processes each run 4 rounds of intake, stage and list
+    Then every process finished without errors
+    And every intake of the same name got a distinct item ID
+    And exactly 1 process moved "contested" to backlog
+    And every item is linked once, in the folder of its stage
+    And the item index matches the status files
+    And the journal is empty
+
+  Scenario: A writer gives up when the workshop lock is held too long
+    Given an initialized workshop
+    And an item "contested" in the intake stage
+    And another process holds the workshop lock
+    When I run "steward stage contested backlog" with STEWARD_LOCK_TIMEOUT "0.2"
+    Then the exit code should be 75
+    And stderr contains "another steward command is still running"
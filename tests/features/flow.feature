@@ -0,0 +1,41 @@
+Feature: Flow analytics
+  Report lead time, time in stage, throughput and WIP aging from item timestamps.
+
+  Scenario: Lead time and throughput come from finished items
+    Given an initialized workshop
+    And an item "shipped" in archive created 10 days ago and updated 4 days ago
+    And an item "handed" in handoff created 20 days ago and updated 2 days ago
+    And an item "dropped" in trash created 30 days ago and updated 1 days ago
+    When I run "steward metrics flow --json"
+    Then the exit code should be 0
+    And the report covers 3 items
+    And the lead time of 2 finished items has p50 6 days and max 18 days
+    And 2 items were finished in the last period
+    And 3 items were created in the last 5 periods
+
+  Scenario: Items in progress are aged and timed in their stage
+    Given an initialized workshop
+    And an item "fresh" in backlog created 0 days ago and updated 0 days ago
+    And an item "stale" in backlog created 40 days ago and updated 12 days ago
+    And an item "old" in forge created 400 days ago and updated 3 days ago
+    When I run "steward metrics flow --json"
+    Then the exit code should be 0
+    And the "backlog" WIP age counts are 1 under "<1d" and 1 under "30-90d"
+    And the "forge" WIP age counts are 1 under ">=365d"
+    And the "backlog" time in stage has 2 items with max 12 days
+    And the cumulative flow of "backlog" goes from 1 to 2 over the last 2 periods
+
+  Scenario: Table output
+    Given an initialized workshop
+    And an item "shipped" in archive created 10 days ago and updated 4 days ago
+    When I run "steward metrics flow --periods 4"
+    Then the exit code should be 0
+    And the output contains "Lead time, days"
+    And the output contains "WIP age"
+    And the output contains "Flow per 7 days"
+
+  Scenario: Empty workshop
+    Given an initialized workshop
+    When I run "steward metrics flow"
+    Then the exit code should be 0
+    And the output contains "No items found"
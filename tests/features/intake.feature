@@ -40,8 +40,323 @@ Feature: Steward Intake
     Then the exit code should be 0
     And an item directory exists in _workshop/9-items/ with slug "my-idea-2"
 
+  Scenario: A slug that ends in a number does not advance the collision counter
+    Given an initialized workshop
+    And an existing item with slug "report"
+    And an existing item with slug "report-2024"
+    And a file "report.md" exists in _workshop/1-inbox/
+    When I run "steward intake report.md"
+    Then the exit code should be 0
+    And an item directory exists in _workshop/9-items/ with exactly the slug "report-2"
+
   Scenario: Intake non-existent file
     Given an initialized workshop
     When I run "steward intake missing.md"
     Then the exit code should be 66
     And stderr contains "not found"
+
+  Scenario: Intake everything in the inbox
+    Given an initialized workshop
+    And a file "idea-a.md" exists in _workshop/1-inbox/
+    And a file "idea-b.md" exists in _workshop/1-inbox/
+    And a folder "project-c/" exists in _workshop/1-inbox/
+    When I run "steward intake --all --move"
+    Then the exit code should be 0
+    And the output contains "3 items, 36 bytes"
+    And an item directory exists in _workshop/9-items/ with slug "idea-a"
+    And an item directory exists in _workshop/9-items/ with slug "idea-b"
+    And an item directory exists in _workshop/9-items/ with slug "project-c"
+    And a symlink exists in _workshop/3-intake/ pointing to the item
+    And _workshop/1-inbox/ is empty
+
+  Scenario: Sweeping the inbox ignores same-named files in the working directory
+    Given an initialized workshop
+    And a file "idea-a.md" exists in _workshop/1-inbox/
+    And the working directory holds a different file "idea-a.md"
+    When I run "steward intake --all --move"
+    Then the exit code should be 0
+    And _workshop/1-inbox/ is empty
+    And the working directory file "idea-a.md" is untouched
+
+  Scenario: Intake sources matching a glob pattern
+    Given an initialized workshop
+    And a file "notes-1.md" exists in _workshop/1-inbox/
+    And a file "notes-2.md" exists in _workshop/1-inbox/
+    And a file "other.txt" exists in _workshop/1-inbox/
+    When I run "steward intake 'notes-*.md' --jobs 2"
+    Then the exit code should be 0
+    And the output contains "2 items"
+    And an item directory exists in _workshop/9-items/ with slug "notes-1"
+    And an item directory exists in _workshop/9-items/ with slug "notes-2"
+    And the output does not contain "other"
+
+  Scenario: Sources with the same slug get distinct IDs in one run
+    Given an initialized workshop
+    And a file "My Idea.md" exists in _workshop/1-inbox/
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    When I run "steward intake --all"
+    Then the exit code should be 0
+    And an item directory exists in _workshop/9-items/ with slug "my-idea-2"
+
+  Scenario: Intake of several sources reports the missing ones
+    Given an initialized workshop
+    And a file "idea-a.md" exists in _workshop/1-inbox/
+    When I run "steward intake idea-a.md missing.md"
+    Then the exit code should be 66
+    And stderr contains "missing.md"
+    And an item directory exists in _workshop/9-items/ with slug "idea-a"
+
+  Scenario: Custom slug requires a single source
+    Given an initialized workshop
+    And a file "idea-a.md" exists in _workshop/1-inbox/
+    And a file "idea-b.md" exists in _workshop/1-inbox/
+    When I run "steward intake idea-a.md idea-b.md --slug shared"
+    Then the exit code should be 2
+
+  Scenario: Intake reports the copy strategy and throughput
+    Given an initialized workshop
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    When I run "steward intake my-idea.md --link-mode copy"
+    Then the exit code should be 0
+    And the output contains "12 bytes in 1 file via"
+    And the output contains "MB/s"
+    And the item file "my-idea.md" has the inbox content
+
+  Scenario Outline: A kernel copy that copies nothing falls back to the next strategy
+    Given an initialized workshop
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    And <calls> copy no bytes, as on procfs
+    When I run "steward intake my-idea.md --link-mode copy"
+    Then the exit code should be 0
+    And the output contains "12 bytes in 1 file via <strategy>"
+    And the item file "my-idea.md" has the inbox content
+
+    Examples:
+      | calls                    | strategy  |
+      | copy_file_range          | sendfile  |
+      | copy_file_range,sendfile | userspace |
+
+  Scenario: Intake with hardlinks shares the source inode
+    Given an initialized workshop
+    And a folder "my-project/" exists in _workshop/1-inbox/
+    When I run "steward intake my-project/ --link-mode hardlink"
+    Then the exit code should be 0
+    And the output contains "via hardlink"
+    And an item directory exists in _workshop/9-items/ with slug "my-project"
+    And the item file "README.md" shares its inode with the inbox copy in "my-project"
+
+  Scenario: Reflink intake falls back to a copy where cloning is unsupported
+    Given an initialized workshop
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    When I run "steward intake my-idea.md --link-mode reflink"
+    Then the exit code should be 0
+    And an item directory exists in _workshop/9-items/ with slug "my-idea"
+    And the item file "my-idea.md" has the inbox content
+
+  Scenario: Moving a folder within one filesystem does not walk it
+    Given an initialized workshop
+    And a folder "my-project/" with nested files exists in _workshop/1-inbox/
+    And walking a source to size it fails
+    When I run "steward intake my-project/ --move"
+    Then the exit code should be 0
+    And the output contains "via rename"
+    And the item holds the nested files of "my-project"
+
+  Scenario: Move across filesystems falls back to a verified copy
+    Given an initialized workshop
+    And a folder "my-project/" with nested files exists in _workshop/1-inbox/
+    And renames fail because the inbox is on another filesystem
+    When I run "steward intake my-project/ --move"
+    Then the exit code should be 0
+    And the output contains "via verified-copy"
+    And an item directory exists in _workshop/9-items/ with slug "my-project"
+    And the item holds the nested files of "my-project"
+    And _workshop/1-inbox/ is empty
+
+  Scenario: An interrupted cross-filesystem move resumes into the same item
+    Given an initialized workshop
+    And a folder "my-project/" with nested files exists in _workshop/1-inbox/
+    And renames fail because the inbox is on another filesystem
+    And the move is interrupted after 1 file
+    When I run "steward intake my-project/ --move"
+    Then the exit code should be 78
+    And stderr contains "run the intake again to resume"
+    When the interruption is cleared
+    And I run "steward intake my-project/ --move"
+    Then the exit code should be 0
+    And the output contains "Resumed an interrupted move"
+    And there is exactly 1 item in _workshop/9-items/
+    And the item holds the nested files of "my-project"
+    And _workshop/1-inbox/ is empty
+
+  Scenario: An interrupted copy of a large file resumes from its checkpoint
+    Given an initialized workshop
+    And a file "big.bin" of 1000000 bytes exists in _workshop/1-inbox/
+    And renames fail because the inbox is on another filesystem
+    And the move is interrupted after its first checkpoint
+    When I run "steward intake big.bin --move"
+    Then the exit code should be 78
+    When the interruption is cleared
+    And I run "steward intake big.bin --move"
+    Then the exit code should be 0
+    And the copy resumed from the checkpoint
+    And the item file "big.bin" has the original content
+    And _workshop/1-inbox/ is empty
+
+  Scenario: Concurrent intakes of the same name get distinct IDs
+    Given an initialized workshop
+    When 8 processes each reserve 25 IDs for slug "same-name" in the same minute
+    Then there are 200 distinct item directories for slug "same-name"
+
+  Scenario: Reserving an ID without a collision does not list the items directory
+    Given an initialized workshop
+    And an existing item with slug "other-idea"
+    When an ID is reserved for slug "new-idea"
+    Then an item directory exists in _workshop/9-items/ with exactly the slug "new-idea"
+    And _workshop/9-items/ was not listed
+
+  Scenario: An intake interrupted before linking is finished by the next command
+    Given an initialized workshop
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    And a file "other.md" exists in _workshop/1-inbox/
+    And linking the intake folder fails
+    When I run "steward intake my-idea.md"
+    Then the exit code should be 1
+    When linking the intake folder works again
+    And I run "steward intake other.md"
+    Then the exit code should be 0
+    And a symlink for "my-idea" exists in _workshop/3-intake/
+    And the journal is empty
+
+  Scenario: The directory of an intake that died while copying is removed by the next command
+    Given an initialized workshop
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    And a file "other.md" exists in _workshop/1-inbox/
+    And the intake dies while copying
+    When I run "steward intake my-idea.md"
+    Then the exit code should be 1
+    When the interruption is cleared
+    And I run "steward intake other.md"
+    Then the exit code should be 0
+    And there is exactly 1 item in _workshop/9-items/
+    And the journal is empty
+
+  Scenario: Recovery leaves the directories of a running intake alone
+    Given an initialized workshop
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    And another command recovers the workshop while the intake copies
+    When I run "steward intake my-idea.md"
+    Then the exit code should be 0
+    And the item file "my-idea.md" has the inbox content
+    And the journal is empty
+
+  Scenario: Intaking content that is already an item warns by default
+    Given an initialized workshop
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    And "my-idea.md" has already been intaken
+    When I run "steward intake my-idea.md"
+    Then the exit code should be 0
+    And stderr contains "same content as existing item"
+    And there are exactly 2 items in _workshop/9-items/
+    And the digest of the inbox file "my-idea.md" is cached
+
+  Scenario: Re-intaking a folder with --on-duplicate skip leaves it alone
+    Given an initialized workshop
+    And a folder "my-project/" with nested files exists in _workshop/1-inbox/
+    And "my-project/" has already been intaken
+    When I run "steward intake my-project/ --on-duplicate skip"
+    Then the exit code should be 0
+    And the output contains "Skipped"
+    And there is exactly 1 item in _workshop/9-items/
+
+  Scenario: A renamed copy of an intaken file is linked to the existing item
+    Given an initialized workshop
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    And "my-idea.md" has already been intaken
+    And a copy of "my-idea.md" named "my-idea (1).md" exists in _workshop/1-inbox/
+    When I run "steward intake --all --move --on-duplicate link"
+    Then the exit code should be 0
+    And the output contains "2 duplicates linked"
+    And there is exactly 1 item in _workshop/9-items/
+    And _workshop/1-inbox/ is empty
+
+  Scenario: A copied duplicate is replaced with a symlink to the existing item
+    Given an initialized workshop
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    And "my-idea.md" has already been intaken
+    And a copy of "my-idea.md" named "my-idea (1).md" exists in _workshop/1-inbox/
+    When I run "steward intake 'my-idea (1).md' --on-duplicate link"
+    Then the exit code should be 0
+    And the output contains "source replaced by a symlink"
+    And the inbox entry "my-idea (1).md" links to the item file "my-idea.md"
+    And there is exactly 1 item in _workshop/9-items/
+
+  Scenario: A copied duplicate outside the inbox is left in place
+    Given an initialized workshop
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    And "my-idea.md" has already been intaken
+    And the working directory holds a copy of "my-idea.md" named "notes.md"
+    When I run "steward intake notes.md --on-duplicate link"
+    Then the exit code should be 0
+    And the output contains "source left in place"
+    And the working directory file "notes.md" is still a regular file
+    And there is exactly 1 item in _workshop/9-items/
+
+  Scenario: Sources with the same content in one run are intaken once
+    Given an initialized workshop
+    And a file "idea-a.md" exists in _workshop/1-inbox/
+    And a file "idea-b.md" exists in _workshop/1-inbox/
+    When I run "steward intake --all --on-duplicate skip"
+    Then the exit code should be 0
+    And the output contains "1 items, 12 bytes, 1 duplicates skipped"
+    And there is exactly 1 item in _workshop/9-items/
+
+  Scenario: Items created outside steward are checked for duplicates too
+    Given an initialized workshop
+    And a file "other.bin" of 100 bytes exists in _workshop/1-inbox/
+    And "other.bin" has already been intaken
+    And an existing item with slug "old-idea" holding a file "notes.md" with "Test content"
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    When I run "steward intake my-idea.md --on-duplicate skip"
+    Then the exit code should be 0
+    And the output contains "__old-idea"
+    And there are exactly 2 items in _workshop/9-items/
+
+  Scenario: A source changed since it was hashed is not a duplicate
+    Given an initialized workshop
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    And "my-idea.md" has already been intaken
+    And the inbox file "my-idea.md" is changed
+    When I run "steward intake my-idea.md --on-duplicate skip"
+    Then the exit code should be 0
+    And there are exactly 2 items in _workshop/9-items/
+
+  Scenario: An item edited since intake no longer matches its old content
+    Given an initialized workshop
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    And "my-idea.md" has already been intaken
+    And the intaken copy of "my-idea.md" is changed
+    When I run "steward intake my-idea.md --on-duplicate skip"
+    Then the exit code should be 0
+    And there are exactly 2 items in _workshop/9-items/
+
+  Scenario: A source matching the new content of an edited item is a duplicate
+    Given an initialized workshop
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    And "my-idea.md" has already been intaken
+    And the intaken copy of "my-idea.md" now says "Best content"
+    And the inbox file "my-idea.md" now says "Best content"
+    When I run "steward intake my-idea.md --on-duplicate skip"
+    Then the exit code should be 0
+    And the output contains "Skipped"
+    And there is exactly 1 item in _workshop/9-items/
+
+  Scenario: Checking a source for duplicates only reads items of its size
+    Given an initialized workshop
+    And a file "other.bin" of 100 bytes exists in _workshop/1-inbox/
+    And "other.bin" has already been intaken
+    And a file "my-idea.md" exists in _workshop/1-inbox/
+    And the trees listed by the hash index are recorded
+    When I run "steward intake my-idea.md"
+    Then the exit code should be 0
+    And the hash index did not list the item of "other.bin"
@@ -7,8 +7,8 @@ Feature: Steward List
     And an item "feature-b" exists with stage "backlog"
     When I run "steward list"
     Then the exit code should be 0
-    And the output contains "feature-a"
-    And the output contains "feature-b"
+    And the output contains "feature-a [forge]"
+    And the output contains "feature-b [backlog]"
 
   Scenario: List items filtered by stage
     Given an initialized workshop
@@ -24,3 +24,91 @@ Feature: Steward List
     When I run "steward list"
     Then the exit code should be 0
     And the output contains "No items found"
+
+  Scenario: List picks up status.yaml edits made after indexing
+    Given an initialized workshop
+    And an item "feature-a" exists with stage "forge"
+    When I run "steward list --stage forge"
+    Then the output contains "feature-a"
+    When the status.yaml of "feature-a" is edited to stage "shelf"
+    And I run "steward list --stage forge"
+    Then the exit code should be 0
+    And the output does not contain "feature-a"
+    When I run "steward list --stage shelf"
+    Then the output contains "feature-a"
+
+  Scenario: List drops items removed after indexing
+    Given an initialized workshop
+    And an item "feature-a" exists with stage "forge"
+    And an item "feature-b" exists with stage "forge"
+    When I run "steward list"
+    Then the output contains "feature-b"
+    When the item "feature-b" is deleted
+    And I run "steward list"
+    Then the output contains "feature-a"
+    And the output does not contain "feature-b"
+
+  Scenario: List reads hand-edited status.yaml files
+    Given an initialized workshop
+    And an item "feature-a" exists with a hand-edited status.yaml at stage "review"
+    When I run "steward list --stage review"
+    Then the exit code should be 0
+    And the output contains "feature-a [review]"
+
+  Scenario: List reads status files across several workers in a stable order
+    Given an initialized workshop
+    And 1200 items exist with stage "forge"
+    When I run "steward list --jobs 4"
+    Then the exit code should be 0
+    And the output contains "Items (1200):"
+    And the listed items are in item ID order
+
+  Scenario: List rejects an invalid STEWARD_JOBS value
+    Given an initialized workshop
+    And the environment variable "STEWARD_JOBS" is "lots"
+    When I run "steward list"
+    Then the exit code should be 78
+    And stderr contains "STEWARD_JOBS must be a positive integer"
+
+  Scenario: List streams tab-separated records
+    Given an initialized workshop
+    And an item "feature-a" exists with stage "forge"
+    And an item "feature-b" exists with stage "backlog"
+    When I run "steward list --format tsv"
+    Then the exit code should be 0
+    And every output line has 5 tab-separated fields
+    And the output does not contain "Items"
+
+  Scenario: List streams JSON lines
+    Given an initialized workshop
+    And an item "feature-a" exists with stage "forge"
+    When I run "steward list --format jsonl"
+    Then the exit code should be 0
+    And the output is JSON lines with slug "feature-a" and stage "forge"
+
+  Scenario: List stops after the limit
+    Given an initialized workshop
+    And 1200 items exist with stage "forge"
+    When I run "steward list --format plain --limit 3"
+    Then the exit code should be 0
+    And the output has 3 lines
+    And the output contains "bulk-00000 [forge]"
+    When I run "steward list"
+    Then the output contains "Items (1200):"
+
+  Scenario: A slow reader of the listing does not block writers
+    Given an initialized workshop
+    And an item "feature-a" exists with stage "forge"
+    And an item "feature-b" exists with stage "backlog"
+    When a reader takes the first listed record and pauses
+    Then a writer can take the workshop lock while the reader pauses
+    And the rest of the listing is "feature-b"
+
+  Scenario: A paused listing has not read the rest of the workshop
+    Given an initialized workshop
+    And 1200 items exist with stage "forge"
+    And status files are read by a single worker
+    When a reader takes the first listed record and pauses
+    And the bulk item "bulk-01199" is deleted
+    Then a writer can take the workshop lock while the reader pauses
+    And the rest of the listing has 1198 records
@@ -0,0 +1,33 @@
+Feature: Command metrics
+  Record per-command timings and aggregate them into latency reports.
+
+  Scenario: Commands append a metrics record when STEWARD_METRICS is set
+    Given an initialized workshop
+    And an item "idea" in the intake stage
+    When I run "steward list" with metrics enabled
+    And I run "steward stage missing backlog" with metrics enabled
+    Then the metrics file has 2 records
+    And metrics record 1 is for "list" with exit code 0
+    And metrics record 1 counted 1 item scanned in a workshop of 1 item
+    And metrics record 1 has timings for the scan phase
+    And metrics record 1 counted scandir syscalls
+    And metrics record 2 is for "stage" with exit code 66
+
+  Scenario: No metrics without STEWARD_METRICS
+    Given an initialized workshop
+    When I run "steward list"
+    Then no metrics file was written
+
+  Scenario: The report gives percentiles per command and workshop size
+    Given a metrics file with 100 "list" runs taking 1 to 100 ms on 500 items
+    And the metrics file has 10 "list" runs taking 1000 ms on 20000 items
+    When I run "steward metrics report" on the metrics file as JSON
+    Then the exit code should be 0
+    And the "list" summary for "all" sizes has 110 runs
+    And the "list" summary for "<1k" sizes has p50 50 ms and p99 99 ms
+    And the "list" summary for "10k-100k" sizes has p50 1000 ms and p99 1000 ms
+
+  Scenario: The report needs a metrics file
+    Given an initialized workshop
+    When I run "steward metrics report"
+    Then the exit code should be 2
@@ -0,0 +1,74 @@
+Feature: Full-text search
+  Find items by the words in their notes, best matches first.
+
+  Scenario: Items containing every query word are ranked by relevance
+    Given an initialized workshop
+    And an item "gateway" whose note says "Rate limit the API gateway. Rate limit per token, rate limit per user."
+    And an item "billing" whose note says "Billing API has no rate limit yet."
+    And an item "docs" whose note says "Document the rate of releases."
+    When I run "steward search rate limit --json"
+    Then the exit code should be 0
+    And the hits are "gateway, billing"
+
+  Scenario: Matching ignores case and punctuation
+    Given an initialized workshop
+    And an item "oauth" whose note says "Switch to OAuth2 (see RFC-6749)."
+    When I run "steward search oauth2 rfc --json"
+    Then the hits are "oauth"
+
+  Scenario: Drafts and other text files are searched too
+    Given an initialized workshop
+    And an item "cache" whose note says "Cache design."
+    And item "cache" has a file "research/notes.txt" saying "Eviction uses LRU."
+    When I run "steward search lru --json"
+    Then the hits are "cache"
+    And hit 1 matched the file "research/notes.txt"
+
+  Scenario: Edited, added and removed files are picked up incrementally
+    Given an initialized workshop
+    And an item "queue" whose note says "Retry with backoff."
+    And an item "shard" whose note says "Split by tenant."
+    When I run "steward search backoff --json"
+    Then the hits are "queue"
+    When the note of "queue" now says "Retry immediately."
+    And the note of "shard" now says "Split by tenant, with backoff on rebalance."
+    And I run "steward search backoff --json"
+    Then the hits are "shard"
+    And the search index re-read 2 files on the last search
+
+  Scenario: Concurrent searches applying the same change do not collide
+    Given an initialized workshop
+    And an item "queue" whose note says "Retry with backoff."
+    And an item "shard" whose note says "Split by tenant."
+    When I run "steward search backoff --json"
+    And the note of "queue" now says "Retry immediately."
+    And another search refreshes the index while the next one reads the changed files
+    And I run "steward search immediately --json"
+    Then the hits are "queue"
+    And the search index holds 1 file for "queue"
+
+  Scenario: Results can be limited to a stage or an item
+    Given an initialized workshop
+    And an item "alpha" whose note says "Timeout handling."
+    And an item "beta" whose note says "Timeout handling."
+    And item "beta" is in the forge stage
+    When I run "steward search timeout --stage forge --json"
+    Then the hits are "beta"
+    When I run "steward search timeout --item alpha --json"
+    Then the hits are "alpha"
+
+  Scenario: Table output and no matches
+    Given an initialized workshop
+    And an item "alpha" whose note says "Timeout handling."
+    When I run "steward search timeout"
+    Then the exit code should be 0
+    And the output contains "alpha"
+    And the output contains "alpha.md"
+    When I run "steward search nonexistent"
+    Then the exit code should be 0
+    And the output contains "No matches"
+
+  Scenario: Invalid stage filter
+    Given an initialized workshop
+    When I run "steward search timeout --stage nope"
+    Then the exit code should be 2
@@ -0,0 +1,77 @@
+Feature: Steward Serve
+  Run commands through a long-lived server with a thin client.
+
+  Scenario: Client runs commands locally when no server is running
+    Given an initialized workshop
+    And an item "feature-a" exists with stage "forge"
+    When I run "steward-client list" as a subprocess
+    Then the exit code should be 0
+    And the output contains "feature-a [forge]"
+
+  Scenario: Client forwards commands to a running server
+    Given an initialized workshop
+    And an item "feature-a" exists with stage "forge"
+    And steward serve is running
+    When I run "steward-client stage feature-a review" as a subprocess
+    Then the exit code should be 0
+    And the output contains "Stage transition complete"
+    And the server handled the command
+    When I run "steward-client list --stage review" as a subprocess
+    Then the exit code should be 0
+    And the output contains "feature-a [review]"
+
+  Scenario: Client forwards stdin for batch transitions
+    Given an initialized workshop
+    And an item "feature-a" exists with stage "forge"
+    And an item "feature-b" exists with stage "forge"
+    And steward serve is running
+    When I run "steward-client stage --batch" as a subprocess with input "feature-a review\nfeature-b shelf\n"
+    Then the exit code should be 0
+    And the output contains "Transitioned: 2"
+    And the server handled the command
+
+  Scenario: Client passes stdin to a local run when no server is running
+    Given an initialized workshop
+    And an item "feature-a" exists with stage "forge"
+    When I run "steward-client stage --batch" as a subprocess with input "feature-a review\n"
+    Then the exit code should be 0
+    And the output contains "Transitioned: 1"
+
+  Scenario: Forwarded command errors keep their exit code
+    Given an initialized workshop
+    And steward serve is running
+    When I run "steward-client stage nonexistent backlog" as a subprocess
+    Then the exit code should be 66
+    And stderr contains "No item found"
+
+  Scenario: Forwarded commands see the client's STEWARD_ settings
+    Given an initialized workshop
+    And an item "feature-a" exists with stage "forge"
+    And steward serve is running
+    When I run "steward-client list" as a subprocess with STEWARD_JOBS set to "lots"
+    Then the exit code should be 78
+    And stderr contains "STEWARD_JOBS must be a positive integer"
+    And the server handled the command
+    When I run "steward-client list" as a subprocess
+    Then the exit code should be 0
+    And the output contains "feature-a [forge]"
+
+  Scenario: Client runs watch locally even when a server is running
+    Given an initialized workshop
+    And steward serve is running
+    When I run "steward-client watch --help" as a subprocess
+    Then the exit code should be 0
+    And the output contains "inotify"
+    And the client ran the command itself
+
+  Scenario: The server refuses to run long-running commands
+    Given an initialized workshop
+    When a client asks the server to run "watch --no-intake"
+    Then the exit code should be 2
+    And stderr contains "watch cannot be forwarded to a running server"
+
+  Scenario: Server removes its socket on shutdown
+    Given an initialized workshop
+    And steward serve is running
+    When the server is stopped
+    Then the server socket does not exist
@@ -79,3 +79,171 @@ Feature: Steward Stage
     When I run "steward stage my-feature forge"
     Then the exit code should be 0
     And the item has stage "forge"
+
+  Scenario: Stage finds an item created after the previous lookup
+    Given an initialized workshop
+    And an item "feature-a" exists with stage "intake"
+    When I run "steward stage feature-a backlog"
+    Then the exit code should be 0
+    Given an item "feature-b" exists with stage "intake"
+    When I run "steward stage feature-b forge"
+    Then the exit code should be 0
+    And the item has stage "forge"
+
+  Scenario: Ambiguous slug lists every matching item
+    Given an initialized workshop
+    And an item "report-q1" exists with stage "intake"
+    And an item "report-q2" exists with stage "intake"
+    And an item "roadmap" exists with stage "intake"
+    When I run "steward stage report backlog"
+    Then the exit code should be 66
+    And stderr contains "report-q1"
+    And stderr contains "report-q2"
+    And stderr does not contain "roadmap"
+
+  Scenario: A directory reserved by a running intake does not make a slug ambiguous
+    Given an initialized workshop
+    And an item "report" exists with stage "intake"
+    And an intake has reserved a directory for "report-2"
+    When I run "steward stage report backlog"
+    Then the exit code should be 0
+    And the item "report" has stage "backlog"
+
+  Scenario: Batch transitions from arguments
+    Given an initialized workshop
+    And an item "report-a" exists with stage "review"
+    And an item "report-b" exists with stage "review"
+    When I run "steward stage --batch report-a archive report-b archive"
+    Then the exit code should be 0
+    And the output contains "Transitioned: 2, failed: 0"
+    And the item "report-a" has stage "archive"
+    And the item "report-b" has stage "archive"
+    And a symlink for "report-b" exists in _workshop/7-exits/3-archive/
+    And no symlink for "report-b" exists in _workshop/5-active/5-review/
+
+  Scenario: Batch transitions from stdin
+    Given an initialized workshop
+    And an item "report-a" exists with stage "intake"
+    And an item "report-b" exists with stage "forge"
+    When I run "steward stage --batch" with input "# sweep\nreport-a backlog\n\nreport-b review\n"
+    Then the exit code should be 0
+    And the item "report-a" has stage "backlog"
+    And the item "report-b" has stage "review"
+
+  Scenario: Batch applies valid transitions and reports rejected ones
+    Given an initialized workshop
+    And an item "report-a" exists with stage "intake"
+    And an item "report-b" exists with stage "forge"
+    When I run "steward stage --batch report-a review report-b review"
+    Then the exit code should be 65
+    And stderr contains "Cannot transition from intake to review"
+    And the item "report-a" has stage "intake"
+    And the item "report-b" has stage "review"
+
+  Scenario: Batch reports an item without a status file and applies the rest
+    Given an initialized workshop
+    And an item "report-a" exists with stage "intake"
+    And an item "report-b" exists with stage "forge"
+    And the status.yaml of "report-a" is deleted
+    When I run "steward stage --batch report-a backlog report-b review"
+    Then the exit code should be 66
+    And stderr contains "No item found matching: report-a"
+    And the output contains "Transitioned: 1, failed: 1"
+    And the item "report-b" has stage "review"
+
+  Scenario: Batch reports an item with a malformed status file and applies the rest
+    Given an initialized workshop
+    And an item "report-a" exists with stage "intake"
+    And an item "report-b" exists with stage "forge"
+    And the status.yaml of "report-a" holds "stage: [intake"
+    When I run "steward stage --batch report-a backlog report-b review"
+    Then the exit code should be 78
+    And stderr contains "not valid YAML"
+    And the item "report-b" has stage "review"
+
+  Scenario: All-or-nothing batch applies nothing when one transition is rejected
+    Given an initialized workshop
+    And an item "report-a" exists with stage "intake"
+    And an item "report-b" exists with stage "forge"
+    When I run "steward stage --batch --all-or-nothing report-a review report-b review"
+    Then the exit code should be 65
+    And the output contains "skipped"
+    And the item "report-a" has stage "intake"
+    And the item "report-b" has stage "forge"
+    And a symlink for "report-b" exists in _workshop/5-active/3-forge/
+
+  Scenario: Stage without a target stage is rejected
+    Given an initialized workshop
+    And an item "report-a" exists with stage "intake"
+    When I run "steward stage report-a"
+    Then the exit code should be 2
+
+  Scenario Outline: Batch transitions replace status files atomically in every durability mode
+    Given an initialized workshop
+    And an item "report-a" exists with stage "intake"
+    And an item "report-b" exists with stage "intake"
+    And STEWARD_DURABILITY is set to "<mode>"
+    When I run "steward stage --batch report-a backlog report-b backlog"
+    Then the exit code should be 0
+    And the item "report-a" has stage "backlog"
+    And the item "report-b" has stage "backlog"
+    And no temporary status files are left behind
+
+    Examples:
+      | mode  |
+      | none  |
+      | file  |
+      | group |
+
+  Scenario: Group durability fsyncs each status file and item directory once
+    Given an initialized workshop
+    And an item "report-a" exists with stage "intake"
+    And an item "report-b" exists with stage "intake"
+    And STEWARD_DURABILITY is set to "group"
+    And status fsyncs are recorded
+    When I run "steward stage --batch report-a backlog report-b backlog"
+    Then the exit code should be 0
+    And 2 status files and 2 item directories were fsynced once each
+
+  Scenario: A failed status write leaves every item at its old stage
+    Given an initialized workshop
+    And an item "report-a" exists with stage "intake"
+    And an item "report-b" exists with stage "intake"
+    And writing the second status file fails
+    When I run "steward stage --batch report-a backlog report-b backlog"
+    Then the exit code should be 1
+    And the item "report-a" has stage "intake"
+    And the item "report-b" has stage "intake"
+    And no temporary status files are left behind
+
+  Scenario: Unknown durability mode is rejected
+    Given an initialized workshop
+    And an item "report-a" exists with stage "intake"
+    And STEWARD_DURABILITY is set to "sometimes"
+    When I run "steward stage report-a backlog"
+    Then the exit code should be 78
+    And stderr contains "STEWARD_DURABILITY must be one of none, file, group"
+    And the item "report-a" has stage "intake"
+
+  Scenario: A transition interrupted after its status writes is finished by the next command
+    Given an initialized workshop
+    And an item "report-a" exists with stage "intake"
+    And an item "report-b" exists with stage "intake"
+    And linking stage folders fails
+    When I run "steward stage report-a backlog"
+    Then the exit code should be 1
+    And the journal has 1 interrupted operation
+    When linking stage folders works again
+    And I run "steward stage report-b backlog"
+    Then the exit code should be 0
+    And the item "report-a" has stage "backlog"
+    And a symlink for "report-a" exists in _workshop/5-active/1-backlog/
+    And no symlink for "report-a" exists in _workshop/3-intake/
+    And the journal is empty
+
+  Scenario: Completed transitions leave the journal empty
+    Given an initialized workshop
+    And an item "report-a" exists with stage "intake"
+    When I run "steward stage report-a backlog"
+    Then the exit code should be 0
+    And the journal is empty
@@ -0,0 +1,26 @@
+Feature: Startup cost
+  Cheap invocations do not import the application's heavy dependencies.
+
+  Scenario: steward --version skips pydantic, PyYAML and SQLite
+    Given PRAXIS_HOME is set to a valid directory
+    When I run "steward --version" with import timing
+    Then the exit code should be 0
+    And the output contains "steward"
+    And the module "pydantic" was not imported
+    And the module "yaml" was not imported
+    And the module "sqlite3" was not imported
+
+  Scenario: steward init skips pydantic, PyYAML and SQLite
+    Given PRAXIS_HOME is set to a valid directory
+    When I run "steward init" with import timing
+    Then the exit code should be 0
+    And the module "pydantic" was not imported
+    And the module "yaml" was not imported
+
+  Scenario: steward list skips pydantic and PyYAML
+    Given PRAXIS_HOME is set to a valid directory
+    And the workshop is initialized
+    When I run "steward list" with import timing
+    Then the exit code should be 0
+    And the module "pydantic" was not imported
+    And the module "yaml" was not imported
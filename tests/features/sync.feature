@@ -20,3 +20,51 @@ Feature: Steward Sync
     Then the exit code should be 0
     And no symlink exists in _workshop/3-intake/ for "my-feature"
     And a symlink exists in _workshop/5-active/3-forge/ for "my-feature"
+
+  Scenario: Sync leaves correct symlinks untouched
+    Given an initialized workshop
+    And an item "feature-a" exists with stage "forge"
+    And an item "feature-b" exists with stage "backlog"
+    When I run "steward sync"
+    Then the exit code should be 0
+    And the output contains "Symlinks created: 0"
+    And the output contains "Unchanged: 2"
+
+  Scenario: Sync retargets a symlink pointing at the wrong item
+    Given an initialized workshop
+    And an item "my-feature" exists with stage "forge"
+    And an orphaned symlink exists in _workshop/5-active/3-forge/ for "my-feature"
+    When I run "steward sync"
+    Then the exit code should be 0
+    And the output contains "Symlinks retargeted: 1"
+    And a symlink exists in _workshop/5-active/3-forge/ for "my-feature"
+    And the symlink in _workshop/5-active/3-forge/ for "my-feature" resolves to the item
+
+  Scenario: Check passes on a consistent workshop
+    Given an initialized workshop
+    And an item "feature-a" exists with stage "forge"
+    And an item "feature-b" exists with stage "backlog"
+    When I run "steward sync --check"
+    Then the exit code should be 0
+    And the output contains "In sync"
+
+  Scenario: Check reports every kind of drift without fixing it
+    Given an initialized workshop
+    And an item "feature-a" exists with stage "forge"
+    And an item "feature-b" exists with stage "backlog"
+    And an item "feature-c" exists with stage "review"
+    And an item "feature-d" exists with stage "forge"
+    And the symlink for "feature-a" is moved to _workshop/3-intake/
+    And the symlink for "feature-b" is removed
+    And an orphaned symlink exists in _workshop/5-active/5-review/ for "feature-c"
+    And an orphaned symlink exists in _workshop/5-active/1-backlog/ for "stray"
+    When I run "steward sync --check"
+    Then the exit code should be 1
+    And the output contains "wrong-stage   3-intake/feature-a"
+    And the output contains "missing       5-active/1-backlog/feature-b"
+    And the output contains "mis-targeted  5-active/5-review/feature-c"
+    And the output contains "orphaned      5-active/1-backlog/stray"
+    And the output does not mention "feature-d"
+    And a symlink exists in _workshop/3-intake/ for "feature-a"
+    And no symlink exists in _workshop/5-active/3-forge/ for "feature-a"
+    And a symlink exists in _workshop/5-active/1-backlog/ for "stray"
@@ -0,0 +1,41 @@
+Feature: Profiling and tracing
+  Find out where a slow command spends its time.
+
+  Scenario Outline: STEWARD_TRACE prints a per-phase breakdown
+    Given an initialized workshop
+    And an item "idea" in the intake stage
+    And a file "note.md" in the inbox
+    When I run "<command>" with STEWARD_TRACE "1"
+    Then the exit code should be 0
+    And stderr contains "steward trace: <name>"
+    And the trace lists the phases import, env, scan, parse, validate, write, link
+    And the trace counted time in the <phase> phase
+    And the trace counted syscalls
+
+    Examples:
+      | command                    | name   | phase |
+      | steward intake note.md     | intake | write |
+      | steward stage idea backlog | stage  | link  |
+      | steward sync               | sync   | scan  |
+      | steward list               | list   | scan  |
+
+  Scenario: STEWARD_TRACE covers init
+    Given PRAXIS_HOME is an empty directory
+    When I run "steward init" with STEWARD_TRACE "1"
+    Then the exit code should be 0
+    And stderr contains "steward trace: init"
+    And the trace counted time in the write phase
+
+  Scenario: No trace without STEWARD_TRACE
+    Given an initialized workshop
+    When I run "steward list" with STEWARD_TRACE "0"
+    Then the exit code should be 0
+    And stderr does not contain "steward trace"
+
+  Scenario: --profile writes a pstats dump and a tracemalloc snapshot
+    Given an initialized workshop
+    And an item "idea" in the intake stage
+    When I run "steward list" with --profile and --profile-memory
+    Then the exit code should be 0
+    And the profile can be loaded with pstats
+    And the tracemalloc snapshot can be loaded
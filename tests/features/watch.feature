@@ -0,0 +1,37 @@
+Feature: Steward Watch
+  Intake inbox drops and repair symlinks as the workshop changes.
+
+  Scenario Outline: A file dropped into the inbox is intaken
+    Given an initialized workshop
+    And the watcher is running with the <backend> backend
+    When I drop "idea.md" into the inbox
+    Then within 5 seconds an item "idea" is in the intake stage
+    And the inbox is empty
+
+    Examples:
+      | backend |
+      | inotify |
+      | polling |
+
+  Scenario Outline: Editing status.yaml re-links only that item
+    Given an initialized workshop
+    And an item "feature-a" in the intake stage
+    And an item "feature-b" in the intake stage
+    And the watcher is running with the <backend> backend
+    When I set the stage of "feature-a" to "forge" in its status.yaml
+    Then within 5 seconds a symlink exists in _workshop/5-active/3-forge/ for "feature-a"
+    And within 1 seconds no symlink exists in _workshop/3-intake/ for "feature-a"
+    And a symlink exists in _workshop/3-intake/ for "feature-b"
+    And the watcher re-linked 1 item
+
+    Examples:
+      | backend |
+      | inotify |
+      | polling |
+
+  Scenario: Partial downloads stay in the inbox
+    Given an initialized workshop
+    And the watcher is running with the inotify backend
+    When I drop "big.iso.part" into the inbox
+    And I wait 0.5 seconds
+    Then the inbox contains "big.iso.part"
@@ -0,0 +1,196 @@
+"""Step definitions for concurrency feature tests."""
+
+import fcntl
+import multiprocessing
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+from pytest_bdd import given, parsers, scenarios, then, when
+from typer.testing import CliRunner
+
+from steward.application import init_workshop, intake_item, list_records, stage_item
+from steward.cli import app
+from steward.domain.errors import InvalidStageTransitionError
+from steward.domain.stages import Stage, get_stage_path
+from steward.infrastructure.item_index import open_index
+from steward.infrastructure.journal import Journal
+from steward.infrastructure.locking import LOCK_FILENAME
+from steward.infrastructure.state import ensure_state_path
+from steward.infrastructure.status_yaml import read_status
+
+scenarios("../features/concurrency.feature")
+
+
+@pytest.fixture
+def cli_runner() -> CliRunner:
+    """Provide a CLI test runner."""
+    return CliRunner(mix_stderr=False)
+
+
+@pytest.fixture
+def result() -> dict:
+    """Store the CLI result between steps."""
+    return {}
+
+
+@pytest.fixture
+def temp_dir() -> dict:
+    """Provide temporary directory context."""
+    return {"path": None, "old_env": None}
+
+
+@given("an initialized workshop")
+def initialized_workshop(temp_dir: dict) -> None:
+    """Set up an initialized workshop."""
+    tmpdir = tempfile.mkdtemp()
+    temp_dir["path"] = Path(tmpdir)
+    temp_dir["old_env"] = os.environ.get("PRAXIS_HOME")
+    os.environ["PRAXIS_HOME"] = tmpdir
+    init_workshop()
+
+
+@given(parsers.parse('an item "{slug}" in the intake stage'))
+def intaken_item(temp_dir: dict, slug: str) -> None:
+    """Intake an item through the service."""
+    source = temp_dir["path"] / f"{slug}.md"
+    source.write_text(slug)
+    intake_item(str(source))
+
+
+@given("another process holds the workshop lock")
+def hold_lock(temp_dir: dict, request: pytest.FixtureRequest) -> None:
+    """Hold an exclusive lock from a separate open file description."""
+    fd = os.open(ensure_state_path(temp_dir["path"] / "_workshop") / LOCK_FILENAME, os.O_RDWR | os.O_CREAT)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    request.addfinalizer(lambda: os.close(fd))
+
+
+def _hammer(praxis_home: str, worker: int, rounds: int) -> dict:
+    """One agent: intake a shared and an own file per round, stage and list."""
+    home = Path(praxis_home)
+    outcome: dict = {"shared_ids": [], "errors": [], "contested": False}
+    try:
+        for round_number in range(rounds):
+            outcome["shared_ids"].append(intake_item(str(home / "shared.md")).id)
+            own = home / f"w{worker}-r{round_number}.md"
+            own.write_text(f"{worker}/{round_number}")
+            item = intake_item(str(own), move=True)
+            stage_item(item.slug, "backlog")
+            stage_item(item.slug, "forge")
+            list_records()
+        try:
+            stage_item("contested", "backlog")
+            outcome["contested"] = True
+        except InvalidStageTransitionError:
+            pass
+    except Exception as e:  # Reported to the parent
+        outcome["errors"].append(repr(e))
+    return outcome
+
+
+@when(parsers.parse("{processes:d} processes each run {rounds:d} rounds of intake, stage and list"))
+def run_processes(temp_dir: dict, result: dict, processes: int, rounds: int) -> None:
+    """Run the agents in parallel processes."""
+    (temp_dir["path"] / "shared.md").write_text("shared")
+    args = [(str(temp_dir["path"]), worker, rounds) for worker in range(processes)]
+    with multiprocessing.get_context("fork").Pool(processes) as pool:
+        result["outcomes"] = pool.starmap(_hammer, args)
+    result["expected_items"] = processes * rounds * 2 + 1
+
+
+@when(parsers.parse('I run "{command}" with STEWARD_LOCK_TIMEOUT "{seconds}"'))
+def run_with_lock_timeout(
+    cli_runner: CliRunner, result: dict, command: str, seconds: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Run a CLI command with a short lock timeout."""
+    import shlex
+
+    monkeypatch.setenv("STEWARD_LOCK_TIMEOUT", seconds)
+    args = shlex.split(command)
+    if args and args[0] == "steward":
+        args = args[1:]
+    result["output"] = cli_runner.invoke(app, args)
+
+
+@then("every process finished without errors")
+def check_no_errors(result: dict) -> None:
+    """Verify no agent hit an error."""
+    errors = [error for outcome in result["outcomes"] for error in outcome["errors"]]
+    assert not errors, f"Errors: {errors}"
+
+
+@then("every intake of the same name got a distinct item ID")
+def check_distinct_ids(temp_dir: dict, result: dict) -> None:
+    """Verify no ID was handed out twice."""
+    shared_ids = [item_id for outcome in result["outcomes"] for item_id in outcome["shared_ids"]]
+    assert len(shared_ids) == len(set(shared_ids))
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    assert len(list(items_path.iterdir())) == result["expected_items"]
+
+
+@then(parsers.parse('exactly {count:d} process moved "{slug}" to backlog'))
+def check_contested(result: dict, count: int, slug: str) -> None:
+    """Verify competing transitions of one item were serialised."""
+    assert sum(outcome["contested"] for outcome in result["outcomes"]) == count
+
+
+@then("every item is linked once, in the folder of its stage")
+def check_links(temp_dir: dict) -> None:
+    """Verify stage folders agree with the status files."""
+    workshop_path = temp_dir["path"] / "_workshop"
+    links: dict[str, list[Stage]] = {}
+    for stage in Stage:
+        folder = workshop_path / get_stage_path(stage)
+        for link in folder.iterdir() if folder.is_dir() else []:
+            if link.is_symlink():
+                links.setdefault(link.resolve().name, []).append(stage)
+    for item_path in (workshop_path / "9-items").iterdir():
+        stage = Stage(read_status(item_path).stage)
+        assert links.get(item_path.name) == [stage], f"{item_path.name}: {links.get(item_path.name)} != [{stage}]"
+
+
+@then("the item index matches the status files")
+def check_index(temp_dir: dict) -> None:
+    """Verify the index recorded every write."""
+    workshop_path = temp_dir["path"] / "_workshop"
+    with open_index(workshop_path) as index:
+        indexed = {record.id: record.stage for record in index.entries()}
+    on_disk = {path.name: read_status(path).stage for path in (workshop_path / "9-items").iterdir()}
+    assert indexed == on_disk
+
+
+@then("the journal is empty")
+def check_journal_empty(temp_dir: dict) -> None:
+    """Verify nothing is left to recover."""
+    assert Journal(temp_dir["path"] / "_workshop").is_empty()
+
+
+@then(parsers.parse("the exit code should be {code:d}"))
+def check_exit_code(result: dict, code: int) -> None:
+    """Verify the exit code."""
+    assert result["output"].exit_code == code, (
+        f"Expected exit code {code}, got {result['output'].exit_code}. Output: {result['output'].output}"
+    )
+
+
+@then(parsers.parse('stderr contains "{text}"'))
+def check_stderr_contains(result: dict, text: str) -> None:
+    """Verify stderr contains text."""
+    stderr = result["output"].stderr or ""
+    assert text in stderr, f"Expected '{text}' in stderr. Got: {stderr}"
+
+
+@pytest.fixture(autouse=True)
+def cleanup_env(temp_dir: dict):
+    """Clean up environment after test."""
+    yield
+    if temp_dir.get("old_env") is not None:
+        os.environ["PRAXIS_HOME"] = temp_dir["old_env"]
+    elif "PRAXIS_HOME" in os.environ and temp_dir.get("path"):
+        del os.environ["PRAXIS_HOME"]
+    if temp_dir.get("path") and temp_dir["path"].exists():
+        import shutil
+
+        shutil.rmtree(temp_dir["path"])
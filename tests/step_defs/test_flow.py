@@ -0,0 +1,163 @@
+"""Step definitions for flow analytics feature tests."""
+
+import json
+import os
+import shlex
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from pytest_bdd import given, parsers, scenarios, then, when
+from typer.testing import CliRunner
+
+from steward.application import init_workshop
+from steward.cli import app
+from steward.domain.models import Status
+from steward.domain.stages import Stage
+from steward.infrastructure.status_yaml import write_status
+
+scenarios("../features/flow.feature")
+
+
+@pytest.fixture
+def cli_runner() -> CliRunner:
+    """Provide a CLI test runner."""
+    return CliRunner(mix_stderr=False)
+
+
+@pytest.fixture
+def result() -> dict:
+    """Store the CLI result between steps."""
+    return {}
+
+
+@pytest.fixture
+def temp_dir() -> dict:
+    """Provide temporary directory context."""
+    return {"path": Path(tempfile.mkdtemp()), "old_env": None}
+
+
+@given("an initialized workshop")
+def initialized_workshop(temp_dir: dict) -> None:
+    """Set up an initialized workshop."""
+    temp_dir["old_env"] = os.environ.get("PRAXIS_HOME")
+    os.environ["PRAXIS_HOME"] = str(temp_dir["path"])
+    init_workshop()
+
+
+@given(
+    parsers.parse('an item "{slug}" in {stage} created {created_days:d} days ago and updated {updated_days:d} days ago')
+)
+def item_with_times(temp_dir: dict, slug: str, stage: str, created_days: int, updated_days: int) -> None:
+    """Write an item whose status has the given stage and ages."""
+    now = datetime.now()
+    created = now - timedelta(days=created_days, minutes=1)
+    updated = now - timedelta(days=updated_days, minutes=1)
+    item_path = temp_dir["path"] / "_workshop" / "9-items" / f"{created:%Y-%m-%d-%H%M}__{slug}"
+    item_path.mkdir()
+    write_status(item_path, Status(stage=Stage(stage), created=created, updated=updated))
+
+
+@when(parsers.parse('I run "{command}"'))
+def run_command(cli_runner: CliRunner, result: dict, command: str) -> None:
+    """Run a CLI command."""
+    result["output"] = cli_runner.invoke(app, shlex.split(command)[1:])
+
+
+@then(parsers.parse("the exit code should be {code:d}"))
+def check_exit_code(result: dict, code: int) -> None:
+    """Verify the exit code."""
+    assert result["output"].exit_code == code, (
+        f"Expected exit code {code}, got {result['output'].exit_code}. "
+        f"Output: {result['output'].output} {result['output'].stderr}"
+    )
+
+
+@then(parsers.parse('the output contains "{text}"'))
+def check_output_contains(result: dict, text: str) -> None:
+    """Verify the output contains text."""
+    assert text in result["output"].output
+
+
+def _report(result: dict) -> dict:
+    return json.loads(result["output"].output)
+
+
+@then(parsers.parse("the report covers {count:d} items"))
+def check_item_count(result: dict, count: int) -> None:
+    """Verify every item was loaded."""
+    assert _report(result)["items"] == count
+
+
+@then(parsers.parse("the lead time of {count:d} finished items has p50 {p50:d} days and max {maximum:d} days"))
+def check_lead_time(result: dict, count: int, p50: int, maximum: int) -> None:
+    """Verify the lead time distribution."""
+    lead_time = _report(result)["lead_time_days"]
+    assert lead_time["count"] == count
+    assert lead_time["p50"] == pytest.approx(p50, abs=0.01)
+    assert lead_time["max"] == pytest.approx(maximum, abs=0.01)
+
+
+@then(parsers.parse("{count:d} items were finished in the last period"))
+def check_throughput(result: dict, count: int) -> None:
+    """Verify the throughput of the latest period."""
+    assert _report(result)["periods"][-1]["finished"] == count
+
+
+@then(parsers.parse("{count:d} items were created in the last {periods:d} periods"))
+def check_arrivals(result: dict, count: int, periods: int) -> None:
+    """Verify arrivals over recent periods."""
+    assert sum(period["created"] for period in _report(result)["periods"][-periods:]) == count
+
+
+@then(
+    parsers.parse(
+        'the "{stage}" WIP age counts are {first:d} under "{first_bucket}" and {second:d} under "{second_bucket}"'
+    )
+)
+def check_aging_two(result: dict, stage: str, first: int, first_bucket: str, second: int, second_bucket: str) -> None:
+    """Verify two WIP aging buckets of a stage."""
+    report = _report(result)
+    counts = dict(zip(report["aging_buckets"], report["aging"][stage], strict=True))
+    assert counts[first_bucket] == first
+    assert counts[second_bucket] == second
+    assert sum(counts.values()) == first + second
+
+
+@then(parsers.parse('the "{stage}" WIP age counts are {count:d} under "{bucket}"'))
+def check_aging_one(result: dict, stage: str, count: int, bucket: str) -> None:
+    """Verify the WIP aging of a stage with a single bucket in use."""
+    report = _report(result)
+    counts = dict(zip(report["aging_buckets"], report["aging"][stage], strict=True))
+    assert counts[bucket] == count
+    assert sum(counts.values()) == count
+
+
+@then(parsers.parse('the "{stage}" time in stage has {count:d} items with max {maximum:d} days'))
+def check_time_in_stage(result: dict, stage: str, count: int, maximum: int) -> None:
+    """Verify time in the current stage."""
+    dist = _report(result)["time_in_stage_days"][stage]
+    assert dist["count"] == count
+    assert dist["max"] == pytest.approx(maximum, abs=0.01)
+
+
+@then(parsers.parse('the cumulative flow of "{stage}" goes from {before:d} to {after:d} over the last 2 periods'))
+def check_cumulative_flow(result: dict, stage: str, before: int, after: int) -> None:
+    """Verify the cumulative flow series of a stage."""
+    periods = _report(result)["periods"]
+    assert [period["cumulative"][stage] for period in periods[-2:]] == [before, after]
+
+
+@pytest.fixture(autouse=True)
+def cleanup_env(temp_dir: dict):
+    """Clean up environment after test."""
+    yield
+    if temp_dir.get("old_env") is not None:
+        os.environ["PRAXIS_HOME"] = temp_dir["old_env"]
+    elif "PRAXIS_HOME" in os.environ:
+        del os.environ["PRAXIS_HOME"]
+    if temp_dir["path"].exists():
+        import shutil
+
+        shutil.rmtree(temp_dir["path"])
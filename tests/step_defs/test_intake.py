@@ -1,6 +1,10 @@
 """Step definitions for intake feature tests."""
 
+import errno
+import multiprocessing
 import os
+import shutil
+import sqlite3
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -9,10 +13,17 @@ import pytest
 from pytest_bdd import given, parsers, scenarios, then, when
 from typer.testing import CliRunner
 
-from steward.application import init_workshop
+from steward.application import init_workshop, intake_service
+from steward.application.recovery_service import recover_workshop
 from steward.cli import app
 from steward.domain.models import Status
 from steward.domain.stages import Stage
+from steward.infrastructure import copy_engine, hash_index, move_engine
+from steward.infrastructure.hash_index import HASH_INDEX_FILENAME
+from steward.infrastructure.id_reservation import IdReserver
+from steward.infrastructure.journal import Journal
+from steward.infrastructure.locking import exclusive_lock
+from steward.infrastructure.state import STATE_DIR
 from steward.infrastructure.status_yaml import read_status, write_status
 
 scenarios("../features/intake.feature")
@@ -70,6 +81,181 @@ def folder_in_inbox(temp_dir: dict, foldername: str) -> None:
     (folder_path / "README.md").write_text("Test content")
 
 
+@given(parsers.parse('a folder "{foldername}" with nested files exists in _workshop/1-inbox/'))
+def nested_folder_in_inbox(temp_dir: dict, foldername: str, item_context: dict) -> None:
+    """Create a folder with subfolders, several files and a symlink in inbox."""
+    folder_path = temp_dir["path"] / "_workshop" / "1-inbox" / foldername.rstrip("/")
+    files = {
+        "README.md": b"Test content",
+        "notes/a.txt": b"alpha",
+        "notes/deep/b.txt": b"beta" * 1000,
+        "data.bin": os.urandom(200_000),
+    }
+    for name, content in files.items():
+        path = folder_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    (folder_path / "empty").mkdir()
+    (folder_path / "latest").symlink_to("notes/a.txt")
+    item_context["nested_files"] = files
+
+
+@given(parsers.parse('a file "{filename}" of {size:d} bytes exists in _workshop/1-inbox/'))
+def sized_file_in_inbox(temp_dir: dict, filename: str, size: int, item_context: dict) -> None:
+    """Create a file of random bytes in inbox."""
+    content = os.urandom(size)
+    (temp_dir["path"] / "_workshop" / "1-inbox" / filename).write_bytes(content)
+    item_context["original_content"] = content
+
+
+@given("renames fail because the inbox is on another filesystem")
+def renames_cross_device(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make every rename fail as it would across mount points."""
+
+    def rename(src: object, dst: object) -> None:
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "rename", rename)
+
+
+@given("walking a source to size it fails")
+def forbid_tree_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail the test if a move sizes its source tree."""
+
+    def tree_size(path: Path) -> int:
+        raise AssertionError(f"walked {path}")
+
+    monkeypatch.setattr(move_engine, "_tree_size", tree_size)
+
+
+@given(parsers.parse("{calls} copy no bytes, as on procfs"))
+def kernel_copies_copy_nothing(monkeypatch: pytest.MonkeyPatch, calls: str) -> None:
+    """Make kernel-side copy calls report 0 bytes copied at offset 0."""
+    for call in calls.split(","):
+        monkeypatch.setattr(os, call, lambda *args: 0, raising=False)
+    # Offer both kernel copies, whichever this platform's os module has
+    kernel = [("copy_file_range", copy_engine._copy_file_range), ("sendfile", copy_engine._sendfile)]
+    monkeypatch.setattr(copy_engine, "_KERNEL_COPIES", kernel)
+    monkeypatch.setattr(copy_engine, "_CLONE_OR_COPY", [("reflink", copy_engine._reflink), *kernel])
+
+
+@pytest.fixture
+def interruption(request: pytest.FixtureRequest) -> pytest.MonkeyPatch:
+    """Patches that interrupt a move; undone by 'the interruption is cleared'."""
+    patch = pytest.MonkeyPatch()
+    request.addfinalizer(patch.undo)
+    return patch
+
+
+@given(parsers.parse("the move is interrupted after {count:d} file"))
+def interrupt_after_files(interruption: pytest.MonkeyPatch, count: int) -> None:
+    """Fail the move when it reaches file number count + 1."""
+    copy_file = move_engine._Mover.copy_file
+    calls = []
+
+    def failing_copy_file(self: move_engine._Mover, src: str, dst: str, rel: str) -> None:
+        calls.append(rel)
+        if len(calls) > count:
+            raise OSError(errno.EIO, "simulated interruption")
+        copy_file(self, src, dst, rel)
+
+    interruption.setattr(move_engine._Mover, "copy_file", failing_copy_file)
+
+
+@given("the move is interrupted after its first checkpoint")
+def interrupt_after_checkpoint(
+    monkeypatch: pytest.MonkeyPatch, interruption: pytest.MonkeyPatch, item_context: dict
+) -> None:
+    """Use small chunks and fail right after the first mid-file checkpoint."""
+    monkeypatch.setattr(move_engine, "CHUNK_SIZE", 64 * 1024)
+    monkeypatch.setattr(move_engine, "CHECKPOINT_BYTES", 256 * 1024)
+    save_state = move_engine._save_state
+
+    def failing_save_state(path: Path, state: move_engine.MoveState) -> None:
+        save_state(path, state)
+        if state.offset > 0:
+            raise OSError(errno.EIO, "simulated interruption")
+
+    interruption.setattr(move_engine, "_save_state", failing_save_state)
+
+    # Record how many bytes the resumed copy started from
+    advance = move_engine._Mover._advance
+    first_steps: list[int] = []
+
+    def recording_advance(self: move_engine._Mover, count: int) -> None:
+        first_steps.append(count)
+        advance(self, count)
+
+    monkeypatch.setattr(move_engine._Mover, "_advance", recording_advance)
+    item_context["advances"] = first_steps
+
+
+@when("the interruption is cleared")
+def clear_interruption(interruption: pytest.MonkeyPatch, item_context: dict) -> None:
+    """Let the next run complete."""
+    interruption.undo()
+    item_context.get("advances", []).clear()
+
+
+@given("linking the intake folder fails")
+def break_intake_linking(interruption: pytest.MonkeyPatch) -> None:
+    """Fail after the status files are written, as a crash would."""
+
+    def failing_create_symlink(target: Path, link: Path) -> None:
+        raise OSError(errno.EIO, "simulated crash")
+
+    interruption.setattr(intake_service, "create_symlink", failing_create_symlink)
+
+
+@given("the intake dies while copying")
+def die_while_copying(interruption: pytest.MonkeyPatch) -> None:
+    """Abort the intake once its item directory is reserved, as a crash would."""
+
+    def dying_transfer(*args: object) -> None:
+        raise RuntimeError("simulated crash")
+
+    interruption.setattr(intake_service, "_transfer", dying_transfer)
+
+
+@given("another command recovers the workshop while the intake copies")
+def recover_during_copy(monkeypatch: pytest.MonkeyPatch, temp_dir: dict) -> None:
+    """Run recovery, as a concurrent command would, before each copy."""
+    transfer = intake_service._transfer
+
+    def transfer_after_recovery(workshop_path: Path, *args: object, **kwargs: object) -> object:
+        with exclusive_lock(workshop_path):
+            recover_workshop(workshop_path)
+        return transfer(workshop_path, *args, **kwargs)
+
+    monkeypatch.setattr(intake_service, "_transfer", transfer_after_recovery)
+
+
+@when("linking the intake folder works again")
+def fix_intake_linking(interruption: pytest.MonkeyPatch) -> None:
+    """Undo the simulated crash."""
+    interruption.undo()
+
+
+@given(parsers.parse('the working directory holds a different file "{filename}"'))
+def file_in_working_directory(monkeypatch: pytest.MonkeyPatch, item_context: dict, filename: str) -> None:
+    """Change into a directory holding a file named like an inbox entry."""
+    workdir = Path(tempfile.mkdtemp())
+    (workdir / filename).write_text("Not the inbox copy")
+    monkeypatch.chdir(workdir)
+    item_context["workdir"] = workdir
+
+
+@given(parsers.parse('the working directory holds a copy of "{source}" named "{name}"'))
+def copy_in_working_directory(
+    monkeypatch: pytest.MonkeyPatch, temp_dir: dict, item_context: dict, source: str, name: str
+) -> None:
+    """Change into a directory holding a renamed copy of an inbox file."""
+    workdir = Path(tempfile.mkdtemp())
+    shutil.copy(temp_dir["path"] / "_workshop" / "1-inbox" / source, workdir / name)
+    monkeypatch.chdir(workdir)
+    item_context["workdir"] = workdir
+
+
 @given(parsers.parse('an existing item with slug "{slug}"'))
 def existing_item(temp_dir: dict, slug: str, item_context: dict) -> None:
     """Create an existing item."""
@@ -83,6 +269,70 @@ def existing_item(temp_dir: dict, slug: str, item_context: dict) -> None:
     item_context["existing_id"] = item_id
 
 
+@given(parsers.parse('an existing item with slug "{slug}" holding a file "{filename}" with "{content}"'))
+def existing_item_with_file(temp_dir: dict, slug: str, filename: str, content: str, item_context: dict) -> None:
+    """Create an item by hand, as if it predated the hash index."""
+    existing_item(temp_dir, slug, item_context)
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    (items_path / item_context["existing_id"] / filename).write_text(content)
+
+
+@given(parsers.parse('"{source}" has already been intaken'))
+def already_intaken(temp_dir: dict, source: str) -> None:
+    """Intake a source once, leaving it in the inbox."""
+    intake_service.intake_item(source)
+
+
+@given(parsers.parse('a copy of "{source}" named "{name}" exists in _workshop/1-inbox/'))
+def copy_in_inbox(temp_dir: dict, source: str, name: str) -> None:
+    """Drop a renamed copy of an inbox file."""
+    inbox_path = temp_dir["path"] / "_workshop" / "1-inbox"
+    shutil.copy(inbox_path / source, inbox_path / name)
+
+
+@given(parsers.parse('the inbox file "{filename}" is changed'))
+def change_inbox_file(temp_dir: dict, filename: str) -> None:
+    """Rewrite an inbox file in place, keeping its inode."""
+    path = temp_dir["path"] / "_workshop" / "1-inbox" / filename
+    with open(path, "a") as f:
+        f.write(" and more")
+
+
+@given(parsers.parse('the intaken copy of "{filename}" is changed'))
+def change_item_file(temp_dir: dict, filename: str) -> None:
+    """Edit an item's file in place, as a user would after intake."""
+    (path,) = (temp_dir["path"] / "_workshop" / "9-items").glob(f"*/{filename}")
+    with open(path, "a") as f:
+        f.write(" and more")
+
+
+@given(parsers.parse('the intaken copy of "{filename}" now says "{text}"'))
+def rewrite_item_file(temp_dir: dict, filename: str, text: str) -> None:
+    """Rewrite an item's file in place."""
+    (path,) = (temp_dir["path"] / "_workshop" / "9-items").glob(f"*/{filename}")
+    path.write_text(text)
+
+
+@given(parsers.parse('the inbox file "{filename}" now says "{text}"'))
+def rewrite_inbox_file(temp_dir: dict, filename: str, text: str) -> None:
+    """Rewrite an inbox file in place."""
+    (temp_dir["path"] / "_workshop" / "1-inbox" / filename).write_text(text)
+
+
+@given("the trees listed by the hash index are recorded")
+def record_hash_listings(monkeypatch: pytest.MonkeyPatch, item_context: dict) -> None:
+    """Record every file or directory tree the hash index stats."""
+    listed: list[Path] = []
+    item_context["hash_listed"] = listed
+    list_content = hash_index.list_content
+
+    def recording(path: Path, exclude: tuple[str, ...] = ()) -> list:
+        listed.append(path)
+        return list_content(path, exclude)
+
+    monkeypatch.setattr(hash_index, "list_content", recording)
+
+
 @when(parsers.parse('I run "{command}"'))
 def run_command(cli_runner: CliRunner, result: dict, command: str) -> None:
     """Run a CLI command."""
@@ -94,6 +344,38 @@ def run_command(cli_runner: CliRunner, result: dict, command: str) -> None:
     result["output"] = cli_runner.invoke(app, args)
 
 
+def _reserve_ids(items_path: Path, slug: str, timestamp: datetime, count: int) -> list[str]:
+    """Reserve IDs the way one intake process would."""
+    reserver = IdReserver(items_path)
+    return [reserver.reserve(slug, timestamp) for _ in range(count)]
+
+
+@when(parsers.parse('an ID is reserved for slug "{slug}"'))
+def reserve_one_id(monkeypatch: pytest.MonkeyPatch, temp_dir: dict, result: dict, slug: str) -> None:
+    """Reserve a single ID, recording the directories listed meanwhile."""
+    listed: list[str] = []
+    listdir = os.listdir
+
+    def recording_listdir(path: str = ".") -> list[str]:
+        listed.append(str(path))
+        return listdir(path)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(os, "listdir", recording_listdir)
+        IdReserver(temp_dir["path"] / "_workshop" / "9-items").reserve(slug)
+    result["listed"] = listed
+
+
+@when(parsers.parse('{processes:d} processes each reserve {count:d} IDs for slug "{slug}" in the same minute'))
+def reserve_concurrently(temp_dir: dict, result: dict, processes: int, count: int, slug: str) -> None:
+    """Race several processes reserving IDs for the same slug."""
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    timestamp = datetime.now()
+    with multiprocessing.get_context("fork").Pool(processes) as pool:
+        batches = pool.starmap(_reserve_ids, [(items_path, slug, timestamp, count)] * processes)
+    result["reserved"] = [item_id for batch in batches for item_id in batch]
+
+
 @then(parsers.parse("the exit code should be {code:d}"))
 def check_exit_code(result: dict, code: int) -> None:
     """Verify the exit code."""
@@ -115,6 +397,14 @@ def check_item_exists(temp_dir: dict, slug: str, item_context: dict) -> None:
     item_context["slug"] = slug
 
 
+@then(parsers.parse('an item directory exists in _workshop/9-items/ with exactly the slug "{slug}"'))
+def check_item_exact_slug(temp_dir: dict, slug: str) -> None:
+    """Verify an item directory's slug is exactly the given one."""
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    slugs = [d.name.split("__", 1)[1] for d in items_path.iterdir() if d.is_dir()]
+    assert slug in slugs, f"No item with slug '{slug}' in {slugs}"
+
+
 @then(parsers.parse('the item contains status.yaml with stage "{stage}"'))
 def check_status_stage(item_context: dict, stage: str) -> None:
     """Verify status.yaml contains the expected stage."""
@@ -132,6 +422,158 @@ def check_intake_symlink(temp_dir: dict, item_context: dict) -> None:
     assert symlink_path.is_symlink(), f"Symlink not found: {symlink_path}"
 
 
+@then(parsers.parse('the item file "{filename}" has the inbox content'))
+def check_item_file_content(temp_dir: dict, filename: str) -> None:
+    """Verify the intaken copy matches the inbox file byte for byte."""
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    inbox_file = temp_dir["path"] / "_workshop" / "1-inbox" / filename
+    (item_file,) = items_path.glob(f"*/{filename}")
+    assert item_file.read_bytes() == inbox_file.read_bytes()
+    assert item_file.stat().st_mtime == inbox_file.stat().st_mtime, "Copy should keep the mtime"
+
+
+@then(parsers.parse('the item file "{filename}" shares its inode with the inbox copy in "{folder}"'))
+def check_item_file_hardlinked(temp_dir: dict, filename: str, folder: str) -> None:
+    """Verify the item file is a hardlink of the inbox file."""
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    inbox_file = temp_dir["path"] / "_workshop" / "1-inbox" / folder / filename
+    (item_file,) = items_path.glob(f"*/{filename}")
+    assert item_file.stat().st_ino == inbox_file.stat().st_ino
+
+
+@then(parsers.parse('the item holds the nested files of "{folder}"'))
+def check_nested_files(temp_dir: dict, folder: str, item_context: dict) -> None:
+    """Verify every file, the empty folder and the symlink arrived intact."""
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    (item_path,) = items_path.glob(f"*__{folder}")
+    for name, content in item_context["nested_files"].items():
+        assert (item_path / name).read_bytes() == content, f"{name} differs"
+    assert (item_path / "empty").is_dir()
+    assert os.readlink(item_path / "latest") == "notes/a.txt"
+
+
+@then(parsers.parse("there is exactly {count:d} item in _workshop/9-items/"))
+def check_item_count(temp_dir: dict, count: int) -> None:
+    """Verify the number of item directories."""
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    assert len(list(items_path.iterdir())) == count
+
+
+@then(parsers.parse("there are exactly {count:d} items in _workshop/9-items/"))
+def check_items_count(temp_dir: dict, count: int) -> None:
+    """Verify the number of item directories."""
+    check_item_count(temp_dir, count)
+
+
+@then(parsers.parse('the digest of the inbox file "{filename}" is cached'))
+def check_digest_cached(temp_dir: dict, filename: str) -> None:
+    """Verify the file's digest is kept under its inode."""
+    workshop_path = temp_dir["path"] / "_workshop"
+    st = os.stat(workshop_path / "1-inbox" / filename)
+    with sqlite3.connect(workshop_path / STATE_DIR / HASH_INDEX_FILENAME) as conn:
+        row = conn.execute(
+            "SELECT mtime_ns, size FROM files WHERE dev = ? AND ino = ?", (st.st_dev, st.st_ino)
+        ).fetchone()
+    assert row == (st.st_mtime_ns, st.st_size)
+
+
+@then(parsers.parse('there are {count:d} distinct item directories for slug "{slug}"'))
+def check_distinct_reservations(temp_dir: dict, result: dict, count: int, slug: str) -> None:
+    """Verify no two reservations returned the same ID."""
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    assert len(result["reserved"]) == count
+    assert len(set(result["reserved"])) == count, "An ID was handed out twice"
+    assert len(list(items_path.glob(f"*__{slug}*"))) == count
+
+
+@then(parsers.parse('a symlink for "{slug}" exists in _workshop/3-intake/'))
+def check_named_intake_symlink(temp_dir: dict, slug: str) -> None:
+    """Verify a named item is linked into 3-intake/."""
+    link = temp_dir["path"] / "_workshop" / "3-intake" / slug
+    assert link.is_symlink() and link.resolve().is_dir(), f"Missing link: {link}"
+
+
+@then("_workshop/9-items/ was not listed")
+def check_items_not_listed(temp_dir: dict, result: dict) -> None:
+    """Verify the reservation did not read the whole items directory."""
+    assert str(temp_dir["path"] / "_workshop" / "9-items") not in result["listed"]
+
+
+@then("the journal is empty")
+def check_journal_empty(temp_dir: dict) -> None:
+    """Verify nothing is left to recover."""
+    assert Journal(temp_dir["path"] / "_workshop").is_empty()
+
+
+@then("the copy resumed from the checkpoint")
+def check_resumed_from_checkpoint(item_context: dict) -> None:
+    """Verify the second run skipped the bytes already on disk."""
+    assert item_context["advances"][0] == move_engine.CHECKPOINT_BYTES
+
+
+@then(parsers.parse('the item file "{filename}" has the original content'))
+def check_item_file_original(temp_dir: dict, filename: str, item_context: dict) -> None:
+    """Verify the item file matches what was created in the inbox."""
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    (item_file,) = items_path.glob(f"*/{filename}")
+    assert item_file.read_bytes() == item_context["original_content"]
+
+
+@then(parsers.parse('the working directory file "{filename}" is untouched'))
+def check_working_directory_file(item_context: dict, filename: str) -> None:
+    """Verify intake left the working directory file alone."""
+    workdir = item_context["workdir"]
+    assert (workdir / filename).read_text() == "Not the inbox copy"
+    shutil.rmtree(workdir)
+
+
+@then(parsers.parse('the inbox entry "{name}" links to the item file "{filename}"'))
+def check_inbox_link(temp_dir: dict, name: str, filename: str) -> None:
+    """Verify a duplicate source was replaced with a symlink into its item."""
+    workshop_path = temp_dir["path"] / "_workshop"
+    link = workshop_path / "1-inbox" / name
+    (item_file,) = (workshop_path / "9-items").glob(f"*/{filename}")
+    assert link.is_symlink()
+    assert link.resolve() == item_file.resolve()
+
+
+@then(parsers.parse('the hash index did not list the item of "{source}"'))
+def check_item_not_listed(temp_dir: dict, item_context: dict, source: str) -> None:
+    """Verify a lookup did not stat the files of an item of another size."""
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    (item_path,) = items_path.glob(f"*__{Path(source).stem}*")
+    assert item_context["hash_listed"]
+    assert item_path not in item_context["hash_listed"]
+
+
+@then(parsers.parse('the working directory file "{filename}" is still a regular file'))
+def check_working_directory_file_not_replaced(item_context: dict, filename: str) -> None:
+    """Verify a source outside the inbox was not replaced."""
+    path = item_context["workdir"] / filename
+    assert not path.is_symlink()
+    assert path.read_text() == "Test content"
+
+
+@then("_workshop/1-inbox/ is empty")
+def check_inbox_empty(temp_dir: dict) -> None:
+    """Verify every inbox entry was moved out."""
+    inbox_path = temp_dir["path"] / "_workshop" / "1-inbox"
+    remaining = [p.name for p in inbox_path.iterdir() if not p.name.startswith(".")]
+    assert not remaining, f"Inbox still contains: {remaining}"
+
+
+@then(parsers.parse('the output contains "{text}"'))
+def check_output_contains(result: dict, text: str) -> None:
+    """Verify output contains text."""
+    assert text in result["output"].output, f"Expected '{text}' in output. Got: {result['output'].output}"
+
+
+@then(parsers.parse('the output does not contain "{text}"'))
+def check_output_not_contains(result: dict, text: str) -> None:
+    """Verify output does not contain text."""
+    assert text not in result["output"].output, f"Did not expect '{text}' in output. Got: {result['output'].output}"
+
+
 @then(parsers.parse('stderr contains "{text}"'))
 def check_stderr_contains(result: dict, text: str) -> None:
     """Verify stderr contains text."""
@@ -149,6 +591,4 @@ def cleanup_env(temp_dir: dict):
     elif "PRAXIS_HOME" in os.environ and temp_dir.get("path"):
         del os.environ["PRAXIS_HOME"]
     if temp_dir.get("path") and temp_dir["path"].exists():
-        import shutil
-
         shutil.rmtree(temp_dir["path"])
@@ -1,5 +1,6 @@
 """Step definitions for list feature tests."""
 
+import json
 import os
 import tempfile
 from datetime import datetime
@@ -9,11 +10,13 @@ import pytest
 from pytest_bdd import given, parsers, scenarios, then, when
 from typer.testing import CliRunner
 
-from steward.application import init_workshop
+from steward.application import init_workshop, iter_records
 from steward.cli import app
 from steward.domain.models import Status
 from steward.domain.stages import Stage, get_stage_path
+from steward.infrastructure.env import get_workshop_path
 from steward.infrastructure.filesystem import create_symlink
+from steward.infrastructure.locking import exclusive_lock
 from steward.infrastructure.status_yaml import write_status
 
 scenarios("../features/list.feature")
@@ -85,14 +88,91 @@ def item_exists_with_stage(
 
 
 @when(parsers.parse('I run "{command}"'))
-def run_command(cli_runner: CliRunner, result: dict, command: str) -> None:
+def run_command(
+    cli_runner: CliRunner, result: dict, command: str, item_context: dict
+) -> None:
     """Run a CLI command."""
     import shlex
 
     args = shlex.split(command)
     if args and args[0] == "steward":
         args = args[1:]
-    result["output"] = cli_runner.invoke(app, args)
+    result["output"] = cli_runner.invoke(app, args, env=item_context.get("env"))
+
+
+@given(parsers.parse(
+    'an item "{slug}" exists with a hand-edited status.yaml at stage "{stage}"'
+))
+def item_with_hand_edited_status(temp_dir: dict, slug: str, stage: str) -> None:
+    """Create an item whose status.yaml is not in steward's canonical form."""
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    item_path = items_path / f"2025-01-01-1200__{slug}"
+    item_path.mkdir(parents=True, exist_ok=True)
+    (item_path / "status.yaml").write_text(
+        "# edited by hand\n"
+        f"stage: {stage}\n"
+        "created: 2025-01-01T12:00:00\n"
+        "updated: \"2025-01-02T08:30:00\"\n"
+    )
+
+
+@given(parsers.parse('{count:d} items exist with stage "{stage}"'))
+def many_items_exist(temp_dir: dict, count: int, stage: str) -> None:
+    """Create many items directly in 9-items/."""
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    now = datetime.now()
+    status = Status(stage=Stage(stage), created=now, updated=now)
+    for i in range(count):
+        item_path = items_path / f"2025-01-01-1200__bulk-{i:05d}"
+        item_path.mkdir(parents=True)
+        write_status(item_path, status)
+
+
+@given(parsers.parse('the environment variable "{name}" is "{value}"'))
+def set_env_var(item_context: dict, name: str, value: str) -> None:
+    """Set an environment variable for the CLI invocation."""
+    item_context.setdefault("env", {})[name] = value
+
+
+@when(parsers.parse('the status.yaml of "{slug}" is edited to stage "{stage}"'))
+def edit_status(item_context: dict, slug: str, stage: str) -> None:
+    """Rewrite an item's status.yaml outside of steward."""
+    item_path = item_context["items"][slug]["path"]
+    status_file = item_path / "status.yaml"
+    content = status_file.read_text()
+    old_stage = item_context["items"][slug]["stage"]
+    status_file.write_text(content.replace(f"stage: {old_stage}", f"stage: {stage}"))
+    item_context["items"][slug]["stage"] = stage
+
+
+@when(parsers.parse('the item "{slug}" is deleted'))
+def delete_item(item_context: dict, slug: str) -> None:
+    """Remove an item directory outside of steward."""
+    import shutil
+
+    shutil.rmtree(item_context["items"][slug]["path"])
+
+
+@given("status files are read by a single worker")
+def single_worker(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Scan status files in order, without workers reading ahead."""
+    monkeypatch.setenv("STEWARD_JOBS", "1")
+
+
+@when(parsers.parse('the bulk item "{slug}" is deleted'))
+def delete_bulk_item(temp_dir: dict, slug: str) -> None:
+    """Remove a bulk-created item directory outside of steward."""
+    import shutil
+
+    shutil.rmtree(temp_dir["path"] / "_workshop" / "9-items" / f"2025-01-01-1200__{slug}")
+
+
+@when("a reader takes the first listed record and pauses")
+def pause_reader(result: dict) -> None:
+    """Start a listing and stop after its first record."""
+    records = iter_records()
+    result["first"] = next(records)
+    result["records"] = records
 
 
 @then(parsers.parse("the exit code should be {code:d}"))
@@ -112,6 +192,44 @@ def check_output_contains(result: dict, text: str) -> None:
     )
 
 
+@then("the listed items are in item ID order")
+def check_listed_order(result: dict) -> None:
+    """Verify listed slugs come out sorted."""
+    slugs = [line.split()[0] for line in result["output"].output.splitlines()[1:]]
+    assert slugs == sorted(slugs), "Listed items are not in item ID order"
+
+
+@then(parsers.parse("every output line has {count:d} tab-separated fields"))
+def check_tsv_fields(result: dict, count: int) -> None:
+    """Verify each line of TSV output has the expected number of fields."""
+    lines = result["output"].output.splitlines()
+    assert lines, "Expected TSV output"
+    for line in lines:
+        assert len(line.split("\t")) == count, f"Unexpected TSV line: {line!r}"
+
+
+@then(parsers.parse('the output is JSON lines with slug "{slug}" and stage "{stage}"'))
+def check_jsonl(result: dict, slug: str, stage: str) -> None:
+    """Verify JSONL output describes the item."""
+    records = [json.loads(line) for line in result["output"].output.splitlines()]
+    assert [(r["slug"], r["stage"]) for r in records] == [(slug, stage)], f"Unexpected records: {records}"
+
+
+@then(parsers.parse("the output has {count:d} lines"))
+def check_line_count(result: dict, count: int) -> None:
+    """Verify the number of output lines."""
+    lines = result["output"].output.splitlines()
+    assert len(lines) == count, f"Expected {count} lines. Got: {lines}"
+
+
+@then(parsers.parse('stderr contains "{text}"'))
+def check_stderr_contains(result: dict, text: str) -> None:
+    """Verify stderr contains text."""
+    stderr = result["output"].stderr or ""
+    combined = stderr or result["output"].output
+    assert text in combined, f"Expected '{text}' in stderr. Got: {combined}"
+
+
 @then(parsers.parse('the output does not contain "{text}"'))
 def check_output_not_contains(result: dict, text: str) -> None:
     """Verify output does not contain text."""
@@ -120,6 +238,25 @@ def check_output_not_contains(result: dict, text: str) -> None:
     )
 
 
+@then("a writer can take the workshop lock while the reader pauses")
+def check_writer_not_blocked(result: dict) -> None:
+    """Verify the paused listing holds no workshop lock."""
+    with exclusive_lock(get_workshop_path(), timeout=0.2):
+        pass
+
+
+@then(parsers.parse('the rest of the listing is "{slug}"'))
+def check_rest_of_listing(result: dict, slug: str) -> None:
+    """Verify the paused listing resumes where it stopped."""
+    assert [record.slug for record in result["records"]] == [slug]
+
+
+@then(parsers.parse("the rest of the listing has {count:d} records"))
+def check_rest_of_listing_count(result: dict, count: int) -> None:
+    """Verify the paused listing only read items still present."""
+    assert sum(1 for _ in result["records"]) == count
+
+
 @pytest.fixture(autouse=True)
 def cleanup_env(temp_dir: dict):
     """Clean up environment after test."""
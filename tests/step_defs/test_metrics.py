@@ -0,0 +1,180 @@
+"""Step definitions for command metrics feature tests."""
+
+import json
+import os
+import shlex
+import tempfile
+from pathlib import Path
+
+import pytest
+from pytest_bdd import given, parsers, scenarios, then, when
+from typer.testing import CliRunner
+
+from steward.application import init_workshop, intake_item
+from steward.cli import app
+
+scenarios("../features/metrics.feature")
+
+
+@pytest.fixture
+def cli_runner() -> CliRunner:
+    """Provide a CLI test runner."""
+    return CliRunner(mix_stderr=False)
+
+
+@pytest.fixture
+def result() -> dict:
+    """Store the CLI result between steps."""
+    return {}
+
+
+@pytest.fixture
+def temp_dir() -> dict:
+    """Provide temporary directory context."""
+    tmpdir = Path(tempfile.mkdtemp())
+    return {"path": tmpdir, "old_env": None, "metrics": tmpdir / "metrics.jsonl"}
+
+
+@given("an initialized workshop")
+def initialized_workshop(temp_dir: dict) -> None:
+    """Set up an initialized workshop."""
+    temp_dir["old_env"] = os.environ.get("PRAXIS_HOME")
+    os.environ["PRAXIS_HOME"] = str(temp_dir["path"])
+    init_workshop()
+
+
+@given(parsers.parse('an item "{slug}" in the intake stage'))
+def intaken_item(temp_dir: dict, slug: str) -> None:
+    """Intake an item through the service."""
+    source = temp_dir["path"] / f"{slug}.md"
+    source.write_text(slug)
+    intake_item(str(source))
+
+
+def _write_runs(path: Path, command: str, walls: list[float], size: int) -> None:
+    with open(path, "a") as f:
+        for wall in walls:
+            record = {"cmd": command, "exit": 0, "wall_ms": wall, "phases": {}, "items": size, "bytes": 0, "size": size}
+            f.write(json.dumps(record) + "\n")
+
+
+@given(parsers.parse('a metrics file with {count:d} "{command}" runs taking 1 to {slowest:d} ms on {size:d} items'))
+def metrics_file_range(temp_dir: dict, count: int, command: str, slowest: int, size: int) -> None:
+    """Write runs with evenly spread wall times."""
+    _write_runs(temp_dir["metrics"], command, [slowest * (i + 1) / count for i in range(count)], size)
+
+
+@given(parsers.parse('the metrics file has {count:d} "{command}" runs taking {wall:d} ms on {size:d} items'))
+def metrics_file_constant(temp_dir: dict, count: int, command: str, wall: int, size: int) -> None:
+    """Append runs with the same wall time."""
+    _write_runs(temp_dir["metrics"], command, [float(wall)] * count, size)
+    # A torn line, as left by a crash mid-write, is skipped
+    with open(temp_dir["metrics"], "a") as f:
+        f.write('{"cmd": "li')
+
+
+@when(parsers.parse('I run "{command}" with metrics enabled'))
+def run_with_metrics(cli_runner: CliRunner, result: dict, temp_dir: dict, command: str) -> None:
+    """Run a CLI command with STEWARD_METRICS set."""
+    env = {"STEWARD_METRICS": str(temp_dir["metrics"])}
+    result["output"] = cli_runner.invoke(app, shlex.split(command)[1:], env=env)
+
+
+@when(parsers.parse('I run "{command}" on the metrics file as JSON'))
+def run_report(cli_runner: CliRunner, result: dict, temp_dir: dict, command: str) -> None:
+    """Run a report over the metrics file."""
+    args = [*shlex.split(command)[1:], str(temp_dir["metrics"]), "--json"]
+    result["output"] = cli_runner.invoke(app, args, env={"STEWARD_METRICS": None})
+
+
+@when(parsers.parse('I run "{command}"'))
+def run_command(cli_runner: CliRunner, result: dict, command: str) -> None:
+    """Run a CLI command without STEWARD_METRICS."""
+    result["output"] = cli_runner.invoke(app, shlex.split(command)[1:], env={"STEWARD_METRICS": None})
+
+
+@then(parsers.parse("the exit code should be {code:d}"))
+def check_exit_code(result: dict, code: int) -> None:
+    """Verify the exit code."""
+    assert result["output"].exit_code == code, (
+        f"Expected exit code {code}, got {result['output'].exit_code}. "
+        f"Output: {result['output'].output} {result['output'].stderr}"
+    )
+
+
+def _records(temp_dir: dict) -> list[dict]:
+    return [json.loads(line) for line in temp_dir["metrics"].read_text().splitlines()]
+
+
+@then(parsers.parse("the metrics file has {count:d} records"))
+def check_record_count(temp_dir: dict, count: int) -> None:
+    """Verify one record per command run."""
+    assert len(_records(temp_dir)) == count
+
+
+@then(parsers.parse('metrics record {number:d} is for "{command}" with exit code {code:d}'))
+def check_record(temp_dir: dict, number: int, command: str, code: int) -> None:
+    """Verify a record's command, exit code and wall time."""
+    record = _records(temp_dir)[number - 1]
+    assert record["cmd"] == command
+    assert record["exit"] == code
+    assert record["wall_ms"] > 0
+
+
+@then(parsers.parse("metrics record {number:d} counted {items:d} item scanned in a workshop of {size:d} item"))
+def check_record_counts(temp_dir: dict, number: int, items: int, size: int) -> None:
+    """Verify the item counts of a record."""
+    record = _records(temp_dir)[number - 1]
+    assert record["items"] == items
+    assert record["size"] == size
+
+
+@then(parsers.parse("metrics record {number:d} has timings for the {phase} phase"))
+def check_record_phase(temp_dir: dict, number: int, phase: str) -> None:
+    """Verify a phase duration was recorded."""
+    assert phase in _records(temp_dir)[number - 1]["phases"]
+
+
+@then(parsers.parse("metrics record {number:d} counted {syscall} syscalls"))
+def check_record_syscalls(temp_dir: dict, number: int, syscall: str) -> None:
+    """Verify a syscall count was recorded."""
+    assert _records(temp_dir)[number - 1]["syscalls"].get(syscall, 0) > 0
+
+
+@then("no metrics file was written")
+def check_no_metrics(temp_dir: dict) -> None:
+    """Verify metrics are opt-in."""
+    assert not temp_dir["metrics"].exists()
+
+
+def _summary(result: dict, command: str, size: str) -> dict:
+    data = json.loads(result["output"].stdout)
+    return next(s for s in data["commands"] if s["command"] == command and s["size"] == size)
+
+
+@then(parsers.parse('the "{command}" summary for "{size}" sizes has {count:d} runs'))
+def check_summary_count(result: dict, command: str, size: str, count: int) -> None:
+    """Verify how many runs were aggregated."""
+    assert _summary(result, command, size)["count"] == count
+
+
+@then(parsers.parse('the "{command}" summary for "{size}" sizes has p50 {p50:d} ms and p99 {p99:d} ms'))
+def check_summary_percentiles(result: dict, command: str, size: str, p50: int, p99: int) -> None:
+    """Verify the percentiles of a summary."""
+    summary = _summary(result, command, size)
+    assert summary["p50_ms"] == p50
+    assert summary["p99_ms"] == p99
+
+
+@pytest.fixture(autouse=True)
+def cleanup_env(temp_dir: dict):
+    """Clean up environment after test."""
+    yield
+    if temp_dir.get("old_env") is not None:
+        os.environ["PRAXIS_HOME"] = temp_dir["old_env"]
+    elif "PRAXIS_HOME" in os.environ:
+        del os.environ["PRAXIS_HOME"]
+    if temp_dir["path"].exists():
+        import shutil
+
+        shutil.rmtree(temp_dir["path"])
@@ -0,0 +1,167 @@
+"""Step definitions for full-text search feature tests."""
+
+import json
+import os
+import shlex
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+from pytest_bdd import given, parsers, scenarios, then, when
+from typer.testing import CliRunner
+
+from steward.application import init_workshop, intake_item, stage_item
+from steward.application.stage_service import find_item_by_slug
+from steward.cli import app
+from steward.infrastructure.env import get_workshop_path
+from steward.infrastructure.search_index import SEARCH_INDEX_FILENAME, SearchIndex
+
+scenarios("../features/search.feature")
+
+
+@pytest.fixture
+def cli_runner() -> CliRunner:
+    """Provide a CLI test runner."""
+    return CliRunner(mix_stderr=False)
+
+
+@pytest.fixture
+def result() -> dict:
+    """Store the CLI result between steps."""
+    return {}
+
+
+@pytest.fixture
+def temp_dir() -> dict:
+    """Provide temporary directory context."""
+    return {"path": Path(tempfile.mkdtemp()), "old_env": None}
+
+
+@given("an initialized workshop")
+def initialized_workshop(temp_dir: dict) -> None:
+    """Set up an initialized workshop."""
+    temp_dir["old_env"] = os.environ.get("PRAXIS_HOME")
+    os.environ["PRAXIS_HOME"] = str(temp_dir["path"])
+    init_workshop()
+
+
+@given(parsers.parse('an item "{slug}" whose note says "{text}"'))
+def item_with_note(temp_dir: dict, slug: str, text: str) -> None:
+    """Intake a markdown file as an item."""
+    source = temp_dir["path"] / f"{slug}.md"
+    source.write_text(text + "\n")
+    intake_item(str(source))
+
+
+@given(parsers.parse('item "{slug}" has a file "{name}" saying "{text}"'))
+def item_with_file(slug: str, name: str, text: str) -> None:
+    """Add a file to an item."""
+    item_path, _ = find_item_by_slug(slug)
+    (item_path / name).parent.mkdir(parents=True, exist_ok=True)
+    (item_path / name).write_text(text + "\n")
+
+
+@given(parsers.parse('item "{slug}" is in the {stage} stage'))
+def item_in_stage(slug: str, stage: str) -> None:
+    """Move an item to a stage."""
+    stage_item(slug, stage)
+
+
+@when(parsers.parse('the note of "{slug}" now says "{text}"'))
+def rewrite_note(slug: str, text: str) -> None:
+    """Rewrite the note an item was intaken from, changing its size."""
+    item_path, _ = find_item_by_slug(slug)
+    (item_path / f"{slug}.md").write_text(text + "\n")
+
+
+@when("another search refreshes the index while the next one reads the changed files")
+def concurrent_refresh(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Apply the same changes from a second index between snapshot and write."""
+    tokenize = SearchIndex._tokenize
+
+    def tokenize_after_other(self: SearchIndex, paths: list[str], total_bytes: int) -> list:
+        monkeypatch.setattr(SearchIndex, "_tokenize", tokenize)
+        with SearchIndex(get_workshop_path()) as other:
+            other.refresh()
+        return tokenize(self, paths, total_bytes)
+
+    monkeypatch.setattr(SearchIndex, "_tokenize", tokenize_after_other)
+
+
+@when(parsers.parse('I run "{command}"'))
+def run_command(cli_runner: CliRunner, result: dict, temp_dir: dict, command: str) -> None:
+    """Run a CLI command, noting the search index rows first."""
+    db_path = temp_dir["path"] / "_workshop" / ".steward" / SEARCH_INDEX_FILENAME
+    result["docs_before"] = _docs(db_path)
+    result["output"] = cli_runner.invoke(app, shlex.split(command)[1:])
+    result["docs_after"] = _docs(db_path)
+
+
+def _docs(db_path: Path) -> set[tuple]:
+    if not db_path.exists():
+        return set()
+    conn = sqlite3.connect(db_path)
+    try:
+        return set(conn.execute("SELECT item_id, name, mtime_ns, size FROM docs"))
+    finally:
+        conn.close()
+
+
+@then(parsers.parse("the exit code should be {code:d}"))
+def check_exit_code(result: dict, code: int) -> None:
+    """Verify the exit code."""
+    assert result["output"].exit_code == code, (
+        f"Expected exit code {code}, got {result['output'].exit_code}. "
+        f"Output: {result['output'].output} {result['output'].stderr}"
+    )
+
+
+@then(parsers.parse('the output contains "{text}"'))
+def check_output_contains(result: dict, text: str) -> None:
+    """Verify the output contains text."""
+    assert text in result["output"].output
+
+
+def _hits(result: dict) -> list[dict]:
+    assert result["output"].exit_code == 0, result["output"].stderr
+    return json.loads(result["output"].output)
+
+
+@then(parsers.parse('the hits are "{slugs}"'))
+def check_hits(result: dict, slugs: str) -> None:
+    """Verify which items matched, in rank order."""
+    assert [hit["slug"] for hit in _hits(result)] == [slug.strip() for slug in slugs.split(",")]
+
+
+@then(parsers.parse('hit {number:d} matched the file "{name}"'))
+def check_hit_file(result: dict, number: int, name: str) -> None:
+    """Verify a hit lists a matching file."""
+    assert name in _hits(result)[number - 1]["files"]
+
+
+@then(parsers.parse("the search index re-read {count:d} files on the last search"))
+def check_reindexed(result: dict, count: int) -> None:
+    """Verify only changed files were re-indexed."""
+    assert len(result["docs_after"] - result["docs_before"]) == count
+    assert len(result["docs_after"] & result["docs_before"]) == len(result["docs_after"]) - count
+
+
+@then(parsers.parse('the search index holds {count:d} file for "{slug}"'))
+def check_indexed_files(result: dict, count: int, slug: str) -> None:
+    """Verify an item's files are indexed once each."""
+    assert len([doc for doc in result["docs_after"] if doc[0].endswith(f"__{slug}")]) == count
+
+
+@pytest.fixture(autouse=True)
+def cleanup_env(temp_dir: dict):
+    """Clean up environment after test."""
+    yield
+    if temp_dir.get("old_env") is not None:
+        os.environ["PRAXIS_HOME"] = temp_dir["old_env"]
+    elif "PRAXIS_HOME" in os.environ:
+        del os.environ["PRAXIS_HOME"]
+    if temp_dir["path"].exists():
+        import shutil
+
+        shutil.rmtree(temp_dir["path"])
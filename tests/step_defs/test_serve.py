@@ -0,0 +1,198 @@
+"""Step definitions for serve feature tests."""
+
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from pytest_bdd import given, parsers, scenarios, then, when
+
+from steward.application import init_workshop
+from steward.domain.models import Status
+from steward.domain.stages import Stage, get_stage_path
+from steward.infrastructure.filesystem import create_symlink
+from steward.infrastructure.status_yaml import write_status
+from steward.server import run_forwarded
+
+scenarios("../features/serve.feature")
+
+
+@pytest.fixture
+def result() -> dict:
+    """Store the result between steps."""
+    return {}
+
+
+@pytest.fixture
+def temp_dir() -> dict:
+    """Provide temporary directory context."""
+    return {"path": None, "old_env": None, "server": None}
+
+
+@given("an initialized workshop")
+def initialized_workshop(temp_dir: dict) -> None:
+    """Set up an initialized workshop."""
+    tmpdir = tempfile.mkdtemp()
+    temp_dir["path"] = Path(tmpdir)
+    temp_dir["old_env"] = os.environ.get("PRAXIS_HOME")
+    os.environ["PRAXIS_HOME"] = tmpdir
+    init_workshop()
+
+
+@given(parsers.parse('an item "{slug}" exists with stage "{stage}"'))
+def item_exists_with_stage(temp_dir: dict, slug: str, stage: str) -> None:
+    """Create an item at the specified stage."""
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    now = datetime.now()
+    item_id = now.strftime("%Y-%m-%d-%H%M") + f"__{slug}"
+    item_path = items_path / item_id
+    item_path.mkdir(parents=True, exist_ok=True)
+
+    stage_enum = Stage(stage)
+    status = Status(stage=stage_enum, created=now, updated=now)
+    write_status(item_path, status)
+
+    stage_path = temp_dir["path"] / "_workshop" / get_stage_path(stage_enum)
+    create_symlink(item_path, stage_path / slug)
+
+
+def _socket_path(temp_dir: dict) -> Path:
+    return temp_dir["path"] / "_workshop" / ".steward" / "steward.sock"
+
+
+@given("steward serve is running")
+def server_running(temp_dir: dict) -> None:
+    """Start steward serve in the background and wait for its socket."""
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "steward", "serve"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    temp_dir["server"] = proc
+    deadline = time.monotonic() + 15
+    while not _socket_path(temp_dir).exists():
+        if proc.poll() is not None or time.monotonic() > deadline:
+            pytest.fail(f"steward serve did not start: {proc.communicate()}")
+        time.sleep(0.05)
+
+
+@when(parsers.parse('I run "{command}" as a subprocess'))
+def run_client(temp_dir: dict, result: dict, command: str) -> None:
+    """Run the thin client in a fresh interpreter."""
+    run_client_with_input(temp_dir, result, command, "")
+
+
+@when(parsers.parse('I run "{command}" as a subprocess with {name} set to "{value}"'))
+def run_client_with_env(temp_dir: dict, result: dict, command: str, name: str, value: str) -> None:
+    """Run the thin client with an environment variable set for it alone."""
+    run_client_with_input(temp_dir, result, command, "", {name: value})
+
+
+@when(parsers.parse('I run "{command}" as a subprocess with input "{text}"'))
+def run_client_with_input(
+    temp_dir: dict, result: dict, command: str, text: str, env: dict[str, str] | None = None
+) -> None:
+    """Run the thin client with text (\\n for newlines) on stdin."""
+    args = shlex.split(command)
+    if args and args[0] == "steward-client":
+        args = args[1:]
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "steward.client", *args],
+        input=text.replace("\\n", "\n"),
+        capture_output=True,
+        text=True,
+        timeout=60,
+        env={**os.environ, **(env or {})},
+    )
+    result["output"] = proc.stdout
+    result["stderr"] = "\n".join(line for line in proc.stderr.splitlines() if not line.startswith("import time:"))
+    result["modules"] = {
+        line.rsplit("|", 1)[1].strip()
+        for line in proc.stderr.splitlines()
+        if line.startswith("import time:") and line.count("|") == 2
+    }
+    result["exit_code"] = proc.returncode
+
+
+@when(parsers.parse('a client asks the server to run "{command}"'))
+def request_from_server(temp_dir: dict, result: dict, command: str) -> None:
+    """Hand a request straight to the server's request handler."""
+    output: dict[str, str] = {"stdout": "", "stderr": ""}
+
+    def write(stream: str, data: str) -> None:
+        output[stream] += data
+
+    result["exit_code"] = run_forwarded(shlex.split(command), str(temp_dir["path"]), write)
+    result["output"] = output["stdout"]
+    result["stderr"] = output["stderr"]
+
+
+@when("the server is stopped")
+def stop_server(temp_dir: dict) -> None:
+    """Send SIGTERM to the server and wait for it to exit."""
+    proc = temp_dir["server"]
+    proc.terminate()
+    proc.wait(timeout=15)
+
+
+@then(parsers.parse("the exit code should be {code:d}"))
+def check_exit_code(result: dict, code: int) -> None:
+    """Verify the exit code."""
+    output = f"{result['output']} {result['stderr']}"
+    assert result["exit_code"] == code, f"Expected exit code {code}, got {result['exit_code']}. Output: {output}"
+
+
+@then(parsers.parse('the output contains "{text}"'))
+def check_output_contains(result: dict, text: str) -> None:
+    """Verify output contains text."""
+    assert text in result["output"], f"Expected '{text}' in output. Got: {result['output']}"
+
+
+@then(parsers.parse('stderr contains "{text}"'))
+def check_stderr_contains(result: dict, text: str) -> None:
+    """Verify stderr contains text."""
+    assert text in result["stderr"], f"Expected '{text}' in stderr. Got: {result['stderr']}"
+
+
+@then("the server handled the command")
+def check_server_handled(temp_dir: dict, result: dict) -> None:
+    """Verify the command ran in the server, not in the client process."""
+    assert temp_dir["server"].poll() is None, "steward serve exited unexpectedly"
+    assert "typer" not in result["modules"], "Client ran the command locally"
+
+
+@then("the client ran the command itself")
+def check_client_ran(temp_dir: dict, result: dict) -> None:
+    """Verify the command ran in the client process, leaving the server free."""
+    assert temp_dir["server"].poll() is None, "steward serve exited unexpectedly"
+    assert "typer" in result["modules"], "Client forwarded the command"
+
+
+@then("the server socket does not exist")
+def check_socket_removed(temp_dir: dict) -> None:
+    """Verify the socket file was cleaned up."""
+    assert not _socket_path(temp_dir).exists()
+
+
+@pytest.fixture(autouse=True)
+def cleanup_env(temp_dir: dict):
+    """Stop the server and clean up environment after test."""
+    yield
+    proc = temp_dir.get("server")
+    if proc is not None and proc.poll() is None:
+        proc.terminate()
+        proc.wait(timeout=15)
+    if temp_dir.get("old_env") is not None:
+        os.environ["PRAXIS_HOME"] = temp_dir["old_env"]
+    elif "PRAXIS_HOME" in os.environ and temp_dir.get("path"):
+        del os.environ["PRAXIS_HOME"]
+    if temp_dir.get("path") and temp_dir["path"].exists():
+        import shutil
+
+        shutil.rmtree(temp_dir["path"])
@@ -1,5 +1,6 @@
 """Step definitions for stage feature tests."""
 
+import errno
 import os
 import tempfile
 from datetime import datetime
@@ -9,11 +10,13 @@ import pytest
 from pytest_bdd import given, parsers, scenarios, then, when
 from typer.testing import CliRunner
 
-from steward.application import init_workshop
+from steward.application import init_workshop, stage_service
 from steward.cli import app
 from steward.domain.models import Status
 from steward.domain.stages import Stage, get_stage_path
+from steward.infrastructure import status_yaml
 from steward.infrastructure.filesystem import create_symlink
+from steward.infrastructure.journal import Journal
 from steward.infrastructure.status_yaml import read_status, write_status
 
 scenarios("../features/stage.feature")
@@ -77,6 +80,88 @@ def item_exists_with_stage(
     item_context["item_path"] = item_path
     item_context["item_id"] = item_id
     item_context["slug"] = slug
+    item_context.setdefault("items", {})[slug] = item_path
+
+
+@given(parsers.parse('the status.yaml of "{slug}" is deleted'))
+def delete_status(item_context: dict, slug: str) -> None:
+    """Remove an item's status.yaml outside of steward."""
+    (item_context["items"][slug] / "status.yaml").unlink()
+
+
+@given(parsers.parse('the status.yaml of "{slug}" holds "{text}"'))
+def corrupt_status(item_context: dict, slug: str, text: str) -> None:
+    """Overwrite an item's status.yaml outside of steward."""
+    (item_context["items"][slug] / "status.yaml").write_text(text)
+
+
+@given(parsers.parse('an intake has reserved a directory for "{slug}"'))
+def reserved_directory(temp_dir: dict, slug: str) -> None:
+    """Create an item directory with no status.yaml yet, as an intake in progress has."""
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    (items_path / (datetime.now().strftime("%Y-%m-%d-%H%M") + f"__{slug}")).mkdir()
+
+
+@given(parsers.parse('STEWARD_DURABILITY is set to "{mode}"'))
+def set_durability(monkeypatch: pytest.MonkeyPatch, mode: str) -> None:
+    """Select the durability mode for status writes."""
+    monkeypatch.setenv("STEWARD_DURABILITY", mode)
+
+
+@given("status fsyncs are recorded")
+def record_status_fsyncs(monkeypatch: pytest.MonkeyPatch, item_context: dict) -> None:
+    """Record the files and directories status writes flush."""
+    synced: list[tuple[str, Path]] = []
+    item_context["fsyncs"] = synced
+
+    def recording(kind: str, fsync):  # noqa: ANN001, ANN202
+        def record(path: Path) -> None:
+            synced.append((kind, path))
+            fsync(path)
+
+        return record
+
+    monkeypatch.setattr(status_yaml, "fsync_file", recording("file", status_yaml.fsync_file))
+    monkeypatch.setattr(status_yaml, "fsync_directory", recording("directory", status_yaml.fsync_directory))
+
+
+@given("writing the second status file fails")
+def fail_second_status_write(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make encoding of the second status in a batch fail like a full disk."""
+    encode_status = status_yaml.encode_status
+    calls = []
+
+    def failing_encode_status(*args: object) -> str:
+        calls.append(args)
+        if len(calls) == 2:
+            raise OSError(errno.ENOSPC, "No space left on device")
+        return encode_status(*args)
+
+    monkeypatch.setattr(status_yaml, "encode_status", failing_encode_status)
+
+
+@pytest.fixture
+def link_failure(request: pytest.FixtureRequest) -> pytest.MonkeyPatch:
+    """Patches that break linking; undone by 'linking stage folders works again'."""
+    patch = pytest.MonkeyPatch()
+    request.addfinalizer(patch.undo)
+    return patch
+
+
+@given("linking stage folders fails")
+def break_linking(link_failure: pytest.MonkeyPatch) -> None:
+    """Fail after the status files are written, as a crash would."""
+
+    def failing_create_symlink(target: Path, link: Path) -> None:
+        raise OSError(errno.EIO, "simulated crash")
+
+    link_failure.setattr(stage_service, "create_symlink", failing_create_symlink)
+
+
+@when("linking stage folders works again")
+def fix_linking(link_failure: pytest.MonkeyPatch) -> None:
+    """Undo the simulated crash."""
+    link_failure.undo()
 
 
 @when(parsers.parse('I run "{command}"'))
@@ -90,6 +175,17 @@ def run_command(cli_runner: CliRunner, result: dict, command: str) -> None:
     result["output"] = cli_runner.invoke(app, args)
 
 
+@when(parsers.parse('I run "{command}" with input "{text}"'))
+def run_command_with_input(cli_runner: CliRunner, result: dict, command: str, text: str) -> None:
+    """Run a CLI command with text (\\n for newlines) on stdin."""
+    import shlex
+
+    args = shlex.split(command)
+    if args and args[0] == "steward":
+        args = args[1:]
+    result["output"] = cli_runner.invoke(app, args, input=text.replace("\\n", "\n"))
+
+
 @then(parsers.parse("the exit code should be {code:d}"))
 def check_exit_code(result: dict, code: int) -> None:
     """Verify the exit code."""
@@ -107,6 +203,63 @@ def check_item_stage(item_context: dict, stage: str) -> None:
     assert status.stage == stage, f"Expected stage '{stage}', got '{status.stage}'"
 
 
+@then(parsers.parse('the item "{slug}" has stage "{stage}"'))
+def check_named_item_stage(item_context: dict, slug: str, stage: str) -> None:
+    """Verify a named item has the expected stage."""
+    status = read_status(item_context["items"][slug])
+    assert status.stage == stage, f"Expected stage '{stage}' for {slug}, got '{status.stage}'"
+
+
+@then(parsers.parse("{files:d} status files and {directories:d} item directories were fsynced once each"))
+def check_status_fsyncs(item_context: dict, files: int, directories: int) -> None:
+    """Verify a group write flushed each new file and each directory exactly once."""
+    synced = item_context["fsyncs"]
+    synced_files = [path for kind, path in synced if kind == "file"]
+    synced_dirs = [path for kind, path in synced if kind == "directory"]
+    assert len(synced_files) == len(set(synced_files)) == files
+    assert len(synced_dirs) == len(set(synced_dirs)) == directories
+
+
+@then("no temporary status files are left behind")
+def check_no_temp_status_files(temp_dir: dict) -> None:
+    """Verify every item directory holds only its final status.yaml."""
+    items_path = temp_dir["path"] / "_workshop" / "9-items"
+    leftovers = [str(path) for path in items_path.glob("*/.status.yaml.*")]
+    assert not leftovers, f"Temporary files left behind: {leftovers}"
+
+
+@then(parsers.parse("the journal has {count:d} interrupted operation"))
+def check_journal_pending(temp_dir: dict, count: int) -> None:
+    """Verify the number of operations begun but never finished."""
+    assert len(Journal(temp_dir["path"] / "_workshop").pending()) == count
+
+
+@then("the journal is empty")
+def check_journal_empty(temp_dir: dict) -> None:
+    """Verify nothing is left to recover."""
+    assert Journal(temp_dir["path"] / "_workshop").is_empty()
+
+
+@then(parsers.parse('a symlink for "{slug}" exists in {stage_path}'))
+def check_named_symlink(temp_dir: dict, slug: str, stage_path: str) -> None:
+    """Verify a named item's symlink exists in a stage folder."""
+    symlink_path = temp_dir["path"] / stage_path / slug
+    assert symlink_path.is_symlink(), f"Symlink not found: {symlink_path}"
+
+
+@then(parsers.parse('no symlink for "{slug}" exists in {stage_path}'))
+def check_named_symlink_absent(temp_dir: dict, slug: str, stage_path: str) -> None:
+    """Verify a named item's symlink is absent from a stage folder."""
+    symlink_path = temp_dir["path"] / stage_path / slug
+    assert not symlink_path.is_symlink(), f"Symlink should not exist: {symlink_path}"
+
+
+@then(parsers.parse('the output contains "{text}"'))
+def check_output_contains(result: dict, text: str) -> None:
+    """Verify output contains text."""
+    assert text in result["output"].output, f"Expected '{text}' in output. Got: {result['output'].output}"
+
+
 @then("no symlink exists in _workshop/3-intake/")
 def check_no_intake_symlink(temp_dir: dict, item_context: dict) -> None:
     """Verify no symlink exists in intake stage."""
@@ -135,6 +288,13 @@ def check_stderr_contains(result: dict, text: str) -> None:
     assert text in combined, f"Expected '{text}' in stderr. Got: {combined}"
 
 
+@then(parsers.parse('stderr does not contain "{text}"'))
+def check_stderr_not_contains(result: dict, text: str) -> None:
+    """Verify stderr does not contain text."""
+    stderr = result["output"].stderr or ""
+    assert text not in stderr, f"Did not expect '{text}' in stderr. Got: {stderr}"
+
+
 @pytest.fixture(autouse=True)
 def cleanup_env(temp_dir: dict):
     """Clean up environment after test."""
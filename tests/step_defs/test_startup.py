@@ -0,0 +1,93 @@
+"""Step definitions for startup feature tests."""
+
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from pytest_bdd import given, parsers, scenarios, then, when
+
+scenarios("../features/startup.feature")
+
+
+@pytest.fixture
+def result() -> dict:
+    """Store the result between steps."""
+    return {}
+
+
+@pytest.fixture
+def temp_dir() -> dict:
+    """Provide temporary directory context."""
+    return {"path": None}
+
+
+@given("PRAXIS_HOME is set to a valid directory")
+def praxis_home_set(temp_dir: dict) -> None:
+    """Create a temporary PRAXIS_HOME for the subprocess."""
+    temp_dir["path"] = Path(tempfile.mkdtemp())
+
+
+@given("the workshop is initialized")
+def workshop_initialized(temp_dir: dict) -> None:
+    """Run steward init in a subprocess."""
+    env = os.environ.copy()
+    env["PRAXIS_HOME"] = str(temp_dir["path"])
+    subprocess.run([sys.executable, "-m", "steward", "init"], check=True, capture_output=True, env=env, timeout=60)
+
+
+@when(parsers.parse('I run "{command}" with import timing'))
+def run_with_importtime(temp_dir: dict, result: dict, command: str) -> None:
+    """Run steward in a fresh interpreter under -X importtime."""
+    args = shlex.split(command)
+    if args and args[0] == "steward":
+        args = args[1:]
+    env = os.environ.copy()
+    env["PRAXIS_HOME"] = str(temp_dir["path"])
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "steward", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    result["output"] = proc.stdout
+    result["exit_code"] = proc.returncode
+    result["modules"] = {
+        line.rsplit("|", 1)[1].strip()
+        for line in proc.stderr.splitlines()
+        if line.startswith("import time:") and line.count("|") == 2
+    }
+
+
+@then(parsers.parse("the exit code should be {code:d}"))
+def check_exit_code(result: dict, code: int) -> None:
+    """Verify the exit code."""
+    output = result["output"]
+    assert result["exit_code"] == code, f"Expected exit code {code}, got {result['exit_code']}. Output: {output}"
+
+
+@then(parsers.parse('the output contains "{text}"'))
+def check_output_contains(result: dict, text: str) -> None:
+    """Verify output contains text."""
+    assert text in result["output"], f"Expected '{text}' in output. Got: {result['output']}"
+
+
+@then(parsers.parse('the module "{module}" was not imported'))
+def check_module_not_imported(result: dict, module: str) -> None:
+    """Verify neither the module nor any of its submodules were imported."""
+    imported = sorted(name for name in result["modules"] if name == module or name.startswith(f"{module}."))
+    assert not imported, f"Expected '{module}' not to be imported. Got: {imported}"
+
+
+@pytest.fixture(autouse=True)
+def cleanup_env(temp_dir: dict):
+    """Clean up the temporary directory after test."""
+    yield
+    if temp_dir.get("path") and temp_dir["path"].exists():
+        import shutil
+
+        shutil.rmtree(temp_dir["path"])
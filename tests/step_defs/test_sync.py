@@ -108,6 +108,22 @@ def create_orphaned_symlink(temp_dir: dict, stage_path: str, slug: str) -> None:
     symlink.symlink_to("../9-items/nonexistent")
 
 
+@given(parsers.parse('the symlink for "{slug}" is moved to {stage_path}'))
+def move_symlink(temp_dir: dict, slug: str, stage_path: str, item_context: dict) -> None:
+    """Link an item from another stage's folder instead of its own."""
+    item = item_context["items"][slug]
+    workshop_path = temp_dir["path"] / "_workshop"
+    (workshop_path / get_stage_path(Stage(item["stage"])) / slug).unlink()
+    create_symlink(item["path"], temp_dir["path"] / stage_path / slug)
+
+
+@given(parsers.parse('the symlink for "{slug}" is removed'))
+def remove_item_symlink(temp_dir: dict, slug: str, item_context: dict) -> None:
+    """Delete an item's stage symlink."""
+    stage = Stage(item_context["items"][slug]["stage"])
+    (temp_dir["path"] / "_workshop" / get_stage_path(stage) / slug).unlink()
+
+
 @when(parsers.parse('I run "{command}"'))
 def run_command(cli_runner: CliRunner, result: dict, command: str) -> None:
     """Run a CLI command."""
@@ -136,6 +152,12 @@ def check_output_contains(result: dict, text: str) -> None:
     )
 
 
+@then(parsers.parse('the output does not mention "{text}"'))
+def check_output_lacks(result: dict, text: str) -> None:
+    """Verify output does not contain text."""
+    assert text not in result["output"].output, result["output"].output
+
+
 @then(parsers.parse('a symlink exists in {stage_path} for "{slug}"'))
 def check_symlink_exists(temp_dir: dict, stage_path: str, slug: str) -> None:
     """Verify symlink exists in stage folder."""
@@ -143,6 +165,18 @@ def check_symlink_exists(temp_dir: dict, stage_path: str, slug: str) -> None:
     assert full_path.is_symlink(), f"Symlink not found: {full_path}"
 
 
+@then(parsers.parse('the symlink in {stage_path} for "{slug}" resolves to the item'))
+def check_symlink_resolves(
+    temp_dir: dict, stage_path: str, slug: str, item_context: dict
+) -> None:
+    """Verify the symlink resolves to the item's canonical directory."""
+    full_path = temp_dir["path"] / stage_path / slug
+    expected = item_context["items"][slug]["path"]
+    assert full_path.resolve() == expected.resolve(), (
+        f"Symlink {full_path} resolves to {full_path.resolve()}, expected {expected}"
+    )
+
+
 @then(parsers.parse('no symlink exists in {stage_path} for "{slug}"'))
 def check_no_symlink(temp_dir: dict, stage_path: str, slug: str) -> None:
     """Verify no symlink exists in stage folder."""
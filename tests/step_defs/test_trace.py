@@ -0,0 +1,157 @@
+"""Step definitions for profiling and tracing feature tests."""
+
+import os
+import pstats
+import re
+import shlex
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from pytest_bdd import given, parsers, scenarios, then, when
+from typer.testing import CliRunner
+
+from steward.application import init_workshop, intake_item
+from steward.cli import app
+
+scenarios("../features/trace.feature")
+
+
+@pytest.fixture
+def cli_runner() -> CliRunner:
+    """Provide a CLI test runner."""
+    return CliRunner(mix_stderr=False)
+
+
+@pytest.fixture
+def result() -> dict:
+    """Store the CLI result between steps."""
+    return {}
+
+
+@pytest.fixture
+def temp_dir() -> dict:
+    """Provide temporary directory context."""
+    return {"path": None, "old_env": None}
+
+
+@given("PRAXIS_HOME is an empty directory")
+def empty_praxis_home(temp_dir: dict) -> None:
+    """Point PRAXIS_HOME at a fresh directory."""
+    tmpdir = tempfile.mkdtemp()
+    temp_dir["path"] = Path(tmpdir)
+    temp_dir["old_env"] = os.environ.get("PRAXIS_HOME")
+    os.environ["PRAXIS_HOME"] = tmpdir
+
+
+@given("an initialized workshop")
+def initialized_workshop(temp_dir: dict) -> None:
+    """Set up an initialized workshop."""
+    empty_praxis_home(temp_dir)
+    init_workshop()
+
+
+@given(parsers.parse('an item "{slug}" in the intake stage'))
+def intaken_item(temp_dir: dict, slug: str) -> None:
+    """Intake an item through the service."""
+    source = temp_dir["path"] / f"{slug}.md"
+    source.write_text(slug)
+    intake_item(str(source))
+
+
+@given(parsers.parse('a file "{name}" in the inbox'))
+def inbox_file(temp_dir: dict, name: str) -> None:
+    """Drop a file into the inbox."""
+    (temp_dir["path"] / "_workshop" / "1-inbox" / name).write_text("note")
+
+
+@when(parsers.parse('I run "{command}" with STEWARD_TRACE "{value}"'))
+def run_traced(cli_runner: CliRunner, result: dict, command: str, value: str) -> None:
+    """Run a CLI command with STEWARD_TRACE set."""
+    args = shlex.split(command)[1:]
+    result["output"] = cli_runner.invoke(app, args, env={"STEWARD_TRACE": value})
+
+
+@when(parsers.parse('I run "{command}" with --profile and --profile-memory'))
+def run_profiled(cli_runner: CliRunner, result: dict, temp_dir: dict, command: str) -> None:
+    """Run a CLI command under the profiler."""
+    result["profile"] = temp_dir["path"] / "steward.prof"
+    args = ["--profile", str(result["profile"]), "--profile-memory", *shlex.split(command)[1:]]
+    result["output"] = cli_runner.invoke(app, args)
+
+
+@then(parsers.parse("the exit code should be {code:d}"))
+def check_exit_code(result: dict, code: int) -> None:
+    """Verify the exit code."""
+    assert result["output"].exit_code == code, (
+        f"Expected exit code {code}, got {result['output'].exit_code}. "
+        f"Output: {result['output'].output} {result['output'].stderr}"
+    )
+
+
+@then(parsers.parse('stderr contains "{text}"'))
+def check_stderr_contains(result: dict, text: str) -> None:
+    """Verify stderr contains text."""
+    stderr = result["output"].stderr or ""
+    assert text in stderr, f"Expected '{text}' in stderr. Got: {stderr}"
+
+
+@then(parsers.parse('stderr does not contain "{text}"'))
+def check_stderr_lacks(result: dict, text: str) -> None:
+    """Verify stderr does not contain text."""
+    assert text not in (result["output"].stderr or "")
+
+
+def _phase_line(result: dict, phase: str) -> re.Match[str]:
+    match = re.search(rf"^\s+{phase}\s+(\d+)\s+([\d.]+)", result["output"].stderr, re.MULTILINE)
+    assert match is not None, f"No {phase} line in: {result['output'].stderr}"
+    return match
+
+
+@then(parsers.parse("the trace lists the phases {phases}"))
+def check_phases(result: dict, phases: str) -> None:
+    """Verify every phase has a line in the breakdown."""
+    for phase in phases.split(", "):
+        _phase_line(result, phase)
+
+
+@then(parsers.parse("the trace counted time in the {phase} phase"))
+def check_phase_time(result: dict, phase: str) -> None:
+    """Verify a phase was entered at least once."""
+    assert int(_phase_line(result, phase).group(1)) > 0
+
+
+@then("the trace counted syscalls")
+def check_syscalls(result: dict) -> None:
+    """Verify syscall counts were reported."""
+    match = re.search(r"syscalls: (.*)", result["output"].stderr)
+    assert match is not None and "open" in match.group(1), result["output"].stderr
+
+
+@then("the profile can be loaded with pstats")
+def check_profile(result: dict) -> None:
+    """Verify the cProfile dump is readable."""
+    stats = pstats.Stats(str(result["profile"]))
+    assert stats.total_calls > 0
+
+
+@then("the tracemalloc snapshot can be loaded")
+def check_snapshot(result: dict) -> None:
+    """Verify the tracemalloc snapshot is readable."""
+    snapshot = tracemalloc.Snapshot.load(f"{result['profile']}.tracemalloc")
+    assert snapshot.statistics("filename")
+
+
+@pytest.fixture(autouse=True)
+def cleanup_env(temp_dir: dict):
+    """Clean up environment after test."""
+    yield
+    if temp_dir.get("old_env") is not None:
+        os.environ["PRAXIS_HOME"] = temp_dir["old_env"]
+    elif "PRAXIS_HOME" in os.environ and temp_dir.get("path"):
+        del os.environ["PRAXIS_HOME"]
+    if temp_dir.get("path") and temp_dir["path"].exists():
+        import shutil
+
+        shutil.rmtree(temp_dir["path"])
@@ -0,0 +1,196 @@
+"""Step definitions for watch feature tests."""
+
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from pytest_bdd import given, parsers, scenarios, then, when
+
+from steward.application import init_workshop, intake_item, list_records
+from steward.application.watch_service import WatchReport, watch_workshop
+from steward.domain.stages import Stage
+from steward.infrastructure.status_yaml import read_status, write_status
+
+scenarios("../features/watch.feature")
+
+
+@pytest.fixture
+def temp_dir() -> dict:
+    """Provide temporary directory context."""
+    return {"path": None, "old_env": None}
+
+
+@pytest.fixture
+def reports() -> list[WatchReport]:
+    """Collect what the watcher did."""
+    return []
+
+
+@pytest.fixture
+def item_context() -> dict:
+    """Store item IDs by slug."""
+    return {}
+
+
+@given("an initialized workshop")
+def initialized_workshop(temp_dir: dict) -> None:
+    """Set up an initialized workshop."""
+    tmpdir = tempfile.mkdtemp()
+    temp_dir["path"] = Path(tmpdir)
+    temp_dir["old_env"] = os.environ.get("PRAXIS_HOME")
+    os.environ["PRAXIS_HOME"] = tmpdir
+    init_workshop()
+
+
+@given(parsers.parse('an item "{slug}" in the intake stage'))
+def intaken_item(temp_dir: dict, item_context: dict, slug: str) -> None:
+    """Intake an item through the service."""
+    source = temp_dir["path"] / f"{slug}.md"
+    source.write_text(slug)
+    item_context[slug] = intake_item(str(source)).id
+
+
+@given(parsers.parse("the watcher is running with the {backend} backend"))
+def running_watcher(backend: str, reports: list[WatchReport], request: pytest.FixtureRequest) -> None:
+    """Run watch_workshop in a thread until the scenario ends."""
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=watch_workshop,
+        kwargs={
+            "debounce": 0.1,
+            "poll": backend == "polling",
+            "interval": 0.1,
+            "stop": stop,
+            "on_report": reports.append,
+        },
+    )
+    thread.start()
+    # Let the watcher take its first look before anything changes
+    time.sleep(0.2)
+
+    def stop_watcher() -> None:
+        stop.set()
+        thread.join(timeout=5)
+
+    request.addfinalizer(stop_watcher)
+
+
+@when(parsers.parse('I drop "{name}" into the inbox'))
+def drop_file(temp_dir: dict, name: str) -> None:
+    """Write a file into the inbox."""
+    (temp_dir["path"] / "_workshop" / "1-inbox" / name).write_text("dropped")
+
+
+@when(parsers.parse('I set the stage of "{slug}" to "{stage}" in its status.yaml'))
+def edit_status(temp_dir: dict, item_context: dict, slug: str, stage: str) -> None:
+    """Change an item's stage without going through steward."""
+    item_path = temp_dir["path"] / "_workshop" / "9-items" / item_context[slug]
+    status = read_status(item_path)
+    write_status(item_path, status.model_copy(update={"stage": Stage(stage)}))
+
+
+@when(parsers.parse("I wait {seconds:f} seconds"))
+def wait(seconds: float) -> None:
+    """Give the watcher time to act."""
+    time.sleep(seconds)
+
+
+def _eventually(check, timeout: float) -> None:
+    """Retry a check until it passes or the timeout runs out."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            check()
+            return
+        except AssertionError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+@then(parsers.parse('within {seconds:d} seconds an item "{slug}" is in the intake stage'))
+def item_intaken(slug: str, seconds: int) -> None:
+    """Wait for the watcher to intake a drop."""
+
+    def check() -> None:
+        stages = {record.slug: record.stage for record in list_records()}
+        assert stages.get(slug) == "intake", stages
+
+    _eventually(check, seconds)
+
+
+@then("the inbox is empty")
+def inbox_empty(temp_dir: dict) -> None:
+    """Verify the drop was moved, not copied."""
+    assert os.listdir(temp_dir["path"] / "_workshop" / "1-inbox") == []
+
+
+@then(parsers.parse('the inbox contains "{name}"'))
+def inbox_contains(temp_dir: dict, name: str) -> None:
+    """Verify an entry was left in the inbox."""
+    assert (temp_dir["path"] / "_workshop" / "1-inbox" / name).exists()
+
+
+@then(parsers.parse('within {seconds:d} seconds a symlink exists in {stage_path} for "{slug}"'))
+def symlink_appears(temp_dir: dict, stage_path: str, slug: str, seconds: int) -> None:
+    """Wait for the watcher to link an item."""
+
+    def check() -> None:
+        assert (temp_dir["path"] / stage_path / slug).is_symlink()
+
+    _eventually(check, seconds)
+
+
+@then(parsers.parse('within {seconds:d} seconds no symlink exists in {stage_path} for "{slug}"'))
+def eventually_no_symlink(temp_dir: dict, seconds: int, stage_path: str, slug: str) -> None:
+    """Wait for the watcher to remove an item's old link (it is removed after the new one is made)."""
+
+    def check() -> None:
+        assert not (temp_dir["path"] / stage_path / slug).is_symlink()
+
+    _eventually(check, seconds)
+
+
+@then(parsers.parse('a symlink exists in {stage_path} for "{slug}"'))
+def symlink_exists(temp_dir: dict, stage_path: str, slug: str) -> None:
+    """Verify symlink exists in stage folder."""
+    assert (temp_dir["path"] / stage_path / slug).is_symlink()
+
+
+@then(parsers.parse('no symlink exists in {stage_path} for "{slug}"'))
+def no_symlink(temp_dir: dict, stage_path: str, slug: str) -> None:
+    """Verify no symlink exists in stage folder."""
+    assert not (temp_dir["path"] / stage_path / slug).is_symlink()
+
+
+@then(parsers.parse("the watcher re-linked {count:d} item"))
+def relinked(reports: list[WatchReport], count: int) -> None:
+    """Verify only the edited item's links changed."""
+
+    def check() -> None:
+        changes = [
+            report.sync.created + report.sync.retargeted + report.sync.removed
+            for report in reports
+            if report.sync is not None
+        ]
+        # One link created in the new stage folder, one removed from the old
+        assert sum(changes) == 2 * count, reports
+
+    _eventually(check, 1)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_env(temp_dir: dict):
+    """Clean up environment after test."""
+    yield
+    if temp_dir.get("old_env") is not None:
+        os.environ["PRAXIS_HOME"] = temp_dir["old_env"]
+    elif "PRAXIS_HOME" in os.environ and temp_dir.get("path"):
+        del os.environ["PRAXIS_HOME"]
+    if temp_dir.get("path") and temp_dir["path"].exists():
+        import shutil
+
+        shutil.rmtree(temp_dir["path"])